@@ -18,7 +18,7 @@
 import re
 from copy import deepcopy
 from threading import RLock
-from typing import Optional, TYPE_CHECKING
+from typing import Dict, Optional, Tuple, TYPE_CHECKING
 
 from cylc.flow import LOG
 from cylc.flow.broadcast_report import (
@@ -30,7 +30,7 @@ from cylc.flow.broadcast_report import (
 from cylc.flow.cfgspec.workflow import SPEC
 from cylc.flow.cycling.loader import get_point, standardise_point_string
 from cylc.flow.exceptions import PointParsingError
-from cylc.flow.parsec.util import listjoin, pdeepcopy, poverride
+from cylc.flow.parsec.util import listjoin, pdeepcopy, poverlay, poverride
 from cylc.flow.parsec.validate import BroadcastConfigValidator
 from cylc.flow.run_modes import WORKFLOW_ONLY_MODES
 from cylc.flow.platforms import (
@@ -42,6 +42,7 @@ from cylc.flow.util import uniq
 if TYPE_CHECKING:
     from cylc.flow.id import Tokens
     from cylc.flow.task_proxy import TaskProxy
+    from cylc.flow.taskdef import TaskDef
 
 
 ALL_CYCLE_POINTS_STRS = ["*", "all-cycle-points", "all-cycles"]
@@ -77,6 +78,9 @@ class BroadcastMgr:
         self.broadcasts = {}
         self.ext_triggers = {}  # Can use collections.Counter in future
         self.lock = RLock()
+        # runtime configs with broadcasts applied by (task, cycle point)
+        # (the cycle point is "*" if no cycle specific broadcasts apply)
+        self._rtconfigs: Dict[Tuple[str, str], Tuple['TaskDef', dict]] = {}
 
     def check_ext_triggers(self, itask, ext_trigger_queue):
         """Get queued ext trigger messages and try to satisfy itask.
@@ -85,11 +89,21 @@ class BroadcastMgr:
         new messages and satisfy dependent tasks at the same time.
         Return True if itask has a newly satisfied ext-trigger.
         """
+        self.get_ext_triggers(ext_trigger_queue)
+        return self._match_ext_trigger(itask)
+
+    def get_ext_triggers(self, ext_trigger_queue):
+        """Get queued ext trigger messages.
+
+        Return True if there were any.
+        """
+        got_ext_triggers = False
         while not ext_trigger_queue.empty():
             ext_trigger = ext_trigger_queue.get_nowait()
             self.ext_triggers.setdefault(ext_trigger, 0)
             self.ext_triggers[ext_trigger] += 1
-        return self._match_ext_trigger(itask)
+            got_ext_triggers = True
+        return got_ext_triggers
 
     def clear_broadcast(
             self, point_strings=None, namespaces=None, cancel_settings=None):
@@ -143,6 +157,8 @@ class BroadcastMgr:
         bad_options = self._get_bad_options(
             self._prune(), point_strings, namespaces, cancel_keys_list)
 
+        self._rtconfigs.clear()
+
         # Log the broadcast
         self.workflow_db_mgr.put_broadcast(modified_settings, is_cancel=True)
         LOG.info(
@@ -189,15 +205,29 @@ class BroadcastMgr:
         return ret
 
     def get_updated_rtconfig(self, itask: 'TaskProxy') -> dict:
-        """Retrieve updated rtconfig for a single task proxy"""
+        """Retrieve updated rtconfig for a single task proxy.
+
+        The result is cached until the broadcasts change and may be shared
+        with other tasks, do not modify it.
+        """
+        cycle = itask.tokens['cycle']
+        if cycle not in self.broadcasts:
+            # only all-cycle broadcasts apply (if any), share the result
+            # with other cycles
+            cycle = '*'
+        key = (itask.tdef.name, cycle)
+        try:
+            tdef, rtconfig = self._rtconfigs[key]
+        except KeyError:
+            pass
+        else:
+            if tdef is itask.tdef:
+                return rtconfig
         overrides = self.get_broadcast(
             itask.tokens
         )
-        if overrides:
-            rtconfig = pdeepcopy(itask.tdef.rtconfig)
-            poverride(rtconfig, overrides, prepend=True)
-        else:
-            rtconfig = itask.tdef.rtconfig
+        rtconfig = poverlay(itask.tdef.rtconfig, overrides, prepend=True)
+        self._rtconfigs[key] = (itask.tdef, rtconfig)
         return rtconfig
 
     def load_db_broadcast_states(self, row_idx, row):
@@ -218,6 +248,7 @@ class BroadcastMgr:
                 dict_.setdefault(section, {})
                 dict_ = dict_[section]
             dict_[cur_key] = value
+            self._rtconfigs.clear()
         LOG.info(CHANGE_FMT.strip() % {
             "change": CHANGE_PREFIX_SET,
             "point": point,
@@ -243,6 +274,7 @@ class BroadcastMgr:
                 BroadcastConfigValidator().validate(
                     settings, SPEC['runtime']['__MANY__']
                 )
+        self._rtconfigs.clear()
 
     def _match_ext_trigger(self, itask):
         """Match external triggers for a waiting task proxy."""
@@ -366,6 +398,9 @@ class BroadcastMgr:
                                 coerced_setting,
                             )
 
+        if modified_settings:
+            self._rtconfigs.clear()
+
         # Log the broadcast
         self.workflow_db_mgr.put_broadcast(modified_settings)
         LOG.info(get_broadcast_change_report(modified_settings))
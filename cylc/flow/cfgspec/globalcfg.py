@@ -889,6 +889,55 @@ with Conf('global.cylc', desc='''
 
                Moved into the ``[scheduler]`` section from the top level.
         ''')
+        Conf('xtrigger pool size', VDR.V_INTEGER, 0, desc='''
+            Run xtrigger functions in this many long-lived worker processes.
+
+            By default each xtrigger function call is run as a new
+            subprocess (``cylc function-run``) in the process pool. This
+            requires a new Python interpreter to be started and the xtrigger
+            module to be imported for every call, which can be costly for
+            workflows which check many xtriggers frequently.
+
+            If set to a number greater than zero, xtrigger functions are
+            instead run by a dedicated pool of this many worker processes
+            which are started as required and kept for the lifetime of the
+            scheduler. Workers share no state with the scheduler. Calls which
+            exceed the ``process pool timeout`` are killed along with their
+            worker (which is then replaced). Xtrigger functions may be
+            ``async`` when run in this way.
+
+            .. note::
+
+               Xtrigger modules are imported once by each worker, changes
+               to them will not be picked up until the workflow is
+               restarted.
+
+            .. seealso::
+
+               :ref:`Managing External Command Execution`.
+
+            .. versionadded:: 8.7.0
+        ''')
+        Conf('legacy data store checksums', VDR.V_BOOLEAN, True, desc='''
+            Publish data store updates with checksums for older clients.
+
+            Clients which subscribe to updates from the scheduler (e.g. the
+            UI Server and ``cylc tui``) use checksums to check that their
+            copy of the workflow data is consistent with the scheduler's.
+
+            Since Cylc 8.7.0 the scheduler also publishes checksums which it
+            maintains incrementally, which is much cheaper for large
+            workflows. Clients which do not support these expect checksums
+            which must be generated from all of the workflow's data each
+            time it is updated. Without these they will repeatedly request
+            the full workflow data.
+
+            Set this to ``False`` to stop publishing the older checksums if
+            all clients subscribing to the scheduler support the incremental
+            checksums (e.g. ``cylc tui`` from Cylc 8.7.0).
+
+            .. versionadded:: 8.7.0
+        ''')
         Conf('auto restart delay', VDR.V_INTERVAL, desc=f'''
             Maximum number of seconds the auto-restart mechanism will delay
             before restarting workflows.
@@ -1220,6 +1269,55 @@ with Conf('global.cylc', desc='''
                 )
             )
 
+        with Conf('database', desc='''
+            Settings for the workflow run databases.
+
+            The scheduler maintains a private database (in the workflow
+            ``.service`` directory) and a public database (in the workflow
+            ``log`` directory) which is read by other Cylc commands.
+
+            .. versionadded:: 8.7.0
+        '''):
+            Conf('persistent connections', VDR.V_BOOLEAN, False, desc='''
+                Keep connections to the workflow databases open for the
+                lifetime of the scheduler.
+
+                By default the scheduler reconnects to the databases each
+                time it writes to them. Turning this setting on avoids the
+                cost of re-opening the database files and re-preparing SQL
+                statements which can be significant on network filesystems.
+
+                Persistent connections use SQLite's `write-ahead logging
+                <https://www.sqlite.org/wal.html>`_ journal mode.
+
+                .. warning::
+
+                   Write-ahead logging requires that all processes reading
+                   a database are on the same host. Do not turn this on if
+                   other hosts read the public workflow database (e.g. via
+                   ``cylc workflow-state`` or ``workflow_state`` xtriggers).
+
+                .. versionadded:: 8.7.0
+            ''')
+            Conf('asynchronous public database', VDR.V_BOOLEAN, False,
+                 desc='''
+                Write to the public database in a background thread.
+
+                By default the scheduler writes each change to both the
+                private and public databases before continuing. Turning this
+                setting on moves the public database writes off of the
+                scheduler's main loop so that slow writes (e.g. on a loaded
+                filesystem) or external readers of the public database (e.g.
+                ``cylc workflow-state``) do not hold up the scheduler.
+
+                Changes are written to the public database in batches so it
+                may lag slightly behind the private database. If the public
+                database cannot be written to (e.g. because it is locked),
+                it will be recovered from a snapshot of the private database.
+
+                .. versionadded:: 8.7.0
+            ''')
+
         with Conf('main loop', desc=(
             default_for(
                 MAIN_LOOP_DESCR, "[scheduler][main loop]", section=True
@@ -1251,6 +1349,39 @@ with Conf('global.cylc', desc='''
 
                     .. versionadded:: 8.0.0
             ''')
+            Conf('event driven', VDR.V_BOOLEAN, False, desc='''
+                Wake the main loop as soon as there is something to do.
+
+                By default the scheduler main loop runs on a fixed interval.
+                If this setting is turned on the main loop will instead sleep
+                until one of these events occurs:
+
+                * A task message is received.
+                * A command is received (e.g. ``cylc trigger``).
+                * An external trigger is received.
+                * A workflow timer or task event handler timer is due.
+                * A task retry, clock trigger or xtrigger function call is
+                  due.
+                * The :cylc:conf:`[..]maximum idle interval` elapses.
+
+                This reduces the latency between (for example) a task
+                message arriving and downstream tasks being queued.
+
+                .. versionadded:: 8.7.0
+            ''')
+            Conf('maximum idle interval', VDR.V_INTERVAL, DurationFloat(1),
+                 desc='''
+                The maximum time the main loop will sleep for when
+                :cylc:conf:`[..]event driven` is turned on.
+
+                Events which do not wake the main loop (e.g. main loop
+                plugins falling due) may be delayed by up to this interval.
+
+                Increasing this interval reduces the CPU usage of idle
+                schedulers.
+
+                .. versionadded:: 8.7.0
+            ''')
 
             with Conf('<plugin name>', desc=(
                 default_for(
@@ -1587,6 +1718,48 @@ with Conf('global.cylc', desc='''
 
                    {REPLACES}``global.rc[hosts][<host>]ssh command``.
             ''')
+            Conf('share ssh connections', VDR.V_BOOLEAN, False, desc='''
+                Reuse SSH connections to this platform's hosts.
+
+                If ``True``, the scheduler keeps a connection open to each
+                host it runs commands on (job submission, polling and
+                killing, remote init and tidy, file installation and
+                job log retrieval) and runs its commands over it, rather
+                than opening a new connection for each command. This can
+                reduce the latency of these commands and avoid site limits
+                on the rate of SSH connections.
+
+                The connections are checked periodically and closed when the
+                scheduler shuts down or when a host is found to be
+                unreachable.
+
+                This uses OpenSSH connection multiplexing (the
+                ``ControlMaster``, ``ControlPath`` and ``ControlPersist``
+                options) so requires the
+                :cylc:conf:`[..]ssh command` to be OpenSSH.
+
+                .. versionadded:: 8.7.0
+            ''')
+            Conf('use job agent', VDR.V_BOOLEAN, False, desc='''
+                Submit, poll and kill jobs through a long-lived agent process.
+
+                If ``True``, the scheduler starts a ``cylc jobs-agent``
+                process on one of this platform's hosts once the remote
+                install target has been initialised. Job submission, poll
+                and kill commands are sent to the agent rather than starting a
+                new ``cylc`` process on the remote host for each command,
+                avoiding the cost of starting Python each time.
+
+                The agent runs one command at a time. It is replaced if it
+                exits or its host is found to be unreachable and stopped when
+                the scheduler shuts down.
+
+                This only applies to remote platforms. The platform hosts must
+                have a version of Cylc installed which provides
+                ``cylc jobs-agent``.
+
+                .. versionadded:: 8.7.0
+            ''')
             Conf('rsync command',
                  VDR.V_STRING,
                  'rsync',
@@ -97,6 +97,7 @@ from cylc.flow.parsec.exceptions import ItemNotFoundError
 from cylc.flow.parsec.upgrade import upgrader
 from cylc.flow.parsec.util import (
     dequote,
+    poverlay,
     replicate,
 )
 from cylc.flow.pathutil import (
@@ -1517,39 +1518,40 @@ class WorkflowConfig:
     def compute_inheritance(self):
         LOG.debug("Parsing the runtime namespace hierarchy")
 
-        # TODO: Note an unused alternative mechanism was removed here
-        # (March 2020). It stored the result of each completed MRO and
-        # re-used these wherever possible. This could be more efficient
-        # for full namespaces in deep hierarchies. We should go back and
-        # look if inheritance computation becomes a problem.
-
         results = OrderedDictWithDefaults()
 
+        # The result of inheriting each tail of each linearized MRO.
+        # Namespaces with common ancestors re-use these results and share
+        # any sections which they don't override (so must not modify
+        # sections in-place).
+        inherited = {(): OrderedDictWithDefaults()}
+
         # Loop through runtime members, 'root' first.
         nses = list(self.cfg['runtime'])
         nses.sort(key=lambda ns: ns != 'root')
         for ns in nses:
             # for each namespace ...
+            hierarchy = tuple(self.runtime['linearized ancestors'][ns])
+
+            # Go up the linearized MRO from root, overriding each namespace
+            # element as we go.
+            for ind in reversed(range(len(hierarchy))):
+                if hierarchy[ind:] not in inherited:
+                    inherited[hierarchy[ind:]] = poverlay(
+                        inherited[hierarchy[ind + 1:]],
+                        self.cfg['runtime'][hierarchy[ind]],
+                    )
 
-            hierarchy = copy(self.runtime['linearized ancestors'][ns])
-            hierarchy.reverse()
-
-            result = OrderedDictWithDefaults()
-
-            # Go up the linearized MRO from root, replicating or
-            # overriding each namespace element as we go.
-            for name in hierarchy:
-                replicate(result, self.cfg['runtime'][name])
-                # n_reps += 1
-
+            result = inherited[hierarchy]
+            if result is inherited[hierarchy[1:]]:
+                # nothing is set in this namespace, it still needs its own
+                # top-level section
+                result = OrderedDictWithDefaults(result)
             results[ns] = result
 
         # replace pre-inheritance namespaces with the post-inheritance result
         self.cfg['runtime'] = results
 
-        # uncomment this to compare the simple and efficient methods
-        # print '  Number of namespace replications:', n_reps
-
     # def print_inheritance(self):
     #     # (use for debugging)
     #     for foo in self.runtime:
@@ -2743,8 +2745,9 @@ class WorkflowConfig:
         self.cfg['meta']['URL'] = RE_WORKFLOW_ID_VAR.sub(
             self.workflow, self.cfg['meta']['URL'])
         for name, cfg in self.cfg['runtime'].items():
+            task_url = cfg['meta']['URL']
             try:
-                cfg['meta']['URL'] = cfg['meta']['URL'] % {
+                task_url = task_url % {
                     'workflow': self.workflow,
                     'task': name,
                 }
@@ -2759,7 +2762,7 @@ class WorkflowConfig:
                 # remove at:
                 #     Cylc8.x
                 try:
-                    cfg['meta']['URL'] = cfg['meta']['URL'] % {
+                    task_url = task_url % {
                         # cylc 7
                         'suite_name': self.workflow,
                         'task_name': name,
@@ -2777,10 +2780,11 @@ class WorkflowConfig:
                         f' [runtime][{name}][meta]URL.'
                         '\nSee the configuration documentation for details.'
                     )
-            cfg['meta']['URL'] = RE_WORKFLOW_ID_VAR.sub(
-                self.workflow, cfg['meta']['URL'])
-            cfg['meta']['URL'] = RE_TASK_NAME_VAR.sub(
-                name, cfg['meta']['URL'])
+            task_url = RE_WORKFLOW_ID_VAR.sub(self.workflow, task_url)
+            task_url = RE_TASK_NAME_VAR.sub(name, task_url)
+            if task_url != cfg['meta']['URL']:
+                # (the [meta] section may be shared with other namespaces)
+                cfg['meta'] = poverlay(cfg['meta'], {'URL': task_url})
 
     @staticmethod
     def check_for_owner(tasks: Dict) -> None:
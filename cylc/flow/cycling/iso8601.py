@@ -16,8 +16,11 @@
 
 """Date-time cycling by point, interval, and sequence classes."""
 
+from bisect import bisect_right
 import contextlib
+from datetime import date
 from functools import lru_cache
+from itertools import accumulate
 import os
 import re
 from typing import TYPE_CHECKING, List, Optional, Tuple
@@ -94,27 +97,169 @@ class WorkflowSpecifics:
         'TimePointParser', 'DurationParser', 'TimeRecurrenceParser'
     ]
     NUM_EXPANDED_YEAR_DIGITS: int = 0
+    # None if points are not written in the default format
+    compact_format: Optional['CompactFormat'] = None
+
+
+class CompactFormat:
+    """Convert points in the default format to and from integers.
+
+    Points written in the default dump format ("CCYYMMDDThhmm" followed by
+    the workflow time zone) can be represented by the number of minutes
+    since the start of the calendar (in the workflow time zone). This allows
+    them to be compared and offset by exact intervals without parsing them
+    with isodatetime.
+
+    Examples:
+        >>> compact = CompactFormat('Z')
+        >>> compact.to_minutes('20000101T0000Z')
+        1051372800
+        >>> compact.to_string(1051372800 + 90)
+        '20000101T0130Z'
+        >>> compact.to_minutes('20000101T0000+13') is None
+        True
+
+    """
+
+    __slots__ = (
+        'mode', 'time_zone', 'point_rec', 'days_in_year', 'month_offsets',
+    )
+
+    def __init__(self, time_zone: str):
+        self.mode = CALENDAR.mode
+        self.time_zone = time_zone
+        self.point_rec = re.compile(
+            r'(\d{4})(\d{2})(\d{2})T(\d{2})(\d{2})' + re.escape(time_zone)
+        )
+        self.days_in_year: Optional[int] = None
+        self.month_offsets: Tuple[int, ...] = ()
+        if self.mode != Calendar.MODE_GREGORIAN:
+            # all years are the same length (e.g. 360 day calendar)
+            self.days_in_year = sum(CALENDAR.DAYS_IN_MONTHS)
+            self.month_offsets = (
+                0, *accumulate(CALENDAR.DAYS_IN_MONTHS[:-1])
+            )
+
+    def to_minutes(self, point_string: str) -> Optional[int]:
+        """Return a point string as minutes, None if not in this format."""
+        match = self.point_rec.fullmatch(point_string)
+        if not match:
+            return None
+        year, month, day, hour, minute = map(int, match.groups())
+        if hour > 23 or minute > 59:
+            return None
+        if self.days_in_year is None:
+            # Gregorian calendar
+            try:
+                days = date(year, month, day).toordinal()
+            except ValueError:
+                return None
+        elif 1 <= month <= 12 and 1 <= day <= CALENDAR.DAYS_IN_MONTHS[
+            month - 1
+        ]:
+            days = (
+                year * self.days_in_year + self.month_offsets[month - 1]
+                + day - 1
+            )
+        else:
+            return None
+        return (days * 24 + hour) * 60 + minute
+
+    def to_string(self, minutes: int) -> Optional[str]:
+        """Return minutes as a point string, None if not in this format."""
+        days, minutes = divmod(minutes, 24 * 60)
+        if self.days_in_year is None:
+            # Gregorian calendar
+            try:
+                point_date = date.fromordinal(days)
+            except (ValueError, OverflowError):
+                return None
+            year, month, day = (
+                point_date.year, point_date.month, point_date.day
+            )
+        else:
+            year, day = divmod(days, self.days_in_year)
+            if not 0 <= year <= 9999:
+                return None
+            month = bisect_right(self.month_offsets, day)
+            day -= self.month_offsets[month - 1] - 1
+        hour, minute = divmod(minutes, 60)
+        return (
+            f'{year:04d}{month:02d}{day:02d}T{hour:02d}{minute:02d}'
+            f'{self.time_zone}'
+        )
+
+
+def _get_compact_format() -> Optional[CompactFormat]:
+    """Return the compact format for points, if points can use it."""
+    compact = WorkflowSpecifics.compact_format
+    if compact is not None and compact.mode == CALENDAR.mode:
+        return compact
+    return None
 
 
 class ISO8601Point(PointBase):
 
-    """A single point in an ISO8601 date time sequence."""
+    """A single point in an ISO8601 date time sequence.
+
+    Points in the default format also hold their value as an integer (see
+    CompactFormat) which is used for comparison and arithmetic with exact
+    intervals. Other operations are performed with isodatetime.
+    """
 
     TYPE = CYCLER_TYPE_ISO8601
     TYPE_SORT_KEY = CYCLER_TYPE_SORT_KEY_ISO8601
 
-    __slots__ = ('value')
+    __slots__ = ('_compact', '_minutes')
+    _compact: Optional[CompactFormat]
+    _minutes: Optional[int]
 
     @classmethod
     def from_nonstandard_string(cls, point_string):
         """Standardise a date-time string."""
         return ISO8601Point(str(point_parse(point_string))).standardise()
 
+    def _get_minutes(self) -> Optional[int]:
+        """Return the value as an integer, None if not in compact format."""
+        compact = _get_compact_format()
+        if compact is None:
+            return None
+        if getattr(self, '_compact', None) is compact:
+            # already computed
+            return self._minutes
+        self._compact = compact
+        self._minutes = compact.to_minutes(self.value)
+        return self._minutes
+
+    @staticmethod
+    def _from_minutes(minutes: int) -> Optional['ISO8601Point']:
+        """Return a point from an integer, None if not in compact format."""
+        compact = _get_compact_format()
+        if compact is None:
+            return None
+        value = compact.to_string(minutes)
+        if value is None:
+            return None
+        point = ISO8601Point(value)
+        point._compact = compact
+        point._minutes = minutes
+        return point
+
+    def _add_minutes(self, interval_string: str, sign: int):
+        """Return self offset by an exact interval, None if not possible."""
+        minutes = self._get_minutes()
+        if minutes is None:
+            return None
+        offset = _interval_minutes(interval_string)
+        if offset is None:
+            return None
+        return self._from_minutes(minutes + sign * offset)
+
     def add(self, other):
         """Add an Interval to self."""
-        return ISO8601Point(self._iso_point_add(
-            self.value, other.value, CALENDAR.mode
-        ))
+        return self._add_minutes(other.value, 1) or ISO8601Point(
+            self._iso_point_add(self.value, other.value, CALENDAR.mode)
+        )
 
     def standardise(self, allow_truncated=True):
         """Reformat self.value into a standard representation."""
@@ -127,6 +272,7 @@ class ISO8601Point(PointBase):
                     'Truncated ISO8601 dates are not permitted',
                 )
             self.value = str(point_parse(self.value))
+            self._compact = None
         except IsodatetimeError as exc:
             if self.value.startswith("+") or self.value.startswith("-"):
                 message = WARNING_PARSE_EXPANDED_YEAR_DIGITS % (
@@ -139,12 +285,20 @@ class ISO8601Point(PointBase):
     def sub(self, other):
         """Subtract a Point or Interval from self."""
         if isinstance(other, ISO8601Point):
+            minutes = self._get_minutes()
+            other_minutes = other._get_minutes()
+            if minutes is not None and other_minutes is not None:
+                return ISO8601Interval(
+                    _minutes_interval(minutes - other_minutes)
+                )
             return ISO8601Interval(self._iso_point_sub_point(
                 self.value, other.value, CALENDAR.mode
             ))
-        return ISO8601Point(self._iso_point_sub_interval(
-            self.value, other.value, CALENDAR.mode
-        ))
+        return self._add_minutes(other.value, -1) or ISO8601Point(
+            self._iso_point_sub_interval(
+                self.value, other.value, CALENDAR.mode
+            )
+        )
 
     @staticmethod
     @lru_cache(_LRU_CACHE_SIZE)
@@ -155,6 +309,10 @@ class ISO8601Point(PointBase):
         return str(point + interval)
 
     def _cmp(self, other: 'ISO8601Point') -> int:
+        minutes = self._get_minutes()
+        other_minutes = other._get_minutes()
+        if minutes is not None and other_minutes is not None:
+            return cmp(minutes, other_minutes)
         return self._iso_point_cmp(self.value, other.value, CALENDAR.mode)
 
     @staticmethod
@@ -915,6 +1073,10 @@ def init(num_expanded_year_digits=0, custom_dump_format=None, time_zone=None,
                 ('cylc', 'cycle point format'),
                 WorkflowSpecifics.DUMP_FORMAT
             )
+    if WorkflowSpecifics.DUMP_FORMAT == DATE_TIME_FORMAT + time_zone:
+        WorkflowSpecifics.compact_format = CompactFormat(time_zone)
+    else:
+        WorkflowSpecifics.compact_format = None
 
     WorkflowSpecifics.iso8601_parsers = CylcTimeParser.initiate_parsers(
         dump_format=WorkflowSpecifics.DUMP_FORMAT,
@@ -980,6 +1142,42 @@ def is_offset_absolute(offset_string):
         return False
 
 
+@lru_cache(_LRU_CACHE_SIZE)
+def _interval_minutes(interval_string: str) -> Optional[int]:
+    """Return an exact interval in whole minutes, else None."""
+    duration = interval_parse(interval_string)
+    if not duration.is_exact():
+        return None
+    seconds = duration.get_seconds()
+    if seconds % 60:
+        return None
+    return int(seconds // 60)
+
+
+@lru_cache(_LRU_CACHE_SIZE)
+def _minutes_interval(minutes: int) -> str:
+    """Return a number of minutes as an interval string.
+
+    This matches the result of subtracting one point from another with
+    isodatetime.
+
+    Examples:
+        >>> _minutes_interval(0)
+        'P0Y'
+        >>> _minutes_interval(1830)
+        'P1DT6H30M'
+        >>> _minutes_interval(-1830)
+        '-P1DT6H30M'
+
+    """
+    days, remainder = divmod(abs(minutes), 24 * 60)
+    hours, remainder = divmod(remainder, 60)
+    duration = Duration(days=days, hours=hours, minutes=remainder, seconds=0)
+    if minutes < 0:
+        duration = -1 * duration
+    return str(duration)
+
+
 @lru_cache(_LRU_CACHE_SIZE)
 def _interval_parse(interval_string):
     """Parse an interval_string into a proper Duration object."""
@@ -528,100 +528,112 @@ class PbEntireWorkflow(_message.Message):
     def __init__(self, workflow: _Optional[_Union[PbWorkflow, _Mapping]] = ..., tasks: _Optional[_Iterable[_Union[PbTask, _Mapping]]] = ..., task_proxies: _Optional[_Iterable[_Union[PbTaskProxy, _Mapping]]] = ..., jobs: _Optional[_Iterable[_Union[PbJob, _Mapping]]] = ..., families: _Optional[_Iterable[_Union[PbFamily, _Mapping]]] = ..., family_proxies: _Optional[_Iterable[_Union[PbFamilyProxy, _Mapping]]] = ..., edges: _Optional[_Iterable[_Union[PbEdge, _Mapping]]] = ...) -> None: ...
 
 class EDeltas(_message.Message):
-    __slots__ = ("time", "checksum", "added", "updated", "pruned", "reloaded")
+    __slots__ = ("time", "checksum", "added", "updated", "pruned", "reloaded", "incremental_checksum")
     TIME_FIELD_NUMBER: _ClassVar[int]
     CHECKSUM_FIELD_NUMBER: _ClassVar[int]
     ADDED_FIELD_NUMBER: _ClassVar[int]
     UPDATED_FIELD_NUMBER: _ClassVar[int]
     PRUNED_FIELD_NUMBER: _ClassVar[int]
     RELOADED_FIELD_NUMBER: _ClassVar[int]
+    INCREMENTAL_CHECKSUM_FIELD_NUMBER: _ClassVar[int]
     time: float
     checksum: int
     added: _containers.RepeatedCompositeFieldContainer[PbEdge]
     updated: _containers.RepeatedCompositeFieldContainer[PbEdge]
     pruned: _containers.RepeatedScalarFieldContainer[str]
     reloaded: bool
-    def __init__(self, time: _Optional[float] = ..., checksum: _Optional[int] = ..., added: _Optional[_Iterable[_Union[PbEdge, _Mapping]]] = ..., updated: _Optional[_Iterable[_Union[PbEdge, _Mapping]]] = ..., pruned: _Optional[_Iterable[str]] = ..., reloaded: bool = ...) -> None: ...
+    incremental_checksum: int
+    def __init__(self, time: _Optional[float] = ..., checksum: _Optional[int] = ..., added: _Optional[_Iterable[_Union[PbEdge, _Mapping]]] = ..., updated: _Optional[_Iterable[_Union[PbEdge, _Mapping]]] = ..., pruned: _Optional[_Iterable[str]] = ..., reloaded: bool = ..., incremental_checksum: _Optional[int] = ...) -> None: ...
 
 class FDeltas(_message.Message):
-    __slots__ = ("time", "checksum", "added", "updated", "pruned", "reloaded")
+    __slots__ = ("time", "checksum", "added", "updated", "pruned", "reloaded", "incremental_checksum")
     TIME_FIELD_NUMBER: _ClassVar[int]
     CHECKSUM_FIELD_NUMBER: _ClassVar[int]
     ADDED_FIELD_NUMBER: _ClassVar[int]
     UPDATED_FIELD_NUMBER: _ClassVar[int]
     PRUNED_FIELD_NUMBER: _ClassVar[int]
     RELOADED_FIELD_NUMBER: _ClassVar[int]
+    INCREMENTAL_CHECKSUM_FIELD_NUMBER: _ClassVar[int]
     time: float
     checksum: int
     added: _containers.RepeatedCompositeFieldContainer[PbFamily]
     updated: _containers.RepeatedCompositeFieldContainer[PbFamily]
     pruned: _containers.RepeatedScalarFieldContainer[str]
     reloaded: bool
-    def __init__(self, time: _Optional[float] = ..., checksum: _Optional[int] = ..., added: _Optional[_Iterable[_Union[PbFamily, _Mapping]]] = ..., updated: _Optional[_Iterable[_Union[PbFamily, _Mapping]]] = ..., pruned: _Optional[_Iterable[str]] = ..., reloaded: bool = ...) -> None: ...
+    incremental_checksum: int
+    def __init__(self, time: _Optional[float] = ..., checksum: _Optional[int] = ..., added: _Optional[_Iterable[_Union[PbFamily, _Mapping]]] = ..., updated: _Optional[_Iterable[_Union[PbFamily, _Mapping]]] = ..., pruned: _Optional[_Iterable[str]] = ..., reloaded: bool = ..., incremental_checksum: _Optional[int] = ...) -> None: ...
 
 class FPDeltas(_message.Message):
-    __slots__ = ("time", "checksum", "added", "updated", "pruned", "reloaded")
+    __slots__ = ("time", "checksum", "added", "updated", "pruned", "reloaded", "incremental_checksum")
     TIME_FIELD_NUMBER: _ClassVar[int]
     CHECKSUM_FIELD_NUMBER: _ClassVar[int]
     ADDED_FIELD_NUMBER: _ClassVar[int]
     UPDATED_FIELD_NUMBER: _ClassVar[int]
     PRUNED_FIELD_NUMBER: _ClassVar[int]
     RELOADED_FIELD_NUMBER: _ClassVar[int]
+    INCREMENTAL_CHECKSUM_FIELD_NUMBER: _ClassVar[int]
     time: float
     checksum: int
     added: _containers.RepeatedCompositeFieldContainer[PbFamilyProxy]
     updated: _containers.RepeatedCompositeFieldContainer[PbFamilyProxy]
     pruned: _containers.RepeatedScalarFieldContainer[str]
     reloaded: bool
-    def __init__(self, time: _Optional[float] = ..., checksum: _Optional[int] = ..., added: _Optional[_Iterable[_Union[PbFamilyProxy, _Mapping]]] = ..., updated: _Optional[_Iterable[_Union[PbFamilyProxy, _Mapping]]] = ..., pruned: _Optional[_Iterable[str]] = ..., reloaded: bool = ...) -> None: ...
+    incremental_checksum: int
+    def __init__(self, time: _Optional[float] = ..., checksum: _Optional[int] = ..., added: _Optional[_Iterable[_Union[PbFamilyProxy, _Mapping]]] = ..., updated: _Optional[_Iterable[_Union[PbFamilyProxy, _Mapping]]] = ..., pruned: _Optional[_Iterable[str]] = ..., reloaded: bool = ..., incremental_checksum: _Optional[int] = ...) -> None: ...
 
 class JDeltas(_message.Message):
-    __slots__ = ("time", "checksum", "added", "updated", "pruned", "reloaded")
+    __slots__ = ("time", "checksum", "added", "updated", "pruned", "reloaded", "incremental_checksum")
     TIME_FIELD_NUMBER: _ClassVar[int]
     CHECKSUM_FIELD_NUMBER: _ClassVar[int]
     ADDED_FIELD_NUMBER: _ClassVar[int]
     UPDATED_FIELD_NUMBER: _ClassVar[int]
     PRUNED_FIELD_NUMBER: _ClassVar[int]
     RELOADED_FIELD_NUMBER: _ClassVar[int]
+    INCREMENTAL_CHECKSUM_FIELD_NUMBER: _ClassVar[int]
     time: float
     checksum: int
     added: _containers.RepeatedCompositeFieldContainer[PbJob]
     updated: _containers.RepeatedCompositeFieldContainer[PbJob]
     pruned: _containers.RepeatedScalarFieldContainer[str]
     reloaded: bool
-    def __init__(self, time: _Optional[float] = ..., checksum: _Optional[int] = ..., added: _Optional[_Iterable[_Union[PbJob, _Mapping]]] = ..., updated: _Optional[_Iterable[_Union[PbJob, _Mapping]]] = ..., pruned: _Optional[_Iterable[str]] = ..., reloaded: bool = ...) -> None: ...
+    incremental_checksum: int
+    def __init__(self, time: _Optional[float] = ..., checksum: _Optional[int] = ..., added: _Optional[_Iterable[_Union[PbJob, _Mapping]]] = ..., updated: _Optional[_Iterable[_Union[PbJob, _Mapping]]] = ..., pruned: _Optional[_Iterable[str]] = ..., reloaded: bool = ..., incremental_checksum: _Optional[int] = ...) -> None: ...
 
 class TDeltas(_message.Message):
-    __slots__ = ("time", "checksum", "added", "updated", "pruned", "reloaded")
+    __slots__ = ("time", "checksum", "added", "updated", "pruned", "reloaded", "incremental_checksum")
     TIME_FIELD_NUMBER: _ClassVar[int]
     CHECKSUM_FIELD_NUMBER: _ClassVar[int]
     ADDED_FIELD_NUMBER: _ClassVar[int]
     UPDATED_FIELD_NUMBER: _ClassVar[int]
     PRUNED_FIELD_NUMBER: _ClassVar[int]
     RELOADED_FIELD_NUMBER: _ClassVar[int]
+    INCREMENTAL_CHECKSUM_FIELD_NUMBER: _ClassVar[int]
     time: float
     checksum: int
     added: _containers.RepeatedCompositeFieldContainer[PbTask]
     updated: _containers.RepeatedCompositeFieldContainer[PbTask]
     pruned: _containers.RepeatedScalarFieldContainer[str]
     reloaded: bool
-    def __init__(self, time: _Optional[float] = ..., checksum: _Optional[int] = ..., added: _Optional[_Iterable[_Union[PbTask, _Mapping]]] = ..., updated: _Optional[_Iterable[_Union[PbTask, _Mapping]]] = ..., pruned: _Optional[_Iterable[str]] = ..., reloaded: bool = ...) -> None: ...
+    incremental_checksum: int
+    def __init__(self, time: _Optional[float] = ..., checksum: _Optional[int] = ..., added: _Optional[_Iterable[_Union[PbTask, _Mapping]]] = ..., updated: _Optional[_Iterable[_Union[PbTask, _Mapping]]] = ..., pruned: _Optional[_Iterable[str]] = ..., reloaded: bool = ..., incremental_checksum: _Optional[int] = ...) -> None: ...
 
 class TPDeltas(_message.Message):
-    __slots__ = ("time", "checksum", "added", "updated", "pruned", "reloaded")
+    __slots__ = ("time", "checksum", "added", "updated", "pruned", "reloaded", "incremental_checksum")
     TIME_FIELD_NUMBER: _ClassVar[int]
     CHECKSUM_FIELD_NUMBER: _ClassVar[int]
     ADDED_FIELD_NUMBER: _ClassVar[int]
     UPDATED_FIELD_NUMBER: _ClassVar[int]
     PRUNED_FIELD_NUMBER: _ClassVar[int]
     RELOADED_FIELD_NUMBER: _ClassVar[int]
+    INCREMENTAL_CHECKSUM_FIELD_NUMBER: _ClassVar[int]
     time: float
     checksum: int
     added: _containers.RepeatedCompositeFieldContainer[PbTaskProxy]
     updated: _containers.RepeatedCompositeFieldContainer[PbTaskProxy]
     pruned: _containers.RepeatedScalarFieldContainer[str]
     reloaded: bool
-    def __init__(self, time: _Optional[float] = ..., checksum: _Optional[int] = ..., added: _Optional[_Iterable[_Union[PbTaskProxy, _Mapping]]] = ..., updated: _Optional[_Iterable[_Union[PbTaskProxy, _Mapping]]] = ..., pruned: _Optional[_Iterable[str]] = ..., reloaded: bool = ...) -> None: ...
+    incremental_checksum: int
+    def __init__(self, time: _Optional[float] = ..., checksum: _Optional[int] = ..., added: _Optional[_Iterable[_Union[PbTaskProxy, _Mapping]]] = ..., updated: _Optional[_Iterable[_Union[PbTaskProxy, _Mapping]]] = ..., pruned: _Optional[_Iterable[str]] = ..., reloaded: bool = ..., incremental_checksum: _Optional[int] = ...) -> None: ...
 
 class WDeltas(_message.Message):
     __slots__ = ("time", "added", "updated", "reloaded", "pruned")
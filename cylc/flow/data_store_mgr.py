@@ -69,6 +69,7 @@ from typing import (
     TYPE_CHECKING,
     Any,
     Dict,
+    Iterable,
     List,
     Literal,
     Optional,
@@ -81,6 +82,7 @@ from cylc.flow import (
     LOG,
     __version__ as CYLC_VERSION,
 )
+from cylc.flow.cfgspec.glbl_cfg import glbl_cfg
 from cylc.flow.cycling.loader import get_point
 from cylc.flow.data_messages_pb2 import (
     AllDeltas,
@@ -201,6 +203,9 @@ DELTAS_MAP = {
 
 DELTA_FIELDS = {DELTA_ADDED, DELTA_UPDATED, DELTA_PRUNED}
 
+# Protobuf wire type of length-delimited fields (e.g. embedded messages)
+WIRE_TYPE_LEN = 2
+
 JOB_STATUSES_ALL = [
     TASK_STATUS_SUBMITTED,
     TASK_STATUS_SUBMIT_FAILED,
@@ -243,6 +248,23 @@ RESET_PROTOBUF_TYPES = {
     WORKFLOW,
 }
 
+# Data types with checksums and the element field the checksum is made from
+CHECKSUM_ATTRS = {
+    EDGES: 'id',
+    FAMILIES: 'stamp',
+    FAMILY_PROXIES: 'stamp',
+    JOBS: 'stamp',
+    TASKS: 'stamp',
+    TASK_PROXIES: 'stamp',
+}
+
+# Data types with secondary indexes and the element fields they index, these
+# correspond to the query filters (see ElementIndex)
+INDEX_FIELDS = {
+    JOBS: ('state', 'cycle_point', 'name'),
+    TASK_PROXIES: ('state', 'cycle_point', 'name'),
+}
+
 # internal runtime to protobuf field name mapping
 RUNTIME_CFG_MAP_TO_FIELD = {
     'completion': 'completion',
@@ -316,6 +338,33 @@ def generate_checksum(in_strings):
     return zlib.adler32(''.join(sorted(in_strings)).encode()) & 0xffffffff
 
 
+def generate_incremental_checksum(in_strings):
+    """Generate a checksum from strings which can be updated incrementally.
+
+    The checksum is the sum of the checksums of the individual strings, so
+    it does not depend on their order and can be maintained incrementally
+    as strings are added and removed (see "checksum_item").
+
+    Examples:
+        >>> generate_incremental_checksum(['a', 'b']) == (
+        ...     generate_incremental_checksum(['b', 'a'])
+        ... )
+        True
+        >>> generate_incremental_checksum(['a', 'b']) == (
+        ...     (checksum_item('a') + checksum_item('b')) & 0xffffffff
+        ... )
+        True
+
+    """
+    return sum(map(checksum_item, in_strings)) & 0xffffffff
+
+
+def checksum_item(in_string: str) -> int:
+    """Return the contribution of a string to its collection's checksum."""
+    # can't use hash(), it's not the same across 32-64bit or python invocations
+    return zlib.crc32(in_string.encode())
+
+
 def task_mean_elapsed_time(tdef: 'TaskDef') -> float | None:
     """Calculate task mean elapsed time."""
     if tdef.elapsed_times:
@@ -413,6 +462,167 @@ def runtime_from_partial(rtconfig, runtimeold: Optional[PbRuntime] = None):
     return runtime
 
 
+def encode_varint(value: int) -> bytes:
+    """Encode a non-negative integer in the Protobuf varint format.
+
+    Examples:
+        >>> encode_varint(1)
+        b'\\x01'
+        >>> encode_varint(300)
+        b'\\xac\\x02'
+
+    """
+    buf = bytearray()
+    while True:
+        bits = value & 0x7f
+        value >>= 7
+        if not value:
+            buf.append(bits)
+            return bytes(buf)
+        buf.append(bits | 0x80)
+
+
+# Keys of the AllDeltas fields in field number order, these prefix the
+# serialised deltas in the serialised AllDeltas message
+ALL_DELTAS_FIELD_KEYS = {
+    field.name: encode_varint(field.number << 3 | WIRE_TYPE_LEN)
+    for field in sorted(AllDeltas.DESCRIPTOR.fields, key=lambda f: f.number)
+}
+
+
+def get_checksums(data: dict) -> Dict[str, int]:
+    """Return the checksums of the elements of a data-store by type."""
+    return {
+        key: generate_incremental_checksum(
+            getattr(element, attr) for element in data[key].values()
+        )
+        for key, attr in CHECKSUM_ATTRS.items()
+    }
+
+
+class ElementIndex:
+    """Secondary indexes of the data-store elements of a type.
+
+    Maps the values of selected element fields to the IDs of the elements
+    which have them, so that queries can select elements without checking
+    every element of the type.
+
+    The index is updated as deltas are applied (see apply_delta).
+
+    Attributes:
+        fields:
+            The indexes by field, {field: {value: {id, ...}}}.
+        order:
+            The position of each element in the data-store, used to return
+            selected elements in data-store order, {id: position}.
+
+    """
+
+    def __init__(self, fields: Tuple[str, ...]) -> None:
+        self.fields: Dict[str, Dict[str, Set[str]]] = {
+            field: {} for field in fields
+        }
+        self.order: Dict[str, int] = {}
+        self._count = 0
+
+    def add(self, elements: dict, ids: Iterable[str]) -> None:
+        """Index elements (removing any that are no longer present)."""
+        for id_ in ids:
+            element = elements.get(id_)
+            if element is None:
+                self.order.pop(id_, None)
+                continue
+            if id_ not in self.order:
+                self.order[id_] = self._count
+                self._count += 1
+            for field, index in self.fields.items():
+                index.setdefault(getattr(element, field), set()).add(id_)
+
+    def remove(self, elements: dict, ids: Iterable[str]) -> None:
+        """Remove elements from the field indexes."""
+        for id_ in ids:
+            element = elements.get(id_)
+            if element is None:
+                continue
+            for field, index in self.fields.items():
+                value = getattr(element, field)
+                index_ids = index.get(value)
+                if index_ids is not None:
+                    index_ids.discard(id_)
+                    if not index_ids:
+                        del index[value]
+
+    def select(self, field: str, values) -> Set[str]:
+        """Return the IDs of elements with any of the values of a field."""
+        index = self.fields[field]
+        return {
+            id_
+            for value in values
+            for id_ in index.get(value, ())
+        }
+
+    def sort(self, ids: Set[str]) -> List[str]:
+        """Return IDs in data-store order."""
+        return sorted(ids, key=self.order.__getitem__)
+
+
+def create_indexes() -> Dict[str, ElementIndex]:
+    """Return new (empty) secondary indexes for a data-store."""
+    return {
+        key: ElementIndex(fields)
+        for key, fields in INDEX_FIELDS.items()
+    }
+
+
+def get_delta_ids(delta: Any) -> List[str]:
+    """Return the IDs of the elements a delta touches.
+
+    The IDs are returned in the order they are added to the data-store.
+    """
+    return list(dict.fromkeys([
+        *(e.id for e in delta.added),
+        *(e.id for e in delta.updated),
+        *delta.pruned,
+    ]))
+
+
+def apply_checksummed_delta(
+    key: str,
+    delta: Any,
+    data: dict,
+    checksums: Dict[str, int],
+    indexes: Optional[Dict[str, ElementIndex]] = None,
+) -> None:
+    """Apply a delta and update the checksum of the data type it touches.
+
+    The checksum is updated incrementally from the elements touched by the
+    delta so the whole collection doesn't need to be checksummed again.
+
+    Args:
+        key: The data type of the delta.
+        delta: The delta to apply.
+        data: The data-store to apply the delta to.
+        checksums: The checksums of the data-store, updated in place.
+        indexes: The secondary indexes of the data-store, if any.
+
+    """
+    if key not in CHECKSUM_ATTRS:
+        apply_delta(key, delta, data, indexes)
+        return
+    s_att = CHECKSUM_ATTRS[key]
+    elements = data[key]
+    ids = get_delta_ids(delta)
+    checksum = checksums[key]
+    for id_ in ids:
+        if id_ in elements:
+            checksum -= checksum_item(getattr(elements[id_], s_att))
+    apply_delta(key, delta, data, indexes)
+    for id_ in ids:
+        if id_ in elements:
+            checksum += checksum_item(getattr(elements[id_], s_att))
+    checksums[key] = checksum & 0xffffffff
+
+
 def reset_protobuf_object(msg_class, msg_orig):
     """Reset upb-protobuf object to clear memory build-up."""
     # See: https://github.com/protocolbuffers/protobuf/issues/19674
@@ -422,8 +632,28 @@ def reset_protobuf_object(msg_class, msg_orig):
     return new_msg
 
 
-def apply_delta(key, delta, data):
-    """Apply delta to specific data-store workflow and type."""
+def apply_delta(key, delta, data, indexes=None):
+    """Apply delta to specific data-store workflow and type.
+
+    Args:
+        key: The data type of the delta.
+        delta: The delta to apply.
+        data: The data-store to apply the delta to.
+        indexes: The secondary indexes of the data-store, if any, these are
+            updated to reflect the delta.
+
+    """
+    index = indexes.get(key) if indexes else None
+    if index is None:
+        _apply_delta(key, delta, data)
+        return
+    ids = get_delta_ids(delta)
+    index.remove(data[key], ids)
+    _apply_delta(key, delta, data)
+    index.add(data[key], ids)
+
+
+def _apply_delta(key, delta, data):
     # Assimilate new data
     if getattr(delta, 'added', False):
         if key != WORKFLOW:
@@ -596,6 +826,12 @@ class DataStoreMgr:
                 Message containing the global information of the workflow.
         .descendants (dict):
             Local store of config.get_first_parent_descendants()
+        .generation (int):
+            Incremented whenever deltas are applied to the data store, so
+            anything derived from the data can tell whether it is stale.
+        .indexes (dict):
+            Secondary indexes of the data by workflow and type
+            (see ElementIndex).
         .n_edge_distance (int):
             Maximum distance of the data-store graph from the active pool.
         .parents (dict):
@@ -654,6 +890,24 @@ class DataStoreMgr:
         # internal delta
         self.delta_queues = {self.workflow_id: {}}
         self.publish_deltas = []
+        # checksums of the data-store elements by type, maintained
+        # incrementally as deltas are applied (see
+        # generate_incremental_checksum)
+        self.checksums: Dict[str, int] = dict.fromkeys(CHECKSUM_ATTRS, 0)
+        # BACK COMPAT: also publish checksums in the format expected by
+        # subscribers running older versions (see generate_checksum)
+        # from: 8.0.0
+        # to: 8.7.0
+        self.legacy_checksums: bool = glbl_cfg().get(
+            ['scheduler', 'legacy data store checksums']
+        )
+        # incremented each time deltas are applied to the data-store
+        self.generation = 0
+        # secondary indexes of the data-store elements by workflow and type,
+        # used to resolve filtered queries (see ElementIndex)
+        self.indexes: Dict[str, Dict[str, ElementIndex]] = {
+            self.workflow_id: create_indexes()
+        }
 
         # internal n-window
         self.all_task_pool = set()
@@ -697,7 +951,11 @@ class DataStoreMgr:
         """
         # Reset attributes/data-store on reload:
         if reloaded:
+            # the generation must keep increasing across reloads, else
+            # anything derived from the old data-store could pass as current
+            generation = self.generation
             self.__init__(self.schd, self.n_edge_distance)
+            self.generation = generation + 1
 
         # Static elements
         self.generate_definition_elements()
@@ -3025,9 +3283,16 @@ class DataStoreMgr:
     def apply_delta_batch(self):
         """Apply delta batch to local data-store."""
         data = self.data[self.workflow_id]
+        indexes = self.indexes[self.workflow_id]
+        applied = False
         for key, delta in self.deltas.items():
             if delta.ListFields():
-                apply_delta(key, delta, data)
+                apply_checksummed_delta(
+                    key, delta, data, self.checksums, indexes
+                )
+                applied = True
+        if applied:
+            self.generation += 1
 
     def apply_delta_checksum(self):
         """Construct checksum on deltas for export."""
@@ -3036,15 +3301,13 @@ class DataStoreMgr:
         for key, delta in self.deltas.items():
             if delta.ListFields():
                 delta.time = update_time
-                if hasattr(delta, 'checksum'):
-                    if key == EDGES:
-                        s_att = 'id'
-                    else:
-                        s_att = 'stamp'
-                    delta.checksum = generate_checksum(
-                        [getattr(e, s_att)
-                         for e in data[key].values()]
-                    )
+                if key in CHECKSUM_ATTRS:
+                    delta.incremental_checksum = self.checksums[key]
+                    if self.legacy_checksums:
+                        s_att = CHECKSUM_ATTRS[key]
+                        delta.checksum = generate_checksum(
+                            [getattr(e, s_att) for e in data[key].values()]
+                        )
 
     def clear_delta_batch(self):
         """Clear current deltas."""
@@ -3087,20 +3350,37 @@ class DataStoreMgr:
 
         return workflow_msg
 
-    def get_publish_deltas(self):
-        """Return deltas for publishing."""
-        all_deltas = DELTAS_MAP[ALL_DELTAS]()
-        result = []
-        for key, delta in self.deltas.items():
-            if delta.ListFields():
-                result.append(
-                    (key.encode('utf-8'), delta, 'SerializeToString'))
-                getattr(all_deltas, key).CopyFrom(delta)
-        result.append(
-            (ALL_DELTAS.encode('utf-8'), all_deltas, 'SerializeToString')
-        )
+    def get_publish_deltas(self) -> List[Tuple[bytes, bytes, None]]:
+        """Return deltas for publishing.
+
+        Each delta is serialised once. The serialised AllDeltas message is
+        assembled from the same buffers (an embedded message is encoded as
+        its field key and length followed by its own serialisation), so no
+        Protobuf messages are copied. The buffers are immutable so can be
+        handed to the publisher thread as they are.
+
+        Returns:
+            [(topic, serialised delta, None), ...]
+
+        """
+        buffers = {
+            key: delta.SerializeToString()
+            for key, delta in self.deltas.items()
+            if delta.ListFields()
+        }
+        all_deltas: List[bytes] = []
+        for key, field_key in ALL_DELTAS_FIELD_KEYS.items():
+            if key in buffers:
+                all_deltas.extend(
+                    (field_key, encode_varint(len(buffers[key])), buffers[key])
+                )
+        result: List[Tuple[bytes, bytes, None]] = [
+            (key.encode('utf-8'), buf, None)
+            for key, buf in buffers.items()
+        ]
+        result.append((ALL_DELTAS.encode('utf-8'), b''.join(all_deltas), None))
         self.publish_pending = True
-        return deepcopy(result)
+        return result
 
     def get_data_elements(self, element_type):
         """Get elements of a given type in the form of a delta.
@@ -0,0 +1,516 @@
+# THIS FILE IS PART OF THE CYLC WORKFLOW ENGINE.
+# Copyright (C) NIWA & British Crown (Met Office) & Contributors.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""Run job commands through long-lived agents on remote platforms.
+
+For platforms configured with ``use job agent = True``, the scheduler starts
+a ``cylc jobs-agent`` process on a platform host (over SSH) once the remote
+install target has been initialised. The ``jobs-submit``, ``jobs-poll`` and
+``jobs-kill`` commands for the platform are then sent to the agent rather
+than each starting a new ``cylc`` process on the remote host.
+
+Protocol (all over the SSH command's STDIN and STDOUT):
+
+* A request is a JSON line ``[request_id, argv, stdin_size]`` where ``argv``
+  is the job command line (e.g. ``["jobs-poll", "--", JOB-LOG-ROOT, ...]``),
+  followed by ``stdin_size`` bytes for the command's STDIN (the job files for
+  ``jobs-submit``).
+* The agent runs requests one at a time. It writes the command's output
+  (e.g. ``[TASK JOB SUMMARY]`` lines) followed by the line
+  ``[TASK JOB AGENT]request_id|ret_code|JSON-encoded-stderr``.
+* The agent exits when its STDIN is closed.
+"""
+
+from collections import deque
+from contextlib import (
+    redirect_stderr,
+    suppress,
+)
+from io import (
+    BytesIO,
+    StringIO,
+    TextIOWrapper,
+)
+import json
+from logging import DEBUG
+import os
+import selectors
+from signal import SIGKILL
+from subprocess import PIPE  # nosec
+import sys
+from time import time
+from traceback import print_exc
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from cylc.flow import LOG
+from cylc.flow.cylc_subproc import procopen
+from cylc.flow.remote import construct_ssh_cmd
+
+
+if TYPE_CHECKING:
+    from subprocess import Popen
+
+    from cylc.flow.ssh_pool import SSHConnectionPool
+
+
+JOBS_AGENT = 'jobs-agent'
+OUT_PREFIX_DONE = '[TASK JOB AGENT]'
+# The commands an agent can run.
+AGENT_COMMANDS = ('jobs-kill', 'jobs-poll', 'jobs-submit')
+
+
+def run_agent() -> None:
+    """Run job command requests read from STDIN until it is closed."""
+    stdin = sys.stdin.buffer
+    stdout = sys.stdout
+    while True:
+        line = stdin.readline()
+        if not line:
+            return
+        if not line.strip():
+            continue
+        try:
+            request_id, argv, stdin_size = json.loads(line)
+        except ValueError:
+            # the scheduler and agent are out of step, give up
+            sys.stderr.write(f'Invalid request: {line!r}\n')
+            sys.exit(1)
+        data = stdin.read(stdin_size)
+        # reap exited background jobs so "ps" doesn't report them as running
+        _reap()
+        err = StringIO()
+        with redirect_stderr(err):
+            ret_code = _run_request(argv, data)
+        stdout.write(
+            f'{OUT_PREFIX_DONE}{request_id}|{ret_code}'
+            f'|{json.dumps(err.getvalue())}\n'
+        )
+        stdout.flush()
+
+
+def _run_request(argv: List[str], data: bytes) -> int:
+    """Run a job command in this process, return its exit code."""
+    from cylc.flow.job_runner_mgr import JobRunnerManager
+    from cylc.flow.scripts import jobs_kill, jobs_poll, jobs_submit
+
+    stdin = sys.stdin
+    sys.stdin = TextIOWrapper(BytesIO(data))
+    try:
+        cmd_key, *args = argv
+        if cmd_key not in AGENT_COMMANDS:
+            raise ValueError(f'Invalid command: {cmd_key}')
+        if cmd_key == 'jobs-submit':
+            opts, args = jobs_submit.get_option_parser().parse_args(args)
+            JobRunnerManager(opts.clean_env, opts.env, opts.path).jobs_submit(
+                args[0],
+                args[1:],
+                remote_mode=opts.remote_mode,
+                utc_mode=opts.utc_mode,
+            )
+        elif cmd_key == 'jobs-poll':
+            _, args = jobs_poll.get_option_parser().parse_args(args)
+            JobRunnerManager().jobs_poll(args[0], args[1:])
+        else:
+            _, args = jobs_kill.get_option_parser().parse_args(args)
+            JobRunnerManager().jobs_kill(args[0], args[1:])
+    except SystemExit as exc:
+        # option parsing error
+        return exc.code if isinstance(exc.code, int) else 1
+    except Exception:
+        print_exc()
+        return 1
+    finally:
+        sys.stdin = stdin
+    return 0
+
+
+def _reap() -> None:
+    """Wait for any exited child processes."""
+    with suppress(ChildProcessError):
+        while os.waitpid(-1, os.WNOHANG)[0]:
+            pass
+
+
+class JobAgent:
+    """A "cylc jobs-agent" process on a remote host.
+
+    Requests are written to the agent's STDIN without blocking and its output
+    is read as it becomes available.
+
+    """
+
+    # max bytes of the agent's own STDERR to keep (e.g. SSH errors)
+    MAX_ERR = 65536
+
+    def __init__(self, platform: Dict[str, Any], host: str, cmd: List[str]):
+        self.platform_name: str = platform['name']
+        self.host = host
+        self.cmd = cmd
+        self.proc: 'Popen[bytes]' = procopen(
+            cmd,
+            stdin=PIPE,
+            stdoutpipe=True,
+            stderrpipe=True,
+            # Execute command as a process group leader,
+            # so we can use "os.killpg" to kill the whole group.
+            preexec_fn=os.setpgrp,
+        )
+        for handle in (self.proc.stdin, self.proc.stdout, self.proc.stderr):
+            os.set_blocking(handle.fileno(), False)  # type: ignore[union-attr]
+        # data waiting to be written to the agent
+        self.wbuf = bytearray()
+        # incomplete output line
+        self.rbuf = b''
+        # output of the current request
+        self.out: List[str] = []
+        self.err = ''
+        # requests sent to the agent
+        # [[request_id, ctx, bad_hosts, callback, ...], ...]
+        self.pending: deque = deque()
+
+    def send(self, request_id: int, argv: List[str], data: bytes) -> None:
+        """Queue a request to send to the agent."""
+        self.wbuf += json.dumps([request_id, argv, len(data)]).encode()
+        self.wbuf += b'\n'
+        self.wbuf += data
+        self.write()
+
+    def write(self) -> None:
+        """Write as much of the queued data as the agent will accept."""
+        if not self.wbuf or self.proc.stdin is None:
+            return
+        try:
+            written = os.write(self.proc.stdin.fileno(), self.wbuf)
+        except BlockingIOError:
+            return
+        except OSError:
+            # agent has exited, handled when its output is read
+            self.wbuf.clear()
+            return
+        del self.wbuf[:written]
+
+    def read(self) -> Tuple[List[Tuple[int, int, str, str]], bool]:
+        """Read the agent's output.
+
+        Returns:
+            (responses, alive)
+
+            responses:
+                [(request_id, ret_code, out, err), ...] for the requests
+                which have completed.
+            alive:
+                False if the agent has exited.
+
+        """
+        responses = []
+        alive = True
+        while self.proc.stderr is not None:
+            try:
+                data = os.read(self.proc.stderr.fileno(), 65536)
+            except BlockingIOError:
+                break
+            if not data:
+                break
+            self.err = (self.err + data.decode())[-self.MAX_ERR:]
+        while self.proc.stdout is not None:
+            try:
+                data = os.read(self.proc.stdout.fileno(), 65536)
+            except BlockingIOError:
+                break
+            if not data:
+                # EOF
+                alive = False
+                break
+            *lines, self.rbuf = (self.rbuf + data).split(b'\n')
+            for line in lines:
+                text = line.decode() + '\n'
+                if not text.startswith(OUT_PREFIX_DONE):
+                    self.out.append(text)
+                    continue
+                request_id, ret_code, err = (
+                    text[len(OUT_PREFIX_DONE):].split('|', 2)
+                )
+                responses.append((
+                    int(request_id),
+                    int(ret_code),
+                    ''.join(self.out),
+                    json.loads(err),
+                ))
+                self.out.clear()
+        return responses, alive
+
+    def stop(self, kill: bool = False) -> int:
+        """Stop the agent, return its exit code."""
+        if self.proc.stdin is not None:
+            with suppress(OSError):
+                self.proc.stdin.close()
+        if kill:
+            with suppress(ProcessLookupError, PermissionError):
+                os.killpg(self.proc.pid, SIGKILL)
+        for handle in (self.proc.stdout, self.proc.stderr):
+            if handle is not None:
+                handle.close()
+        return self.proc.wait()
+
+
+class JobAgentPool:
+    """Manage the job agents of a scheduler.
+
+    Agents are keyed by (platform name, install target). An agent is started
+    when first required and replaced if it exits or its host is found to be
+    unreachable.
+
+    Request results are returned in a SubProcContext in the same form as if
+    the command had been run with SSH, so the same callbacks can be used.
+
+    """
+
+    def __init__(
+        self,
+        timeout: float,
+        ssh_connections: 'Optional[SSHConnectionPool]' = None,
+    ):
+        self.timeout = timeout
+        self.ssh_connections = ssh_connections
+        self.agents: Dict[Tuple[str, str], JobAgent] = {}
+        # agents' STDOUT and STDERR, readable when there is output
+        self.selector = selectors.DefaultSelector()
+        # done requests for agents which have been stopped
+        self._done: List[list] = []
+        self._request_id = 0
+
+    def get(
+        self,
+        platform: Dict[str, Any],
+        host: str,
+        bad_hosts: Optional[Set[str]] = None,
+    ) -> Optional[JobAgent]:
+        """Return the agent for a platform, starting it if required.
+
+        Args:
+            platform:
+                The platform, returns None unless it uses job agents.
+            host:
+                The host to start the agent on if it is not running.
+            bad_hosts:
+                Replace the agent if it is running on one of these hosts.
+
+        """
+        if not platform.get('use job agent'):
+            return None
+        key = (platform['name'], platform['install target'])
+        agent = self.agents.get(key)
+        if agent and bad_hosts and agent.host in bad_hosts:
+            self._stop(key, 'host unreachable', 255)
+            agent = None
+        if agent is None:
+            cmd = [JOBS_AGENT]
+            if LOG.isEnabledFor(DEBUG):
+                cmd.append('--debug')
+            cmd = construct_ssh_cmd(
+                cmd,
+                platform,
+                host,
+                ssh_connections=self.ssh_connections,
+            )
+            try:
+                agent = JobAgent(platform, host, cmd)
+            except OSError as exc:
+                LOG.warning(
+                    f'Could not start job agent for {platform["name"]}'
+                    f' on {host}: {exc}'
+                )
+                return None
+            LOG.debug(f'Started job agent for {platform["name"]} on {host}')
+            self.agents[key] = agent
+            for handle in (agent.proc.stdout, agent.proc.stderr):
+                if handle is not None:
+                    self.selector.register(handle, selectors.EVENT_READ, key)
+        return agent
+
+    def put_command(
+        self,
+        agent: JobAgent,
+        ctx,
+        bad_hosts: Optional[Set[str]] = None,
+        callback: Optional[Callable] = None,
+        callback_args: Optional[list] = None,
+        callback_255: Optional[Callable] = None,
+        callback_255_args: Optional[list] = None,
+    ) -> None:
+        """Send a job command to an agent.
+
+        Args:
+            agent:
+                The agent to run the command.
+            ctx (cylc.flow.subprocctx.SubProcContext):
+                "ctx.cmd" is the cylc command to run (without "cylc",
+                e.g. ["jobs-poll", "--", JOB-LOG-ROOT, JOB-LOG-DIR]), STDIN is
+                read from "stdin_files".
+            bad_hosts, callback, callback_args, callback_255,
+            callback_255_args:
+                See SubProcPool.put_command.
+
+        """
+        argv = list(ctx.cmd)
+        data = b''
+        for file_ in ctx.cmd_kwargs.get('stdin_files') or []:
+            if hasattr(file_, 'read'):
+                data += file_.read()
+            else:
+                with open(file_, 'rb') as handle:
+                    data += handle.read()
+        ctx.cmd = [*agent.cmd, *argv]
+        ctx.host = agent.host
+        self._request_id += 1
+        # (reset when the agent starts running the request)
+        ctx.timeout = time() + self.timeout
+        agent.pending.append([
+            self._request_id, ctx, bad_hosts, callback, callback_args,
+            callback_255, callback_255_args
+        ])
+        agent.send(self._request_id, argv, data)
+
+    def is_not_done(self) -> bool:
+        """Return True if any requests have not completed."""
+        return bool(self._done) or any(
+            agent.pending for agent in self.agents.values()
+        )
+
+    def needs_polling(self) -> bool:
+        """Return True if any agents have data waiting to be written."""
+        return bool(self._done) or any(
+            agent.wbuf for agent in self.agents.values()
+        )
+
+    def get_next_timeout(self) -> Optional[float]:
+        """Return the time the next request will time out (if any)."""
+        return min(
+            (
+                agent.pending[0][1].timeout
+                for agent in self.agents.values()
+                if agent.pending
+            ),
+            default=None,
+        )
+
+    def process(self) -> List[list]:
+        """Send and receive requests.
+
+        Returns:
+            [[ctx, bad_hosts, callback, callback_args, callback_255,
+            callback_255_args], ...] for requests which have completed.
+
+        """
+        done, self._done = self._done, []
+        ready = {key.data for key, _ in self.selector.select(0)}
+        now = time()
+        for key, agent in list(self.agents.items()):
+            agent.write()
+            if key not in ready:
+                if agent.pending and now > agent.pending[0][1].timeout:
+                    self._stop(key, f'killed on timeout ({self.timeout})')
+                    done.extend(self._done)
+                    self._done.clear()
+                continue
+            responses, alive = agent.read()
+            for request_id, ret_code, out, err in responses:
+                if not agent.pending or agent.pending[0][0] != request_id:
+                    LOG.warning(
+                        f'Unexpected response from job agent on {agent.host}'
+                    )
+                    alive = False
+                    break
+                _, ctx, *callback = agent.pending.popleft()
+                ctx.ret_code = ret_code
+                ctx.out = out
+                ctx.err = err
+                done.append([ctx, *callback])
+                if agent.pending:
+                    agent.pending[0][1].timeout = now + self.timeout
+            if not alive:
+                self._stop(key, 'job agent exited')
+                done.extend(self._done)
+                self._done.clear()
+        return done
+
+    def stop(self, host: str) -> None:
+        """Stop the agents on a host (e.g. if it is unreachable)."""
+        for key, agent in list(self.agents.items()):
+            if agent.host == host:
+                self._stop(key, 'host unreachable', 255)
+
+    def _stop(
+        self,
+        key: Tuple[str, str],
+        reason: str,
+        ret_code: Optional[int] = None,
+    ) -> None:
+        """Stop an agent, fail its pending requests.
+
+        Args:
+            key:
+                The agent's key.
+            reason:
+                Why the agent was stopped, reported as the requests' error.
+            ret_code:
+                The exit code for the requests, defaults to that of the
+                agent (e.g. 255 if the SSH connection was lost).
+
+        """
+        agent = self.agents.pop(key)
+        for handle in (agent.proc.stdout, agent.proc.stderr):
+            if handle is not None:
+                with suppress(KeyError, ValueError):
+                    self.selector.unregister(handle)
+        agent_ret_code = agent.stop(kill=True)
+        if ret_code is None:
+            ret_code = agent_ret_code if agent_ret_code > 0 else 1
+        LOG.debug(
+            f'Stopped job agent for {agent.platform_name} on {agent.host}'
+            f' ({reason})'
+        )
+        for _, ctx, *callback in agent.pending:
+            ctx.ret_code = ret_code
+            ctx.out = ''
+            ctx.err = '\n'.join(filter(None, [agent.err.strip(), reason]))
+            self._done.append([ctx, *callback])
+        agent.pending.clear()
+
+    def terminate(self) -> List[list]:
+        """Stop all agents.
+
+        Returns:
+            [[ctx, bad_hosts, callback, ...], ...] for requests which have
+            not completed.
+
+        """
+        done, self._done = self._done, []
+        for key, agent in list(self.agents.items()):
+            pending = list(agent.pending)
+            agent.pending.clear()
+            self._stop(key, 'workflow stopping')
+            done.extend([ctx, *callback] for _, ctx, *callback in pending)
+        self._done.clear()
+        return done
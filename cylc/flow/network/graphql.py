@@ -19,18 +19,26 @@ GraphQL Middleware defined here also.
 
 """
 
+from collections import OrderedDict
+from functools import lru_cache
 from inspect import isclass
+import json
 import logging
 from typing import (
-    Any, Awaitable, Callable, TypeVar, Tuple, Dict, Union, cast
+    Any, Awaitable, Callable, TypeVar, Tuple, Dict, Optional, Union, cast
 )
 
 from graphene.utils.str_converters import to_snake_case
 from graphql import (
     ExecutionContext,
+    GraphQLError,
+    OperationDefinitionNode,
+    OperationType,
     TypeInfo,
     TypeInfoVisitor,
     Visitor,
+    parse,
+    print_ast,
     visit,
     get_named_type,
     is_introspection_type,
@@ -213,6 +221,135 @@ class CylcExecutionContext(ExecutionContext):
         return result
 
 
+@lru_cache(maxsize=256)
+def normalise_query(request_string: str) -> Optional[str]:
+    """Return the normalised form of a query document.
+
+    Documents which differ only in whitespace, comments or formatting have
+    the same normalised form.
+
+    Returns None if the document cannot be parsed or contains operations
+    other than queries (the results of which must not be cached).
+
+    Examples:
+        >>> normalise_query('{ workflows { id } }')
+        '{\\n  workflows {\\n    id\\n  }\\n}'
+        >>> normalise_query('''
+        ...     # comment
+        ...     {workflows{id}}
+        ... ''') == normalise_query('{ workflows { id } }')
+        True
+        >>> normalise_query('mutation { stop(workflows: []) { result } }')
+        >>> normalise_query('{ workflows {')
+
+    """
+    try:
+        document = parse(request_string, no_location=True)
+    except GraphQLError:
+        return None
+    for definition in document.definitions:
+        if (
+            isinstance(definition, OperationDefinitionNode)
+            and definition.operation != OperationType.QUERY
+        ):
+            return None
+    return print_ast(document)
+
+
+class ResponseCache:
+    """Least recently used cache of GraphQL query results.
+
+    Results are keyed by the normalised query document and the variables.
+    Each result is valid for a single data-store generation, the cache is
+    cleared when a request for a new generation is made.
+
+    Args:
+        maxsize: The maximum number of results to hold.
+
+    Attributes:
+        hits: The number of requests answered from the cache.
+        misses: The number of cacheable requests not in the cache.
+        evictions: The number of results evicted to make room for others.
+
+    """
+
+    def __init__(self, maxsize: int = 128) -> None:
+        self.maxsize = maxsize
+        self.generation: Optional[int] = None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._results: 'OrderedDict[Tuple[str, str], Any]' = OrderedDict()
+
+    @staticmethod
+    def get_key(
+        request_string: Optional[str],
+        variables: Optional[Dict[str, Any]],
+    ) -> Optional[Tuple[str, str]]:
+        """Return the cache key for a request, or None if not cacheable."""
+        if not request_string:
+            return None
+        query = normalise_query(request_string)
+        if query is None:
+            return None
+        try:
+            return (query, json.dumps(variables, sort_keys=True))
+        except (TypeError, ValueError):
+            return None
+
+    def get(self, key: Tuple[str, str], generation: int) -> Any:
+        """Return the cached result for a key, or None if there isn't one.
+
+        Args:
+            key: Cache key from get_key.
+            generation: The current data-store generation.
+
+        """
+        if generation != self.generation:
+            self._results.clear()
+            self.generation = generation
+        try:
+            result = self._results[key]
+        except KeyError:
+            self.misses += 1
+            return None
+        self._results.move_to_end(key)
+        self.hits += 1
+        return result
+
+    def put(self, key: Tuple[str, str], generation: int, result: Any) -> None:
+        """Cache the result for a key.
+
+        The result is discarded if it is for a different generation than
+        the cache holds (i.e. the data-store changed during execution).
+
+        Args:
+            key: Cache key from get_key.
+            generation: The data-store generation the result was made from.
+            result: The query result.
+
+        """
+        if generation != self.generation or result is None:
+            return
+        self._results[key] = result
+        self._results.move_to_end(key)
+        while len(self._results) > self.maxsize:
+            self._results.popitem(last=False)
+            self.evictions += 1
+
+    def info(self) -> Dict[str, Union[int, float]]:
+        """Return cache statistics."""
+        requests = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / requests if requests else 0.0,
+            'evictions': self.evictions,
+            'size': len(self._results),
+            'maxsize': self.maxsize,
+        }
+
+
 # -- Middleware --
 
 class IgnoreFieldMiddleware:
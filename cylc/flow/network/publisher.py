@@ -85,7 +85,7 @@ class WorkflowPublisher(ZMQSocketBase):
         if self.socket:
             self.topics.add(topic)
             self.socket.send_multipart(
-                [topic, serialize_data(data, serializer)]
+                [topic, serialize_data(data, serializer)], copy=False
             )
         # else we are in the process of shutting down - don't send anything
 
@@ -15,7 +15,6 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 """Server for workflow runtime API."""
 
-from queue import Queue
 from typing import (
     TYPE_CHECKING,
     Optional,
@@ -32,9 +31,12 @@ from cylc.flow.network import (
     deserialize,
     serialize,
 )
+from cylc.flow.wakeup import WakeupQueue
 
 
 if TYPE_CHECKING:
+    from queue import Queue
+
     from cylc.flow.network import ResponseDict
     from cylc.flow.network.server import WorkflowRuntimeServer
     from zmq.asyncio import Context
@@ -71,7 +73,8 @@ class WorkflowReplier(ZMQSocketBase):
             zmq.REP, server.schd.workflow, bind=True, context=context
         )
         self.server = server
-        self.queue: 'Queue[str]' = Queue()
+        # wake the server thread when a command is queued (e.g. STOP)
+        self.queue: 'Queue[str]' = WakeupQueue(server.wakeup)
 
     def _bespoke_stop(self) -> None:
         """Stop the listener and Authenticator.
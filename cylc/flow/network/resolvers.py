@@ -30,6 +30,7 @@ from typing import (
     List,
     NamedTuple,
     Optional,
+    Set,
     Tuple,
     TYPE_CHECKING,
     cast,
@@ -46,6 +47,7 @@ from cylc.flow.data_store_mgr import (
 )
 import cylc.flow.flags
 from cylc.flow.id import Tokens
+from cylc.flow.id_cli import contains_fnmatch
 from cylc.flow.network.schema import (
     DEF_TYPES,
     NodesEdges,
@@ -60,7 +62,7 @@ if TYPE_CHECKING:
     from enum import Enum
     from uuid import UUID
     from graphql import GraphQLResolveInfo
-    from cylc.flow.data_store_mgr import DataStoreMgr
+    from cylc.flow.data_store_mgr import DataStoreMgr, ElementIndex
     from cylc.flow.scheduler import Scheduler
 
     DeltaQueue = queue.Queue[Tuple[str, str, dict]]
@@ -270,6 +272,50 @@ def node_filter(node, node_type, args, state):
     )
 
 
+def index_filter(index: 'ElementIndex', args) -> Optional[Set[str]]:
+    """Select nodes which may match the filter args using a data-store index.
+
+    Uses the "states", "exstates" and "ids" arguments (where the cycle, task
+    name or state selector of an ID is not a glob). The selected nodes must
+    still be checked with node_filter.
+
+    Returns:
+        The IDs of the selected nodes, or None if the nodes can't be selected
+        this way (i.e. all nodes must be checked).
+
+    """
+    ids: Optional[Set[str]] = None
+    if args.get('states'):
+        ids = index.select('state', args['states'])
+    if args.get('ids'):
+        id_matches: Optional[Set[str]] = set()
+        for item in iter_uniq(args['ids']):
+            if item.is_null:
+                # matches nothing (see node_ids_filter)
+                continue
+            item_matches: Optional[Set[str]] = None
+            for field, value in (
+                ('cycle_point', item['cycle']),
+                ('name', item['task']),
+                ('state', get_state_from_selectors(item)),
+            ):
+                if value and not contains_fnmatch(value):
+                    matches = index.select(field, [value])
+                    if item_matches is not None:
+                        matches &= item_matches
+                    item_matches = matches
+            if item_matches is None or id_matches is None:
+                # this ID could match any node
+                id_matches = None
+                break
+            id_matches |= item_matches
+        if id_matches is not None:
+            ids = id_matches if ids is None else ids & id_matches
+    if ids is not None and args.get('exstates'):
+        ids -= index.select('state', args['exstates'])
+    return ids
+
+
 def get_flow_data_from_ids(data_store, native_ids):
     """Return workflow data by id."""
     w_ids = []
@@ -357,13 +403,39 @@ class BaseResolvers(metaclass=ABCMeta):  # noqa: SIM119
                 ][node_type][node.id].state
             )
 
+    def get_index(self, flow, node_type, args) -> 'Optional[ElementIndex]':
+        """Return the data-store index of a node type, if there is one.
+
+        Only the data-store is indexed (not the delta-store used for
+        subscriptions).
+
+        """
+        if 'sub_id' in args and args['delta_store']:
+            return None
+        with suppress(AttributeError, KeyError):
+            return self.data_store_mgr.indexes[flow[WORKFLOW].id][node_type]
+        return None
+
+    def get_filter_nodes(self, flow, node_type, args):
+        """Return the nodes of a workflow to check against the filter args.
+
+        Uses the data-store index to avoid checking every node where possible.
+
+        """
+        nodes = flow[node_type]
+        index = self.get_index(flow, node_type, args)
+        ids = index_filter(index, args) if index else None
+        if ids is None:
+            return nodes.values()
+        return [nodes[id_] for id_ in index.sort(ids) if id_ in nodes]
+
     async def get_nodes_all(self, node_type, args):
         """Return nodes from all workflows, filter by args."""
         return sort_elements(
             [
                 node
                 for flow in await self.get_workflows_data(args)
-                for node in flow[node_type].values()
+                for node in self.get_filter_nodes(flow, node_type, args)
                 if node_filter(
                     node,
                     node_type,
@@ -397,7 +469,9 @@ class BaseResolvers(metaclass=ABCMeta):  # noqa: SIM119
                 node
                 for flow in flow_data
                 for node_type in node_types
-                for node in get_data_elements(flow, nat_ids, node_type)
+                for node in self.get_filter_data_elements(
+                    flow, nat_ids, node_type, args
+                )
                 if node_filter(
                     node,
                     node_type,
@@ -408,6 +482,19 @@ class BaseResolvers(metaclass=ABCMeta):  # noqa: SIM119
             args,
         )
 
+    def get_filter_data_elements(self, flow, nat_ids, node_type, args):
+        """Return the nodes of a workflow by ID to check against the filter
+        args.
+
+        Uses the data-store index to avoid checking every node where possible.
+
+        """
+        index = self.get_index(flow, node_type, args)
+        ids = index_filter(index, args) if index else None
+        if ids is not None:
+            nat_ids = [n_id for n_id in nat_ids if n_id in ids]
+        return get_data_elements(flow, nat_ids, node_type)
+
     async def get_node_by_id(self, node_type, args):
         """Return protobuf node object for given id."""
         n_id = args.get('id')
@@ -46,8 +46,11 @@ e.g. :py:func:`contact_info`.
 """
 
 import asyncio
+import json
+import os
 from pathlib import Path
 import re
+from time import time_ns
 from typing import (
     AsyncGenerator,
     Dict,
@@ -64,6 +67,7 @@ from packaging.version import parse as parse_version
 
 from cylc.flow import LOG
 from cylc.flow.async_util import (
+    make_async,
     pipe,
     scandir,
 )
@@ -92,7 +96,8 @@ CONTACT = Path(WorkflowFiles.Service.CONTACT)
 
 EXCLUDE_FILES = {
     WorkflowFiles.RUN_N,
-    WorkflowFiles.Install.SOURCE
+    WorkflowFiles.Install.SOURCE,
+    '.scan-index',  # ScanIndex.DIRNAME
 }
 
 
@@ -166,6 +171,263 @@ def dir_is_flow(listing: Iterable[Path]) -> Optional[bool]:
         return False
 
 
+def _list_dir(path: Path) -> Tuple[int, List[str], List[str]]:
+    """List a directory.
+
+    Returns:
+        (mtime, names, subdirs)
+
+        mtime:
+            The modification time of the directory (ns).
+        names:
+            The names of the directory entries.
+        subdirs:
+            The names of entries which are directories or symlinks (which
+            may point to directories).
+
+    """
+    mtime = os.stat(path).st_mtime_ns
+    names: List[str] = []
+    subdirs: List[str] = []
+    with os.scandir(path) as entries:
+        for entry in entries:
+            names.append(entry.name)
+            if entry.is_symlink() or entry.is_dir():
+                subdirs.append(entry.name)
+    return mtime, names, subdirs
+
+
+_async_list_dir = make_async(_list_dir)
+
+
+class ScanIndex:
+    """Persistent index of the directory listings made by scan.
+
+    Scanning the cylc-run directory lists every directory down to the
+    "max depth", which can be slow on shared filesystems with many
+    workflows.
+
+    The index records the outcome of listing each directory (whether it is
+    a workflow, and if not, its subdirectories) against the modification
+    time of the directory. Adding or removing an entry (e.g. installing or
+    cleaning a workflow) changes the modification time of the directory
+    containing it, so on subsequent scans a directory only has to be
+    listed again if its modification time has changed, otherwise a stat
+    suffices. Stale entries are repaired as they are found.
+
+    The index is stored in a subdirectory of the cylc-run directory (so that
+    writing it doesn't change the modification time of the cylc-run
+    directory itself).
+
+    Args:
+        run_dir:
+            The cylc-run directory.
+
+    """
+
+    DIRNAME = '.scan-index'
+    FILENAME = 'index.json'
+    VERSION = 1
+
+    MIN_AGE = 2 * 10**9
+    """Directories modified more recently than this (ns) are not indexed.
+
+    This avoids missing changes made within the timestamp resolution of the
+    filesystem immediately after a directory was listed.
+    """
+
+    def __init__(self, run_dir: Path) -> None:
+        self.run_dir = run_dir
+        self.path = run_dir / self.DIRNAME / self.FILENAME
+        self._prefix_len = len(str(run_dir)) + 1
+        # {relative path: [mtime, is_flow, subdirs]}
+        self.entries: Dict[str, list] = {}
+        # the entries confirmed or (re)created by this scan
+        # (None for directories which have changed but can't be indexed)
+        self.visited: Dict[str, Optional[list]] = {}
+        # entries validated ahead of being listed (see _validate)
+        self.validated: Dict[str, list] = {}
+        self._async_validate = make_async(self._validate)
+        self.load()
+
+    def load(self) -> None:
+        """Load the index from disk (if present and valid)."""
+        try:
+            with open(self.path) as index_file:
+                data = json.load(index_file)
+            if data['version'] == self.VERSION:
+                self.entries = data['entries']
+        except (OSError, ValueError, KeyError, TypeError):
+            # missing, corrupt or incompatible index, start afresh
+            self.entries = {}
+
+    def save(self) -> None:
+        """Merge the results of this scan into the index and write it."""
+        entries = self.update()
+        if entries == self.entries:
+            return
+        self.entries = entries
+        tmp_path = self.path.with_name(f'{self.FILENAME}.{os.getpid()}')
+        try:
+            tmp_path.parent.mkdir(exist_ok=True)
+            with open(tmp_path, 'w') as index_file:
+                json.dump(
+                    {'version': self.VERSION, 'entries': entries},
+                    index_file,
+                    separators=(',', ':'),
+                )
+            os.replace(tmp_path, self.path)
+        except OSError as exc:
+            LOG.debug(f'Could not write scan index: {exc}')
+            tmp_path.unlink(missing_ok=True)
+
+    def update(self) -> Dict[str, list]:
+        """Return the index updated with the results of this scan.
+
+        Entries not visited by this scan are kept unless their parent was
+        visited and no longer contains them (i.e. they have been removed).
+        """
+        entries: Dict[str, list] = {}
+        removed = set()
+        for key in sorted(
+            self.entries.keys() | self.visited.keys(),
+            # parents before children
+            key=lambda key: -1 if key == '.' else key.count(os.sep),
+        ):
+            if key in self.visited:
+                entry = self.visited[key]
+                if entry is not None:
+                    entries[key] = entry
+                continue
+            if key == '.':
+                entries[key] = self.entries[key]
+                continue
+            parent, name = os.path.split(key)
+            parent = parent or '.'
+            if parent in removed or (
+                parent in entries
+                and name not in entries[parent][2]
+            ):
+                removed.add(key)
+                continue
+            entries[key] = self.entries[key]
+        return entries
+
+    def _validate(
+        self, key: str, path: str, recursive: bool
+    ) -> Dict[str, list]:
+        """Return the entries for a directory which are still valid.
+
+        Args:
+            key:
+                The index key of the directory.
+            path:
+                The path of the directory.
+            recursive:
+                If True, the entries of the indexed subdirectories are
+                validated too.
+
+        Note: Runs in an executor, this validates a whole tree with a
+        single call to save the overheads of calling it for each directory.
+
+        """
+        valid: Dict[str, list] = {}
+        stack = [(key, path)]
+        while stack:
+            key, path = stack.pop()
+            entry = self.entries.get(key)
+            if entry is None:
+                continue
+            try:
+                if os.stat(path).st_mtime_ns != entry[0]:
+                    continue
+            except OSError:
+                continue
+            valid[key] = entry
+            if recursive:
+                stack.extend(
+                    (
+                        name if key == '.' else os.path.join(key, name),
+                        os.path.join(path, name),
+                    )
+                    for name in entry[2]
+                )
+        return valid
+
+    async def list_dir(
+        self, path: Path, recursive: bool = True
+    ) -> Tuple[Optional[bool], List[Path]]:
+        """List a directory, using the index if it is up to date.
+
+        Args:
+            path:
+                The directory to list.
+            recursive:
+                Validate the index entries for the directory's
+                subdirectories at the same time (see _validate). Use False
+                where the subdirectories should be validated in parallel.
+
+        Returns:
+            (is_flow, subdirs)
+
+            is_flow:
+                See dir_is_flow.
+            subdirs:
+                Subdirectories to scan for workflows (if not a workflow).
+
+        """
+        # (equivalent to path.relative_to(self.run_dir) but much faster)
+        key = str(path)[self._prefix_len:] or '.'
+        entry = self.validated.pop(key, None)
+        if entry is None and key in self.entries:
+            self.validated.update(
+                await self._async_validate(key, str(path), recursive)
+            )
+            entry = self.validated.pop(key, None)
+        if entry is not None:
+            self.visited[key] = entry
+            return entry[1], [path / name for name in entry[2]]
+
+        start = time_ns()
+        mtime, names, subdirs = await _async_list_dir(path)
+        is_flow = dir_is_flow([path / name for name in names])
+        if is_flow is False:
+            subdirs = [
+                name
+                for name in subdirs
+                if Path(name).stem not in EXCLUDE_FILES
+            ]
+        else:
+            subdirs = []
+        if (
+            mtime < start - self.MIN_AGE
+            # Cylc 7 workflow status depends on the contents of the log dir
+            and (
+                WorkflowFiles.SUITE_RC not in names
+                or WorkflowFiles.FLOW_FILE in names
+            )
+        ):
+            self.visited[key] = [mtime, is_flow, subdirs]
+        else:
+            self.visited[key] = None
+        return is_flow, [path / name for name in subdirs]
+
+
+async def _list_dir_unindexed(
+    path: Path, descend: bool
+) -> Tuple[Optional[bool], List[Path]]:
+    """List a directory without using the index, see ScanIndex.list_dir."""
+    contents = await scandir(path)
+    is_flow = dir_is_flow(contents)
+    if is_flow is not False or not descend:
+        return is_flow, []
+    return is_flow, [
+        subdir
+        for subdir in contents
+        if subdir.is_dir() and subdir.stem not in EXCLUDE_FILES
+    ]
+
+
 @pipe
 async def scan_multi(
     dirs: Iterable[Path],
@@ -219,6 +481,8 @@ async def scan(
     Yields:
         dict - Dictionary containing information about the flow.
 
+    Scans of the cylc-run directory use (and update) the ScanIndex.
+
     """
     cylc_run_dir = Path(get_cylc_run_dir())
     if not run_dir:
@@ -228,60 +492,79 @@ async def scan(
     if max_depth is None:
         max_depth = glbl_cfg().get(['install', 'max depth'])
 
+    index: Optional[ScanIndex] = None
+    if run_dir == cylc_run_dir and scan_dir.is_relative_to(cylc_run_dir):
+        index = ScanIndex(cylc_run_dir)
+
     running: List[asyncio.tasks.Task] = []
 
-    # wrapper for scandir to preserve context
-    async def _scandir(path: Path, depth: int) -> Tuple[Path, int, List[Path]]:
-        contents = await scandir(path)
-        return path, depth, contents
-
-    def _scan_subdirs(listing: List[Path], depth: int) -> None:
-        for subdir in listing:
-            if subdir.is_dir() and subdir.stem not in EXCLUDE_FILES:
-                running.append(
-                    asyncio.create_task(
-                        _scandir(subdir, depth + 1)
-                    )
+    async def _list(
+        path: Path, descend: bool, recursive: bool = True
+    ) -> Tuple[Optional[bool], List[Path]]:
+        if index:
+            return await index.list_dir(path, recursive)
+        return await _list_dir_unindexed(path, descend)
+
+    # wrapper for the directory listing to preserve context
+    async def _scandir(
+        path: Path, depth: int
+    ) -> Tuple[Path, int, Optional[bool], List[Path]]:
+        is_flow, subdirs = await _list(path, depth < max_depth)
+        return path, depth, is_flow, subdirs
+
+    def _scan_subdirs(subdirs: List[Path], depth: int) -> None:
+        for subdir in subdirs:
+            running.append(
+                asyncio.create_task(
+                    _scandir(subdir, depth + 1)
                 )
+            )
 
-    # perform the first directory listing
     try:
-        scan_dir_listing = await scandir(scan_dir)
-    except FileNotFoundError:
-        return
-    if scan_dir != cylc_run_dir and dir_is_flow(scan_dir_listing):
-        # If the scan_dir itself is a workflow run dir, yield nothing
-        return
-
-    _scan_subdirs(scan_dir_listing, depth=0)
-
-    # perform all further directory listings
-    while running:
-        # wait here until there's something to do
-        done, _ = await asyncio.wait(
-            running,
-            return_when=asyncio.FIRST_COMPLETED
-        )
-        for task in done:
-            try:
-                path, depth, contents = task.result()
-            except FileNotFoundError:
-                # directory has been removed since the scan was scheduled
+        # perform the first directory listing
+        try:
+            # (validate the index for each subdirectory in parallel)
+            is_flow, subdirs = await _list(scan_dir, True, recursive=False)
+        except (FileNotFoundError, NotADirectoryError):
+            return
+        if scan_dir != cylc_run_dir and is_flow:
+            # If the scan_dir itself is a workflow run dir, yield nothing
+            return
+
+        _scan_subdirs(subdirs, depth=0)
+
+        # perform all further directory listings
+        while running:
+            # wait here until there's something to do
+            done, _ = await asyncio.wait(
+                running,
+                return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                try:
+                    path, depth, is_flow, subdirs = task.result()
+                except (FileNotFoundError, NotADirectoryError):
+                    # directory has been removed since the scan was scheduled
+                    # (or is a symlink to a file)
+                    running.remove(task)
+                    continue
                 running.remove(task)
-                continue
-            running.remove(task)
-            is_flow = dir_is_flow(contents)
-            if is_flow:
-                # this is a flow directory
-                yield {
-                    'name': str(path.relative_to(run_dir)),
-                    'path': path,
-                }
-            elif is_flow is False and depth < max_depth:
-                # we may have a nested flow, lets see...
-                _scan_subdirs(contents, depth)
-        # don't allow this to become blocking
-        await asyncio.sleep(0)
+                if is_flow:
+                    # this is a flow directory
+                    yield {
+                        'name': str(path.relative_to(run_dir)),
+                        'path': path,
+                    }
+                elif is_flow is False and depth < max_depth:
+                    # we may have a nested flow, lets see...
+                    _scan_subdirs(subdirs, depth)
+            # don't allow this to become blocking
+            await asyncio.sleep(0)
+    finally:
+        for task in running:
+            task.cancel()
+        if index:
+            index.save()
 
 
 def join_regexes(*patterns):
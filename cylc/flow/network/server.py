@@ -16,9 +16,7 @@
 """Server for workflow runtime API."""
 
 import asyncio
-from queue import Queue
 from textwrap import dedent
-from time import sleep
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -26,6 +24,7 @@ from typing import (
     Iterable,
     List,
     Optional,
+    Tuple,
     Union,
 )
 
@@ -43,15 +42,22 @@ from cylc.flow.data_store_mgr import DELTAS_MAP
 from cylc.flow.network.graphql import (
     CylcExecutionContext,
     IgnoreFieldMiddleware,
+    ResponseCache,
     instantiate_middleware,
 )
 from cylc.flow.network.publisher import WorkflowPublisher
 from cylc.flow.network.replier import WorkflowReplier
 from cylc.flow.network.resolvers import Resolvers
 from cylc.flow.network.schema import schema
+from cylc.flow.wakeup import (
+    PipeWakeup,
+    WakeupQueue,
+)
 
 
 if TYPE_CHECKING:
+    from queue import Queue
+
     from cylc.flow.network import ResponseDict
     from cylc.flow.scheduler import Scheduler
 
@@ -141,8 +147,11 @@ class WorkflowRuntimeServer:
     client_pub_key_dir: str
     """Client public key directory, used by the ZMQ authenticator."""
 
-    OPERATE_SLEEP_INTERVAL = 0.2
-    STOP_SLEEP_INTERVAL = 0.2
+    OPERATE_POLL_TIMEOUT = 5.0
+    """Max time (secs) operate() sleeps for, requests & publishes wake it."""
+
+    GRAPHQL_CACHE_SIZE = 128
+    """Max number of GraphQL query results cached for the current data."""
 
     def __init__(self, schd):
 
@@ -162,8 +171,14 @@ class WorkflowRuntimeServer:
         self.middleware = [
             IgnoreFieldMiddleware,
         ]
+        # query results for the current data-store generation
+        self.graphql_cache = ResponseCache(self.GRAPHQL_CACHE_SIZE)
 
-        self.publish_queue: 'Queue[Iterable[tuple]]' = Queue()
+        # wakes the operate() loop when there is something to publish or stop
+        self.wakeup = PipeWakeup()
+        self.publish_queue: 'Queue[Iterable[tuple]]' = WakeupQueue(
+            self.wakeup
+        )
         self.waiting_to_stop = False
         self.stopped = True
 
@@ -212,6 +227,8 @@ class WorkflowRuntimeServer:
         self.pub_port = self.publisher.port
         self.schd.data_store_mgr.delta_workflow_ports()
 
+        self.wakeup.bind()
+
         # wait for threads to setup socket ports before continuing
         barrier.wait()
 
@@ -232,13 +249,11 @@ class WorkflowRuntimeServer:
         and wait for self.thread to terminate.
         """
         self.waiting_to_stop = True
+        self.wakeup.set()
         if self.thread and self.thread.is_alive():
-            # Wait for self.operate() loop to finish:
-            while self.waiting_to_stop:
-                # Non-async sleep - yield to other threads rather than
-                # event loop (allows self.operate() running in different
-                # thread to return)
-                sleep(self.STOP_SLEEP_INTERVAL)
+            # Wait for self.operate() loop to finish (blocking rather than
+            # awaiting, the server thread must return before we continue)
+            self.thread.join()
 
         if self.replier:
             self.replier.stop(stop_loop=False)
@@ -251,10 +266,16 @@ class WorkflowRuntimeServer:
             self.publisher = None
         if self.curve_auth:
             self.curve_auth.stop()  # stop the authentication thread
+        LOG.debug(
+            'GraphQL response cache: {hits} hits, {misses} misses'
+            ' ({hit_rate:.0%} hit rate), {evictions} evictions'
+            .format(**self.graphql_cache.info())
+        )
         if self.loop and self.loop.is_running():
             self.loop.stop()
         if self.thread and self.thread.is_alive():
             self.thread.join()  # Wait for processes to return
+        self.wakeup.close()
 
         self.stopped = True
 
@@ -263,6 +284,10 @@ class WorkflowRuntimeServer:
         # Note: this cannot be an async method because the response part
         # of the listener runs the event loop synchronously
         # (in graphql schema.execute_async)
+        # Sleep until a request arrives or we are woken to publish/stop.
+        poller = zmq.Poller()
+        poller.register(self.replier.socket, zmq.POLLIN)
+        poller.register(self.wakeup.fileno(), zmq.POLLIN)
         while True:
             if self.waiting_to_stop:
                 # The self.stop() method is waiting for us to signal that we
@@ -275,8 +300,9 @@ class WorkflowRuntimeServer:
             # Publish all requested/queued.
             self.loop.run_until_complete(self.publish_queued_items())
 
-            # Yield control to other threads
-            sleep(self.OPERATE_SLEEP_INTERVAL)
+            # Yield control to other threads until there is something to do
+            poller.poll(int(self.OPERATE_POLL_TIMEOUT * 1000))
+            self.wakeup.clear()
 
     async def publish_queued_items(self) -> None:
         """Publish all queued items."""
@@ -398,7 +424,16 @@ class WorkflowRuntimeServer:
 
         Returns:
             object: Execution result, or a list with errors.
+
+        Query results are cached until the data-store changes, so repeated
+        queries are not re-executed (see ResponseCache).
         """
+        generation = self.schd.data_store_mgr.generation
+        cache_key = self.graphql_cache.get_key(request_string, variables)
+        if cache_key is not None:
+            result = self.graphql_cache.get(cache_key, generation)
+            if result is not None:
+                return result
         executed = self.loop.run_until_complete(
             schema.execute_async(
                 request_string,
@@ -417,8 +452,51 @@ class WorkflowRuntimeServer:
             # If there are execution errors, it means there was an unexpected
             # error, so fail the command.
             raise Exception(*(error.message for error in executed.errors))
+        if (
+            cache_key is not None
+            # don't cache results if the data changed during execution
+            and generation == self.schd.data_store_mgr.generation
+        ):
+            self.graphql_cache.put(cache_key, generation, executed.data)
         return executed.data
 
+    @expose
+    def put_messages(
+        self,
+        messages: List[list],
+        meta: Optional[Dict[str, Any]] = None,
+        **_kwargs
+    ) -> Tuple[bool, str]:
+        """Put task messages for one or more jobs in the queue.
+
+        This is a lightweight alternative to the GraphQL "message" mutation
+        for use by jobs. It avoids the overhead of GraphQL parsing and
+        allows messages for many jobs to be sent in a single request.
+
+        Args:
+            messages:
+                List in the format
+                ``[[task_job, event_time, [[severity, message], ...]], ...]``
+                where ``task_job`` is the job ID in the format
+                ``CYCLE/TASK_NAME/SUBMIT_NUM``.
+            meta: Dict containing auth user etc.
+
+        Returns:
+            tuple: (outcome, message)
+
+        """
+        user = (meta or {}).get('auth_user', self.schd.owner)
+        if user != self.schd.owner:
+            LOG.info(
+                f'Command "put_messages" received from {user}.\n'
+                f'put_messages(messages={messages})'
+            )
+        count = 0
+        for task_job, event_time, job_messages in messages:
+            self.resolvers.put_messages(task_job, event_time, job_messages)
+            count += len(job_messages)
+        return (True, f'Messages queued: {count}')
+
     # UIServer Data Commands
     @expose
     def pb_entire_workflow(self, **_kwargs) -> bytes:
@@ -252,16 +252,69 @@ def poverride(target, sparse, prepend=False):
                 setitem(key, val)
 
 
+def poverlay(source, sparse, prepend=False):
+    """Return a copy of a pdict source with the items of sparse overridden.
+
+    This is equivalent to "pdeepcopy" followed by "poverride", however, only
+    the sections which are overridden are copied (shallowly), all other values
+    are shared with the source. Neither the source nor the result should be
+    modified. Unlike "poverride", sections need not exist in the source.
+
+    Examples:
+        >>> source = OrderedDictWithDefaults(
+        ...     [('a', 1), ('env', {'X': '1'}), ('dirs', {'-q': 'x'})]
+        ... )
+        >>> result = poverlay(source, {'env': {'Y': '2'}}, prepend=True)
+        >>> list(result['env'].items())
+        [('Y', '2'), ('X', '1')]
+        >>> result['dirs'] is source['dirs']
+        True
+        >>> source['env']
+        {'X': '1'}
+        >>> poverlay(source, {}) is source
+        True
+        >>> list(poverlay(source, {'new': {'b': 2}})['new'].items())
+        [('b', 2)]
+
+    """
+    if not sparse:
+        return source
+    target = OrderedDictWithDefaults()
+    if hasattr(source, 'defaults_'):
+        target.defaults_ = source.defaults_
+    for key, val in source.items():
+        target[key] = val
+    for key, val in sparse.items():
+        if isinstance(val, dict):
+            target[key] = poverlay(
+                target[key] if key in target else OrderedDictWithDefaults(),
+                val,
+                prepend,
+            )
+        elif prepend and key not in target:
+            # Prepend new items in the target ordered dict.
+            target.prepend(key, val[:] if isinstance(val, list) else val)
+        else:
+            target[key] = val[:] if isinstance(val, list) else val
+    return target
+
+
 def m_override(target, sparse):
     """Override items in a target pdict.
 
     Target keys must already exist unless there is a "__MANY__" placeholder in
     the right position.
+
+    Sections which are shared in the sparse pdict (e.g. inherited runtime
+    sections) are shared in the target too.
     """
     if not sparse:
         return
     stack = deque([(sparse, target, [], OrderedDictWithDefaults())])
     defaults_list = []
+    # {(id(source), id(many_defaults)): (source, many_defaults, dest)}
+    # (the objects are held so that their IDs cannot be reused)
+    shared = {}
     while stack:
         source, dest, keylist, many_defaults = stack.popleft()
         if many_defaults:
@@ -285,7 +338,13 @@ def m_override(target, sparse):
                             "parsec dict override: no __MANY__ placeholder" +
                             "%s" % (keylist + [key])
                         )
+                    shared_key = (id(val), id(child_many_defaults))
+                    if shared_key in shared:
+                        # this section has already been expanded
+                        dest[key] = shared[shared_key][2]
+                        continue
                     dest[key] = OrderedDictWithDefaults()
+                    shared[shared_key] = (val, child_many_defaults, dest[key])
 
                 stack.append(
                     (val, dest[key], keylist + [key], child_many_defaults))
@@ -34,6 +34,7 @@ from subprocess import (
 import sys
 from time import sleep
 from typing import (
+    TYPE_CHECKING,
     Any,
     Dict,
     List,
@@ -57,6 +58,10 @@ from cylc.flow.platforms import (
 from cylc.flow.util import format_cmd
 
 
+if TYPE_CHECKING:
+    from cylc.flow.ssh_pool import SSHConnectionPool
+
+
 def get_proc_ancestors():
     """Return list of parent PIDs back to init."""
     pid = os.getpid()
@@ -223,7 +228,8 @@ DEFAULT_INCLUDES = [
 
 def construct_rsync_over_ssh_cmd(
     src_path: str, dst_path: str, platform: Dict[str, Any],
-    rsync_includes=None, bad_hosts=None
+    rsync_includes=None, bad_hosts=None,
+    ssh_connections: 'Optional[SSHConnectionPool]' = None,
 ) -> Tuple[List[str], str]:
     """Constructs the rsync command used for remote file installation.
 
@@ -235,6 +241,8 @@ def construct_rsync_over_ssh_cmd(
         dst_path: path of target
         platform: contains info relating to platform
         rsync_includes: files and directories to be included in the rsync
+        bad_hosts: hosts which are not to be used
+        ssh_connections: share SSH connections if configured for the platform
 
     Raises:
         NoHostsError:
@@ -247,7 +255,10 @@ def construct_rsync_over_ssh_cmd(
     """
     dst_path = dst_path.replace('$HOME/', '')
     dst_host = get_host_from_platform(platform, bad_hosts=bad_hosts)
-    ssh_cmd = platform['ssh command']
+    if ssh_connections:
+        ssh_cmd = ssh_connections.get_rsh(platform, dst_host)
+    else:
+        ssh_cmd = platform['ssh command']
     command = platform['rsync command']
     rsync_cmd = shlex.split(command)
     rsync_options = [
@@ -281,6 +292,7 @@ def construct_ssh_cmd(
     set_UTC=False,
     set_verbosity=False,
     timeout=None,
+    ssh_connections: 'Optional[SSHConnectionPool]' = None,
 ):
     """Build an SSH command for execution on a remote platform hosts.
 
@@ -302,6 +314,8 @@ def construct_ssh_cmd(
             If True apply -q, -v opts to match cylc.flow.flags.verbosity.
         timeout (str):
             String for bash timeout command.
+        ssh_connections:
+            Share SSH connections to the host if configured for the platform.
 
     Returns:
         list - A list containing a chosen command including all arguments and
@@ -310,6 +324,8 @@ def construct_ssh_cmd(
 
     """
     command = shlex.split(platform['ssh command'])
+    if ssh_connections:
+        command += ssh_connections.get_ssh_opts(platform, host)
 
     if forward_x11:
         command.append('-Y')
@@ -26,6 +26,7 @@ from typing import (
     Tuple,
 )
 
+from cylc.flow.parsec.util import poverlay
 from cylc.flow.platforms import get_platform
 from cylc.flow.run_modes import RunMode
 from cylc.flow.run_modes.simulation import (
@@ -63,7 +64,7 @@ def submit_task_job(
         False indicating that TaskJobManager needs to continue running the
         live mode path.
     """
-    configure_dummy_mode(
+    rtconfig = configure_dummy_mode(
         rtconfig, itask.tdef.rtconfig['simulation']['fail cycle points'])
 
     itask.summary['started_time'] = now[0]
@@ -92,10 +93,15 @@ def submit_task_job(
     return False
 
 
-def configure_dummy_mode(rtc: Dict[str, Any], fallback: str) -> None:
+def configure_dummy_mode(
+    rtc: Dict[str, Any], fallback: str
+) -> Dict[str, Any]:
     """Adjust task defs for dummy mode.
+
+    Returns a new task config, the one provided is not modified (it may be
+    shared with other tasks, see BroadcastMgr.get_updated_rtconfig).
     """
-    rtc['submission retry delays'] = [1]
+    rtc = poverlay(rtc, {'submission retry delays': [1]})
     # Generate dummy scripting.
 
     for script in CLEAR_THESE_SCRIPTS:
@@ -106,11 +112,13 @@ def configure_dummy_mode(rtc: Dict[str, Any], fallback: str) -> None:
     disable_platforms(rtc)
     # Disable environment, in case it depends on env-script.
     rtc['environment'] = {}
-    rtc["simulation"][
-        "fail cycle points"
-    ] = parse_fail_cycle_points(
-        rtc["simulation"]["fail cycle points"], fallback
-    )
+    # (the [simulation] section may be shared with other namespaces)
+    rtc['simulation'] = poverlay(rtc['simulation'], {
+        'fail cycle points': parse_fail_cycle_points(
+            rtc["simulation"]["fail cycle points"], fallback
+        )
+    })
+    return rtc
 
 
 def build_dummy_script(rtc: Dict[str, Any], sleep_sec: int) -> str:
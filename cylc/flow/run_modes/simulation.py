@@ -35,6 +35,7 @@ from cylc.flow import LOG
 from cylc.flow.cycling import PointBase
 from cylc.flow.cycling.loader import get_point
 from cylc.flow.exceptions import PointParsingError
+from cylc.flow.parsec.util import poverlay
 from cylc.flow.platforms import FORBIDDEN_WITH_PLATFORM
 from cylc.flow.run_modes import RunMode
 from cylc.flow.task_outputs import (
@@ -68,7 +69,7 @@ def submit_task_job(
     Returns:
         True - indicating that TaskJobManager need take no further action.
     """
-    configure_sim_mode(
+    rtconfig = configure_sim_mode(
         rtconfig,
         itask.tdef.rtconfig['simulation']['fail cycle points'])
     itask.summary['started_time'] = now[0]
@@ -176,12 +177,17 @@ class ModeSettings:
         if not rtconfig:
             rtconfig = itask.tdef.rtconfig
         if rtconfig and rtconfig != itask.tdef.rtconfig:
-            rtconfig["simulation"][
-                "fail cycle points"
-            ] = parse_fail_cycle_points(
-                rtconfig["simulation"]["fail cycle points"],
-                itask.tdef.rtconfig['simulation']['fail cycle points']
-            )
+            # (copy, the config may be shared with other tasks)
+            rtconfig = poverlay(rtconfig, {
+                'simulation': {
+                    'fail cycle points': parse_fail_cycle_points(
+                        rtconfig["simulation"]["fail cycle points"],
+                        itask.tdef.rtconfig['simulation'][
+                            'fail cycle points'
+                        ]
+                    )
+                }
+            })
 
         # Calculate simulation outcome and run-time:
         self.simulated_run_length = (
@@ -197,6 +203,9 @@ class ModeSettings:
 def configure_sim_mode(rtc, fallback, warnonly: bool = True):
     """Adjust task defs for simulation mode.
 
+    Returns a new task config, the one provided is not modified (it may be
+    shared with other tasks, see BroadcastMgr.get_updated_rtconfig).
+
     Example:
         >>> this = configure_sim_mode
         >>> rtc = {
@@ -204,15 +213,17 @@ def configure_sim_mode(rtc, fallback, warnonly: bool = True):
         ...     'environment': {'DoNot': '"WantThis"'},
         ...     'simulation': {'fail cycle points': ['all']}
         ... }
-        >>> this(rtc, [53])
-        >>> rtc['submission retry delays']
+        >>> new_rtc = this(rtc, [53])
+        >>> new_rtc['submission retry delays']
         [1]
-        >>> rtc['environment']
+        >>> new_rtc['environment']
         {}
-        >>> rtc['simulation']
+        >>> dict(new_rtc['simulation'])
         {'fail cycle points': None}
-        >>> rtc['platform']
+        >>> new_rtc['platform']
         'localhost'
+        >>> rtc['submission retry delays']
+        [42, 24, 23]
     """
     if not warnonly:
         parse_fail_cycle_points(
@@ -220,21 +231,23 @@ def configure_sim_mode(rtc, fallback, warnonly: bool = True):
             fallback,
             warnonly
         )
-        return
-    rtc['submission retry delays'] = [1]
+        return rtc
+    rtc = poverlay(rtc, {'submission retry delays': [1]})
 
     disable_platforms(rtc)
 
     # Disable environment, in case it depends on env-script.
     rtc['environment'] = {}
 
-    rtc["simulation"][
-        "fail cycle points"
-    ] = parse_fail_cycle_points(
-        rtc["simulation"]["fail cycle points"],
-        fallback,
-        warnonly
-    )
+    # (the [simulation] section may be shared with other namespaces)
+    rtc['simulation'] = poverlay(rtc['simulation'], {
+        'fail cycle points': parse_fail_cycle_points(
+            rtc["simulation"]["fail cycle points"],
+            fallback,
+            warnonly
+        )
+    })
+    return rtc
 
 
 def get_simulated_run_len(rtc: Dict[str, Any]) -> int:
@@ -269,9 +282,11 @@ def disable_platforms(
     """
     for section, keys in FORBIDDEN_WITH_PLATFORM.items():
         if section in rtc:
-            for key in keys:
-                if key in rtc[section]:
-                    rtc[section][key] = None
+            # (the section may be shared with other namespaces)
+            rtc[section] = poverlay(
+                rtc[section],
+                {key: None for key in keys if key in rtc[section]},
+            )
     rtc['platform'] = 'localhost'
 
 
@@ -18,6 +18,7 @@
 from collections import defaultdict
 from contextlib import suppress
 from dataclasses import dataclass
+import os
 from os.path import expandvars
 from pprint import pformat
 import sqlite3
@@ -207,6 +208,18 @@ class CylcWorkflowDAO:
     """Data access object for the workflow runtime database."""
 
     CONN_TIMEOUT = 0.2
+    # Size of the prepared statement cache for each connection
+    CACHED_STATEMENTS = 256
+    # SQLite settings for persistent connections
+    PERSISTENT_PRAGMAS = {
+        # Write ahead logging, see https://www.sqlite.org/wal.html
+        'journal_mode': 'WAL',
+        # Safe from corruption in WAL mode, see
+        # https://www.sqlite.org/pragma.html#pragma_synchronous
+        'synchronous': 'NORMAL',
+        # Page cache size (negative values are in KiB)
+        'cache_size': '-8192',
+    }
     DB_FILE_BASE_NAME = "db"
     MAX_TRIES = 100
     RESTART_INCOMPAT_VERSION = "8.0rc2"  # Can't restart if <= this version
@@ -371,7 +384,8 @@ class CylcWorkflowDAO:
         self,
         db_file_name: Union['Path', str],
         is_public: bool = False,
-        create_tables: bool = False
+        create_tables: bool = False,
+        persistent: bool = False,
     ):
         """Initialise database access object.
 
@@ -383,12 +397,20 @@ class CylcWorkflowDAO:
             is_public: If True, allow retries.
             create_tables: If True, create the tables if they
                 don't already exist.
+            persistent: If True, keep the connection open between calls to
+                "execute_queued_items" and use write-ahead logging. Otherwise
+                the connection is closed after each call.
 
         """
         self.db_file_name = expandvars(db_file_name)
         self.is_public = is_public
+        self.persistent = persistent
         self.conn: Optional[sqlite3.Connection] = None
+        # (device, inode) of the DB file at the time of connection
+        self._db_file_id: Optional[Tuple[int, int]] = None
         self.n_tries = 0
+        # statements awaiting execution (see "stage_queued_items")
+        self.staged_stmts: List[Tuple[str, list]] = []
 
         self.tables = {
             name: CylcWorkflowDAOTable(name, attrs)
@@ -453,10 +475,39 @@ class CylcWorkflowDAO:
         """Connect to the database."""
         if self.conn is None:
             self.conn = sqlite3.connect(
-                self.db_file_name, timeout=self.CONN_TIMEOUT
+                self.db_file_name,
+                timeout=self.CONN_TIMEOUT,
+                cached_statements=self.CACHED_STATEMENTS,
             )
+            if self.persistent:
+                for key, value in self.PERSISTENT_PRAGMAS.items():
+                    self.conn.execute(f'PRAGMA {key}={value}')
+                self._db_file_id = self._get_db_file_id()
         return self.conn
 
+    def _get_db_file_id(self) -> Optional[Tuple[int, int]]:
+        """Return the (device, inode) of the DB file or None if missing."""
+        try:
+            stat = os.stat(self.db_file_name)
+        except OSError:
+            return None
+        return (stat.st_dev, stat.st_ino)
+
+    def _check_connection(self) -> None:
+        """Drop a persistent connection if the DB file has gone.
+
+        An open connection will happily write to a DB file which has since
+        been deleted (e.g. if the workflow run directory has been removed).
+        Dropping the connection forces a reconnection which will fail in the
+        same way as for non-persistent connections.
+        """
+        if (
+            self.conn is not None
+            and self._get_db_file_id() != self._db_file_id
+        ):
+            LOG.debug(f'{self.db_file_name}: file changed, reconnecting')
+            self.close()
+
     def create_tables(self):
         """Create tables."""
         names = []
@@ -471,9 +522,8 @@ class CylcWorkflowDAO:
         if cur is not None:
             self.conn.commit()
 
-    def execute_queued_items(self):
-        """Execute queued items for each table."""
-        # determine the sql statements to execute
+    def _get_queued_stmts(self) -> List[Tuple[str, list]]:
+        """Return the SQL statements for the queued items of each table."""
         sql_queue = []  # (sql_statement, values)
         for table in self.tables.values():
             # DELETE statements may have varying number of WHERE args so we
@@ -494,6 +544,36 @@ class CylcWorkflowDAO:
             # statement.
             for stmt, stmt_args_list in table.update_queues.items():
                 sql_queue.append((stmt, stmt_args_list))
+        return sql_queue
+
+    def _clear_queues(self) -> None:
+        """Clear the queued items of each table."""
+        for table in self.tables.values():
+            table.delete_queues = {}
+            table.insert_queue = []
+            table.update_queues = defaultdict(list)
+
+    def clear_queued_items(self) -> None:
+        """Discard all staged and queued items."""
+        self.staged_stmts = []
+        self._clear_queues()
+
+    def stage_queued_items(self) -> None:
+        """Convert the queued items into SQL statements for execution later.
+
+        This allows items queued in multiple batches to be executed in the
+        order they were queued, in a single transaction, by the next call to
+        "execute_queued_items".
+        """
+        self.staged_stmts.extend(self._get_queued_stmts())
+        self._clear_queues()
+
+    def execute_queued_items(self):
+        """Execute staged and queued items for each table."""
+        if self.persistent:
+            self._check_connection()
+        # determine the sql statements to execute
+        sql_queue = self.staged_stmts + self._get_queued_stmts()
 
         # execute the statements and commit the transaction
         try:
@@ -556,10 +636,7 @@ class CylcWorkflowDAO:
 
         else:
             # Clear the queues
-            for table in self.tables.values():
-                table.delete_queues.clear()
-                table.insert_queue.clear()
-                table.update_queues.clear()
+            self.clear_queued_items()
             # Report public database retry recovery if necessary
             if self.n_tries:
                 LOG.info(
@@ -571,7 +648,9 @@ class CylcWorkflowDAO:
             # Note: This is not strictly necessary. But if the workflow run
             # directory is removed, a forced reconnection to the private
             # database will ensure that the workflow dies.
-            self.close()
+            # (Persistent connections check for this on the next call.)
+            if not self.persistent:
+                self.close()
 
     def _execute_stmt(self, stmt, stmt_args_list):
         """Helper for "self.execute_queued_items".
@@ -862,6 +941,38 @@ class CylcWorkflowDAO:
             )
         ]
 
+    def select_prev_instances_for_cycle(
+        self, point: str
+    ) -> Dict[str, List[Tuple[int, bool, Set[int], str]]]:
+        """Select task_states table info about all tasks in a cycle.
+
+        See select_prev_instances.
+
+        Return: {name: [(submit_num, flow_wait, flow_nums, status), ...]}
+
+        """
+        stmt = rf'''
+            SELECT
+                name, flow_nums, submit_num, flow_wait, status
+            FROM
+                {self.TABLE_TASK_STATES}
+            WHERE
+                cycle==?
+        '''  # nosec B608 (table name is code constant)
+        ret: Dict[str, List[Tuple[int, bool, Set[int], str]]] = {}
+        for name, flow_nums_str, submit_num, flow_wait, status in (
+            self.connect().execute(stmt, (point,))
+        ):
+            ret.setdefault(name, []).append(
+                (
+                    submit_num,
+                    flow_wait == 1,
+                    deserialise_set(flow_nums_str),
+                    status
+                )
+            )
+        return ret
+
     def select_latest_flow_nums(self) -> Optional['FlowNums']:
         """Return a list of the most recent previous flow numbers."""
         stmt = rf'''
@@ -902,6 +1013,31 @@ class CylcWorkflowDAO:
             )
         }
 
+    def select_task_outputs_for_cycle(
+        self, point: str
+    ) -> 'Dict[str, Dict[str, FlowNums]]':
+        """Select task outputs for each flow for all tasks in a cycle.
+
+        See select_task_outputs.
+
+        Return: {name: {outputs_dict_str: flow_nums_set}}
+
+        """
+        stmt = rf'''
+            SELECT
+               name,flow_nums,outputs
+            FROM
+               {self.TABLE_TASK_OUTPUTS}
+            WHERE
+                cycle==?
+        '''  # nosec B608 (table name is code constant)
+        ret: Dict[str, Dict[str, FlowNums]] = {}
+        for name, flow_nums, outputs in self.connect().execute(
+            stmt, (point,)
+        ):
+            ret.setdefault(name, {})[outputs] = deserialise_set(flow_nums)
+        return ret
+
     def select_xtriggers_for_restart(self, callback):
         stmt = rf'''
             SELECT
@@ -161,6 +161,10 @@ from cylc.flow.templatevars import (
 )
 from cylc.flow.timer import Timer
 from cylc.flow.util import cli_format
+from cylc.flow.wakeup import (
+    Wakeup,
+    WakeupQueue,
+)
 from cylc.flow.wallclock import (
     get_current_time_string,
     get_time_string_from_unix_time as time2str,
@@ -285,6 +289,8 @@ class Scheduler:
     # main loop
     main_loop_intervals: deque = deque(maxlen=10)
     main_loop_plugins: Optional[dict] = None
+    main_loop_event_driven: bool = False
+    main_loop_max_idle: float = INTERVAL_MAIN_LOOP
     auto_restart_mode: Optional[AutoRestartMode] = None
     auto_restart_time: Optional[float] = None
 
@@ -319,6 +325,9 @@ class Scheduler:
 
         self.timers: Dict[str, Timer] = {}
 
+        # wakes the main loop early (event driven mode)
+        self.main_loop_wakeup = Wakeup()
+
         self.workflow_run_dir = get_workflow_run_dir(self.workflow)
         self.workflow_work_dir = get_workflow_run_work_dir(self.workflow)
         self.workflow_share_dir = get_workflow_run_share_dir(self.workflow)
@@ -328,7 +337,13 @@ class Scheduler:
 
         self.workflow_db_mgr = WorkflowDatabaseManager(
             pri_d=workflow_files.get_workflow_srv_dir(self.workflow),
-            pub_d=os.path.join(self.workflow_run_dir, 'log')
+            pub_d=os.path.join(self.workflow_run_dir, 'log'),
+            persistent=glbl_cfg().get(
+                ['scheduler', 'database', 'persistent connections']
+            ),
+            async_pub=glbl_cfg().get(
+                ['scheduler', 'database', 'asynchronous public database']
+            ),
         )
         self.is_restart = Path(self.workflow_db_mgr.pri_path).is_file()
         if (
@@ -397,10 +412,10 @@ class Scheduler:
 
         self.server = WorkflowRuntimeServer(self)
 
-        self.proc_pool = SubProcPool()
-        self.command_queue = Queue()
-        self.message_queue = Queue()
-        self.ext_trigger_queue = Queue()
+        self.proc_pool = SubProcPool(wakeup=self.main_loop_wakeup)
+        self.command_queue = WakeupQueue(self.main_loop_wakeup)
+        self.message_queue = WakeupQueue(self.main_loop_wakeup)
+        self.ext_trigger_queue = WakeupQueue(self.main_loop_wakeup)
         self.workflow_event_handler = WorkflowEventHandler(self.proc_pool)
 
         self.xtrigger_mgr = XtriggerManager(
@@ -580,6 +595,10 @@ class Scheduler:
             self.cylc_config.get('main loop', {}),
             self.options.main_loop
         )
+        self.main_loop_event_driven = glbl_cfg().get(
+            ['scheduler', 'main loop', 'event driven'])
+        self.main_loop_max_idle = glbl_cfg().get(
+            ['scheduler', 'main loop', 'maximum idle interval'])
 
         holdcp = None
         if self.options.holdcp:
@@ -702,6 +721,7 @@ class Scheduler:
             # Non-async sleep - yield to other threads rather than event loop
             sleep(0)
             self.profiler.start()
+            self.main_loop_wakeup.bind()
             while True:  # MAIN LOOP
                 await self._main_loop()
 
@@ -831,6 +851,7 @@ class Scheduler:
                 stop_mode = StopMode.REQUEST_NOW
 
             self._set_stop(stop_mode)
+            self.main_loop_wakeup.set()
 
     def _load_pool_from_tasks(self):
         """Load task pool with specified tasks, for a new run."""
@@ -1435,13 +1456,12 @@ class Scheduler:
 
     def late_tasks_check(self):
         """Report tasks that are never active and are late."""
-        now = time()
-        for itask in self.pool.get_tasks():
+        for task_id in self.pool.late_timers.pop_due():
+            itask = self.pool._get_task_by_id(task_id)
             if (
-                    not itask.is_late
-                    and itask.get_late_time()
-                    and itask.state(*TASK_STATUSES_NEVER_ACTIVE)
-                    and now > itask.get_late_time()
+                itask is not None
+                and not itask.is_late
+                and itask.state(*TASK_STATUSES_NEVER_ACTIVE)
             ):
                 msg = '%s (late-time=%s)' % (
                     self.task_events_mgr.EVENT_LATE,
@@ -1635,7 +1655,14 @@ class Scheduler:
 
         # Unqueued tasks with satisfied prerequisites must be waiting on
         # xtriggers or ext_triggers. Check these and queue tasks if ready.
-        for itask in self.pool.get_tasks():
+        # Only tasks which have changed, or whose xtriggers are due, are
+        # checked (see TaskPool.check_task).
+        if self.broadcast_mgr.get_ext_triggers(self.ext_trigger_queue):
+            for itask in self.pool.get_tasks():
+                if itask.state.external_triggers:
+                    self.pool.check_task(itask)
+        self.xtrigger_mgr.check_due_xtriggers()
+        for itask in self.pool.get_tasks_to_check():
             if (
                 not itask.state(TASK_STATUS_WAITING)
                 or itask.state.is_queued
@@ -1660,7 +1687,7 @@ class Scheduler:
                 self.pool.queue_task(itask)
 
         if self.xtrigger_mgr.do_housekeeping:
-            self.xtrigger_mgr.housekeep(self.pool.get_tasks())
+            self.xtrigger_mgr.housekeep()
         self.pool.clock_expire_tasks()
         self.release_tasks_to_run()
 
@@ -1702,8 +1729,7 @@ class Scheduler:
         self.workflow_db_mgr.put_task_event_timers(self.task_events_mgr)
 
         # List of task whose states have changed.
-        updated_task_list = [
-            t for t in self.pool.get_tasks() if t.state.is_updated]
+        updated_task_list = self.pool.get_updated_tasks()
         has_updated = updated_task_list or self.is_updated
 
         if updated_task_list and self.is_restart_timeout_wait:
@@ -1763,24 +1789,74 @@ class Scheduler:
             self.check_workflow_stalled()
 
         # Sleep a bit for things to catch up.
-        # Quick sleep if there are items pending in process pool.
-        # (Should probably use quick sleep logic for other queues?)
         elapsed = time() - tinit
-        quick_mode = self.proc_pool.is_not_done()
-        if (elapsed >= self.INTERVAL_MAIN_LOOP or
-                quick_mode and elapsed >= self.INTERVAL_MAIN_LOOP_QUICK):
-            # Main loop has taken quite a bit to get through
-            # Still yield control to other threads by sleep(0.0)
-            duration: float = 0
-        elif quick_mode:
-            duration = self.INTERVAL_MAIN_LOOP_QUICK - elapsed
+        if self.main_loop_event_driven:
+            # Sleep until there is something to do.
+            await self.main_loop_wakeup.wait(
+                self.get_main_loop_timeout(elapsed)
+            )
         else:
-            duration = self.INTERVAL_MAIN_LOOP - elapsed
-        await asyncio.sleep(duration)
+            # Quick sleep if there are items pending in process pool.
+            # (Should probably use quick sleep logic for other queues?)
+            quick_mode = self.proc_pool.is_not_done()
+            if (elapsed >= self.INTERVAL_MAIN_LOOP or
+                    quick_mode and elapsed >= self.INTERVAL_MAIN_LOOP_QUICK):
+                # Main loop has taken quite a bit to get through
+                # Still yield control to other threads by sleep(0.0)
+                duration: float = 0
+            elif quick_mode:
+                duration = self.INTERVAL_MAIN_LOOP_QUICK - elapsed
+            else:
+                duration = self.INTERVAL_MAIN_LOOP - elapsed
+            await asyncio.sleep(duration)
         # Record latest main loop interval
         self.main_loop_intervals.append(time() - tinit)
         # END MAIN LOOP
 
+    def get_main_loop_timeout(self, elapsed: float = 0) -> float:
+        """Return how long the main loop may sleep for in event driven mode.
+
+        The main loop sleeps until the next known deadline, is woken early by
+        incoming task messages, commands and external triggers and never
+        sleeps for longer than the configured maximum idle interval.
+
+        Args:
+            elapsed:
+                The time taken by the current main loop iteration.
+
+        """
+        if self.pool.tasks_to_check:
+            # Tasks changed after they were checked, check them now.
+            return 0
+        if (
+            self.stop_mode
+            or self.proc_pool.needs_polling()
+        ):
+            # Not all subprocess exits are signalled, check back soon.
+            timeout = self.INTERVAL_MAIN_LOOP_QUICK
+        else:
+            timeout = self.main_loop_max_idle
+        timeout -= elapsed
+        now = time()
+        deadlines = [
+            timer.timeout
+            for timer in self.timers.values()
+        ]
+        deadlines.extend((
+            self.task_events_mgr.event_timer_queue.get_next_deadline(),
+            self.task_events_mgr.job_timer_queue.get_next_deadline(),
+            self.pool.late_timers.get_next_deadline(),
+            self.pool.expiry_timers.get_next_deadline(),
+            self.xtrigger_mgr.call_timers.get_next_deadline(),
+        ))
+        deadlines.append(self.proc_pool.get_next_timeout())
+        deadlines.append(self.stop_clock_time)
+        deadlines.append(self.auto_restart_time)
+        for deadline in deadlines:
+            if deadline is not None:
+                timeout = min(timeout, deadline - now)
+        return max(timeout, 0)
+
     def _update_workflow_state(self):
         """Update workflow state in the data store and push out any deltas.
 
@@ -1914,6 +1990,13 @@ class Scheduler:
             # only attempt remote tidy if the workflow has been started
             self.task_job_mgr.task_remote_mgr.remote_tidy()
 
+        if hasattr(self, 'proc_pool'):
+            # close shared SSH connections (after remote tidy has used them)
+            try:
+                self.proc_pool.ssh_connections.close()
+            except Exception as exc:
+                LOG.exception(exc)
+
         try:
             # Remove ZMQ keys from scheduler
             LOG.debug("Removing authentication keys from scheduler")
@@ -46,6 +46,15 @@ def pythonpath_manip():
 
 pythonpath_manip()
 
+if sys.argv[1:2] == ['message']:
+    # Fast path for task messages, these are sent several times by every job
+    # so we skip loading the CLI where possible (this must happen before the
+    # imports below).
+    from cylc.flow.task_message import fast_message
+    ret = fast_message(sys.argv[2:])
+    if ret is not None:
+        sys.exit(ret)
+
 import argparse
 from contextlib import contextmanager
 from importlib.metadata import (
@@ -33,6 +33,10 @@ Commit to version control before using this, in case you want to back out.
 
 A non-zero return code will be returned if any issues are identified.
 This can be overridden by providing the "--exit-zero" flag.
+
+Files are linted in parallel. The results for files which have not changed
+since they were last linted (with the same rules) are cached, see the
+"--no-cache" option.
 """
 
 NOQA = """
@@ -50,7 +54,12 @@ pyproject.toml configuration:
    max-line-length = 130        # Max line length for linting
 """
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 import functools
+from hashlib import sha256
+import json
+from multiprocessing import get_context
+import os
 from pathlib import Path
 import pkgutil
 import re
@@ -70,6 +79,7 @@ from typing import (
     List,
     Literal,
     Optional,
+    Tuple,
     Union,
 )
 
@@ -77,6 +87,7 @@ from ansimarkup import parse as cparse
 
 from cylc.flow import (
     LOG,
+    __version__ as CYLC_VERSION,
     job_runner_handlers,
 )
 from cylc.flow.cfgspec.workflow import (
@@ -520,6 +531,12 @@ STYLE_GUIDE = (
 SECTION2 = r'\[\[\s*{}\s*\]\]'
 SECTION3 = r'\[\[\[\s*{}\s*\]\]\]'
 FILEGLOBS = ['*.rc', '*.cylc']
+# the minimum number of files to lint per worker process (see get_jobs)
+FILES_PER_JOB = 8
+# forked workers start quickly and don't re-import the "cylc" entry point,
+# this is safe as "cylc lint" does not start any threads (forking is not
+# safe on macOS)
+MP_START_METHOD = 'fork' if sys.platform == 'linux' else 'spawn'
 JINJA2_SHEBANG = '#!jinja2'
 DEPENDENCY_SECTION_MSG = {
     'text': (
@@ -1201,6 +1218,7 @@ def check_cylc_file(
     checks: Dict[str, dict],
     counter: CounterType[str],
     modify: bool = False,
+    write: Callable = print,
 ):
     """Check A Cylc File for Cylc 7 Config"""
     with open(file, 'r') as cylc_file:
@@ -1211,6 +1229,7 @@ def check_cylc_file(
             checks,
             counter,
             modify,
+            write,
         )
 
         if modify:
@@ -1226,6 +1245,10 @@ def check_cylc_file(
                 pass
 
 
+NOQA_REGEX = re.compile(r'.*#\s*[Nn][Oo][Qq][Aa]:?(.*)')
+BACKREF_REGEX = re.compile(r'\\\d|\(\?P=')
+
+
 def no_qa(line: str, index: str):
     """This line has a no-qa comment.
 
@@ -1246,13 +1269,86 @@ def no_qa(line: str, index: str):
         >>> no_qa('foo = bar # noqa: S001 S003', 'S001')
         True
     """
-    NOQA = re.compile(r'.*#\s*[Nn][Oo][Qq][Aa]:?(.*)')
-    noqa = NOQA.findall(line)
+    noqa = NOQA_REGEX.findall(line)
     if noqa and (noqa[0] == '' or index in noqa[0]):
         return True
     return False
 
 
+def is_regex_check(function: Callable) -> bool:
+    """Return True if a check function is the "findall" method of a regex.
+
+    Examples:
+        >>> is_regex_check(re.compile('x').findall)
+        True
+        >>> is_regex_check(check_indentation)
+        False
+
+    """
+    return (
+        isinstance(getattr(function, '__self__', None), re.Pattern)
+        and function.__name__ == 'findall'
+    )
+
+
+def compile_checks(
+    checks: Dict[str, dict]
+) -> Tuple[List[Tuple[str, str, dict, bool]], Optional['re.Pattern']]:
+    """Prepare checks for running against many lines.
+
+    Returns:
+        (checks, combined)
+
+        checks:
+            List of (index, index_str, check_meta, is_regex) tuples.
+        combined:
+            A single regex which matches a line if any of the regex checks
+            would (see is_regex_check), so that lines which match none of
+            them can skip the individual regex checks. None if there are no
+            regex checks (or they can't be combined).
+
+    Examples:
+        >>> checks = {
+        ...     'X001': {FUNCTION: re.compile('^a').findall},
+        ...     'X002': {FUNCTION: check_indentation},
+        ...     'X003': {FUNCTION: re.compile('b$').findall},
+        ... }
+        >>> compiled, combined = compile_checks(checks)
+        >>> [is_regex for *_, is_regex in compiled]
+        [True, False, True]
+        >>> combined.pattern
+        '(?:^a)|(?:b$)'
+        >>> [bool(combined.search(line)) for line in ('ax', 'xb', 'ba')]
+        [True, True, False]
+
+    """
+    compiled = []
+    patterns = []
+    for index, check_meta in checks.items():
+        function = check_meta[FUNCTION]
+        is_regex = (
+            is_regex_check(function)
+            # only combine patterns which can be combined safely
+            and function.__self__.flags == re.UNICODE
+            and not BACKREF_REGEX.search(function.__self__.pattern)
+        )
+        if is_regex:
+            patterns.append(function.__self__.pattern)
+        compiled.append(
+            (index, get_index_str(check_meta, index), check_meta, is_regex)
+        )
+    if not patterns:
+        return compiled, None
+    try:
+        combined = re.compile(
+            '|'.join(f'(?:{pattern})' for pattern in patterns)
+        )
+    except re.error:
+        # e.g. duplicate group names, check each regex individually
+        return [(*check[:3], False) for check in compiled], None
+    return compiled, combined
+
+
 def lint(
     file_rel: Path,
     lines: Iterator[str],
@@ -1288,31 +1384,52 @@ def lint(
     # check if it is a jinja2 shebang
     jinja_shebang = line.strip().lower() == JINJA2_SHEBANG
 
+    compiled_checks, combined = compile_checks(checks)
+    check_list = []
+    for _index, index_str, check_meta, is_regex in compiled_checks:
+        if check_meta.get('kwargs', False):
+            # Use a more complex function with keywords:
+            check_function = functools.partial(
+                check_meta['function'],
+                check_meta=check_meta,
+                file=file_rel,
+                jinja_shebang=jinja_shebang,
+            )
+        else:
+            # Just going to pass the line to the check function:
+            check_function = check_meta['function']
+        check_list.append((
+            index_str,
+            check_meta,
+            check_function,
+            check_meta.get('evaluate commented lines', False),
+            is_regex and combined is not None,
+        ))
+
     while True:
+        is_comment = line.strip().startswith('#')
+        noqa = NOQA_REGEX.findall(line) if '#' in line else None
+        # Only run the regex checks if the combined regex matches
+        # (evaluated on first use).
+        regex_match: Optional[bool] = None
         # run lint checks against the current line
-        for index, check_meta in checks.items():
+        for (
+            index_str, check_meta, check_function, commented, is_regex
+        ) in check_list:
             # Skip commented line unless check says not to.
-            index_str = get_index_str(check_meta, index)
             if (
-                (
-                    line.strip().startswith('#')
-                    and not check_meta.get('evaluate commented lines', False)
-                )
-                or no_qa(line, index_str)
+                (is_comment and not commented)
+                or (noqa and (noqa[0] == '' or index_str in noqa[0]))
             ):
                 continue
 
-            if check_meta.get('kwargs', False):
-                # Use a more complex function with keywords:
-                check_function = functools.partial(
-                    check_meta['function'],
-                    check_meta=check_meta,
-                    file=file_rel,
-                    jinja_shebang=jinja_shebang,
-                )
-            else:
-                # Just going to pass the line to the check function:
-                check_function = check_meta['function']
+            if is_regex:
+                if regex_match is None:
+                    regex_match = combined.search(  # type: ignore[union-attr]
+                        line
+                    ) is not None
+                if not regex_match:
+                    continue
 
             # Run the check:
             check = check_function(line)
@@ -1369,6 +1486,266 @@ def get_cylc_files(
                 yield path
 
 
+def lint_file(
+    file: Path,
+    file_rel: Path,
+    checks: Dict[str, dict],
+    modify: bool = False,
+) -> Tuple[Dict[str, int], List[str]]:
+    """Lint a file.
+
+    Returns:
+        (counter, messages)
+
+        counter:
+            Lint hits by category.
+        messages:
+            Lint messages for the user.
+
+    """
+    LOG.debug(f'Checking {file}')
+    counter: CounterType[str] = Counter()
+    messages: List[str] = []
+    check_cylc_file(file, file_rel, checks, counter, modify, messages.append)
+    return dict(counter), messages
+
+
+# the checks for lint worker processes to run (see lint_files)
+_WORKER_CHECKS: Dict[str, dict] = {}
+
+
+def _init_worker(check_args: tuple) -> None:
+    """Initialise a lint worker process."""
+    global _WORKER_CHECKS
+    _WORKER_CHECKS = parse_checks(*check_args)
+
+
+def _lint_file_worker(
+    file: Path, file_rel: Path, modify: bool
+) -> Tuple[Dict[str, int], List[str]]:
+    """Lint a file in a worker process."""
+    return lint_file(file, file_rel, _WORKER_CHECKS, modify)
+
+
+def get_jobs(jobs: int, files: int) -> int:
+    """Return the number of processes to lint files with.
+
+    Args:
+        jobs:
+            The number of processes requested, or 0 to pick the number
+            based on the number of files and CPUs.
+        files:
+            The number of files to lint.
+
+    Examples:
+        >>> get_jobs(4, 100)
+        4
+        >>> get_jobs(4, 2)
+        2
+        >>> get_jobs(0, FILES_PER_JOB)
+        1
+        >>> get_jobs(0, 1000) == min(os.cpu_count() or 1, 1000)
+        True
+
+    """
+    if jobs <= 0:
+        # starting worker processes costs more than linting a few files
+        jobs = min(os.cpu_count() or 1, -(-files // FILES_PER_JOB))
+    return max(min(jobs, files), 1)
+
+
+class LintCache:
+    """Cache of lint results for files which have not changed.
+
+    The results for each file are keyed by a hash of its contents. All
+    results are discarded if the rules change (e.g. different rulesets,
+    ignores or Cylc version).
+
+    Each linted directory has its own cache file in the user cache
+    directory (``$XDG_CACHE_HOME/cylc/lint`` defaulting to
+    ``~/.cache/cylc/lint``). This holds the results for the files linted
+    on the last run.
+
+    Args:
+        target:
+            The directory being linted.
+        checks:
+            The checks being run.
+
+    """
+
+    VERSION = 1
+
+    def __init__(self, target: Path, checks: Dict[str, dict]) -> None:
+        cache_dir = Path(
+            os.getenv('XDG_CACHE_HOME') or Path.home() / '.cache',
+            'cylc',
+            'lint',
+        )
+        key = sha256(str(target.resolve()).encode()).hexdigest()[:16]
+        self.path = cache_dir / f'{key}.json'
+        self.rules = self.get_rules_hash(checks)
+        # {file_rel: [file_hash, counter, messages]}
+        self.results: Dict[str, list] = {}
+        self.new_results: Dict[str, list] = {}
+        self.load()
+
+    @staticmethod
+    def get_rules_hash(checks: Dict[str, dict]) -> str:
+        """Return a hash of the rules the checks apply."""
+        rules: List[Any] = [
+            CYLC_VERSION,
+            sha256(Path(__file__).read_bytes()).hexdigest(),
+        ]
+        for index, check_meta in checks.items():
+            function = check_meta.get(FUNCTION)
+            rules.append([
+                index,
+                check_meta.get('short'),
+                (
+                    function.__self__.pattern  # type: ignore[union-attr]
+                    if function and is_regex_check(function)
+                    else None
+                ),
+            ])
+        return sha256(json.dumps(rules).encode()).hexdigest()
+
+    @staticmethod
+    def hash_file(file: Path) -> str:
+        """Return a hash of a file's contents."""
+        return sha256(file.read_bytes()).hexdigest()
+
+    def load(self) -> None:
+        """Read the results cached by the last run (if the rules match)."""
+        try:
+            with open(self.path) as cache_file:
+                data = json.load(cache_file)
+            if (
+                data['version'] == self.VERSION
+                and data['rules'] == self.rules
+            ):
+                self.results = data['results']
+        except (OSError, ValueError, KeyError, TypeError):
+            # missing, corrupt or incompatible cache
+            self.results = {}
+
+    def get(
+        self, file_rel: Path, file_hash: str
+    ) -> Optional[Tuple[Dict[str, int], List[str]]]:
+        """Return the cached result for a file, if it hasn't changed."""
+        result = self.results.get(str(file_rel))
+        if result is None or result[0] != file_hash:
+            return None
+        self.new_results[str(file_rel)] = result
+        return result[1], result[2]
+
+    def put(
+        self,
+        file_rel: Path,
+        file_hash: str,
+        result: Tuple[Dict[str, int], List[str]],
+    ) -> None:
+        """Cache the result for a file."""
+        self.new_results[str(file_rel)] = [file_hash, *result]
+
+    def save(self) -> None:
+        """Write the results for the files linted on this run."""
+        if self.new_results == self.results:
+            return
+        tmp_path = self.path.with_name(f'{self.path.name}.{os.getpid()}')
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, 'w') as cache_file:
+                json.dump(
+                    {
+                        'version': self.VERSION,
+                        'rules': self.rules,
+                        'results': self.new_results,
+                    },
+                    cache_file,
+                )
+            os.replace(tmp_path, self.path)
+        except OSError as exc:
+            LOG.debug(f'Could not write lint cache: {exc}')
+            tmp_path.unlink(missing_ok=True)
+
+
+def lint_files(
+    files: List[Tuple[Path, Path]],
+    checks: Dict[str, dict],
+    check_args: tuple,
+    modify: bool = False,
+    jobs: int = 0,
+    cache: Optional[LintCache] = None,
+) -> Iterator[Tuple[Dict[str, int], List[str]]]:
+    """Lint files, in parallel where worthwhile.
+
+    Args:
+        files:
+            List of (file, file_rel) tuples, where file_rel is the file path
+            relative to the workflow directory.
+        checks:
+            The checks to run.
+        check_args:
+            The parse_checks arguments used to create the checks (for
+            creating them in worker processes).
+        modify:
+            Modify files in place, see lint.
+        jobs:
+            The number of processes to use, see get_jobs.
+        cache:
+            Cache of results for unchanged files.
+
+    Yields:
+        (counter, messages) for each file in order, see lint_file.
+
+    """
+    results: List[Optional[Tuple[Dict[str, int], List[str]]]] = []
+    file_hashes: List[str] = []
+    for file, file_rel in files:
+        result = None
+        if cache:
+            file_hashes.append(cache.hash_file(file))
+            result = cache.get(file_rel, file_hashes[-1])
+        results.append(result)
+    to_lint = [ind for ind, result in enumerate(results) if result is None]
+
+    jobs = get_jobs(jobs, len(to_lint))
+    executor: Optional[ProcessPoolExecutor] = None
+    linted: Iterator[Tuple[Dict[str, int], List[str]]]
+    if jobs > 1:
+        executor = ProcessPoolExecutor(
+            max_workers=jobs,
+            mp_context=get_context(MP_START_METHOD),
+            initializer=_init_worker,
+            initargs=(check_args,),
+        )
+        linted = executor.map(
+            _lint_file_worker,
+            *zip(*(files[ind] for ind in to_lint)),
+            [modify] * len(to_lint),
+            chunksize=max(1, len(to_lint) // (jobs * 4)),
+        )
+    else:
+        linted = (
+            lint_file(*files[ind], checks, modify)
+            for ind in to_lint
+        )
+
+    try:
+        for ind, result in enumerate(results):
+            if result is None:
+                result = next(linted)
+                if cache:
+                    cache.put(files[ind][1], file_hashes[ind], result)
+            yield result
+    finally:
+        if executor:
+            executor.shutdown(cancel_futures=True)
+        if cache:
+            cache.save()
+
+
 def get_reference(ruleset: str, output_type: 'Literal["text", "rst"]') -> str:
     """Fill out a template with all the issues Cylc Lint looks for.
     """
@@ -1516,6 +1893,27 @@ def get_option_parser() -> COP:
         default=False,
         dest='exit_zero'
     )
+    parser.add_option(
+        '--jobs', '-j',
+        help=(
+            'Number of processes to lint files with'
+            ' (default: pick based on the number of files and CPUs).'
+        ),
+        type='int',
+        default=0,
+        dest='jobs',
+        metavar='N',
+    )
+    parser.add_option(
+        '--no-cache',
+        help=(
+            'Lint all files, rather than reusing the results for files which'
+            ' have not changed since they were last linted.'
+        ),
+        action='store_true',
+        default=False,
+        dest='no_cache'
+    )
 
     return parser
 
@@ -1550,23 +1948,33 @@ def main(parser: COP, options: 'Values', target=None) -> None:
         target=target, quiet=options.exit_zero, mergedopts=mergedopts)
 
     # Get the checks object.
-    checks = parse_checks(
+    check_args = (
         check_names,
-        ignores=mergedopts[IGNORE],
-        max_line_len=mergedopts[MAX_LINE_LENGTH]
+        mergedopts[IGNORE],
+        mergedopts[MAX_LINE_LENGTH],
     )
+    checks = parse_checks(*check_args)
+
+    cache = None
+    if not (options.inplace or options.no_cache):
+        cache = LintCache(target, checks)
 
     # Check each file matching a pattern:
     counter: CounterType[str] = Counter()
-    for file in get_cylc_files(target, mergedopts[EXCLUDE]):
-        LOG.debug(f'Checking {file}')
-        check_cylc_file(
-            file,
-            file.relative_to(target),
-            checks,
-            counter,
-            options.inplace,
-        )
+    for file_counter, messages in lint_files(
+        [
+            (file, file.relative_to(target))
+            for file in get_cylc_files(target, mergedopts[EXCLUDE])
+        ],
+        checks,
+        check_args,
+        modify=options.inplace,
+        jobs=options.jobs,
+        cache=cache,
+    ):
+        counter.update(file_counter)
+        for message in messages:
+            print(message)
 
     if counter:
         total_lint_hits = sum(counter.values())
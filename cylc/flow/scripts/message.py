@@ -60,6 +60,11 @@ Examples:
   > WARNING:Hey!
   >__STDIN__
 
+  # Send messages from a long-running application as they are written to
+  # STDIN, coalescing messages written within 2 seconds of each other:
+  $ my-app | cylc message --coalesce=2 -- "${CYLC_WORKFLOW_ID}" \
+  >     "${CYLC_TASK_JOB}" -
+
 Note "${CYLC_WORKFLOW_ID}" and "${CYLC_TASK_JOB}" are available in job
 environments - you do not need to write their actual values in task scripting.
 
@@ -93,20 +98,24 @@ identifier.
 """
 
 
-from logging import getLevelName, INFO
+import codecs
 import os
+from select import select
 import sys
-from typing import TYPE_CHECKING
+from time import time
+from typing import TYPE_CHECKING, Iterator, List, Optional
 
 from cylc.flow.id_cli import parse_id
 from cylc.flow.option_parsers import (
     WORKFLOW_ID_ARG_DOC,
     CylcOptionParser as COP
 )
-from cylc.flow.task_message import record_messages
+from cylc.flow.task_message import (
+    parse_messages,
+    record_messages,
+)
 from cylc.flow.terminal import cli_function
 from cylc.flow.exceptions import InputError
-from cylc.flow.unicode_rules import TaskMessageValidator
 
 if TYPE_CHECKING:
     from optparse import Values
@@ -133,9 +142,66 @@ def get_option_parser() -> COP:
         help='Set severity levels for messages that do not have one',
         action='store', dest='severity')
 
+    parser.add_option(
+        '--coalesce',
+        metavar='SECONDS',
+        help=(
+            'Send messages read from STDIN as they arrive rather than once'
+            ' STDIN is closed. Messages which arrive within SECONDS of the'
+            ' first message in a batch are sent together in one request.'
+        ),
+        action='store', type='float', dest='coalesce', default=None)
+
     return parser
 
 
+def read_stdin_batches(coalesce: float) -> Iterator[List[str]]:
+    """Read messages from STDIN, yielding them in batches.
+
+    Messages are separated by empty lines. A batch is yielded once
+    "coalesce" seconds have passed since its first message was read, or when
+    STDIN is closed.
+    """
+    # Note: read the file descriptor directly as select cannot see data
+    # held in the buffer of sys.stdin
+    fd = sys.stdin.fileno()
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    buffer = ''
+    current_message_str = ''
+    batch: List[str] = []
+    deadline: Optional[float] = None
+    while True:
+        timeout = None if deadline is None else max(deadline - time(), 0)
+        if not select([fd], [], [], timeout)[0]:
+            # coalescing interval has elapsed
+            yield batch
+            batch = []
+            deadline = None
+            continue
+        chunk = os.read(fd, 65536)
+        if not chunk:
+            # end of file
+            buffer += decoder.decode(b'', final=True)
+            current_message_str += buffer
+            if current_message_str.strip():
+                batch.append(current_message_str)
+            if batch:
+                yield batch
+            return
+        buffer += decoder.decode(chunk)
+        *lines, buffer = buffer.split('\n')
+        for line in lines:
+            if line.strip():
+                # non-empty line
+                current_message_str += line + '\n'
+            elif current_message_str:
+                # empty line, start next message
+                batch.append(current_message_str)
+                current_message_str = ''  # reset
+                if deadline is None:
+                    deadline = time() + coalesce
+
+
 @cli_function(get_option_parser)
 def main(parser: COP, options: 'Values', *args: str) -> None:
     """CLI."""
@@ -164,6 +230,16 @@ def main(parser: COP, options: 'Values', *args: str) -> None:
             workflow_id,
             constraint='workflows',
         )
+    if '-' in message_strs and options.coalesce is not None:
+        # Send messages from STDIN as they arrive
+        messages = parse_messages(message_strs, options.severity)
+        if messages:
+            record_messages(workflow_id, job_id, messages)
+        for batch in read_stdin_batches(options.coalesce):
+            record_messages(
+                workflow_id, job_id, parse_messages(batch, options.severity)
+            )
+        return
     # Read messages from STDIN
     if '-' in message_strs:
         current_message_str = ''
@@ -182,20 +258,6 @@ def main(parser: COP, options: 'Values', *args: str) -> None:
                 if current_message_str:
                     message_strs.append(current_message_str)
                 break
-    # Separate "severity: message"
-    messages = []  # [(severity, message_str), ...]
-    for message_str in message_strs:
-        if message_str == '-':
-            pass
-        elif ':' in message_str:
-            valid, err_msg = TaskMessageValidator.validate(message_str)
-            if not valid:
-                raise InputError(
-                    f'Invalid task message "{message_str}" - {err_msg}')
-            messages.append(
-                [item.strip() for item in message_str.split(':', 1)])
-        elif options.severity:
-            messages.append([options.severity, message_str.strip()])
-        else:
-            messages.append([getLevelName(INFO), message_str.strip()])
-    record_messages(workflow_id, job_id, messages)
+    record_messages(
+        workflow_id, job_id, parse_messages(message_strs, options.severity)
+    )
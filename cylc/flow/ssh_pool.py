@@ -0,0 +1,235 @@
+# THIS FILE IS PART OF THE CYLC WORKFLOW ENGINE.
+# Copyright (C) NIWA & British Crown (Met Office) & Contributors.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""Share SSH connections to remote hosts between commands.
+
+Opening an SSH connection (key exchange, authentication) often takes much
+longer than the command run over it. For platforms configured with
+``share ssh connections = True``, the scheduler uses OpenSSH connection
+multiplexing so that the commands it runs on a host (job submission, polling
+and killing, remote init and tidy, file installation and job log retrieval)
+reuse a single "master" connection.
+
+The first command to a host starts the master connection (ControlMaster=auto)
+which stays open in the background after the command exits. Later commands to
+the same host connect through its control socket.
+"""
+
+from contextlib import suppress
+import os
+import shlex
+from shutil import rmtree
+
+# CODACY ISSUE:
+#   Consider possible security implications associated with Popen module.
+# REASON IGNORED:
+#   Subprocess is needed, but we use it with security in mind.
+from subprocess import (  # nosec
+    DEVNULL,
+    Popen,
+    TimeoutExpired,
+)
+from tempfile import mkdtemp
+from time import time
+from typing import (
+    Any,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
+
+from cylc.flow import LOG
+
+
+# Seconds between health checks of the master connections.
+CHECK_INTERVAL = 120.0
+# Seconds to wait for a control command (e.g. "ssh -O check") to complete.
+CONTROL_TIMEOUT = 10.0
+# Seconds a master connection stays open while unused. The scheduler closes
+# the connections when it shuts down, this only matters if it is killed.
+CONTROL_PERSIST = 600
+
+
+class SSHConnection(NamedTuple):
+    """A shared connection to a host."""
+
+    host: str
+    # the SSH command with the options for the shared connection
+    ssh_cmd: List[str]
+    # the master connection's control socket
+    path: str
+
+
+class SSHConnectionPool:
+    """Manage shared SSH connections, keyed by (platform name, host).
+
+    Commands use the options returned by "get_ssh_opts" to run over the
+    shared connection to a host, starting the master connection if needed.
+
+    The master connections are health checked periodically (see "check").
+    Connections which are no longer running are forgotten, connections which
+    are not responding are abandoned so that the next command opens a new one.
+
+    Connections to a host are closed when the host is found to be unreachable
+    (see "close") and all connections are closed on shutdown.
+
+    """
+
+    def __init__(self) -> None:
+        # directory containing the control sockets, created when needed
+        self.socket_dir: Optional[str] = None
+        self.connections: Dict[Tuple[str, str], SSHConnection] = {}
+        # number of connections opened, used to name the control sockets
+        self._count = 0
+        # running control commands [(proc, timeout, connection key), ...]
+        self._procs: List[
+            Tuple['Popen[bytes]', float, Optional[Tuple[str, str]]]
+        ] = []
+        self.next_check = time() + CHECK_INTERVAL
+
+    def get_ssh_opts(self, platform: Dict[str, Any], host: str) -> List[str]:
+        """Return the SSH options for running a command on a host.
+
+        Returns an empty list if the platform does not share connections.
+
+        """
+        if not platform.get('share ssh connections'):
+            return []
+        key = (platform['name'], host)
+        if key not in self.connections:
+            if self.socket_dir is None:
+                # NOTE: control socket paths are limited to ~100 characters
+                # so can't go in the workflow run directory
+                self.socket_dir = mkdtemp(prefix='cylc-ssh-')
+            path = os.path.join(self.socket_dir, str(self._count))
+            self._count += 1
+            self.connections[key] = SSHConnection(
+                host,
+                [*shlex.split(platform['ssh command']), *_ssh_opts(path)],
+                path,
+            )
+        return _ssh_opts(self.connections[key].path)
+
+    def get_rsh(self, platform: Dict[str, Any], host: str) -> str:
+        """Return the rsync "--rsh" command for a host."""
+        return ' '.join([
+            platform['ssh command'],
+            *(shlex.quote(opt) for opt in self.get_ssh_opts(platform, host))
+        ])
+
+    def check(self) -> None:
+        """Health check the master connections if due.
+
+        Also reaps control commands started previously, call this regularly.
+
+        """
+        now = time()
+        for proc, timeout, key in list(self._procs):
+            ret_code = proc.poll()
+            if ret_code is None and now < timeout:
+                continue
+            self._procs.remove((proc, timeout, key))
+            if ret_code is None:
+                proc.kill()
+                proc.wait()
+            if key is None or key not in self.connections:
+                # not a health check or the connection has since been closed
+                continue
+            if ret_code is None:
+                # the master is not responding, remove its control socket so
+                # that the next command starts a new master connection
+                conn = self.connections.pop(key)
+                LOG.warning(
+                    f'Shared SSH connection to {conn.host} is not'
+                    ' responding, a new connection will be used'
+                )
+                _unlink(conn.path)
+            elif ret_code != 0:
+                # the master has exited (e.g. idle or lost connection)
+                conn = self.connections.pop(key)
+                LOG.debug(f'Shared SSH connection to {conn.host} has exited')
+                _unlink(conn.path)
+
+        if now < self.next_check:
+            return
+        self.next_check = now + CHECK_INTERVAL
+        checking = {key for _, _, key in self._procs}
+        for key, conn in self.connections.items():
+            if key not in checking and os.path.exists(conn.path):
+                self._control(conn, 'check', key)
+
+    def close(self, host: Optional[str] = None) -> None:
+        """Close the master connections.
+
+        Args:
+            host:
+                Close the connections to this host (e.g. if it has been found
+                to be unreachable) without waiting for them to exit.
+                If not specified, close all connections and wait.
+
+        """
+        for key, conn in list(self.connections.items()):
+            if host is None or conn.host == host:
+                del self.connections[key]
+                if os.path.exists(conn.path):
+                    LOG.debug(f'Closing shared SSH connection to {conn.host}')
+                    self._control(conn, 'exit')
+        if host is not None:
+            return
+        for proc, timeout, _ in self._procs:
+            try:
+                proc.wait(max(timeout - time(), 0))
+            except TimeoutExpired:
+                proc.kill()
+                proc.wait()
+        self._procs.clear()
+        if self.socket_dir is not None:
+            rmtree(self.socket_dir, ignore_errors=True)
+            self.socket_dir = None
+
+    def _control(
+        self,
+        conn: SSHConnection,
+        command: str,
+        key: Optional[Tuple[str, str]] = None,
+    ) -> None:
+        """Send a control command to a master connection."""
+        try:
+            proc = Popen(  # nosec
+                [*conn.ssh_cmd, '-O', command, conn.host],
+                stdin=DEVNULL,
+                stdout=DEVNULL,
+                stderr=DEVNULL,
+            )
+            # * command is constructed via internal interface
+        except OSError as exc:
+            LOG.warning(f'Could not run "ssh -O {command}": {exc}')
+            return
+        self._procs.append((proc, time() + CONTROL_TIMEOUT, key))
+
+
+def _ssh_opts(path: str) -> List[str]:
+    return [
+        '-oControlMaster=auto',
+        f'-oControlPath={path}',
+        f'-oControlPersist={CONTROL_PERSIST}',
+    ]
+
+
+def _unlink(path: str) -> None:
+    with suppress(OSError):
+        os.unlink(path)
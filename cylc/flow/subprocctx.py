@@ -158,6 +158,9 @@ class SubFuncContext(SubProcContext):
         .intvl:
             function call interval in secs (how often to check the
             external trigger)
+        .src_dir:
+            directory to look for local function modules in (under
+            lib/python)
         .ret_val
             function return: (satisfied?, result to pass to trigger tasks)
     """
@@ -183,6 +186,7 @@ class SubFuncContext(SubProcContext):
             self.intvl = float(intvl)
         except (TypeError, ValueError):
             self.intvl = self.DEFAULT_INTVL
+        self.src_dir: Optional[str] = None
         self.ret_val: Tuple[
             bool, Optional[dict]
         ] = (False, None)  # (satisfied, broadcast)
@@ -192,6 +196,7 @@ class SubFuncContext(SubProcContext):
 
     def update_command(self, workflow_run_dir):
         """Update the function wrap command after changes."""
+        self.src_dir = workflow_run_dir
         self.cmd = ['cylc', 'function-run',
                     self.mod_name,
                     self.func_name,
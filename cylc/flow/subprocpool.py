@@ -15,12 +15,30 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 """Manage queueing and pooling of subprocesses for the scheduler."""
 
+import asyncio
 from collections import deque
+from contextlib import (
+    redirect_stderr,
+    redirect_stdout,
+    suppress,
+)
+from heapq import (
+    heappop,
+    heappush,
+)
+from inspect import iscoroutine
+from io import StringIO
 import json
+from multiprocessing import get_context
 import os
 import selectors
 import shlex
-from signal import SIGKILL
+from signal import (
+    SIG_IGN,
+    SIGINT,
+    SIGKILL,
+    signal,
+)
 from subprocess import (  # nosec
     DEVNULL,
     TimeoutExpired,
@@ -30,13 +48,16 @@ import sys
 from tempfile import SpooledTemporaryFile
 from threading import RLock
 from time import time
+from traceback import format_exc
 from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
+    Dict,
     List,
     Optional,
     Set,
+    Tuple,
 )
 
 from cylc.flow import (
@@ -47,10 +68,12 @@ from cylc.flow.cfgspec.glbl_cfg import glbl_cfg
 from cylc.flow.cylc_subproc import procopen
 from cylc.flow.exceptions import PlatformLookupError
 from cylc.flow.hostuserutil import is_remote_host
+from cylc.flow.job_agent import JobAgentPool
 from cylc.flow.platforms import (
     get_platform,
     log_platform_event,
 )
+from cylc.flow.ssh_pool import SSHConnectionPool
 from cylc.flow.subprocctx import SubFuncContext
 from cylc.flow.task_events_mgr import TaskJobLogsRetrieveContext
 from cylc.flow.task_proxy import TaskProxy
@@ -58,9 +81,13 @@ from cylc.flow.wallclock import get_current_time_string
 
 
 if TYPE_CHECKING:
+    from multiprocessing.connection import Connection
+    from multiprocessing.process import BaseProcess
     from subprocess import Popen
 
+    from cylc.flow.job_agent import JobAgent
     from cylc.flow.subprocctx import SubProcContext
+    from cylc.flow.wakeup import Wakeup
 
 _XTRIG_MOD_CACHE: dict = {}
 _XTRIG_FUNC_CACHE: dict = {}
@@ -172,6 +199,236 @@ def run_function(mod_name, func_name, json_args, json_kwargs, src_dir):
     sys.stdout.write(json.dumps(res))
 
 
+def call_function(
+    mod_name: str,
+    func_name: str,
+    func_args: List[Any],
+    func_kwargs: Dict[str, Any],
+    src_dir: Optional[str],
+) -> Tuple[int, Optional[str], str]:
+    """Run a Python function in this process, e.g. in a pool worker.
+
+    Equivalent to run_function but errors are captured rather than raised.
+    Coroutine functions are run to completion.
+
+    Returns:
+        (ret_code, out, err) where out is the function return value as a JSON
+        string and err is anything the function wrote to stdout or stderr
+        (plus the traceback if it failed).
+
+    """
+    err = StringIO()
+    try:
+        with redirect_stdout(err), redirect_stderr(err):
+            func = get_xtrig_func(mod_name, func_name, src_dir)
+            res = func(*func_args, **func_kwargs)
+            if iscoroutine(res):
+                res = asyncio.run(res)
+        return 0, json.dumps(res), err.getvalue()
+    except Exception:
+        return 1, None, err.getvalue() + format_exc()
+
+
+def _function_worker(conn: 'Connection') -> None:
+    """Main loop of a FunctionPool worker process.
+
+    Receive function calls, run them, send back the results.
+    """
+    # interrupts are handled by the scheduler which will stop the pool
+    signal(SIGINT, SIG_IGN)
+    # tell the pool this worker is ready to receive calls
+    conn.send(None)
+    while True:
+        try:
+            call = conn.recv()
+        except EOFError:
+            # pool closed
+            return
+        conn.send(call_function(*call))
+
+
+class FunctionPool:
+    """Run xtrigger functions in a pool of long-lived worker processes.
+
+    An alternative to running each xtrigger function call as a
+    `cylc function-run` subprocess. This avoids the cost of starting a new
+    Python interpreter and importing the xtrigger module for each call.
+
+    Workers are started as required using the "spawn" method so that they
+    share no state with the scheduler. Each function call is sent to an idle
+    worker, calls are queued while all workers are busy or starting up. The
+    timeout of a call starts when it is sent to a worker (so does not include
+    the worker start-up time). A worker which does not return within the
+    timeout is killed and replaced, as is a worker which dies.
+
+    Results are returned in the SubFuncContext in the same form as for
+    `cylc function-run`, i.e. the JSON encoded return value in `.out`.
+
+    """
+
+    def __init__(self, size: int, timeout: float):
+        self.size = size
+        self.timeout = timeout
+        self.mp_context = get_context('spawn')
+        # [[ctx, callback, callback_args], ...]
+        self.queuings: deque = deque()
+        # {worker connection: [worker, ctx, callback, callback_args]}
+        self.runnings: 'Dict[Connection, list]' = {}
+        self.idle: 'List[Tuple[BaseProcess, Connection]]' = []
+        # {worker connection: worker} for workers which are starting up
+        self.starting: 'Dict[Connection, BaseProcess]' = {}
+        # worker connections of running calls and starting workers,
+        # readable when the call returns or the worker is ready
+        self.selector = selectors.DefaultSelector()
+
+    def is_not_done(self) -> bool:
+        """Return True if queuings or runnings not empty."""
+        return bool(self.queuings or self.runnings)
+
+    def get_next_timeout(self) -> Optional[float]:
+        """Return the time the next running call will time out (if any)."""
+        return min(
+            (running[1].timeout for running in self.runnings.values()),
+            default=None
+        )
+
+    def put_function(
+        self,
+        ctx: SubFuncContext,
+        callback: Optional[Callable] = None,
+        callback_args: Optional[list] = None,
+    ) -> None:
+        """Queue a function call."""
+        self.queuings.append([ctx, callback, callback_args])
+
+    def process(self) -> List[list]:
+        """Collect finished calls and start queued calls on idle workers.
+
+        Returns:
+            [[ctx, callback, callback_args], ...] for calls which have
+            finished (or failed).
+
+        """
+        done: List[list] = []
+        for key, _event in self.selector.select(0):
+            conn = key.data
+            if conn in self.starting:
+                self._on_ready(conn, done)
+                continue
+            worker, ctx, *callback = self.runnings.pop(conn)
+            self.selector.unregister(conn)
+            try:
+                ctx.ret_code, ctx.out, ctx.err = conn.recv()
+            except (EOFError, OSError):
+                self._stop_worker(worker, conn)
+                ctx.ret_code = 1
+                ctx.err = (
+                    f'xtrigger worker died (exit code {worker.exitcode})'
+                )
+            else:
+                self.idle.append((worker, conn))
+            done.append([ctx, *callback])
+
+        now = time()
+        for conn, (worker, ctx, *callback) in list(self.runnings.items()):
+            if now > ctx.timeout:
+                del self.runnings[conn]
+                self.selector.unregister(conn)
+                self._stop_worker(worker, conn)
+                ctx.ret_code = 1
+                ctx.err = f'killed on timeout ({self.timeout})'
+                done.append([ctx, *callback])
+
+        while self.queuings and self.idle:
+            ctx, *callback = self.queuings.popleft()
+            worker, conn = self.idle.pop()
+            try:
+                conn.send((
+                    ctx.mod_name,
+                    ctx.func_name,
+                    ctx.func_args,
+                    ctx.func_kwargs,
+                    ctx.src_dir,
+                ))
+            except OSError as exc:
+                self._stop_worker(worker, conn)
+                ctx.ret_code = 1
+                ctx.err = str(exc)
+                done.append([ctx, *callback])
+                continue
+            ctx.timeout = time() + self.timeout
+            self.runnings[conn] = [worker, ctx, *callback]
+            self.selector.register(conn, selectors.EVENT_READ, conn)
+
+        # start more workers for the calls which are still queued
+        while len(self.queuings) > len(self.starting) and (
+            len(self.runnings) + len(self.starting) < self.size
+        ):
+            self._start()
+        return done
+
+    def _start(self) -> None:
+        """Start a new worker, it becomes idle once it is ready."""
+        conn, worker_conn = self.mp_context.Pipe()
+        worker = self.mp_context.Process(
+            target=_function_worker, args=(worker_conn,), daemon=True
+        )
+        worker.start()
+        worker_conn.close()
+        self.starting[conn] = worker
+        self.selector.register(conn, selectors.EVENT_READ, conn)
+
+    def _on_ready(self, conn: 'Connection', done: List[list]) -> None:
+        """Handle a starting worker which is ready (or has died)."""
+        worker = self.starting.pop(conn)
+        self.selector.unregister(conn)
+        try:
+            conn.recv()
+        except (EOFError, OSError):
+            self._stop_worker(worker, conn)
+            # fail a queued call rather than restarting the worker forever
+            if self.queuings:
+                ctx, *callback = self.queuings.popleft()
+                ctx.ret_code = 1
+                ctx.err = (
+                    'xtrigger worker failed to start'
+                    f' (exit code {worker.exitcode})'
+                )
+                done.append([ctx, *callback])
+        else:
+            self.idle.append((worker, conn))
+
+    @staticmethod
+    def _stop_worker(worker: 'BaseProcess', conn: 'Connection') -> None:
+        """Kill a worker and wait for it to exit."""
+        conn.close()
+        worker.kill()
+        worker.join()
+
+    def terminate(self) -> List[list]:
+        """Stop all workers.
+
+        Returns:
+            [[ctx, callback, callback_args], ...] for queued and running
+            calls, which have not been made or have been killed.
+
+        """
+        done = list(self.queuings)
+        self.queuings.clear()
+        for conn, (worker, *call) in self.runnings.items():
+            self._stop_worker(worker, conn)
+            done.append(call)
+        self.runnings.clear()
+        for worker, conn in self.idle:
+            self._stop_worker(worker, conn)
+        self.idle.clear()
+        for conn, worker in self.starting.items():
+            self._stop_worker(worker, conn)
+        self.starting.clear()
+        self.selector.close()
+        return done
+
+
 class SubProcPool:
     """Manage queueing and pooling of subprocesses.
 
@@ -190,6 +447,23 @@ class SubProcPool:
     SubProcContext object as they are read. STDIN can also be specified for the
     command. This is currently fed into the command using a temporary file.
 
+    Where supported (Linux), the exit of a running command and output on its
+    STDOUT and STDERR are reported as events via a process file descriptor
+    (pidfd) so that only commands with something to report are handled when
+    the pool is processed. If a wake-up signal is provided, it is set when
+    any such event occurs. Elsewhere, running commands are polled.
+
+    If `[scheduler]xtrigger pool size` is set, xtrigger functions are run by a
+    FunctionPool of long-lived worker processes rather than as
+    `cylc function-run` commands.
+
+    SSH connections to the hosts of platforms which share connections are
+    managed by an SSHConnectionPool. Commands built with its options reuse the
+    connections, which are closed if the host is found to be unreachable.
+
+    Job commands for platforms which use job agents are sent to long-lived
+    agent processes managed by a JobAgentPool, see cylc.flow.job_agent.
+
     Note: For a cylc command that uses
     `cylc.flow.option_parsers.CylcOptionParser`, the default logging handler
     writes to the STDERR via a StreamHandler. Therefore, log messages will
@@ -202,7 +476,7 @@ class SubProcPool:
     JOBS_SUBMIT = 'jobs-submit'
     RET_CODE_WORKFLOW_STOPPING = 999
 
-    def __init__(self):
+    def __init__(self, wakeup: 'Optional[Wakeup]' = None):
         self.size = glbl_cfg().get(['scheduler', 'process pool size'])
         self.proc_pool_timeout = glbl_cfg().get(
             ['scheduler', 'process pool timeout'])
@@ -210,9 +484,31 @@ class SubProcPool:
         self.stopping = False  # No more job submit if True
         # .stopping may be set by an API command in a different thread
         self.stopping_lock = RLock()
-        self.queuings = deque()
-        self.runnings = []
+        self.queuings: deque = deque()
+        # {pid: [proc, ctx, bad_hosts, callback, ...]}
+        self.runnings: Dict[int, list] = {}
         self.pipepoller = selectors.DefaultSelector()
+        # event driven commands, proc exits (pidfds) and output (pipes)
+        self.selector = selectors.DefaultSelector()
+        self.pidfds: Dict[int, int] = {}
+        # heap of (timeout, pid) for event driven commands
+        self.deadlines: List[Tuple[float, int]] = []
+        # commands which must be polled (no pidfd support)
+        self.polled: Set[int] = set()
+        # xtrigger functions are run by worker processes if configured
+        self.func_pool: Optional[FunctionPool] = None
+        func_pool_size = glbl_cfg().get(['scheduler', 'xtrigger pool size'])
+        if func_pool_size:
+            self.func_pool = FunctionPool(
+                func_pool_size, self.proc_pool_timeout
+            )
+        self.ssh_connections = SSHConnectionPool()
+        self.job_agents = JobAgentPool(
+            self.proc_pool_timeout, self.ssh_connections
+        )
+        self.wakeup = wakeup
+        self._wakeup_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup_fds: Set[int] = set()
 
     def close(self):
         """Mark the pool as closed, which will prevent putting new commands,
@@ -228,7 +524,48 @@ class SubProcPool:
 
     def is_not_done(self):
         """Return True if queuings or runnings not empty."""
-        return self.queuings or self.runnings
+        return (
+            self.queuings
+            or self.runnings
+            or (self.func_pool and self.func_pool.is_not_done())
+            or self.job_agents.is_not_done()
+        )
+
+    def needs_polling(self) -> bool:
+        """Return True if the pool has work which is not signalled as events.
+
+        I.e. queued commands or running commands which do not have a pidfd.
+        """
+        return bool(
+            self.queuings
+            or self.polled
+            or (self.func_pool and self.func_pool.queuings)
+            or self.job_agents.needs_polling()
+        )
+
+    def get_next_timeout(self) -> Optional[float]:
+        """Return the time the next running command will time out (if any)."""
+        timeouts = [
+            self._get_next_proc_timeout(),
+            self.job_agents.get_next_timeout(),
+        ]
+        if self.func_pool:
+            timeouts.append(self.func_pool.get_next_timeout())
+        return min(
+            (timeout for timeout in timeouts if timeout is not None),
+            default=None
+        )
+
+    def _get_next_proc_timeout(self) -> Optional[float]:
+        """Return the time the next event driven subprocess will time out."""
+        while self.deadlines:
+            timeout, pid = self.deadlines[0]
+            running = self.runnings.get(pid)
+            if running and running[1].timeout == timeout:
+                return timeout
+            # command no longer running
+            heappop(self.deadlines)
+        return None
 
     def _is_stopping(self):
         """Return whether .stopping is True or not.
@@ -269,17 +606,35 @@ class SubProcPool:
             callback=callback, callback_args=callback_args,
             callback_255=callback_255, callback_255_args=callback_255_args
         )
+        self._close_bad_host(ctx, bad_hosts)
+
+    def _close_bad_host(
+        self, ctx: 'SubProcContext', bad_hosts: Optional[Set[str]]
+    ) -> None:
+        """Stop using the host of a command if it is unreachable."""
+        if bad_hosts and ctx.host in bad_hosts:
+            self.ssh_connections.close(ctx.host)
+            self.job_agents.stop(ctx.host)
 
     def process(self):
         """Process done child processes and submit more."""
         # Handle child processes that are done
-        runnings = []
-        for running in self.runnings:
+        done = self._get_proc_events()
+        for pid in list(self.polled):
+            running = self.runnings[pid]
+            if running[0].poll() is not None or time() > running[1].timeout:
+                done[pid] = False
+            else:
+                # Unblock proc's STDOUT/STDERR if necessary. Otherwise, a full
+                # STDOUT or STDERR may stop command from proceeding.
+                self._poll_proc_pipes(running[0], running[1])
+        for pid, timed_out in done.items():
             (
                 proc, ctx, bad_hosts,
                 callback, callback_args,
                 callback_255, callback_255_args
-            ) = running
+            ) = self.runnings.pop(pid)
+            self._unwatch_proc(proc)
             # Command completed/exited
             if proc.poll() is not None:
                 self._proc_exit(
@@ -291,7 +646,7 @@ class SubProcPool:
                 )
                 continue
             # Command timed out, kill it
-            if time() > ctx.timeout:
+            if timed_out or time() > ctx.timeout:
                 err_xtra = ""
                 if _killpg(proc, SIGKILL):
                     err_xtra = (
@@ -303,25 +658,7 @@ class SubProcPool:
                     callback_args=callback_args,
                     bad_hosts=bad_hosts
                 )
-                continue
-            # Command still running, see if STDOUT/STDERR are readable or not
-            runnings.append(
-                [
-                    proc,
-                    ctx,
-                    bad_hosts,
-                    callback,
-                    callback_args,
-                    callback_255,
-                    callback_255_args,
-                ]
-            )
-            # Unblock proc's STDOUT/STDERR if necessary. Otherwise, a full
-            # STDOUT or STDERR may stop command from proceeding.
-            self._poll_proc_pipes(proc, ctx)
 
-        # Update list of running items
-        self.runnings[:] = runnings
         # Create more child processes, if items in queue and space in pool
         stopping = self._is_stopping()
         while self.queuings and len(self.runnings) < self.size:
@@ -340,14 +677,141 @@ class SubProcPool:
                 )
                 if proc is not None:
                     ctx.timeout = time() + self.proc_pool_timeout
-                    self.runnings.append([
+                    self.runnings[proc.pid] = [
                         proc, ctx, bad_hosts, callback, callback_args,
                         callback_255, callback_255_args
-                    ])
+                    ]
+                    self._watch_proc(proc, ctx.timeout)
+
+        # Handle xtrigger functions run by worker processes
+        if self.func_pool:
+            for ctx, callback, callback_args in self.func_pool.process():
+                LOG.debug(ctx.dump())
+                self._run_command_exit(
+                    ctx, callback=callback, callback_args=callback_args
+                )
+
+        # Handle job commands run by job agents
+        for ctx, bad_hosts, *callbacks in self.job_agents.process():
+            LOG.debug(ctx)
+            self._run_command_exit(ctx, bad_hosts, *callbacks)
+            self._close_bad_host(ctx, bad_hosts)
+        self.ssh_connections.check()
+        self._arm_wakeup()
+
+    def _watch_proc(self, proc: 'Popen[bytes]', timeout: float) -> None:
+        """Register a running command for exit and output events.
+
+        Falls back to polling the command if pidfds are not supported.
+        """
+        try:
+            pidfd = os.pidfd_open(proc.pid)
+        except (AttributeError, OSError):
+            # AttributeError: not supported on this platform (e.g. darwin)
+            # OSError: not supported by the kernel
+            self.polled.add(proc.pid)
+            return
+        self.pidfds[proc.pid] = pidfd
+        self.selector.register(pidfd, selectors.EVENT_READ, (proc.pid, None))
+        for handle in (proc.stdout, proc.stderr):
+            if handle and not handle.closed:
+                self.selector.register(
+                    handle, selectors.EVENT_READ, (proc.pid, handle)
+                )
+        heappush(self.deadlines, (timeout, proc.pid))
+
+    def _unwatch_proc(self, proc: 'Popen[bytes]') -> None:
+        """Unregister a command which is no longer running."""
+        self.polled.discard(proc.pid)
+        pidfd = self.pidfds.pop(proc.pid, None)
+        if pidfd is None:
+            return
+        for fileobj in (pidfd, proc.stdout, proc.stderr):
+            if fileobj is not None:
+                with suppress(KeyError, ValueError):
+                    self.selector.unregister(fileobj)
+        os.close(pidfd)
+
+    def _get_proc_events(self) -> Dict[int, bool]:
+        """Handle output from event driven commands.
+
+        Returns:
+            {pid: timed_out} for commands which have exited or timed out.
+
+        """
+        done: Dict[int, bool] = {}
+        for key, _event in self.selector.select(0):
+            pid, handle = key.data
+            if handle is None:
+                # the pidfd is readable => the process has exited
+                done[pid] = False
+                continue
+            ctx = self.runnings[pid][1]
+            try:
+                data = os.read(key.fd, 65536).decode()  # 64K
+            except OSError:
+                continue
+            if not data:
+                # EOF
+                self.selector.unregister(handle)
+            elif handle == self.runnings[pid][0].stdout:
+                ctx.out = (ctx.out or '') + data
+            else:
+                ctx.err = (ctx.err or '') + data
+        now = time()
+        while (
+            (timeout := self._get_next_proc_timeout()) is not None
+            and timeout < now
+        ):
+            _, pid = heappop(self.deadlines)
+            done.setdefault(pid, True)
+        return done
+
+    def _arm_wakeup(self) -> None:
+        """Set the wake-up signal when an event driven command has events.
+
+        This is a one-shot callback, it is re-armed each time the pool is
+        processed.
+        """
+        if self.wakeup is None:
+            return
+        fds = set()
+        if self.pidfds:
+            fds.add(self.selector.fileno())
+        if self.func_pool and (
+            self.func_pool.runnings or self.func_pool.starting
+        ):
+            fds.add(self.func_pool.selector.fileno())
+        if self.job_agents.is_not_done():
+            fds.add(self.job_agents.selector.fileno())
+        if not fds - self._wakeup_fds:
+            return
+        try:
+            loop = self._wakeup_loop or asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        for fd in fds - self._wakeup_fds:
+            loop.add_reader(fd, self._on_proc_event)
+        self._wakeup_fds |= fds
+        self._wakeup_loop = loop
+
+    def _disarm_wakeup(self) -> None:
+        if self._wakeup_loop:
+            with suppress(RuntimeError):  # loop closed
+                for fd in self._wakeup_fds:
+                    self._wakeup_loop.remove_reader(fd)
+            self._wakeup_loop = None
+        self._wakeup_fds.clear()
+
+    def _on_proc_event(self) -> None:
+        self._disarm_wakeup()
+        if self.wakeup:
+            self.wakeup.set()
 
     def put_command(
         self, ctx, bad_hosts=None, callback=None, callback_args=None,
-        callback_255=None, callback_255_args=None
+        callback_255=None, callback_255_args=None,
+        agent: 'Optional[JobAgent]' = None,
     ):
         """Queue a new shell command to execute.
 
@@ -360,6 +824,9 @@ class SubProcPool:
                     callback(ctx, *callback_args) -> None
             callback_args (list):
                 Extra arguments to the callback function.
+            agent:
+                Send the command to this job agent rather than running it,
+                see cylc.flow.job_agent.JobAgentPool.put_command.
         """
         if (self.closed or self._is_stopping() and
                 ctx.cmd_key == self.JOBS_SUBMIT):
@@ -370,6 +837,13 @@ class SubProcPool:
                 callback=callback, callback_args=callback_args,
                 callback_255=callback_255, callback_255_args=callback_255_args
             )
+        elif self.func_pool and isinstance(ctx, SubFuncContext):
+            self.func_pool.put_function(ctx, callback, callback_args)
+        elif agent is not None:
+            self.job_agents.put_command(
+                agent, ctx, bad_hosts, callback, callback_args,
+                callback_255, callback_255_args
+            )
         else:
             self.queuings.append(
                 [
@@ -427,13 +901,32 @@ class SubProcPool:
             ctx.ret_code = self.RET_CODE_WORKFLOW_STOPPING
             self._run_command_exit(ctx)
         # Kill remaining processes
-        for value in self.runnings:
+        for value in self.runnings.values():
             proc = value[0]
             if proc:
                 _killpg(proc, SIGKILL)
+        # Kill xtrigger function workers
+        if self.func_pool:
+            self._disarm_wakeup()
+            for ctx, _callback, _callback_args in self.func_pool.terminate():
+                ctx.err = self.ERR_WORKFLOW_STOPPING
+                ctx.ret_code = self.RET_CODE_WORKFLOW_STOPPING
+                self._run_command_exit(ctx)
+            self.func_pool = None
+        # Stop job agents
+        for ctx, _bad_hosts, callback, callback_args, *_ in (
+            self.job_agents.terminate()
+        ):
+            ctx.err = self.ERR_WORKFLOW_STOPPING
+            ctx.ret_code = self.RET_CODE_WORKFLOW_STOPPING
+            self._run_command_exit(
+                ctx, callback=callback, callback_args=callback_args
+            )
         # Wait for child processes
         self.process()
+        self._disarm_wakeup()
         self.pipepoller.close()
+        self.selector.close()
 
     def _poll_proc_pipes(
         self, proc: 'Popen[bytes]', ctx: 'SubProcContext'
@@ -122,6 +122,7 @@ from cylc.flow.task_state import (
     TASK_STATUS_WAITING,
     TASK_STATUSES_ACTIVE,
 )
+from cylc.flow.timer import DeadlineQueue
 from cylc.flow.wallclock import (
     get_current_time_string,
     get_seconds_as_interval_string as intvl_as_str,
@@ -524,6 +525,11 @@ class TaskEventsManager():
         # NOTE: do not mutate directly
         # use the {add,remove,unset_waiting}_event_timers methods
         self._event_timers: Dict[EventKey, Any] = {}
+        # Event timers (excluding those waiting on handlers) by when they
+        # are next due.
+        self.event_timer_queue: DeadlineQueue[EventKey] = DeadlineQueue()
+        # Tasks by when their job poll timer or timeout is next due.
+        self.job_timer_queue: DeadlineQueue[str] = DeadlineQueue()
         # NOTE: flag for DB use
         self.event_timers_updated = True
         self.timestamp = timestamp
@@ -554,6 +560,23 @@ class TaskEventsManager():
         itask.poll_timer.next(no_exhaust=True)
         return True
 
+    def schedule_job_timers(self, itask: 'TaskProxy') -> None:
+        """Schedule the next check of a task's job poll timer and timeout.
+
+        Call whenever either is changed.
+        """
+        deadlines = [itask.timeout]
+        if itask.poll_timer is not None:
+            deadlines.append(itask.poll_timer.timeout)
+        deadline = min(
+            (deadline for deadline in deadlines if deadline is not None),
+            default=None
+        )
+        if deadline is None:
+            self.job_timer_queue.cancel(itask.identity)
+        else:
+            self.job_timer_queue.schedule(itask.identity, deadline)
+
     def check_job_time(self, itask, now):
         """Check/handle job timeout and poll timer"""
         can_poll = self.check_poll_time(itask, now)
@@ -603,8 +626,14 @@ class TaskEventsManager():
         """
         ctx_groups: dict = {}
         now = time()
-        for id_key, timer in self._event_timers.copy().items():
-            if timer.is_waiting:
+        if schd.stop_mode:
+            # Check all timers, held back mail notifications can go now.
+            id_keys = self.event_timer_queue.pop_due(float('inf'))
+        else:
+            id_keys = self.event_timer_queue.pop_due(now)
+        for id_key in id_keys:
+            timer = self._event_timers.get(id_key)
+            if timer is None or timer.is_waiting:
                 continue
             # Set timer if timeout is None.
             if not timer.is_timeout_set():
@@ -633,7 +662,10 @@ class TaskEventsManager():
                 if msg:
                     LOG.debug("%s %s", id_key.tokens.relative_id, msg)
             # Ready to run?
-            if not timer.is_delay_done() or (
+            if not timer.is_delay_done():
+                self.event_timer_queue.schedule(id_key, timer.timeout)
+                continue
+            if (
                 # Avoid flooding user's mail box with mail notification.
                 # Group together as many notifications as possible within a
                 # given interval.
@@ -642,6 +674,7 @@ class TaskEventsManager():
                 self.next_mail_time is not None and
                 self.next_mail_time > now
             ):
+                self.event_timer_queue.schedule(id_key, self.next_mail_time)
                 continue
 
             timer.set_waiting()
@@ -1223,7 +1256,7 @@ class TaskEventsManager():
                 return
 
         # construct the retrieval command
-        ssh_str = str(platform["ssh command"])
+        ssh_str = self.proc_pool.ssh_connections.get_rsh(platform, host)
         rsync_str = str(platform["retrieve job logs command"])
         cmd = shlex.split(rsync_str) + ["--rsh=" + ssh_str]
         if LOG.isEnabledFor(DEBUG):
@@ -1269,6 +1302,7 @@ class TaskEventsManager():
             for key in proc_ctx.cmd_kwargs['id_keys']:
                 timer = self._event_timers[key]
                 timer.reset()
+                self.event_timer_queue.schedule(key, 0)
 
     def _job_logs_retrieval_callback(
         self,
@@ -1373,6 +1407,7 @@ class TaskEventsManager():
                 os.getenv("CYLC_WORKFLOW_RUN_DIR")
             )
             itask.state.add_xtrigger(label)
+        self.xtrigger_mgr.add_task(itask)
 
         # add the retry xtrigger to the data store
         sig = self.xtrigger_mgr.get_xtrig_ctx(itask, label).get_signature()
@@ -1915,6 +1950,7 @@ class TaskEventsManager():
             # Reset, task not active
             itask.timeout = None
             itask.poll_timer = None
+            self.schedule_job_timers(itask)
             return
 
         ctx = (itask.submit_num, itask.state.status)
@@ -1976,6 +2012,7 @@ class TaskEventsManager():
         LOG.debug(f"[{itask}] {message}")
         # Set next poll time
         self.check_poll_time(itask)
+        self.schedule_job_timers(itask)
 
     @staticmethod
     def process_execution_polling_intervals(
@@ -2054,16 +2091,21 @@ class TaskEventsManager():
     ) -> None:
         """Add a new event timer."""
         self._event_timers[id_key] = event_timer
+        if not event_timer.is_waiting:
+            self.event_timer_queue.schedule(id_key, event_timer.timeout or 0)
         self.event_timers_updated = True
 
     def remove_event_timer(self, id_key: EventKey) -> None:
         """Remove an event timer."""
         del self._event_timers[id_key]
+        self.event_timer_queue.cancel(id_key)
         self.event_timers_updated = True
 
     def unset_waiting_event_timer(self, id_key: EventKey) -> None:
         """Invoke unset_waiting on an event timer."""
-        self._event_timers[id_key].unset_waiting()
+        timer = self._event_timers[id_key]
+        timer.unset_waiting()
+        self.event_timer_queue.schedule(id_key, timer.timeout or 0)
         self.event_timers_updated = True
 
     def reset_bad_hosts(self):
@@ -80,6 +80,7 @@ from cylc.flow.run_modes import (
     WORKFLOW_ONLY_MODES,
     RunMode,
 )
+from cylc.flow.run_modes.dummy import configure_dummy_mode
 from cylc.flow.subprocctx import SubProcContext
 from cylc.flow.subprocpool import SubProcPool
 from cylc.flow.task_action_timer import (
@@ -189,10 +190,15 @@ class TaskJobManager:
         """Check submission and execution timeout and polling timers.
 
         Poll tasks that have timed out and/or have reached next polling time.
+        Only tasks whose timers are due are checked.
         """
         now = time()
         poll_tasks = set()
-        for itask in task_pool.get_tasks():
+        for id_ in self.task_events_mgr.job_timer_queue.pop_due(now):
+            itask = task_pool._get_task_by_id(id_)
+            if itask is None:
+                # task no longer in the pool
+                continue
             if self.task_events_mgr.check_job_time(itask, now):
                 poll_tasks.add(itask)
                 if itask.poll_timer.delay is not None:
@@ -200,6 +206,7 @@ class TaskJobManager:
                         f"[{itask}] poll now, (next in "
                         f"{itask.poll_timer.delay_timeout_as_str()})"
                     )
+            self.task_events_mgr.schedule_job_timers(itask)
         if poll_tasks:
             self.poll_task_jobs(poll_tasks)
 
@@ -506,10 +513,16 @@ class TaskJobManager:
                 '%s ... # will invoke in batches, sizes=%s',
                 cmd, [len(b) for b in itasks_batches])
 
+            agent = None
             if remote_mode:
-                cmd = construct_ssh_cmd(
-                    cmd, platform, host
+                agent = self.proc_pool.job_agents.get(
+                    platform, host, self.bad_hosts
                 )
+                if agent is None:
+                    cmd = construct_ssh_cmd(
+                        cmd, platform, host,
+                        ssh_connections=self.proc_pool.ssh_connections,
+                    )
             else:
                 cmd = ['cylc'] + cmd
 
@@ -558,18 +571,32 @@ class TaskJobManager:
                     callback=self._submit_task_jobs_callback,
                     callback_args=[itasks_batch],
                     callback_255=self._submit_task_jobs_callback_255,
+                    agent=agent,
                 )
         return done_tasks
 
+    def _get_rtconfig(self, itask: 'TaskProxy') -> dict:
+        """Return the config for a task's job with broadcasts applied.
+
+        The config of dummy mode tasks is adjusted for dummy mode.
+        """
+        rtconfig = self.task_events_mgr.broadcast_mgr.get_updated_rtconfig(
+            itask
+        )
+        if itask.run_mode == RunMode.DUMMY:
+            rtconfig = configure_dummy_mode(
+                rtconfig,
+                itask.tdef.rtconfig['simulation']['fail cycle points'],
+            )
+        return rtconfig
+
     def _select_new_platform(self, itask: 'TaskProxy') -> bool:
         """Try to select a new platform for a task if it is using a
         platform group and the current platform is not available.
 
         Return True if a new platform was selected.
         """
-        rtconf = self.task_events_mgr.broadcast_mgr.get_updated_rtconfig(
-            itask
-        )
+        rtconf = self._get_rtconfig(itask)
         try:
             new_platform = get_platform(rtconf, bad_hosts=self.bad_hosts)
         except PlatformLookupError:
@@ -963,14 +990,20 @@ class TaskJobManager:
             host = 'localhost'
 
             ctx = SubProcContext(cmd_key, cmd, host=host)
+            agent = None
             if remote_mode:
                 try:
                     host = get_host_from_platform(
                         platform, bad_hosts=self.bad_hosts
                     )
-                    cmd = construct_ssh_cmd(
-                        cmd, platform, host
+                    agent = self.proc_pool.job_agents.get(
+                        platform, host, self.bad_hosts
                     )
+                    if agent is None:
+                        cmd = construct_ssh_cmd(
+                            cmd, platform, host,
+                            ssh_connections=self.proc_pool.ssh_connections,
+                        )
                 except NoHostsError:
                     ctx.err = f'No available hosts for {platform["name"]}'
                     LOG.debug(ctx)
@@ -989,6 +1022,7 @@ class TaskJobManager:
                 callback=callback,
                 callback_args=[itasks],
                 callback_255=callback_255,
+                agent=agent,
             )
 
     @staticmethod
@@ -1149,9 +1183,7 @@ class TaskJobManager:
             return itask
 
         # Handle broadcasts
-        rtconfig = self.task_events_mgr.broadcast_mgr.get_updated_rtconfig(
-            itask
-        )
+        rtconfig = self._get_rtconfig(itask)
 
         # BACK COMPAT: host logic
         # Determine task host or platform now, just before job submission,
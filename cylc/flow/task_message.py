@@ -24,21 +24,24 @@ Send messages to:
 from logging import (
     CRITICAL,
     ERROR,
+    INFO,
     WARNING,
     getLevelName,
 )
+import json
 import os
 import sys
-from typing import List
+from typing import List, Optional
 
-from cylc.flow.exceptions import WorkflowStopped
-import cylc.flow.flags
-from cylc.flow.network.client_factory import (
-    CommsMeth,
-    get_client,
-    get_comms_method,
+from cylc.flow.exceptions import (
+    ClientError,
+    ClientTimeout,
+    CylcError,
+    InputError,
+    RequestError,
+    WorkflowStopped,
 )
-from cylc.flow.pathutil import get_workflow_run_job_dir
+import cylc.flow.flags
 from cylc.flow.task_outputs import (
     TASK_OUTPUT_FAILED,
     TASK_OUTPUT_STARTED,
@@ -46,6 +49,10 @@ from cylc.flow.task_outputs import (
 )
 from cylc.flow.wallclock import get_current_time_string
 
+# NOTE: This module is used by "cylc message" which is run by every job
+# several times. Avoid importing anything expensive (e.g. cylc.flow.network)
+# at the top level.
+
 
 CYLC_JOB_PID = "CYLC_JOB_PID"
 CYLC_JOB_INIT_TIME = "CYLC_JOB_INIT_TIME"
@@ -59,6 +66,10 @@ VACATION_MESSAGE_PREFIX = "vacated"
 
 STDERR_LEVELS = (getLevelName(level) for level in (WARNING, ERROR, CRITICAL))
 
+# Seconds to wait for the scheduler to respond to a message
+# (see cylc.flow.network.client.WorkflowRuntimeClientBase.DEFAULT_TIMEOUT).
+SEND_TIMEOUT = 5
+
 MUTATION = '''
 mutation (
   $wFlows: [WorkflowID]!,
@@ -108,10 +119,84 @@ def record_messages(workflow: str, job_id: str, messages: List[list]) -> None:
     event_time = get_current_time_string(
         override_use_utc=(os.getenv('CYLC_UTC') == 'True'))
     write_messages(workflow, job_id, messages, event_time)
-    if get_comms_method() != CommsMeth.POLL:
+    # NOTE: use the environment rather than get_comms_method to avoid
+    # importing cylc.flow.network
+    if os.getenv('CYLC_TASK_COMMS_METHOD') != 'poll':
         send_messages(workflow, job_id, messages, event_time)
 
 
+def parse_messages(
+    message_strs: List[str], severity: Optional[str]
+) -> List[List[str]]:
+    """Separate "severity: message".
+
+    Returns:
+        List in the format ``[[severity, message], ...]``.
+
+    """
+    messages = []  # [(severity, message_str), ...]
+    for message_str in message_strs:
+        if message_str == '-':
+            pass
+        elif ':' in message_str:
+            # (imported here as this is expensive to import)
+            from cylc.flow.unicode_rules import TaskMessageValidator
+            valid, err_msg = TaskMessageValidator.validate(message_str)
+            if not valid:
+                raise InputError(
+                    f'Invalid task message "{message_str}" - {err_msg}')
+            messages.append(
+                [item.strip() for item in message_str.split(':', 1)])
+        elif severity:
+            messages.append([severity, message_str.strip()])
+        else:
+            messages.append([getLevelName(INFO), message_str.strip()])
+    return messages
+
+
+def fast_message(args: List[str]) -> Optional[int]:
+    """Run "cylc message" as called by job scripts.
+
+    Job scripts send messages using:
+
+    .. code-block:: bash
+
+       cylc message -- "${CYLC_WORKFLOW_ID}" "${CYLC_TASK_JOB}" MESSAGE...
+
+    This is handled without loading the full Cylc CLI (entry points, option
+    parsing, ID parsing, etc) which would otherwise take most of the run time
+    of the command.
+
+    Args:
+        args: The command line arguments (after "cylc message").
+
+    Returns:
+        The exit code, or None if the arguments are not in this form, in which
+        case the full CLI should be used.
+
+    """
+    if (
+        len(args) < 4
+        or args[0] != '--'
+        # the ID in the job environment is already in its canonical form
+        or args[1] != os.getenv('CYLC_WORKFLOW_ID')
+        or '-' in args[3:]
+    ):
+        return None
+    workflow, job_id, *message_strs = args[1:]
+    try:
+        messages = parse_messages(message_strs, None)
+    except InputError:
+        # let the full CLI report the error
+        return None
+    try:
+        record_messages(workflow, job_id, messages)
+    except CylcError as exc:
+        print(f'{type(exc).__name__}: {exc}', file=sys.stderr)
+        return 1
+    return 0
+
+
 def write_messages(workflow, job_id, messages, event_time):
     # Print to stdout/stderr
     for severity, message in messages:
@@ -129,6 +214,11 @@ def send_messages(
     workflow: str, job_id: str, messages: List[list], event_time: str
 ) -> None:
     workflow = os.path.normpath(workflow)
+    if (
+        os.getenv('CYLC_TASK_COMMS_METHOD', 'zmq') == 'zmq'
+        and put_messages(workflow, job_id, messages, event_time)
+    ):
+        return
     try:
         pclient = get_client(workflow)
     except WorkflowStopped:
@@ -144,22 +234,136 @@ def send_messages(
             traceback.print_exc()
         # cylc message shouldn't fail if the client can't initialize.
         return
-    mutation_kwargs = {
-        'request_string': MUTATION,
-        'variables': {
-            'wFlows': [workflow],
-            'taskJob': job_id,
-            'eventTime': event_time,
-            'messages': messages,
+    try:
+        pclient(
+            'put_messages', {'messages': [[job_id, event_time, messages]]}
+        )
+    except ClientError as exc:
+        if 'No method by the name' not in str(exc):
+            raise
+        # BACK COMPAT: put_messages endpoint
+        # from:
+        #     8.7.0
+        # remove at:
+        #     9.0?
+        # (Schedulers prior to 8.7.0 only accept messages via GraphQL)
+        mutation_kwargs = {
+            'request_string': MUTATION,
+            'variables': {
+                'wFlows': [workflow],
+                'taskJob': job_id,
+                'eventTime': event_time,
+                'messages': messages,
+            }
         }
-    }
-    pclient('graphql', mutation_kwargs)
+        pclient('graphql', mutation_kwargs)
+
+
+def get_client(workflow, timeout=None):
+    """Return a client for the workflow (see send_messages)."""
+    # (imported here as this is expensive to import)
+    from cylc.flow.network.client_factory import get_client
+    return get_client(workflow, timeout=timeout)
+
+
+def put_messages(
+    workflow: str, job_id: str, messages: List[list], event_time: str
+) -> bool:
+    """Send messages to the scheduler using a minimal ZMQ client.
+
+    This makes the same "put_messages" request as the full client, without
+    the cost of importing it (asyncio, GraphQL, workflow files, etc).
+
+    It reads the contact file and keys from the workflow run directory in the
+    job environment, so can only be used by jobs of the workflow.
+
+    Returns:
+        False if the messages could not be sent this way, in which case the
+        full client should be used (which reports any problems).
+
+    Raises:
+        ClientTimeout: If the scheduler does not respond.
+        RequestError: If the scheduler returns an error.
+
+    """
+    run_dir = os.getenv('CYLC_WORKFLOW_RUN_DIR')
+    if not run_dir or os.getenv('CYLC_WORKFLOW_ID') != workflow:
+        return False
+
+    # see cylc.flow.workflow_files.load_contact_file & KeyInfo
+    srv_dir = os.path.join(run_dir, '.service')
+    try:
+        with open(os.path.join(srv_dir, 'contact')) as contact_file:
+            contact = dict(
+                line.strip().split('=', 1)
+                for line in contact_file
+                if '=' in line
+            )
+        host = contact['CYLC_WORKFLOW_HOST']
+        port = int(contact['CYLC_WORKFLOW_PORT'])
+    except (OSError, KeyError, ValueError):
+        return False
+
+    from socket import gethostname
+    import zmq
+    import zmq.auth
+    try:
+        client_public_key, client_private_key = zmq.auth.load_certificate(
+            os.path.join(srv_dir, 'client.key_secret')
+        )
+        server_public_key = zmq.auth.load_certificate(
+            os.path.join(srv_dir, 'server.key')
+        )[0]
+    except (OSError, ValueError):
+        return False
+    if client_private_key is None:
+        return False
+
+    context = zmq.Context()
+    socket = context.socket(zmq.REQ)
+    try:
+        socket.linger = 0
+        socket.curve_publickey = client_public_key
+        socket.curve_secretkey = client_private_key
+        socket.curve_serverkey = server_public_key
+        socket.connect(f'tcp://{host}:{port}')
+        socket.send_string(json.dumps({
+            'command': 'put_messages',
+            'args': {'messages': [[job_id, event_time, messages]]},
+            # see cylc.flow.network.client.WorkflowRuntimeClient.get_header
+            'meta': {
+                'prog': 'message',
+                'host': gethostname(),
+                'comms_method': os.getenv('CLIENT_COMMS_METH', 'zmq'),
+            },
+        }))
+        if not socket.poll(SEND_TIMEOUT * 1000):
+            raise ClientTimeout(
+                'Timeout waiting for server response.'
+                ' This could be due to network or server issues.',
+                workflow,
+            )
+        response = json.loads(socket.recv())
+    finally:
+        socket.close()
+        context.term()
+
+    if 'data' in response:
+        return True
+    error = response.get('error')
+    if isinstance(error, dict):
+        error = error.get('message', error)
+    if "No method by the name 'put_messages'" in str(error):
+        # BACK COMPAT: put_messages endpoint (see send_messages)
+        return False
+    raise RequestError(str(error), response.get('cylc_version'))
 
 
 def _append_job_status_file(workflow, job_id, event_time, messages):
     """Write messages to job status file."""
     job_log_name = os.getenv('CYLC_TASK_LOG_ROOT')
     if not job_log_name:
+        from cylc.flow.pathutil import get_workflow_run_job_dir
         job_log_name = get_workflow_run_job_dir(workflow, job_id, 'job')
     try:
         job_status_file = open(job_log_name + '.status', 'a')  # noqa: SIM115
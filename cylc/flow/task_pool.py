@@ -91,6 +91,7 @@ from cylc.flow.task_state import (
     status_geq,
 )
 from cylc.flow.task_trigger import TaskTrigger
+from cylc.flow.timer import DeadlineQueue
 from cylc.flow.util import deserialise_set
 from cylc.flow.workflow_status import StopMode
 from cylc.flow.scripts.set import XTRIGGER_PREREQ_PREFIX
@@ -193,6 +194,20 @@ class TaskPool:
         # Tasks in the active window of the workflow.
         self.active_tasks: Pool = {}
         self._active_tasks_list: List[TaskProxy] = []
+        # Secondary indexes of active_tasks (maintained by add_to_pool,
+        # remove and _swap_out) for lookups which don't depend on the point.
+        self._tasks_by_id: Dict[str, TaskProxy] = {}
+        self._tasks_by_name: Dict[str, Dict[str, TaskProxy]] = {}
+        # Active tasks by when they will be late or clock-expire.
+        self.late_timers: DeadlineQueue[str] = DeadlineQueue()
+        self.expiry_timers: DeadlineQueue[str] = DeadlineQueue()
+        # Tasks past their clock-expiry time which cannot expire yet.
+        self.expiry_pending: Set[str] = set()
+        # Tasks to check for xtriggers, external triggers and readiness to
+        # run in the next main loop iteration (see get_tasks_to_check).
+        self.tasks_to_check: Dict[str, TaskProxy] = {}
+        # Tasks whose state has changed (see get_updated_tasks).
+        self.updated_tasks: Dict[str, TaskProxy] = {}
         self.active_tasks_changed = False
         self.tasks_removed = False
 
@@ -240,9 +255,79 @@ class TaskPool:
 
     def _swap_out(self, itask):
         """Swap old task for new, during reload."""
-        if itask.identity in self.active_tasks.get(itask.point, set()):
+        if itask.identity in self._tasks_by_id:
             self.active_tasks[itask.point][itask.identity] = itask
+            self._tasks_by_id[itask.identity] = itask
+            self._tasks_by_name[itask.tdef.name][itask.identity] = itask
             self.active_tasks_changed = True
+            self._schedule_task_timers(itask)
+            self._watch_task(itask)
+
+    def _schedule_task_timers(self, itask: TaskProxy) -> None:
+        """Schedule the late and clock-expiry checks for a task."""
+        self.late_timers.cancel(itask.identity)
+        self.expiry_timers.cancel(itask.identity)
+        if not itask.is_late and itask.get_late_time():
+            self.late_timers.schedule(itask.identity, itask.get_late_time())
+        if itask.expire_time is not None:
+            self.expiry_timers.schedule(itask.identity, itask.expire_time)
+
+    def _watch_task(self, itask: TaskProxy) -> None:
+        """Track state changes of a task added to the pool."""
+        itask.on_state_change = self._on_task_state_change
+        if itask.state.is_updated:
+            self.updated_tasks[itask.identity] = itask
+        self.check_task(itask)
+
+    def _on_task_state_change(self, itask: TaskProxy) -> None:
+        """Record a task whose state has changed."""
+        self.updated_tasks[itask.identity] = itask
+        self.check_task(itask)
+
+    def get_updated_tasks(self) -> List[TaskProxy]:
+        """Return the tasks (still in the pool) whose state has changed.
+
+        I.e. the tasks with the TaskState.is_updated flag set. The tasks are
+        cleared, reset the flag once they have been handled.
+        """
+        itasks = [
+            itask
+            for id_, itask in self.updated_tasks.items()
+            if self._tasks_by_id.get(id_) is itask and itask.state.is_updated
+        ]
+        self.updated_tasks.clear()
+        return itasks
+
+    def check_task(self, itask: TaskProxy) -> None:
+        """Check a task in the next main loop iteration.
+
+        Call when something has changed which may affect whether the task is
+        ready to run, e.g. its state has changed or an xtrigger it depends on
+        has been satisfied.
+
+        Tasks are not otherwise checked, so unchanged waiting tasks are not
+        rescanned on every main loop iteration. Only waiting tasks which are
+        not queued or runahead limited need checking.
+        """
+        if (
+            itask.state(TASK_STATUS_WAITING)
+            and not itask.state.is_queued
+            and not itask.state.is_runahead
+        ):
+            self.tasks_to_check[itask.identity] = itask
+
+    def get_tasks_to_check(self) -> List[TaskProxy]:
+        """Return the tasks to check (still in the pool), in pool order.
+
+        The tasks are cleared.
+        """
+        itasks = [
+            itask
+            for id_, itask in self.tasks_to_check.items()
+            if self._tasks_by_id.get(id_) is itask
+        ]
+        self.tasks_to_check.clear()
+        return sorted(itasks, key=lambda itask: itask.point)
 
     def load_from_point(self):
         """Load the task pool for the workflow start point.
@@ -270,13 +355,19 @@ class TaskPool:
     def add_to_pool(self, itask) -> None:
         """Add a task to the pool."""
 
-        self.active_tasks.setdefault(itask.point, {})
-        if itask.identity in self.active_tasks[itask.point]:
+        if itask.identity in self._tasks_by_id:
             # If logged, something has gone wrong.
             LOG.debug(f"{itask.identity} not added to n=0: already exists")
             return None
-        self.active_tasks[itask.point][itask.identity] = itask
+        self.active_tasks.setdefault(itask.point, {})[itask.identity] = itask
+        self._tasks_by_id[itask.identity] = itask
+        self._tasks_by_name.setdefault(itask.tdef.name, {})[
+            itask.identity
+        ] = itask
         self.active_tasks_changed = True
+        self.xtrigger_mgr.add_task(itask)
+        self._schedule_task_timers(itask)
+        self._watch_task(itask)
         LOG.debug(f"[{itask}] added to the n=0 window")
 
         self.create_data_store_elements(itask)
@@ -400,6 +491,10 @@ class TaskPool:
 
         LOG.debug(f"Runahead: base point {base_point}")
 
+        if base_point != self._prev_runahead_base_point:
+            # cycles behind the base point are unlikely to be spawned into
+            self.workflow_db_mgr.task_history.evict(base_point)
+
         if self._prev_runahead_base_point is None:
             self._prev_runahead_base_point = base_point
 
@@ -505,7 +600,7 @@ class TaskPool:
             return False
 
         for task_outputs, task_flow_nums in (
-            self.workflow_db_mgr.pri_dao.select_task_outputs(task, cycle)
+            self.workflow_db_mgr.select_task_outputs(task, cycle)
         ).items():
             # loop through matching tasks
             # (if task_flow_nums is empty, it means the 'none' flow)
@@ -591,6 +686,7 @@ class TaskPool:
                     itask.set_summary_time('started', time_run)
                 if timeout is not None:
                     itask.timeout = timeout
+                    self.task_events_mgr.schedule_job_timers(itask)
             elif status == TASK_STATUS_PREPARING:
                 # put back to be readied again.
                 status = TASK_STATUS_WAITING
@@ -695,6 +791,9 @@ class TaskPool:
                     break
             else:  # no break
                 ctx = ctx_data
+                if ctx and ctx[0] == tuple.__name__:
+                    # plain tuple e.g. poll timer (submit_num, status)
+                    ctx = ctx[1][0]
                 if ctx is not None:
                     ctx = tuple(ctx)
             delays = json.loads(str(delays_raw))
@@ -710,6 +809,7 @@ class TaskPool:
                 return
             itask.poll_timer = TaskActionTimer(
                 ctx, delays, num, delay, timeout)
+            self.task_events_mgr.schedule_job_timers(itask)
         elif ctx_key[0] == "try_timers":
             itask = self._get_task_by_id(id_)
             if itask is None:
@@ -913,6 +1013,10 @@ class TaskPool:
         except KeyError:
             pass
         else:
+            del self._tasks_by_id[itask.identity]
+            del self._tasks_by_name[itask.tdef.name][itask.identity]
+            if not self._tasks_by_name[itask.tdef.name]:
+                del self._tasks_by_name[itask.tdef.name]
             self.tasks_to_trigger_now.discard(itask)
             self.pre_start_tasks_to_trigger.discard(
                 (itask.tdef.name, itask.point)
@@ -922,6 +1026,11 @@ class TaskPool:
             if not self.active_tasks[itask.point]:
                 del self.active_tasks[itask.point]
             self.task_queue_mgr.remove_task(itask)
+            self.xtrigger_mgr.remove_task(itask)
+            self.late_timers.cancel(itask.identity)
+            self.expiry_timers.cancel(itask.identity)
+            self.expiry_pending.discard(itask.identity)
+            itask.on_state_change = None
             if itask.tdef.max_future_prereq_offset is not None:
                 self.set_max_future_offset()
 
@@ -978,20 +1087,17 @@ class TaskPool:
             for point, itask_id_map in self.active_tasks.items()
         }
 
+    def get_tasks_by_name(self, name: str) -> List[TaskProxy]:
+        """Return the task proxies in the pool with the given task name."""
+        return list(self._tasks_by_name.get(name, {}).values())
+
     def get_task(self, point: 'PointBase', name: str) -> Optional[TaskProxy]:
         """Retrieve a task from the pool."""
-        rel_id = f'{point}/{name}'
-        tasks = self.active_tasks.get(point)
-        if tasks:
-            return tasks.get(rel_id)
-        return None
+        return self._tasks_by_id.get(f'{point}/{name}')
 
     def _get_task_by_id(self, id_: str) -> Optional[TaskProxy]:
         """Return pool task by ID if it exists, or None."""
-        for itask_ids in self.active_tasks.values():
-            if id_ in itask_ids:
-                return itask_ids[id_]
-        return None
+        return self._tasks_by_id.get(id_)
 
     def get_itasks(self, ids: 'Iterable[Tokens]') -> List[TaskProxy]:
         """Return a list of itasks matching the IDs provided.
@@ -1004,9 +1110,9 @@ class TaskPool:
 
         """
         return [
-            itasks[id_]
-            for itasks in self.active_tasks.values()
-            for id_ in itasks.keys() & {id_.relative_id for id_ in ids}
+            self._tasks_by_id[id_]
+            for id_ in dict.fromkeys(id_.relative_id for id_ in ids)
+            if id_ in self._tasks_by_id
         ]
 
     def queue_task(self, itask: TaskProxy) -> None:
@@ -1149,7 +1255,7 @@ class TaskPool:
         tasks = self.get_tasks()
         # Log tasks orphaned by a reload but not currently in the task pool.
         for name in orphans:
-            if name not in (itask.tdef.name for itask in tasks):
+            if name not in self._tasks_by_name:
                 LOG.info("Removed task: '%s'", name)
         # Store lists of tasks which were active before reload.
         warn_tasks: List[str] = []
@@ -1187,6 +1293,7 @@ class TaskPool:
                     self.check_task_output,
                 )
                 self._swap_out(new_task)
+                self.xtrigger_mgr.add_task(new_task)
                 self.data_store_mgr.delta_task_prerequisite(new_task)
                 LOG.info(f"[{itask}] reloaded task definition")
 
@@ -1756,9 +1863,7 @@ class TaskPool:
         status: Optional[str] = None
         flow_wait = False
 
-        info = self.workflow_db_mgr.pri_dao.select_prev_instances(
-            name, str(point)
-        )
+        info = self.workflow_db_mgr.select_prev_instances(name, str(point))
         with suppress(ValueError):
             submit_num = max(s[0] for s in info)
 
@@ -1781,7 +1886,7 @@ class TaskPool:
 
         NOTE this creates a task_states/task_outputs DB entry if not present.
         """
-        info = self.workflow_db_mgr.pri_dao.select_task_outputs(
+        info = self.workflow_db_mgr.select_task_outputs(
             itask.tdef.name, str(itask.point))
         if not info:
             # task never ran before
@@ -2456,7 +2561,12 @@ class TaskPool:
 
     def clock_expire_tasks(self):
         """Expire any tasks past their clock-expiry time."""
-        for itask in self.get_tasks():
+        self.expiry_pending.update(self.expiry_timers.pop_due())
+        for id_ in list(self.expiry_pending):
+            itask = self._tasks_by_id.get(id_)
+            if itask is None or itask.state(TASK_STATUS_EXPIRED):
+                self.expiry_pending.discard(id_)
+                continue
             if (
                 # force triggered tasks can not clock-expire
                 # see proposal point 10:
@@ -2471,6 +2581,7 @@ class TaskPool:
                 # check if this task is clock expired
                 and itask.clock_expire()
             ):
+                self.expiry_pending.discard(id_)
                 self.task_queue_mgr.remove_task(itask)
                 self.task_events_mgr.process_message(
                     itask,
@@ -2480,13 +2591,8 @@ class TaskPool:
 
     def task_succeeded(self, id_):
         """Return True if task with id_ is in the succeeded state."""
-        return any(
-            (
-                itask.identity == id_
-                and itask.state(TASK_STATUS_SUCCEEDED)
-            )
-            for itask in self.get_tasks()
-        )
+        itask = self._tasks_by_id.get(id_)
+        return itask is not None and itask.state(TASK_STATUS_SUCCEEDED)
 
     def stop_flow(self, flow_num):
         """Stop a given flow from spawning any further.
@@ -2532,8 +2638,7 @@ class TaskPool:
                 task=itask.tokens['task'],
                 task_sel=itask.state.status,
             )
-            for itasks in self.active_tasks.values()
-            for itask in itasks.values()
+            for itask in self._tasks_by_id.values()
         }
 
         return id_match(
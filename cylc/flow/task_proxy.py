@@ -92,6 +92,9 @@ class TaskProxy:
             late if it is never active.
         .non_unique_events (collections.Counter):
             Count non-unique events (e.g. critical, warning, custom).
+        .on_state_change:
+            Called with the task proxy whenever its state is reset (set by
+            the task pool for tasks in the pool).
         .point:
             Cycle point of the task.
         .point_as_seconds:
@@ -191,6 +194,7 @@ class TaskProxy:
         'late_time',
         'local_job_file_path',
         'non_unique_events',
+        'on_state_change',
         'point',
         'point_as_seconds',
         'poll_timer',
@@ -281,6 +285,7 @@ class TaskProxy:
         self.timeout: Optional[float] = None
         self.try_timers: Dict[str, 'TaskActionTimer'] = {}
         self.non_unique_events: TypingCounter[str] = Counter()
+        self.on_state_change: Optional[Callable[['TaskProxy'], None]] = None
 
         self.clock_trigger_times: Dict[str, int] = {}
         self.expire_time: Optional[float] = None
@@ -569,6 +574,8 @@ class TaskProxy:
         ):
             if not silent and not self.transient:
                 LOG.info(f"[{before}] => {self.state}")
+            if self.on_state_change is not None:
+                self.on_state_change(self)
             return True
 
         return False
@@ -270,7 +270,10 @@ class TaskRemoteMgr:
             self.ready = True
         else:
             log_platform_event('remote init', platform, host)
-            cmd = construct_ssh_cmd(cmd, platform, host)
+            cmd = construct_ssh_cmd(
+                cmd, platform, host,
+                ssh_connections=self.proc_pool.ssh_connections,
+            )
             self.proc_pool.put_command(
                 SubProcContext(
                     'remote-init', cmd, stdin_files=[tmphandle], host=host
@@ -297,7 +300,10 @@ class TaskRemoteMgr:
         host = get_host_from_platform(
             platform, bad_hosts=self.bad_hosts
         )
-        cmd = construct_ssh_cmd(cmd, platform, host, timeout='10s')
+        cmd = construct_ssh_cmd(
+            cmd, platform, host, timeout='10s',
+            ssh_connections=self.proc_pool.ssh_connections,
+        )
         return cmd, host
 
     @staticmethod
@@ -509,6 +515,10 @@ class TaskRemoteMgr:
             # added or removed, in order to update the Authenticator's
             # state.
             self.server.configure_curve()
+            # start the job agent now so it is ready for the first jobs
+            self.proc_pool.job_agents.get(
+                platform, proc_ctx.host, self.bad_hosts
+            )
             self.remote_init_map[install_target] = REMOTE_INIT_DONE
             self.ready = True
             return
@@ -550,7 +560,8 @@ class TaskRemoteMgr:
                 dst_path,
                 platform,
                 self.rsync_includes,
-                bad_hosts=self.bad_hosts
+                bad_hosts=self.bad_hosts,
+                ssh_connections=self.proc_pool.ssh_connections,
             )
             ctx = SubProcContext(
                 'file-install',
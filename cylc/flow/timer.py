@@ -14,15 +14,33 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
-"""Simple timer class."""
+"""Simple timer classes."""
 
+from heapq import (
+    heapify,
+    heappop,
+    heappush,
+)
+from itertools import count
 from time import time as now
 from cylc.flow import LOG
 from cylc.flow.wallclock import (
     get_seconds_as_interval_string as get_interval_str
 )
 
-from typing import Callable, Optional
+from typing import (
+    Callable,
+    Dict,
+    Generic,
+    Hashable,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+
+Key = TypeVar('Key', bound=Hashable)
 
 
 class Timer:
@@ -62,3 +80,91 @@ class Timer:
             return True
         else:
             return False
+
+
+class DeadlineQueue(Generic[Key]):
+    """A priority queue of keys by deadline (seconds since epoch).
+
+    Used to check timers when they are due rather than checking every timer
+    on every main loop iteration.
+
+    Each key has at most one deadline, scheduling a key again replaces its
+    deadline. Replaced and cancelled entries are discarded lazily.
+
+    Examples:
+        >>> queue = DeadlineQueue()
+        >>> queue.schedule('a', 3)
+        >>> queue.schedule('b', 1)
+        >>> queue.schedule('c', 2)
+        >>> queue.schedule('b', 4)
+        >>> queue.cancel('c')
+        >>> queue.get_next_deadline()
+        3
+        >>> queue.pop_due(3.5)
+        ['a']
+        >>> 'a' in queue, 'b' in queue
+        (False, True)
+        >>> queue.pop_due(10)
+        ['b']
+        >>> queue.get_next_deadline() is None
+        True
+
+    """
+
+    def __init__(self) -> None:
+        self._deadlines: Dict[Key, float] = {}
+        # (deadline, tie-breaker, key), keys need not be orderable
+        self._heap: List[Tuple[float, int, Key]] = []
+        self._counter = count()
+
+    def __len__(self) -> int:
+        return len(self._deadlines)
+
+    def __contains__(self, key: Key) -> bool:
+        return key in self._deadlines
+
+    def schedule(self, key: Key, deadline: float) -> None:
+        """Schedule a key for a deadline (replacing any previous one)."""
+        if self._deadlines.get(key) == deadline:
+            return
+        self._deadlines[key] = deadline
+        heappush(self._heap, (deadline, next(self._counter), key))
+        if len(self._heap) > 2 * len(self._deadlines) + 64:
+            # compact the heap, too many replaced/cancelled entries
+            self._heap = [
+                entry for entry in self._heap
+                if self._deadlines.get(entry[2]) == entry[0]
+            ]
+            heapify(self._heap)
+
+    def cancel(self, key: Key) -> None:
+        """Remove a key from the queue (if present)."""
+        self._deadlines.pop(key, None)
+
+    def get_next_deadline(self) -> Optional[float]:
+        """Return the earliest deadline (if any)."""
+        while self._heap:
+            deadline, _, key = self._heap[0]
+            if self._deadlines.get(key) == deadline:
+                return deadline
+            heappop(self._heap)
+        return None
+
+    def pop_due(self, time: Optional[float] = None) -> List[Key]:
+        """Remove and return the keys which are due, earliest first.
+
+        Args:
+            time: The time now (defaults to the current time).
+
+        """
+        if time is None:
+            time = now()
+        due = []
+        while (
+            (deadline := self.get_next_deadline()) is not None
+            and deadline <= time
+        ):
+            key = heappop(self._heap)[2]
+            del self._deadlines[key]
+            due.append(key)
+        return due
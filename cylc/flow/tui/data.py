@@ -134,6 +134,12 @@ _COMPAT_QUERIES = (
 )
 
 
+# schedulers which publish deltas with incremental checksums,
+# Tui keeps a replica of the data store of these (see tui.replica), other
+# schedulers are polled with GraphQL queries
+DELTA_VERSIONS = SpecifierSet('>=8.7.0.dev')
+
+
 # the list of mutations we can call on a running scheduler
 MUTATIONS = {
     'workflow': [
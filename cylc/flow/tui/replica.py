@@ -0,0 +1,388 @@
+#!/usr/bin/env python3
+# THIS FILE IS PART OF THE CYLC WORKFLOW ENGINE.
+# Copyright (C) NIWA & British Crown (Met Office) & Contributors.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""A local copy of a workflow's data store for Tui.
+
+Rather than polling the scheduler with GraphQL queries, Tui requests the
+entire data store once and then keeps it up to date by subscribing to the
+deltas published by the scheduler.
+
+The data is converted into the same format as the GraphQL data the Tui tree
+is computed from. Converted elements are cached and only the elements touched
+by deltas are converted again.
+"""
+
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+import zmq
+
+from cylc.flow.data_messages_pb2 import (
+    AllDeltas,
+    PbEntireWorkflow,
+)
+from cylc.flow.data_store_mgr import (
+    CHECKSUM_ATTRS,
+    FAMILIES,
+    FAMILY_PROXIES,
+    JOBS,
+    TASK_PROXIES,
+    TASKS,
+    WORKFLOW,
+    ALL_DELTAS,
+    EDGES,
+    apply_checksummed_delta,
+    get_checksums,
+)
+from cylc.flow.exceptions import WorkflowStopped
+from cylc.flow.id import Tokens
+from cylc.flow.network.subscriber import WorkflowSubscriber
+from cylc.flow.task_state import TASK_STATUSES_ORDERED
+from cylc.flow.tui.util import (
+    Node,
+    compute_workflow_tree,
+)
+
+if TYPE_CHECKING:
+    from cylc.flow.network.client import WorkflowRuntimeClient
+
+
+# the order deltas must be applied in (parents before children)
+DELTA_ORDER = (WORKFLOW, FAMILIES, FAMILY_PROXIES, TASKS, TASK_PROXIES, JOBS)
+
+# the task / family proxy fields Tui displays
+_NODE_FIELDS = (
+    ('id', 'id'),
+    ('name', 'name'),
+    ('cyclePoint', 'cycle_point'),
+    ('state', 'state'),
+    ('isHeld', 'is_held'),
+    ('isQueued', 'is_queued'),
+    ('isRunahead', 'is_runahead'),
+    ('isRetry', 'is_retry'),
+    ('isWallclock', 'is_wallclock'),
+    ('isXtriggered', 'is_xtriggered'),
+)
+
+# the job fields Tui displays
+_JOB_FIELDS = (
+    ('id', 'id'),
+    ('submitNum', 'submit_num'),
+    ('state', 'state'),
+    ('platform', 'platform'),
+    ('jobRunnerName', 'job_runner_name'),
+    ('jobId', 'job_id'),
+    ('startedTime', 'started_time'),
+    ('estimatedFinishTime', 'estimated_finish_time'),
+    ('finishedTime', 'finished_time'),
+)
+
+
+class WorkflowReplica:
+    """A copy of a workflow's data store kept in sync using deltas.
+
+    Args:
+        workflow_id:
+            The full ID of the workflow.
+        client:
+            A client connected to the workflow.
+
+    """
+
+    # the published topic containing all deltas of a data store update
+    TOPIC = ALL_DELTAS.encode()
+    # the topic published when the scheduler shuts down
+    SHUTDOWN_TOPIC = b'shutdown'
+
+    def __init__(
+        self,
+        workflow_id: str,
+        client: 'WorkflowRuntimeClient',
+    ):
+        self.workflow_id = workflow_id
+        self.client = client
+        self.subscriber: Optional[WorkflowSubscriber] = None
+        # the data store, None until it has been requested
+        self.data: Optional[dict] = None
+        self.checksums: Dict[str, int] = {}
+        # the (scheduler) time of the last delta applied for each topic,
+        # older deltas are already contained in the data store
+        self.delta_times: Dict[str, float] = {}
+        # incremented whenever the data changes
+        self.version = 0
+        # converted elements by ID
+        self._tasks: Dict[str, dict] = {}
+        self._families: Dict[str, dict] = {}
+        # the last Tui tree for this workflow
+        self._tree: Optional[Tuple[tuple, Node]] = None
+
+    def stop(self) -> None:
+        """Close the subscription."""
+        if self.subscriber:
+            # don't wait for pending messages, don't stop the event loop
+            self.subscriber.socket.close(linger=0)
+            self.subscriber.stop(stop_loop=False)
+            self.subscriber = None
+
+    async def update(self) -> None:
+        """Apply any published deltas, requesting the data store if needed.
+
+        Raises:
+            ClientError, ClientTimeout, WorkflowStopped, ZMQError:
+                If the scheduler cannot be reached or has shut down.
+
+        """
+        if self.subscriber is None:
+            # subscribe before requesting the data store so that no deltas
+            # are missed between the two
+            self.subscriber = WorkflowSubscriber(
+                Tokens(self.workflow_id)['workflow'],
+                topics=[self.TOPIC, self.SHUTDOWN_TOPIC],
+            )
+        messages = await self._receive()
+        if self.data is None:
+            await self._sync()
+        for msg in messages:
+            if not self._apply(msg):
+                # the replica is out of sync (e.g. a delta was missed)
+                await self._sync()
+                break
+
+    async def _receive(self) -> List[bytes]:
+        """Return the delta messages waiting on the subscriber socket.
+
+        Raises:
+            WorkflowStopped: If the scheduler has shut down.
+
+        """
+        messages: List[bytes] = []
+        if self.subscriber is None:
+            return messages
+        while True:
+            try:
+                topic, msg = await self.subscriber.socket.recv_multipart(
+                    flags=zmq.NOBLOCK
+                )
+            except zmq.ZMQError:
+                return messages
+            if topic == self.SHUTDOWN_TOPIC:
+                raise WorkflowStopped(self.workflow_id)
+            messages.append(msg)
+
+    async def _sync(self) -> None:
+        """Replace the data with the entire data store of the workflow."""
+        msg = PbEntireWorkflow()
+        msg.ParseFromString(
+            await self.client.async_request('pb_entire_workflow')
+        )
+        self.data = {
+            WORKFLOW: msg.workflow,
+            EDGES: {},
+            FAMILIES: {e.id: e for e in msg.families},
+            FAMILY_PROXIES: {e.id: e for e in msg.family_proxies},
+            TASKS: {e.id: e for e in msg.tasks},
+            TASK_PROXIES: {e.id: e for e in msg.task_proxies},
+            JOBS: {e.id: e for e in msg.jobs},
+        }
+        self.checksums = get_checksums(self.data)
+        # edges aren't displayed by Tui so aren't kept
+        self.checksums.pop(EDGES)
+        # compare deltas with the time the scheduler last updated the data
+        # store (rather than the local time, the clocks may differ)
+        self.delta_times = dict.fromkeys(
+            DELTA_ORDER, msg.workflow.last_updated
+        )
+        self._tasks.clear()
+        self._families.clear()
+        self.version += 1
+
+    def _apply(self, msg: bytes) -> bool:
+        """Apply a published batch of deltas.
+
+        Returns:
+            False if the replica is not consistent with the scheduler after
+            applying the deltas.
+
+        """
+        if self.data is None:
+            return True
+        all_deltas = AllDeltas()
+        all_deltas.ParseFromString(msg)
+        changed = False
+        for key in DELTA_ORDER:
+            delta = getattr(all_deltas, key)
+            if not delta.ListFields() or delta.time < self.delta_times[key]:
+                # no changes or already contained in the data store
+                continue
+            changed = True
+            self.delta_times[key] = delta.time
+            self._invalidate(key, delta)
+            apply_checksummed_delta(key, delta, self.data, self.checksums)
+            if (
+                key in CHECKSUM_ATTRS
+                and delta.incremental_checksum != self.checksums[key]
+            ):
+                return False
+        if changed:
+            self.version += 1
+        return True
+
+    def _invalidate(self, key: str, delta) -> None:
+        """Forget the converted elements which a delta will change."""
+        if self.data is None:
+            return
+        if key == WORKFLOW:
+            return
+        ids: Set[str] = {
+            *(element.id for element in delta.added),
+            *(element.id for element in delta.updated),
+            *delta.pruned,
+        }
+        if key == TASK_PROXIES:
+            for id_ in ids:
+                self._tasks.pop(id_, None)
+        elif key == JOBS:
+            for id_ in ids:
+                # strip the submit number off of the job ID
+                self._tasks.pop(id_.rsplit('/', 1)[0], None)
+        elif key == TASKS:
+            for id_ in ids:
+                if id_ in self.data[TASKS]:
+                    for proxy_id in self.data[TASKS][id_].proxies:
+                        self._tasks.pop(proxy_id, None)
+        elif key == FAMILY_PROXIES:
+            for id_ in ids:
+                self._families.pop(id_, None)
+            if delta.added or delta.pruned:
+                # tasks and families reference their first parent
+                self._tasks.clear()
+                self._families.clear()
+
+    def get_tree(self, task_states: Iterable[str], prune: bool) -> Node:
+        """Return the Tui tree for this workflow.
+
+        The tree is only recomputed if the data or filters have changed.
+
+        Args:
+            task_states:
+                The task states to display.
+            prune:
+                Remove empty families, see compute_workflow_tree.
+
+        """
+        key = (self.version, tuple(task_states), prune)
+        if self._tree is None or self._tree[0] != key:
+            self._tree = (
+                key,
+                compute_workflow_tree(self.get_data(task_states), prune),
+            )
+        return self._tree[1]
+
+    def get_data(self, task_states: Iterable[str]) -> dict:
+        """Return the workflow data in the format of the Tui GraphQL query.
+
+        Args:
+            task_states:
+                Only tasks in these states will be returned.
+
+        """
+        if self.data is None:
+            return {'id': self.workflow_id}
+        workflow = self.data[WORKFLOW]
+        states = set(task_states)
+        families = [
+            self._get_family(fam)
+            for fam in self.data[FAMILY_PROXIES].values()
+        ]
+        return {
+            'id': workflow.id or self.workflow_id,
+            'name': workflow.name,
+            'port': workflow.port,
+            'status': workflow.status,
+            'stateTotals': {
+                **dict.fromkeys(TASK_STATUSES_ORDERED, 0),
+                **workflow.state_totals,
+            },
+            'taskProxies': [
+                self._get_task(itask)
+                for itask in self.data[TASK_PROXIES].values()
+                if itask.state in states
+            ],
+            'familyProxies': [
+                family for family in families
+                if family['name'] != 'root'
+            ],
+            'cyclePoints': [
+                family for family in families
+                if family['name'] == 'root'
+            ],
+        }
+
+    def _get_first_parent(self, id_: str) -> Optional[dict]:
+        if self.data is None:
+            return None
+        try:
+            family = self.data[FAMILY_PROXIES][id_]
+        except KeyError:
+            return None
+        return {'id': family.id, 'name': family.name}
+
+    def _get_family(self, family) -> dict:
+        if family.id in self._families:
+            return self._families[family.id]
+        ret = {
+            field: getattr(family, attr)
+            for field, attr in _NODE_FIELDS
+        }
+        ret['firstParent'] = self._get_first_parent(family.first_parent)
+        self._families[family.id] = ret
+        return ret
+
+    def _get_task(self, itask) -> dict:
+        if itask.id in self._tasks:
+            return self._tasks[itask.id]
+        assert self.data is not None
+        ret = {
+            field: getattr(itask, attr)
+            for field, attr in _NODE_FIELDS
+        }
+        ret['flowNums'] = itask.flow_nums
+        ret['firstParent'] = self._get_first_parent(itask.first_parent)
+        jobs = [
+            self.data[JOBS][job_id]
+            for job_id in itask.jobs
+            if job_id in self.data[JOBS]
+        ]
+        jobs.sort(key=lambda job: job.submit_num, reverse=True)
+        ret['jobs'] = [
+            {field: getattr(job, attr) for field, attr in _JOB_FIELDS}
+            for job in jobs
+        ]
+        try:
+            mean_elapsed_time = self.data[TASKS][itask.task].mean_elapsed_time
+        except KeyError:
+            mean_elapsed_time = 0.0
+        ret['task'] = {'meanElapsedTime': mean_elapsed_time}
+        self._tasks[itask.id] = ret
+        return ret
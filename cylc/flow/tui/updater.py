@@ -23,7 +23,6 @@ from asyncio import (
     gather,
 )
 from contextlib import suppress
-from copy import deepcopy
 from getpass import getuser
 from multiprocessing import Queue
 from time import time
@@ -48,12 +47,16 @@ from cylc.flow.task_state import (
     TASK_STATUSES_ORDERED,
 )
 from cylc.flow.tui.data import (
+    DELTA_VERSIONS,
     VersionIncompat,
     get_query,
 )
+from cylc.flow.tui.replica import WorkflowReplica
 from cylc.flow.tui.util import (
     NaturalSort,
-    compute_tree,
+    add_node,
+    compute_workflow_tree,
+    create_node_store,
     suppress_logging,
 )
 from cylc.flow.workflow_status import (
@@ -118,7 +121,9 @@ class Updater():
     """The bit of Tui which provides the data.
 
     It lists workflows using the "scan" interface, and provides detail using
-    the "GraphQL" interface.
+    a replica of the data store of each subscribed workflow, kept up to date
+    with the deltas the workflow publishes (or using the "GraphQL" interface
+    for older workflows).
 
     """
 
@@ -132,8 +137,8 @@ class Updater():
     SIGNAL_TERMINATE = 'terminate'
 
     def __init__(self, client_timeout=3):
-        # Cylc comms clients for each workflow we're connected to
-        self._clients = {}
+        # data store replicas for each workflow we're connected to
+        self._replicas = {}
 
         # iterate over this to get a list of workflows
         self._scan_pipe = None
@@ -189,14 +194,24 @@ class Updater():
                 if ret == self.SIGNAL_TERMINATE:
                     break
                 self.update_queue.put(ret)
+            for w_id in list(self._replicas):
+                self._unsubscribe(w_id)
 
     def _subscribe(self, w_id):
-        if w_id not in self._clients:
-            self._clients[w_id] = None
+        if w_id not in self._replicas:
+            self._replicas[w_id] = None
 
     def _unsubscribe(self, w_id):
-        if w_id in self._clients:
-            self._clients.pop(w_id)
+        if w_id in self._replicas:
+            self._disconnect(w_id)
+            self._replicas.pop(w_id)
+
+    def _disconnect(self, w_id):
+        """Drop the replica for a workflow, we'll reconnect next time."""
+        replica = self._replicas[w_id]
+        if replica:
+            replica.stop()
+        self._replicas[w_id] = None
 
     def _update_filters(self, filters):
         if (
@@ -243,55 +258,65 @@ class Updater():
 
     async def _run_update(self, data):
         # copy the scanned data so it can be reused for future updates
-        data = deepcopy(data)
+        # (messages may be added to the workflow entries)
+        data = {'workflows': [dict(flow) for flow in data['workflows']]}
 
         # connect to schedulers if needed
         self._connect(data)
 
-        # update data with the response from each workflow
-        # NOTE: Currently we're bunching these updates together so Tui will
-        #       only update as fast as the slowest responding workflow.
-        #       We could run these updates separately if this is an issue.
+        # apply the deltas published by each workflow
         await gather(
             *(
-                self._update_workflow(w_id, client, data)
-                for w_id, client in self._clients.items()
+                self._update_workflow(w_id, replica, data)
+                for w_id, replica in self._replicas.items()
             )
         )
 
         # are any task state filters active?
         task_filters_active = not all(self.filters['tasks'].values())
+        # list of task states we want to see
+        task_states = [
+            state
+            for state, is_on in self.filters['tasks'].items()
+            if is_on
+        ]
+
+        # compute the tree, only workflows which have changed are recomputed
+        root_node = add_node('root', 'root', create_node_store(), data={})
+        for flow in data['workflows']:
+            replica = self._replicas.get(flow['id'])
+            if replica and replica.data is not None:
+                flow_node = replica.get_tree(task_states, task_filters_active)
+            else:
+                flow_node = compute_workflow_tree(flow, task_filters_active)
+            root_node['children'].append(flow_node)
+        return root_node
 
-        return compute_tree(data, prune_families=task_filters_active)
-
-    async def _update_workflow(self, w_id, client, data):
-        if not client:
+    async def _update_workflow(self, w_id, replica, data):
+        if not replica:
             # we could not connect to this workflow
             # e.g. workflow is shut down
             return
 
         try:
-            # get a graphql query compatible with this workflow
-            query = get_query(client.scheduler_version)
-
-            # fetch the data from the workflow
-            workflow_update = await client.async_request(
-                'graphql',
-                {
-                    'request_string': query,
-                    'variables': {
-                        # list of task states we want to see
-                        'taskStates': [
-                            state
-                            for state, is_on in self.filters['tasks'].items()
-                            if is_on
-                        ]
-                    }
-                }
-            )
+            for workflow in data['workflows']:
+                if (
+                    workflow['id'] == w_id
+                    and workflow['status'] == WorkflowStatus.STOPPED.value
+                ):
+                    # the scan has found that the workflow has stopped
+                    raise WorkflowStopped(w_id)
+
+            if replica.client.scheduler_version in DELTA_VERSIONS:
+                # apply any new deltas (fetching the data store if required)
+                await replica.update()
+            else:
+                # BACK COMPAT: the deltas published by older schedulers
+                # can't be checked against the replica, query the data
+                await self._query_workflow(replica.client, data)
         except WorkflowStopped:
-            # remove the client on any error, we'll reconnect next time
-            self._clients[w_id] = None
+            # remove the replica on any error, we'll reconnect next time
+            self._disconnect(w_id)
             for workflow in data['workflows']:
                 if workflow['id'] == w_id:
                     break
@@ -305,7 +330,7 @@ class Updater():
                     'status': 'stopped',
                 })
         except ClientTimeout:
-            self._clients[w_id] = None
+            self._disconnect(w_id)
             set_message(
                 data,
                 w_id,
@@ -320,25 +345,55 @@ class Updater():
             )
         except (CylcError, ZMQError) as exc:
             # something went wrong :(
-            # remove the client on any error, we'll reconnect next time
-            self._clients[w_id] = None
+            # remove the replica on any error, we'll reconnect next time
+            self._disconnect(w_id)
             set_message(data, w_id, exc)
-        else:
-            # the data arrived, add it to the update
-            workflow_data = workflow_update['workflows'][0]
-            for workflow in data['workflows']:
-                if workflow['id'] == workflow_data['id']:
-                    workflow.update(workflow_data)
-                    break
+
+    async def _query_workflow(self, client, data):
+        """Update the data for a workflow using a GraphQL query.
+
+        Raises:
+            VersionIncompat:
+                If the scheduler version is not supported.
+
+        """
+        # get a graphql query compatible with this workflow
+        query = get_query(client.scheduler_version)
+
+        # fetch the data from the workflow
+        workflow_update = await client.async_request(
+            'graphql',
+            {
+                'request_string': query,
+                'variables': {
+                    # list of task states we want to see
+                    'taskStates': [
+                        state
+                        for state, is_on in self.filters['tasks'].items()
+                        if is_on
+                    ]
+                }
+            }
+        )
+
+        # the data arrived, add it to the update
+        workflow_data = workflow_update['workflows'][0]
+        for workflow in data['workflows']:
+            if workflow['id'] == workflow_data['id']:
+                workflow.update(workflow_data)
+                break
 
     def _connect(self, data):
         """Connect to all subscribed workflows."""
-        for w_id, client in self._clients.items():
-            if not client:
+        for w_id, replica in self._replicas.items():
+            if not replica:
                 try:
-                    self._clients[w_id] = get_client(
-                        Tokens(w_id)['workflow'],
-                        timeout=self.client_timeout,
+                    self._replicas[w_id] = WorkflowReplica(
+                        w_id,
+                        get_client(
+                            Tokens(w_id)['workflow'],
+                            timeout=self.client_timeout,
+                        ),
                     )
                 except WorkflowStopped:
                     set_message(
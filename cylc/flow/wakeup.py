@@ -0,0 +1,174 @@
+# THIS FILE IS PART OF THE CYLC WORKFLOW ENGINE.
+# Copyright (C) NIWA & British Crown (Met Office) & Contributors.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""Thread-safe wake-up signals for sleeping loops.
+
+Used by the scheduler main loop (in event driven mode) and the workflow
+server to sleep until there is something to do rather than polling on a fixed
+interval.
+"""
+
+import asyncio
+from contextlib import suppress
+import os
+from queue import Queue
+from typing import Optional, Union
+
+
+class Wakeup:
+    """A thread-safe wake-up signal for an asyncio event loop.
+
+    The signal may be set from any thread (or from a signal handler), the
+    waiter must be running in the event loop the signal was bound to.
+
+    Examples:
+        >>> async def test():
+        ...     wakeup = Wakeup()
+        ...     wakeup.bind()
+        ...     wakeup.set()
+        ...     return (await wakeup.wait(1), await wakeup.wait(0.01))
+        >>> asyncio.run(test())
+        (True, False)
+
+    """
+
+    def __init__(self) -> None:
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._event: Optional[asyncio.Event] = None
+
+    def bind(self) -> None:
+        """Bind this signal to the running event loop."""
+        self._loop = asyncio.get_running_loop()
+        self._event = asyncio.Event()
+
+    def set(self) -> None:  # noqa: A003 (method name not local)
+        """Wake up the waiter (safe to call from any thread).
+
+        Does nothing if the signal has not been bound to an event loop yet
+        or if the event loop has been closed.
+        """
+        if self._loop is None or self._event is None:
+            return
+        # NOTE: the loop could be closed (e.g. during shutdown)
+        with suppress(RuntimeError):
+            self._loop.call_soon_threadsafe(self._event.set)
+
+    async def wait(self, timeout: float) -> bool:
+        """Wait for the signal to be set or for the timeout to elapse.
+
+        The signal is cleared on return.
+
+        Returns:
+            True if the signal was set, False if the wait timed out.
+
+        """
+        if self._event is None:
+            await asyncio.sleep(timeout)
+            return False
+        if self._event.is_set():
+            # still yield control to the event loop
+            self._event.clear()
+            await asyncio.sleep(0)
+            return True
+        try:
+            await asyncio.wait_for(self._event.wait(), max(timeout, 0))
+        except asyncio.TimeoutError:
+            return False
+        else:
+            return True
+        finally:
+            self._event.clear()
+
+
+class PipeWakeup:
+    """A thread-safe wake-up signal backed by a pipe.
+
+    For loops which sleep in ``select``/``poll`` (e.g. a ZMQ poller) rather
+    than in an asyncio event loop. Register ``fileno()`` for reading with the
+    poller, the file descriptor becomes readable when the signal is set.
+
+    Examples:
+        >>> import select
+        >>> wakeup = PipeWakeup()
+        >>> wakeup.set()  # no-op, not bound yet
+        >>> wakeup.bind()
+        >>> wakeup.set()
+        >>> wakeup.set()
+        >>> bool(select.select([wakeup.fileno()], [], [], 0)[0])
+        True
+        >>> wakeup.clear()
+        >>> bool(select.select([wakeup.fileno()], [], [], 0)[0])
+        False
+        >>> wakeup.close()
+
+    """
+
+    def __init__(self) -> None:
+        self._read_fd: Optional[int] = None
+        self._write_fd: Optional[int] = None
+
+    def bind(self) -> None:
+        """Open the pipe."""
+        self._read_fd, self._write_fd = os.pipe()
+        os.set_blocking(self._read_fd, False)
+        os.set_blocking(self._write_fd, False)
+
+    def fileno(self) -> int:
+        """Return the file descriptor to wait on."""
+        if self._read_fd is None:
+            raise ValueError('PipeWakeup is not bound')
+        return self._read_fd
+
+    def set(self) -> None:  # noqa: A003 (method name not local)
+        """Wake up the waiter (safe to call from any thread).
+
+        Does nothing if the pipe has not been opened yet or has been closed.
+        """
+        if self._write_fd is None:
+            return
+        # NOTE: BlockingIOError => the pipe is full so is readable already
+        # NOTE: OSError => the pipe was closed by another thread
+        with suppress(OSError):
+            os.write(self._write_fd, b'\0')
+
+    def clear(self) -> None:
+        """Clear the signal (call from the waiting thread)."""
+        if self._read_fd is None:
+            return
+        with suppress(BlockingIOError):
+            while os.read(self._read_fd, 4096):
+                pass
+
+    def close(self) -> None:
+        """Close the pipe."""
+        fds = (self._read_fd, self._write_fd)
+        self._read_fd = self._write_fd = None
+        for fd in fds:
+            if fd is not None:
+                os.close(fd)
+
+
+class WakeupQueue(Queue):
+    """A queue which sets a wake-up signal whenever an item is put to it."""
+
+    def __init__(
+        self, wakeup: Union[Wakeup, PipeWakeup], maxsize: int = 0
+    ) -> None:
+        super().__init__(maxsize)
+        self.wakeup = wakeup
+
+    def put(self, item, block=True, timeout=None):
+        super().put(item, block, timeout)
+        self.wakeup.set()
@@ -20,18 +20,26 @@ This module provides the logic to:
 * Queue database operations.
 * Hide logic that is relevant for database operations.
 * Recover public run database file lock.
+* Write to the public database in the background.
 * Manage existing run database files on restart.
 """
 
 from collections import defaultdict
+from contextlib import suppress
 import json
 import os
-from shutil import (
-    copy,
-    rmtree,
+from queue import (
+    Empty,
+    Queue,
 )
+from shutil import rmtree
+import sqlite3
 from sqlite3 import OperationalError
 from tempfile import mkstemp
+from threading import (
+    Lock,
+    Thread,
+)
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -52,6 +60,7 @@ from cylc.flow import (
     __version__ as CYLC_VERSION,
 )
 from cylc.flow.broadcast_report import get_broadcast_change_iter
+from cylc.flow.cycling.loader import get_point
 from cylc.flow.exceptions import (
     CylcError,
     ServiceFileError,
@@ -87,10 +96,284 @@ if TYPE_CHECKING:
 
 PERM_PRIVATE = 0o600  # -rw-------
 
+# (CylcWorkflowDAO method name, table name, args)
+DbBatchItem = Tuple[str, str, Any]
+
 
 INCOMPAT_MSG = f"Workflow database is incompatible with Cylc {CYLC_VERSION}"
 
 
+def backup_db(src_path: str, dst_path: str) -> None:
+    """Copy a database using SQLite's online backup API.
+
+    This produces a consistent copy of the source database even if it is
+    being written to or has changes pending in a write-ahead log.
+
+    The copy is made to a temporary file which then replaces the destination
+    file to ensure that we do not end up with a partial file. If an external
+    connection is locking the old destination file, it will still be
+    connected to its inode, but should no longer affect future accesses
+    (hopefully that process will soon recover to give up the lock).
+    """
+    temp_fd, temp_path = mkstemp(
+        prefix=CylcWorkflowDAO.DB_FILE_BASE_NAME,
+        dir=os.path.dirname(dst_path)
+    )
+    os.close(temp_fd)
+    try:
+        # Create the file if it didn't exist; this is done in the hope of
+        # addressing potential NFS file lag, we think
+        open(dst_path, "a").close()  # noqa: SIM115
+        # Get default permissions level for the destination file:
+        st_mode = os.stat(dst_path).st_mode
+
+        src_conn = sqlite3.connect(src_path)
+        temp_conn = sqlite3.connect(temp_path)
+        try:
+            src_conn.backup(temp_conn)
+        finally:
+            temp_conn.close()
+            src_conn.close()
+        os.rename(temp_path, dst_path)
+        os.chmod(dst_path, st_mode)
+    except (OSError, sqlite3.Error):
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+class PublicDatabaseWriter:
+    """Write to the public database in a background thread.
+
+    This implements the queueing interface of CylcWorkflowDAO. Calling
+    "execute_queued_items" hands the queued items over to the writer thread
+    as a batch.
+
+    The writer thread applies all available batches in a single transaction.
+    If it fails to write to the public database too many times (e.g. because
+    it is locked by a reader), it catches up by taking a snapshot of the
+    private database.
+
+    The main thread must hold the "lock" whilst writing a batch to the
+    private database and handing it over to the writer. This allows the
+    writer to work out which batches are already included in a snapshot.
+    """
+
+    # Seconds to wait before retrying a failed write
+    RETRY_DELAY = 1.0
+
+    def __init__(
+        self, pri_path: str, pub_path: str, persistent: bool = False
+    ) -> None:
+        self.pri_path = pri_path
+        self.pub_path = pub_path
+        self.persistent = persistent
+        self.lock = Lock()
+        # sequence number of the last batch handed over
+        self.seq = 0
+        # sequence number of the last batch included in a snapshot
+        self.snapshot_seq = 0
+        self.n_snapshots = 0
+        self.queue: 'Queue[Optional[Tuple[int, List[DbBatchItem]]]]' = (
+            Queue()
+        )
+        self._batch: List[DbBatchItem] = []
+        self._thread = Thread(
+            target=self._run, name='PublicDatabaseWriter', daemon=True
+        )
+
+    def add_delete_item(self, table_name, where_args=None):
+        """Queue a DELETE item for a given table."""
+        self._batch.append(('add_delete_item', table_name, where_args))
+
+    def add_insert_item(self, table_name, args):
+        """Queue an INSERT args for a given table."""
+        self._batch.append(('add_insert_item', table_name, args))
+
+    def add_update_item(self, table_name, item):
+        """Queue an UPDATE item for a given table."""
+        self._batch.append(('add_update_item', table_name, item))
+
+    def execute_queued_items(self) -> None:
+        """Hand over the queued items to the writer thread.
+
+        Must be called with the lock held.
+        """
+        if not self._batch:
+            return
+        self.seq += 1
+        self.queue.put((self.seq, self._batch))
+        self._batch = []
+
+    def start(self) -> None:
+        """Start the writer thread."""
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Write any remaining batches then stop the writer thread."""
+        self.queue.put(None)
+        self._thread.join()
+
+    def _run(self) -> None:
+        """The writer thread."""
+        dao = CylcWorkflowDAO(
+            self.pub_path, is_public=True, persistent=self.persistent
+        )
+        stopping = False
+        try:
+            while not stopping:
+                # wait for a batch (or retry failed writes after a delay)
+                items = []
+                with suppress(Empty):
+                    items.append(
+                        self.queue.get(
+                            timeout=(
+                                self.RETRY_DELAY if dao.staged_stmts else None
+                            )
+                        )
+                    )
+                # coalesce all available batches into one transaction
+                while True:
+                    try:
+                        items.append(self.queue.get_nowait())
+                    except Empty:
+                        break
+                for item in items:
+                    if item is None:
+                        stopping = True
+                        continue
+                    seq, batch = item
+                    if seq <= self.snapshot_seq:
+                        # already included in a snapshot
+                        continue
+                    for method, table_name, args in batch:
+                        getattr(dao, method)(table_name, args)
+                    dao.stage_queued_items()
+
+                try:
+                    dao.execute_queued_items()
+                except Exception as exc:
+                    LOG.exception(exc)
+                    dao.n_tries = dao.MAX_TRIES
+                if dao.n_tries >= dao.MAX_TRIES and not stopping:
+                    self._snapshot(dao)
+        finally:
+            dao.close()
+
+    def _snapshot(self, dao: CylcWorkflowDAO) -> None:
+        """Replace the public database with a snapshot of the private one."""
+        dao.close()
+        dao.clear_queued_items()
+        try:
+            with self.lock:
+                backup_db(self.pri_path, self.pub_path)
+                self.snapshot_seq = self.seq
+        except (OSError, sqlite3.Error) as exc:
+            LOG.warning(f"{self.pub_path}: recovery failed: {exc}")
+            return
+        dao.n_tries = 0
+        self.n_snapshots += 1
+        LOG.warning(f"{self.pub_path}: recovered from {self.pri_path}")
+
+
+class TaskHistoryCache:
+    """In-memory cache of the task_states and task_outputs tables.
+
+    Task history is looked up whenever a task is spawned. The history of all
+    tasks in a cycle is loaded from the database in bulk the first time it is
+    required, so looking up tasks which have no history (e.g. when spawning
+    the tasks of a new cycle) does not require any queries.
+
+    Tasks with queued (not yet executed) writes to these tables are read
+    through to the database as the cache cannot replicate the effect of the
+    writes. Once the writes have been executed, they are re-read from the
+    database the next time they are required.
+    """
+
+    def __init__(self) -> None:
+        # {cycle: {name: (prev_instances, outputs) or None if out of date}}
+        self.cycles: Dict[
+            str,
+            Dict[
+                str,
+                Optional[Tuple[
+                    List[Tuple[int, bool, Set[int], str]],
+                    'Dict[str, FlowNums]',
+                ]]
+            ]
+        ] = {}
+        # {(cycle, name)} tasks with queued writes
+        self.pending: Set[Tuple[str, str]] = set()
+
+    def select_prev_instances(
+        self, dao: CylcWorkflowDAO, name: str, point: str
+    ) -> List[Tuple[int, bool, Set[int], str]]:
+        """See CylcWorkflowDAO.select_prev_instances."""
+        if (point, name) in self.pending:
+            return dao.select_prev_instances(name, point)
+        return self._get(dao, name, point)[0]
+
+    def select_task_outputs(
+        self, dao: CylcWorkflowDAO, name: str, point: str
+    ) -> 'Dict[str, FlowNums]':
+        """See CylcWorkflowDAO.select_task_outputs."""
+        if (point, name) in self.pending:
+            return dao.select_task_outputs(name, point)
+        return self._get(dao, name, point)[1]
+
+    def _get(
+        self, dao: CylcWorkflowDAO, name: str, point: str
+    ) -> Tuple[
+        List[Tuple[int, bool, Set[int], str]], 'Dict[str, FlowNums]'
+    ]:
+        """Return (prev_instances, outputs) for a task."""
+        cycle = self.cycles.get(point)
+        if cycle is None:
+            # load the whole cycle
+            prev_instances = dao.select_prev_instances_for_cycle(point)
+            outputs = dao.select_task_outputs_for_cycle(point)
+            cycle = self.cycles[point] = {
+                name_: (
+                    prev_instances.get(name_, []),
+                    outputs.get(name_, {}),
+                )
+                for name_ in {*prev_instances, *outputs}
+            }
+        try:
+            entry = cycle[name]
+        except KeyError:
+            # no history
+            return [], {}
+        if entry is None:
+            # out of date, re-load the task
+            entry = cycle[name] = (
+                dao.select_prev_instances(name, point),
+                dao.select_task_outputs(name, point),
+            )
+        return entry
+
+    def put(self, name: str, point: str) -> None:
+        """Register a queued write for a task."""
+        self.pending.add((point, name))
+
+    def executed(self) -> None:
+        """Mark tasks with pending writes as out of date.
+
+        Call once queued writes have been executed.
+        """
+        for point, name in self.pending:
+            cycle = self.cycles.get(point)
+            if cycle is not None:
+                cycle[name] = None
+        self.pending.clear()
+
+    def evict(self, point: 'PointBase') -> None:
+        """Remove cycles earlier than the provided point from the cache."""
+        for cycle in list(self.cycles):
+            if get_point(cycle) < point:
+                del self.cycles[cycle]
+
+
 class WorkflowDatabaseManager:
     """Manage the workflow runtime private and public databases."""
 
@@ -126,7 +409,20 @@ class WorkflowDatabaseManager:
     TABLE_XTRIGGERS = CylcWorkflowDAO.TABLE_XTRIGGERS
     TABLE_ABS_OUTPUTS = CylcWorkflowDAO.TABLE_ABS_OUTPUTS
 
-    def __init__(self, pri_d=None, pub_d=None):
+    # Tables which mirror the task pool {table_name: primary_key_columns}
+    TASK_POOL_TABLES: Dict[str, Tuple[str, ...]] = {
+        TABLE_TASK_POOL: ('cycle', 'name', 'flow_nums'),
+        TABLE_TASK_PREREQUISITES: (
+            'cycle', 'name', 'flow_nums',
+            'prereq_name', 'prereq_cycle', 'prereq_output',
+        ),
+        TABLE_TASK_TIMEOUT_TIMERS: ('cycle', 'name'),
+        TABLE_TASK_ACTION_TIMERS: ('cycle', 'name', 'ctx_key'),
+    }
+
+    def __init__(
+        self, pri_d=None, pub_d=None, persistent=False, async_pub=False
+    ):
         self.pri_path = None
         if pri_d:
             self.pri_path = os.path.join(
@@ -137,6 +433,11 @@ class WorkflowDatabaseManager:
                 pub_d, CylcWorkflowDAO.DB_FILE_BASE_NAME)
         self.pri_dao = None
         self.pub_dao = None
+        # keep DB connections open between writes (see CylcWorkflowDAO)
+        self.persistent = persistent
+        # write to the public DB in the background (see PublicDatabaseWriter)
+        self.async_pub = async_pub
+        self.pub_writer: Optional[PublicDatabaseWriter] = None
         self.n_restart = 0
 
         self.db_deletes_map: Dict[str, List[DbArgDict]] = {
@@ -167,35 +468,16 @@ class WorkflowDatabaseManager:
         self.db_updates_map: DefaultDict[
             str, List[DbUpdateTuple]
         ] = defaultdict(list)
+        # The task pool rows last written to the DB, used to work out which
+        # rows need writing next time {table_name: {primary_key: row}}
+        self._task_pool_rows: Dict[str, Dict[tuple, DbArgDict]] = {}
+        # cache of the task_states and task_outputs tables
+        self.task_history = TaskHistoryCache()
 
     def copy_pri_to_pub(self) -> None:
         """Copy content of primary database file to public database file."""
         self.pub_dao.close()
-        # Use temporary file to ensure that we do not end up with a
-        # partial file.
-        # If an external connection is locking the old public db, it will
-        # still be connected to its inode, but should no longer affect future
-        # accesses (hopefully that process will soon recover to give up
-        # the lock).
-        temp_pub_db_fd, temp_pub_db_file_name = mkstemp(
-            prefix=self.pub_dao.DB_FILE_BASE_NAME,
-            dir=os.path.dirname(self.pub_dao.db_file_name)
-        )
-        os.close(temp_pub_db_fd)
-        try:
-            # Create the file if it didn't exist; this is done in the hope of
-            # addressing potential NFS file lag, we think
-            open(self.pub_dao.db_file_name, "a").close()  # noqa: SIM115
-            # Get default permissions level for public db:
-            st_mode = os.stat(self.pub_dao.db_file_name).st_mode
-
-            copy(self.pri_dao.db_file_name, temp_pub_db_file_name)
-            os.rename(temp_pub_db_file_name, self.pub_dao.db_file_name)
-            os.chmod(self.pub_dao.db_file_name, st_mode)
-        except OSError:
-            if os.path.exists(temp_pub_db_file_name):
-                os.remove(temp_pub_db_file_name)
-            raise
+        backup_db(self.pri_path, self.pub_path)
 
     def get_pri_dao(self) -> CylcWorkflowDAO:
         """Return the primary DAO.
@@ -236,13 +518,26 @@ class WorkflowDatabaseManager:
                 # ... however, in case there is a directory at the path for
                 # some bizarre reason:
                 rmtree(self.pri_path, ignore_errors=True)
-        self.pri_dao = self.get_pri_dao()
+        self.pri_dao = CylcWorkflowDAO(
+            self.pri_path, create_tables=True, persistent=self.persistent
+        )
+        self.task_history = TaskHistoryCache()
         os.chmod(self.pri_path, PERM_PRIVATE)
-        self.pub_dao = CylcWorkflowDAO(self.pub_path, is_public=True)
+        self.pub_dao = CylcWorkflowDAO(
+            self.pub_path, is_public=True, persistent=self.persistent
+        )
         self.copy_pri_to_pub()
+        if self.async_pub:
+            self.pub_writer = PublicDatabaseWriter(
+                self.pri_path, self.pub_path, persistent=self.persistent
+            )
+            self.pub_writer.start()
 
     def on_workflow_shutdown(self):
         """Close data access objects."""
+        if self.pub_writer:
+            self.pub_writer.stop()
+            self.pub_writer = None
         if self.pri_dao:
             self.pri_dao.close()
             self.pri_dao = None
@@ -254,37 +549,64 @@ class WorkflowDatabaseManager:
         """Handle queued db operations for each task proxy."""
         if self.pri_dao is None or self.pub_dao is None:
             return
+        pub_dao: Union[CylcWorkflowDAO, PublicDatabaseWriter] = (
+            self.pub_writer or self.pub_dao
+        )
         # Record workflow parameters and tasks in pool
         # Record any broadcast settings to be dumped out
         if any(self.db_deletes_map.values()):
             for table_name, db_deletes in sorted(self.db_deletes_map.items()):
-                while db_deletes:
-                    where_args = db_deletes.pop(0)
+                for where_args in db_deletes:
                     self.pri_dao.add_delete_item(table_name, where_args)
-                    self.pub_dao.add_delete_item(table_name, where_args)
+                    pub_dao.add_delete_item(table_name, where_args)
+                db_deletes.clear()
         if any(self.db_inserts_map.values()):
             for table_name, db_inserts in sorted(self.db_inserts_map.items()):
-                while db_inserts:
-                    db_insert = db_inserts.pop(0)
+                for db_insert in db_inserts:
                     self.pri_dao.add_insert_item(table_name, db_insert)
-                    self.pub_dao.add_insert_item(table_name, db_insert)
+                    pub_dao.add_insert_item(table_name, db_insert)
+                db_inserts.clear()
         if any(self.db_updates_map.values()):
             for table_name, db_updates in sorted(self.db_updates_map.items()):
-                while db_updates:
-                    db_update = db_updates.pop(0)
+                for db_update in db_updates:
                     self.pri_dao.add_update_item(table_name, db_update)
-                    self.pub_dao.add_update_item(table_name, db_update)
-
-        # Previously, we used a separate thread for database writes. This has
-        # now been removed. For the private database, there is no real
-        # advantage in using a separate thread as it needs to be always in sync
-        # with what is current. For the public database, which does not need to
-        # be fully in sync, there is some advantage of using a separate
-        # thread/process, if writing to it becomes a bottleneck. At the moment,
-        # there is no evidence that this is a bottleneck, so it is better to
-        # keep the logic simple.
-        self.pri_dao.execute_queued_items()
-        self.pub_dao.execute_queued_items()
+                    pub_dao.add_update_item(table_name, db_update)
+                db_updates.clear()
+
+        # The private database needs to be always in sync with what is
+        # current so is written to by the main thread. The public database
+        # does not need to be fully in sync so can optionally be written to
+        # in a separate thread.
+        if self.pub_writer:
+            with self.pub_writer.lock:
+                self.pri_dao.execute_queued_items()
+                self.pub_writer.execute_queued_items()
+        else:
+            self.pri_dao.execute_queued_items()
+            self.pub_dao.execute_queued_items()
+        self.task_history.executed()
+
+    def select_prev_instances(
+        self, name: str, point: str
+    ) -> List[Tuple[int, bool, Set[int], str]]:
+        """Select info about previous instances of a task (cached).
+
+        See CylcWorkflowDAO.select_prev_instances.
+        """
+        return self.task_history.select_prev_instances(
+            self.pri_dao, name, point
+        )
+
+    def select_task_outputs(
+        self, name: str, point: str
+    ) -> 'Dict[str, FlowNums]':
+        """Select task outputs for each flow (cached).
+
+        See CylcWorkflowDAO.select_task_outputs.
+        """
+        return self.task_history.select_task_outputs(
+            self.pri_dao, name, point
+        )
 
     def put_broadcast(self, modified_settings, is_cancel=False):
         """Put or clear broadcasts in runtime database."""
@@ -419,6 +741,8 @@ class WorkflowDatabaseManager:
         """Put statements to update the task_action_timers table."""
         if task_events_mgr.event_timers_updated:
             self.db_deletes_map[self.TABLE_TASK_ACTION_TIMERS].append({})
+            # task poll and retry timers will need to be re-inserted
+            self._task_pool_rows.pop(self.TABLE_TASK_ACTION_TIMERS, None)
             id_key: 'EventKey'
             for id_key, timer in task_events_mgr._event_timers.items():
                 key1 = (id_key.handler, id_key.event)
@@ -467,6 +791,7 @@ class WorkflowDatabaseManager:
         self.db_updates_map[self.TABLE_TASK_STATES].append(
             (set_args, where_args)
         )
+        self.task_history.put(itask.tdef.name, str(itask.point))
 
     def put_update_task_flow_wait(self, itask):
         """Update flow_wait status of a task, in the task_states table.
@@ -486,82 +811,103 @@ class WorkflowDatabaseManager:
         }
         self.db_updates_map[self.TABLE_TASK_STATES].append(
             (set_args, where_args))
+        self.task_history.put(itask.tdef.name, str(itask.point))
 
     def put_task_pool(self, pool: 'TaskPool') -> None:
-        """Delete task pool table content and recreate from current task pool.
+        """Update the task pool tables to match the current task pool.
 
-        Also recreate:
+        Only rows which have changed since the last call are written to (or
+        deleted from) the:
+        - task pool table
         - prerequisites table
         - timeout timers table
-        - action timers table
+        - action timers table (task poll and retry timers)
 
         And update:
         - task states table
         """
-        self.db_deletes_map[self.TABLE_TASK_POOL].append({})
-        # Comment this out to retain the trigger-time prereq status of past
-        # tasks (but then the prerequisite table will grow indefinitely):
-        self.db_deletes_map[self.TABLE_TASK_PREREQUISITES].append({})
-        # This should already be done by self.put_task_event_timers above:
-        # self.db_deletes_map[self.TABLE_TASK_ACTION_TIMERS].append({})
-        self.db_deletes_map[self.TABLE_TASK_TIMEOUT_TIMERS].append({})
+        rows: Dict[str, Dict[tuple, 'DbArgDict']] = {
+            table_name: {}
+            for table_name in self.TASK_POOL_TABLES
+        }
         for itask in pool.get_tasks():
+            cycle = str(itask.point)
+            name = itask.tdef.name
+            flow_nums = serialise_set(itask.flow_nums)
+            task_args = {"cycle": cycle, "name": name}
             for prereq in itask.state.prerequisites:
                 for (p_cycle, p_name, p_output), satisfied_state in (
                     prereq.items()
                 ):
-                    self.put_insert_task_prerequisites(itask, {
-                        "prereq_name": p_name,
-                        "prereq_cycle": p_cycle,
-                        "prereq_output": p_output,
-                        "satisfied": satisfied_state
-                    })
+                    self._add_task_pool_row(
+                        rows,
+                        self.TABLE_TASK_PREREQUISITES,
+                        {
+                            **task_args,
+                            "flow_nums": flow_nums,
+                            "prereq_name": p_name,
+                            "prereq_cycle": p_cycle,
+                            "prereq_output": p_output,
+                            "satisfied": satisfied_state,
+                        },
+                    )
             for x_label, x_satisfied in itask.state.xtriggers.items():
                 if x_satisfied:
-                    self.put_insert_task_prerequisites(itask, {
-                        "prereq_name": x_label,
-                        "prereq_cycle": XTRIGGER_PREREQ_PREFIX,
-                        "prereq_output": TASK_OUTPUT_SUCCEEDED,
-                        "satisfied": True
-                    })
-
-            self.db_inserts_map[self.TABLE_TASK_POOL].append({
-                "name": itask.tdef.name,
-                "cycle": str(itask.point),
-                "flow_nums": serialise_set(itask.flow_nums),
+                    self._add_task_pool_row(
+                        rows,
+                        self.TABLE_TASK_PREREQUISITES,
+                        {
+                            **task_args,
+                            "flow_nums": flow_nums,
+                            "prereq_name": x_label,
+                            "prereq_cycle": XTRIGGER_PREREQ_PREFIX,
+                            "prereq_output": TASK_OUTPUT_SUCCEEDED,
+                            "satisfied": True,
+                        },
+                    )
+
+            self._add_task_pool_row(rows, self.TABLE_TASK_POOL, {
+                **task_args,
+                "flow_nums": flow_nums,
                 "status": itask.state.status,
                 "is_held": itask.state.is_held
             })
             if itask.timeout is not None:
-                self.db_inserts_map[self.TABLE_TASK_TIMEOUT_TIMERS].append({
-                    "name": itask.tdef.name,
-                    "cycle": str(itask.point),
-                    "timeout": itask.timeout
-                })
+                self._add_task_pool_row(
+                    rows,
+                    self.TABLE_TASK_TIMEOUT_TIMERS,
+                    {**task_args, "timeout": itask.timeout},
+                )
             if itask.poll_timer is not None:
-                self.db_inserts_map[self.TABLE_TASK_ACTION_TIMERS].append({
-                    "name": itask.tdef.name,
-                    "cycle": str(itask.point),
-                    "ctx_key": json.dumps("poll_timer"),
-                    "ctx": self._namedtuple2json(itask.poll_timer.ctx),
-                    "delays": json.dumps(itask.poll_timer.delays),
-                    "num": itask.poll_timer.num,
-                    "delay": itask.poll_timer.delay,
-                    "timeout": itask.poll_timer.timeout
-                })
+                self._add_task_pool_row(
+                    rows,
+                    self.TABLE_TASK_ACTION_TIMERS,
+                    {
+                        **task_args,
+                        "ctx_key": json.dumps("poll_timer"),
+                        "ctx": self._namedtuple2json(itask.poll_timer.ctx),
+                        "delays": json.dumps(itask.poll_timer.delays),
+                        "num": itask.poll_timer.num,
+                        "delay": itask.poll_timer.delay,
+                        "timeout": itask.poll_timer.timeout,
+                    },
+                )
             for ctx_key_1, timer in itask.try_timers.items():
                 if timer is None:
                     continue
-                self.db_inserts_map[self.TABLE_TASK_ACTION_TIMERS].append({
-                    "name": itask.tdef.name,
-                    "cycle": str(itask.point),
-                    "ctx_key": json.dumps(("try_timers", ctx_key_1)),
-                    "ctx": self._namedtuple2json(timer.ctx),
-                    "delays": json.dumps(timer.delays),
-                    "num": timer.num,
-                    "delay": timer.delay,
-                    "timeout": timer.timeout
-                })
+                self._add_task_pool_row(
+                    rows,
+                    self.TABLE_TASK_ACTION_TIMERS,
+                    {
+                        **task_args,
+                        "ctx_key": json.dumps(("try_timers", ctx_key_1)),
+                        "ctx": self._namedtuple2json(timer.ctx),
+                        "delays": json.dumps(timer.delays),
+                        "num": timer.num,
+                        "delay": timer.delay,
+                        "timeout": timer.timeout,
+                    },
+                )
             if itask.state.time_updated:
                 set_args = {
                     "time_updated": itask.state.time_updated,
@@ -571,15 +917,62 @@ class WorkflowDatabaseManager:
                     "is_manual_submit": itask.is_manual_submit,
                 }
                 where_args = {
-                    "cycle": str(itask.point),
-                    "name": itask.tdef.name,
-                    "flow_nums": serialise_set(itask.flow_nums)
+                    "cycle": cycle,
+                    "name": name,
+                    "flow_nums": flow_nums,
                 }
                 self.db_updates_map[self.TABLE_TASK_STATES].append(
                     (set_args, where_args)
                 )
+                self.task_history.put(name, cycle)
                 itask.state.time_updated = None
 
+        for table_name, table_rows in rows.items():
+            prev_rows = self._task_pool_rows.get(table_name)
+            if prev_rows is None:
+                # We don't know what is in the DB (e.g. first call after
+                # restart) so we must rewrite the table.
+                if table_name != self.TABLE_TASK_ACTION_TIMERS:
+                    # NOTE: the action timers table also holds event timers
+                    # so can only be cleared by put_task_event_timers.
+                    self.db_deletes_map[table_name].append({})
+                self.db_inserts_map[table_name].extend(table_rows.values())
+            else:
+                for key, row in prev_rows.items():
+                    if key not in table_rows:
+                        self.db_deletes_map[table_name].append(
+                            self._get_task_pool_row_key_args(table_name, row)
+                        )
+                self.db_inserts_map[table_name].extend(
+                    row
+                    for key, row in table_rows.items()
+                    if prev_rows.get(key) != row
+                )
+            self._task_pool_rows[table_name] = table_rows
+
+    @classmethod
+    def _add_task_pool_row(
+        cls,
+        rows: Dict[str, Dict[tuple, 'DbArgDict']],
+        table_name: str,
+        row: 'DbArgDict',
+    ) -> None:
+        """Add a row to the current task pool rows, indexed by primary key."""
+        key = tuple(
+            row[column] for column in cls.TASK_POOL_TABLES[table_name]
+        )
+        rows[table_name][key] = row
+
+    @classmethod
+    def _get_task_pool_row_key_args(
+        cls, table_name: str, row: 'DbArgDict'
+    ) -> 'DbArgDict':
+        """Return the where args which match a row by its primary key."""
+        return {
+            column: row[column]
+            for column in cls.TASK_POOL_TABLES[table_name]
+        }
+
     def put_tasks_to_hold(
         self, tasks: Set[Tuple[str, 'PointBase']]
     ) -> None:
@@ -624,11 +1017,6 @@ class WorkflowDatabaseManager:
             },
         )
 
-    def put_insert_task_prerequisites(self, itask, args):
-        """Put INSERT statement for task_prerequisites table."""
-        args.setdefault("flow_nums", serialise_set(itask.flow_nums))
-        self._put_insert_task_x(self.TABLE_TASK_PREREQUISITES, itask, args)
-
     def put_insert_task_outputs(self, itask):
         """Reset outputs for a task."""
         self._put_insert_task_x(
@@ -673,6 +1061,8 @@ class WorkflowDatabaseManager:
         })
         args.setdefault("submit_num", itask.submit_num)
         self.db_inserts_map.setdefault(table_name, []).append(args)
+        if table_name in {self.TABLE_TASK_STATES, self.TABLE_TASK_OUTPUTS}:
+            self.task_history.put(itask.tdef.name, str(itask.point))
 
     def put_update_task_jobs(self, itask: 'TaskProxy', set_args: dict) -> None:
         """Put UPDATE statement for task_jobs table."""
@@ -696,6 +1086,7 @@ class WorkflowDatabaseManager:
         self.db_updates_map[self.TABLE_TASK_OUTPUTS].append(
             (set_args, where_args)
         )
+        self.task_history.put(itask.tdef.name, str(itask.point))
 
     def _put_update_task_x(
         self, table_name: str, itask: 'TaskProxy', set_args: 'DbArgDict'
@@ -791,11 +1182,15 @@ class WorkflowDatabaseManager:
             self.db_updates_map[table].append(
                 (stmt, params)
             )
+        self.task_history.put(name, point)
 
         return removed_flow_nums
 
     def recover_pub_from_pri(self):
         """Recover public database from private database."""
+        if self.pub_writer:
+            # the public database writer handles its own recovery
+            return
         if self.pub_dao.n_tries >= self.pub_dao.MAX_TRIES:
             self.copy_pri_to_pub()
             LOG.warning(
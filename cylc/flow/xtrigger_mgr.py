@@ -41,6 +41,8 @@ import cylc.flow.flags
 from cylc.flow.hostuserutil import get_user
 from cylc.flow.subprocctx import add_kwarg_to_sig
 from cylc.flow.subprocpool import get_xtrig_func
+from cylc.flow.task_state import TASK_STATUS_WAITING
+from cylc.flow.timer import DeadlineQueue
 from cylc.flow.xtriggers.wall_clock import _wall_clock
 from cylc.flow.xtriggers.workflow_state import (
     workflow_state,
@@ -525,10 +527,21 @@ class XtriggerManager:
         user = schd.owner
         # When next to call a function, by signature.
         self.t_next_call: dict = {}
+        # When next to check the tasks waiting on an xtrigger, by signature
+        # (the next call of a function, or the trigger time of a clock).
+        self.call_timers: DeadlineQueue[str] = DeadlineQueue()
         # Succeeded triggers and their function results, by signature.
         self.sat_xtrig: dict = {}
         # Signatures of active functions (waiting on callback).
         self.active: list = []
+        # Tasks with unsatisfied xtrigger prerequisites, by signature:
+        # {sig: {task ID: (itask, label)}}.
+        self.xtrig_tasks: Dict[str, Dict[str, Tuple['TaskProxy', str]]] = {}
+        # Xtrigger function contexts of tasks, by task ID and label:
+        # {task ID: {label: (sig, ctx)}}.
+        self.task_xtrig_ctxs: Dict[
+            str, Dict[str, Tuple[str, 'SubFuncContext']]
+        ] = {}
 
         # A record of parentless sequential xtriggered tasks
         # that have had their next occurrance spawned.
@@ -590,12 +603,68 @@ class XtriggerManager:
         # Tell the datastore this xtrigger succeeded.
         self.data_store_mgr.delta_xtrigger(sig, True)
 
+    def add_task(self, itask: 'TaskProxy') -> None:
+        """Index the xtrigger prerequisites of a task.
+
+        Call when a task is added to the pool, or when its xtriggers have
+        changed by other means than satisfaction (e.g. a retry is scheduled,
+        or the workflow is reloaded).
+
+        Args:
+            itask: the task instance
+        """
+        for sig, _ in self.task_xtrig_ctxs.get(itask.identity, {}).values():
+            self._discard(sig, itask)
+        ctxs = self.task_xtrig_ctxs[itask.identity] = {}
+        for label, satisfied in itask.state.xtriggers.items():
+            ctx = self.get_xtrig_ctx(itask, label)
+            sig = ctx.get_signature()
+            ctxs[label] = (sig, ctx)
+            if not satisfied:
+                self.xtrig_tasks.setdefault(sig, {})[itask.identity] = (
+                    itask, label
+                )
+
+    def remove_task(self, itask: 'TaskProxy') -> None:
+        """Remove a task from the xtrigger index.
+
+        Forget the results of succeeded xtriggers no longer needed by any
+        task.
+
+        Args:
+            itask: the task instance
+        """
+        ctxs = self.task_xtrig_ctxs.pop(itask.identity, {})
+        for sig, _ in ctxs.values():
+            self._discard(sig, itask)
+            if sig not in self.xtrig_tasks:
+                self._forget(sig)
+
+    def _discard(self, sig: str, itask: 'TaskProxy') -> None:
+        """Remove a task from those waiting on an xtrigger."""
+        itasks = self.xtrig_tasks.get(sig)
+        if itasks is not None:
+            itasks.pop(itask.identity, None)
+            if not itasks:
+                del self.xtrig_tasks[sig]
+
+    def _forget(self, sig: str) -> None:
+        """Forget an xtrigger no longer needed by any task."""
+        if sig in self.sat_xtrig:
+            LOG.debug(f"Housekeeping xtrigger result: {sig}")
+            del self.sat_xtrig[sig]
+        self.t_next_call.pop(sig, None)
+        self.call_timers.cancel(sig)
+
     def _get_xtrigs(
         self, itask: 'TaskProxy', unsat_only: bool = False,
         sigs_only: bool = False
     ) -> 'List[Any]':
         """(Internal helper method.)
 
+        Function contexts are cached in the xtrigger index (the task is
+        indexed if necessary). Do not modify them.
+
         Args:
             itask: the task instance
             unsat_only: retrieve only unsatisfied xtrigger prerequisites
@@ -606,12 +675,15 @@ class XtriggerManager:
                 with either signature (if sigs_only True) or with tuples of
                 label, signature, function context, and flag for satisfied.
         """
+        ctxs = self.task_xtrig_ctxs.get(itask.identity)
+        if ctxs is None or not ctxs.keys() >= itask.state.xtriggers.keys():
+            self.add_task(itask)
+            ctxs = self.task_xtrig_ctxs[itask.identity]
         res: 'List[Any]' = []
         for label, satisfied in itask.state.xtriggers.items():
             if unsat_only and satisfied:
                 continue
-            ctx = self.get_xtrig_ctx(itask, label)
-            sig = ctx.get_signature()
+            sig, ctx = ctxs[label]
             if sigs_only:
                 res.append(sig)
             else:
@@ -685,11 +757,13 @@ class XtriggerManager:
                 if sig in self.sat_xtrig:
                     # Already satisfied, just update the task
                     itask.state.xtriggers[label] = True
+                    self._discard(sig, itask)
                     if self.all_task_seq_xtriggers_satisfied(itask):
                         self.schd.pool.check_spawn_psx_task(itask)
                 elif _wall_clock(*ctx.func_args, **ctx.func_kwargs):
                     # Newly satisfied
                     itask.state.xtriggers[label] = True
+                    self._discard(sig, itask)
                     self.sat_xtrig[sig] = {}
                     self.data_store_mgr.delta_xtrigger(sig, True)
                     self.workflow_db_mgr.put_xtriggers({sig: {}})
@@ -697,26 +771,16 @@ class XtriggerManager:
                     if self.all_task_seq_xtriggers_satisfied(itask):
                         self.schd.pool.check_spawn_psx_task(itask)
                     self.do_housekeeping = True
+                else:
+                    # Check again at the trigger time.
+                    self.call_timers.schedule(
+                        sig, ctx.func_kwargs['trigger_time']
+                    )
                 continue
             # General case: potentially slow asynchronous function call.
             if sig in self.sat_xtrig:
                 # Already satisfied, just update the task
-                LOG.info(f"[{itask}] satisfying xtrigger prerequisite: {sig}")
-                if not itask.state.xtriggers[label]:
-                    itask.state.xtriggers[label] = True
-                    res = {}
-                    for key, val in self.sat_xtrig[sig].items():
-                        res["%s_%s" % (label, key)] = val
-                    if res:
-                        xtrigger_env = [{'environment': {key: str(val)}} for
-                                        key, val in res.items()]
-                        self.broadcast_mgr.put_broadcast(
-                            [str(itask.point)],
-                            [itask.tdef.name],
-                            xtrigger_env
-                        )
-                    if self.all_task_seq_xtriggers_satisfied(itask):
-                        self.schd.pool.check_spawn_psx_task(itask)
+                self._satisfy_task(itask, label, sig)
                 continue
 
             # Call the function to check the xtrigger.
@@ -731,30 +795,58 @@ class XtriggerManager:
             now = time()
             if sig in self.t_next_call and now < self.t_next_call[sig]:
                 # Too soon to call this one again.
+                self.call_timers.schedule(sig, self.t_next_call[sig])
                 continue
             self.t_next_call[sig] = now + ctx.intvl
             # Queue to the process pool, and record as active.
             self.active.append(sig)
-            self.proc_pool.put_command(ctx, callback=self.callback)
+            self.proc_pool.put_command(deepcopy(ctx), callback=self.callback)
+
+    def _satisfy_task(self, itask: 'TaskProxy', label: str, sig: str):
+        """Satisfy a task's xtrigger prerequisite from a succeeded xtrigger.
+
+        Args:
+            itask: the task instance
+            label: the xtrigger label
+            sig: the xtrigger signature (must be in self.sat_xtrig)
+        """
+        LOG.info(f"[{itask}] satisfying xtrigger prerequisite: {sig}")
+        self._discard(sig, itask)
+        if not itask.state.xtriggers[label]:
+            itask.state.xtriggers[label] = True
+            self.schd.pool.check_task(itask)
+            res = {}
+            for key, val in self.sat_xtrig[sig].items():
+                res["%s_%s" % (label, key)] = val
+            if res:
+                xtrigger_env = [{'environment': {key: str(val)}} for
+                                key, val in res.items()]
+                self.broadcast_mgr.put_broadcast(
+                    [str(itask.point)],
+                    [itask.tdef.name],
+                    xtrigger_env
+                )
+            if self.all_task_seq_xtriggers_satisfied(itask):
+                self.schd.pool.check_spawn_psx_task(itask)
 
-    def housekeep(self, itasks):
+    def check_due_xtriggers(self) -> None:
+        """Check the tasks waiting on xtriggers which are due.
+
+        I.e. xtrigger functions which are due to be called again, or clock
+        triggers which are due to be satisfied.
+        """
+        for sig in self.call_timers.pop_due(time()):
+            for itask, _label in self.xtrig_tasks.get(sig, {}).values():
+                self.schd.pool.check_task(itask)
+
+    def housekeep(self):
         """Forget succeeded xtriggers no longer needed by any task.
 
         Check self.do_housekeeping before calling this method.
-
-        Args:
-            itasks: list of all task proxies.
         """
-        all_xtrig = []
-        for itask in itasks:
-            all_xtrig += self._get_xtrigs(
-                itask, sigs_only=True, unsat_only=True)
         for sig in list(self.sat_xtrig):
-            if sig not in all_xtrig:
-                LOG.debug(f"Housekeeping xtrigger result: {sig}")
-                del self.sat_xtrig[sig]
-                with suppress(KeyError):
-                    del self.t_next_call[sig]
+            if sig not in self.xtrig_tasks:
+                self._forget(sig)
         self.do_housekeeping = False
 
     def all_task_seq_xtriggers_satisfied(self, itask: 'TaskProxy') -> bool:
@@ -778,6 +870,10 @@ class XtriggerManager:
         """
         sig = ctx.get_signature()
         self.active.remove(sig)
+        if sig in self.t_next_call:
+            # Check the waiting tasks when the function is next due to be
+            # called (they are satisfied now if it has succeeded).
+            self.call_timers.schedule(sig, self.t_next_call[sig])
 
         if ctx.ret_code != 0:
             msg = f"ERROR in xtrigger {sig}"
@@ -799,6 +895,15 @@ class XtriggerManager:
         LOG.info(f"xtrigger succeeded: {ctx.get_description()}")
         self.sat_xtrig[sig] = results
 
+        # Update the tasks waiting on this xtrigger now (runahead limited
+        # tasks are updated when next checked).
+        for itask, label in list(self.xtrig_tasks.get(sig, {}).values()):
+            if (
+                itask.state(TASK_STATUS_WAITING)
+                and not itask.state.is_runahead
+            ):
+                self._satisfy_task(itask, label, sig)
+
         self.do_housekeeping = True
 
     def force_satisfy(
@@ -844,6 +949,13 @@ class XtriggerManager:
                 continue
 
             itask.state.xtriggers[label] = satisfied
+            self.schd.pool.check_task(itask)
+            if satisfied:
+                self._discard(sig, itask)
+            else:
+                self.xtrig_tasks.setdefault(sig, {})[itask.identity] = (
+                    itask, label
+                )
             if satisfied and self.all_task_seq_xtriggers_satisfied(itask):
                 self.schd.pool.check_spawn_psx_task(itask)
 
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+# THIS FILE IS PART OF THE CYLC WORKFLOW ENGINE.
+# Copyright (C) NIWA & British Crown (Met Office) & Contributors.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""Benchmark task pool persistence (WorkflowDatabaseManager.put_task_pool).
+
+Simulates a large task pool where a small number of tasks change state on
+each main loop iteration and reports the number of rows written to the
+database per iteration along with the time taken.
+
+The "full" mode emulates the previous behaviour where the task pool tables
+were deleted and rewritten from scratch on each iteration.
+"""
+
+from argparse import ArgumentParser
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from types import SimpleNamespace
+
+from cylc.flow.workflow_db_mgr import WorkflowDatabaseManager
+
+
+def make_task(cycle: int, name: str, n_prereqs: int) -> SimpleNamespace:
+    """Return a minimal stand-in for a TaskProxy."""
+    return SimpleNamespace(
+        point=cycle,
+        tdef=SimpleNamespace(name=name),
+        flow_nums={1},
+        submit_num=0,
+        is_manual_submit=False,
+        timeout=None,
+        poll_timer=None,
+        try_timers={},
+        get_try_num=lambda: 0,
+        state=SimpleNamespace(
+            status='waiting',
+            is_held=False,
+            time_updated=None,
+            xtriggers={},
+            prerequisites=[
+                {
+                    (str(cycle), f'{name}_up{ind}', 'succeeded'): False
+                    for ind in range(n_prereqs)
+                }
+            ],
+        ),
+    )
+
+
+def count_rows(db_mgr: WorkflowDatabaseManager) -> int:
+    """Return the number of queued task pool rows (inserts + deletes)."""
+    return sum(
+        len(db_mgr.db_inserts_map[table_name])
+        + len(db_mgr.db_deletes_map[table_name])
+        for table_name in db_mgr.TASK_POOL_TABLES
+    )
+
+
+def run(n_tasks: int, n_changes: int, n_prereqs: int, n_iterations: int,
+        full: bool) -> None:
+    tasks = [
+        make_task(ind // 100, f'task{ind}', n_prereqs)
+        for ind in range(n_tasks)
+    ]
+    pool = SimpleNamespace(get_tasks=lambda: tasks)
+    with TemporaryDirectory() as tmpdir:
+        pri_d = Path(tmpdir, 'pri')
+        pub_d = Path(tmpdir, 'pub')
+        pri_d.mkdir()
+        pub_d.mkdir()
+        db_mgr = WorkflowDatabaseManager(pri_d, pub_d)
+        db_mgr.on_workflow_start(is_restart=False)
+
+        # initial write
+        db_mgr.put_task_pool(pool)
+        db_mgr.process_queued_ops()
+
+        rows = 0
+        elapsed = 0.
+        for iteration in range(n_iterations):
+            # change the state of a few tasks
+            for ind in range(n_changes):
+                itask = tasks[(iteration * n_changes + ind) % n_tasks]
+                itask.state.is_held = not itask.state.is_held
+            if full:
+                db_mgr._task_pool_rows.clear()
+            start = perf_counter()
+            db_mgr.put_task_pool(pool)
+            rows += count_rows(db_mgr)
+            db_mgr.process_queued_ops()
+            elapsed += perf_counter() - start
+        db_mgr.on_workflow_shutdown()
+
+    print(
+        f'{"full" if full else "incremental":>11}:'
+        f' {rows / n_iterations:10.1f} rows/iteration'
+        f' {elapsed / n_iterations * 1000:10.1f} ms/iteration'
+    )
+
+
+def main():
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument('--tasks', type=int, default=10000)
+    parser.add_argument('--changes', type=int, default=10,
+                        help='Number of tasks which change per iteration.')
+    parser.add_argument('--prereqs', type=int, default=2,
+                        help='Number of prerequisites per task.')
+    parser.add_argument('--iterations', type=int, default=10)
+    opts = parser.parse_args()
+    print(
+        f'{opts.tasks} tasks, {opts.changes} changes/iteration,'
+        f' {opts.prereqs} prerequisites/task'
+    )
+    for full in (True, False):
+        run(opts.tasks, opts.changes, opts.prereqs, opts.iterations, full)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+# THIS FILE IS PART OF THE CYLC WORKFLOW ENGINE.
+# Copyright (C) NIWA & British Crown (Met Office) & Contributors.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""Benchmark ISO8601 cycle point arithmetic and comparison.
+
+Creates points from strings (as the scheduler does when loading tasks from
+the DB or receiving commands), sorts them, offsets them by intervals and
+subtracts them, with empty caches.
+
+The "isodatetime" mode emulates the previous behaviour where all
+operations were performed by parsing the point strings with isodatetime.
+"""
+
+from argparse import ArgumentParser
+from random import Random
+from time import perf_counter
+
+from metomi.isodatetime.data import CALENDAR
+
+from cylc.flow.cycling import iso8601
+from cylc.flow.cycling.iso8601 import (
+    ISO8601Interval,
+    ISO8601Point,
+    WorkflowSpecifics,
+)
+
+
+CACHED = (
+    iso8601._interval_minutes,
+    iso8601._interval_parse,
+    iso8601._minutes_interval,
+    iso8601._point_parse,
+    ISO8601Point._iso_point_add,
+    ISO8601Point._iso_point_cmp,
+    ISO8601Point._iso_point_sub_interval,
+    ISO8601Point._iso_point_sub_point,
+)
+
+
+def clear_caches() -> None:
+    for func in CACHED:
+        func.cache_clear()
+
+
+def run(values, intervals, compact: bool) -> None:
+    compact_format = WorkflowSpecifics.compact_format
+    if not compact:
+        WorkflowSpecifics.compact_format = None
+    clear_caches()
+    times = {}
+    try:
+        start = perf_counter()
+        points = sorted(ISO8601Point(value) for value in values)
+        times['sort'] = perf_counter() - start
+
+        start = perf_counter()
+        for point in points:
+            for interval in intervals:
+                point + interval
+                point - interval
+        times['add/sub'] = perf_counter() - start
+
+        start = perf_counter()
+        for point, other in zip(points, points[1:]):
+            point - other
+        times['diff'] = perf_counter() - start
+    finally:
+        WorkflowSpecifics.compact_format = compact_format
+    print(
+        f'{"compact" if compact else "isodatetime":>11}:'
+        + ''.join(
+            f' {key} {elapsed * 1000:8.1f} ms'
+            for key, elapsed in times.items()
+        )
+    )
+
+
+def main():
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument('--points', type=int, default=20000,
+                        help='Number of cycle points.')
+    parser.add_argument('--calendar', default='gregorian',
+                        help='The calendar mode, e.g. 360_day.')
+    opts = parser.parse_args()
+    CALENDAR.set_mode(opts.calendar)
+    iso8601.init(time_zone='Z')
+    print(f'{opts.points} points, {opts.calendar} calendar')
+
+    # hourly points in a random order
+    start = ISO8601Point('20000101T0000Z')
+    hour = ISO8601Interval('PT1H')
+    values = []
+    point = start
+    for _ in range(opts.points):
+        values.append(point.value)
+        point += hour
+    Random(0).shuffle(values)
+    intervals = [
+        ISO8601Interval(value) for value in ('PT6H', 'P1D', '-PT12H')
+    ]
+
+    for compact in (False, True):
+        run(values, intervals, compact)
+
+
+if __name__ == '__main__':
+    main()
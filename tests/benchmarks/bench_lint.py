@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+# THIS FILE IS PART OF THE CYLC WORKFLOW ENGINE.
+# Copyright (C) NIWA & British Crown (Met Office) & Contributors.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""Benchmark "cylc lint" on a workflow with many include files.
+
+Creates a workflow containing many ".cylc" files and reports the time taken
+to lint it (with all rulesets).
+
+The "sequential" mode lints each file in turn, as "cylc lint" previously
+did. The "parallel" mode lints the files in worker processes. The "cached"
+mode re-lints the workflow with the results of a previous run cached (i.e.
+no files have changed).
+"""
+
+from argparse import ArgumentParser
+import os
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+from cylc.flow.scripts.lint import (
+    LintCache,
+    get_cylc_files,
+    lint_files,
+    parse_checks,
+)
+
+
+FILE = '''
+[scheduling]
+    [[graph]]
+        R1 = foo => bar
+[runtime]
+    [[foo]]
+        script = echo ${CYLC_TASK_NAME}; cylc message -p WARNING 'hello'
+        pre-command scripting = true
+        [[[environment]]]
+            FOO = $CYLC_SUITE_NAME
+            BAR=    1
+    [[bar]]
+    \tinherit = None
+        [[[job]]]
+            execution time limit = PT1H
+'''
+
+
+def run(workflow: Path, mode: str) -> None:
+    check_args = (['728', 'style'],)
+    checks = parse_checks(*check_args)
+    files = [
+        (file, file.relative_to(workflow))
+        for file in get_cylc_files(workflow)
+    ]
+    cache = None
+    if mode == 'cached':
+        cache = LintCache(workflow, checks)
+        # populate the cache
+        list(lint_files(files, checks, check_args, cache=cache))
+        cache = LintCache(workflow, checks)
+    start = perf_counter()
+    messages = sum(
+        len(file_messages)
+        for _, file_messages in lint_files(
+            files,
+            checks,
+            check_args,
+            jobs=(1 if mode == 'sequential' else 0),
+            cache=cache,
+        )
+    )
+    elapsed = perf_counter() - start
+    print(
+        f'{mode:>10}: {len(files)} files, {messages} messages,'
+        f' {elapsed * 1000:8.1f} ms'
+    )
+
+
+def main():
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument('--files', type=int, default=500,
+                        help='Number of files in the workflow.')
+    parser.add_argument('--lines', type=int, default=200,
+                        help='Approximate number of lines per file.')
+    opts = parser.parse_args()
+    with TemporaryDirectory() as tmp_dir:
+        os.environ['XDG_CACHE_HOME'] = str(Path(tmp_dir, 'cache'))
+        workflow = Path(tmp_dir, 'workflow')
+        (workflow / 'include').mkdir(parents=True)
+        text = FILE * max(opts.lines // FILE.count('\n'), 1)
+        (workflow / 'flow.cylc').write_text(text)
+        for ind in range(opts.files - 1):
+            (workflow / 'include' / f'file{ind}.cylc').write_text(text)
+        for mode in ('sequential', 'parallel', 'cached'):
+            run(workflow, mode)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+# THIS FILE IS PART OF THE CYLC WORKFLOW ENGINE.
+# Copyright (C) NIWA & British Crown (Met Office) & Contributors.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""Benchmark the run time of "cylc message" as called by job scripts.
+
+Runs "cylc message -- WORKFLOW_ID JOB MESSAGE" repeatedly in a fake job
+environment (in a temporary $HOME) and reports the mean wall clock and CPU
+time per call.
+
+The "cli" mode adds an option to the command line so that the message is
+sent via the full Cylc CLI, as all messages were previously.
+
+With "--comms=zmq" the messages are sent to a fake scheduler, otherwise the
+"poll" communication method is used (i.e. the messages are only written to
+the job status file).
+"""
+
+from argparse import ArgumentParser
+import json
+import os
+from pathlib import Path
+from resource import (
+    RUSAGE_CHILDREN,
+    getrusage,
+)
+from subprocess import run as run_proc
+import sys
+from tempfile import TemporaryDirectory
+from threading import (
+    Event,
+    Thread,
+)
+from time import perf_counter
+
+import zmq
+import zmq.auth
+
+
+WORKFLOW_ID = 'bench'
+JOB = '1/a/01'
+
+
+def serve(run_dir: Path, stopping: Event) -> None:
+    """Reply to messages as the scheduler would."""
+    srv_dir = run_dir / '.service'
+    zmq.auth.create_certificates(srv_dir, 'server')
+    zmq.auth.create_certificates(srv_dir, 'client')
+    context = zmq.Context()
+    socket = context.socket(zmq.REP)
+    socket.curve_publickey, socket.curve_secretkey = (
+        zmq.auth.load_certificate(srv_dir / 'server.key_secret')
+    )
+    socket.curve_server = True
+    port = socket.bind_to_random_port('tcp://127.0.0.1')
+    (srv_dir / 'contact').write_text(
+        'CYLC_WORKFLOW_HOST=127.0.0.1\n'
+        f'CYLC_WORKFLOW_PORT={port}\n'
+        'CYLC_WORKFLOW_PUBLISH_PORT=0\n'
+        'CYLC_VERSION=8.7.0\n'
+    )
+    try:
+        while not stopping.is_set():
+            if socket.poll(10):
+                socket.recv()
+                socket.send_string(json.dumps({'data': [True, '']}))
+    finally:
+        socket.close(linger=0)
+        context.term()
+
+
+def run(env, cli: bool, calls: int) -> None:
+    cmd = [
+        sys.executable,
+        '-c',
+        'from cylc.flow.scripts.cylc import main; main()',
+        'message',
+        *(['--severity=INFO'] if cli else []),
+        '--',
+        WORKFLOW_ID,
+        JOB,
+        'started',
+    ]
+    usage = getrusage(RUSAGE_CHILDREN)
+    start = perf_counter()
+    for _ in range(calls):
+        run_proc(cmd, env=env, check=True, capture_output=True)
+    elapsed = perf_counter() - start
+    end_usage = getrusage(RUSAGE_CHILDREN)
+    cpu = (
+        end_usage.ru_utime + end_usage.ru_stime
+        - usage.ru_utime - usage.ru_stime
+    )
+    print(
+        f'{"cli" if cli else "fast":>4}:'
+        f' wall {elapsed / calls * 1000:6.1f} ms/call'
+        f' cpu {cpu / calls * 1000:6.1f} ms/call'
+    )
+
+
+def main():
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument('--calls', type=int, default=20,
+                        help='Number of messages to send in each mode.')
+    parser.add_argument('--comms', choices=('poll', 'zmq'), default='poll',
+                        help='The task communication method.')
+    opts = parser.parse_args()
+    with TemporaryDirectory() as tmp_dir:
+        run_dir = Path(tmp_dir, 'cylc-run', WORKFLOW_ID)
+        job_log_dir = run_dir / 'log' / 'job' / JOB
+        job_log_dir.mkdir(parents=True)
+        (run_dir / '.service').mkdir()
+        env = {
+            **os.environ,
+            'HOME': tmp_dir,
+            'CYLC_WORKFLOW_ID': WORKFLOW_ID,
+            'CYLC_WORKFLOW_RUN_DIR': str(run_dir),
+            'CYLC_TASK_JOB': JOB,
+            'CYLC_TASK_LOG_ROOT': str(job_log_dir / 'job'),
+            'CYLC_TASK_COMMS_METHOD': opts.comms,
+        }
+        stopping = Event()
+        server = None
+        if opts.comms == 'zmq':
+            server = Thread(target=serve, args=(run_dir, stopping))
+            server.start()
+            while not (run_dir / '.service' / 'contact').exists():
+                pass
+        print(f'{opts.calls} calls, {opts.comms} comms')
+        try:
+            for cli in (True, False):
+                run(env, cli, opts.calls)
+        finally:
+            stopping.set()
+            if server:
+                server.join()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+# THIS FILE IS PART OF THE CYLC WORKFLOW ENGINE.
+# Copyright (C) NIWA & British Crown (Met Office) & Contributors.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""Benchmark the memory used by the runtime config of a large workflow.
+
+Loads a workflow with many parameterized tasks which inherit from a small
+family hierarchy and reports the memory held by the loaded config.
+
+The "copy" mode emulates the previous behaviour where every namespace held
+a complete copy of the sections it inherited.
+"""
+
+from argparse import ArgumentParser
+from optparse import Values
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from time import perf_counter
+import tracemalloc
+from unittest.mock import patch
+
+from cylc.flow.config import WorkflowConfig
+from cylc.flow.parsec.util import pdeepcopy
+
+
+FLOW = '''
+[task parameters]
+    m = 1..{members}
+    n = 1..{tasks}
+[scheduling]
+    [[graph]]
+        R1 = "a<m> => b<m,n>"
+[runtime]
+    [[root]]
+        script = echo "$CYLC_TASK_ID"
+        execution time limit = PT1H
+        [[[environment]]]
+            ROOT_1 = one
+            ROOT_2 = two
+        [[[events]]]
+            handler events = failed, submission failed
+            handlers = echo %(id)s
+    [[MODEL]]
+        platform = localhost
+        [[[directives]]]
+            -l walltime = 01:00:00
+            -l select = 1:ncpus=1
+        [[[environment]]]
+            MODEL_1 = one
+            MODEL_2 = two
+        [[[meta]]]
+            title = model
+            description = a model task
+    [[a<m>]]
+        inherit = MODEL
+    [[b<m,n>]]
+        inherit = MODEL
+'''
+
+
+def copy_inheritance(config: WorkflowConfig) -> None:
+    """The previous behaviour, each namespace has a copy of all sections."""
+    compute_inheritance(config)
+    for name, rtcfg in config.cfg['runtime'].items():
+        config.cfg['runtime'][name] = pdeepcopy(rtcfg)
+
+
+compute_inheritance = WorkflowConfig.compute_inheritance
+
+
+def run(flow_file: Path, copy: bool) -> None:
+    with patch.object(
+        WorkflowConfig,
+        'compute_inheritance',
+        copy_inheritance if copy else compute_inheritance,
+    ):
+        tracemalloc.start()
+        start = perf_counter()
+        config = WorkflowConfig('bench', flow_file, Values())
+        elapsed = perf_counter() - start
+        size, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    print(
+        f'{"copy" if copy else "share":>5}:'
+        f' {size / 1024 ** 2:8.1f} MiB held'
+        f' {peak / 1024 ** 2:8.1f} MiB peak'
+        f' {elapsed:8.2f} s'
+        f' ({len(config.taskdefs)} tasks)'
+    )
+
+
+def main():
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument('--members', type=int, default=20,
+                        help='Number of values of the first parameter.')
+    parser.add_argument('--tasks', type=int, default=100,
+                        help='Number of values of the second parameter.')
+    opts = parser.parse_args()
+    with TemporaryDirectory() as tmp_dir:
+        flow_file = Path(tmp_dir, 'flow.cylc')
+        flow_file.write_text(
+            FLOW.format(members=opts.members, tasks=opts.tasks)
+        )
+        for copy in (True, False):
+            run(flow_file, copy)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+# THIS FILE IS PART OF THE CYLC WORKFLOW ENGINE.
+# Copyright (C) NIWA & British Crown (Met Office) & Contributors.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""Benchmark scanning the cylc-run directory for workflows.
+
+Creates a cylc-run directory containing many installed workflows (each with
+two runs) and reports the number of directory listings and the time taken
+to scan it.
+
+The "unindexed" mode lists every directory on every scan, as all scans
+previously did. The "indexed" mode uses the scan index, the first scan
+builds the index, subsequent scans only stat the directories.
+"""
+
+from argparse import ArgumentParser
+import asyncio
+import os
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from time import (
+    perf_counter,
+    time,
+)
+
+from cylc.flow import async_util, pathutil
+from cylc.flow.network import scan as scan_module
+from cylc.flow.network.scan import (
+    ScanIndex,
+    scan,
+)
+
+
+def make_run_dir(run_dir: Path, workflows: int) -> None:
+    """Create a cylc-run directory with "cylc install" like run dirs."""
+    for ind in range(workflows):
+        workflow = run_dir / f'workflow{ind}'
+        for run in ('run1', 'run2'):
+            for subdir in ('log', 'share', 'work', '.service'):
+                (workflow / run / subdir).mkdir(parents=True)
+            (workflow / run / 'flow.cylc').touch()
+        (workflow / '_cylc-install').mkdir()
+        (workflow / 'runN').symlink_to('run2')
+    (run_dir / ScanIndex.DIRNAME).mkdir()
+    # make the directories old enough to be indexed
+    mtime = time() - 3600
+    for path in (run_dir, *run_dir.rglob('*')):
+        if path.is_dir() and not path.is_symlink():
+            os.utime(path, (mtime, mtime))
+
+
+def count_listings():
+    """Patch the directory listing functions to count calls."""
+    counter = [0]
+
+    def _counted(fcn):
+        async def _fcn(*args, **kwargs):
+            counter[0] += 1
+            return await fcn(*args, **kwargs)
+        return _fcn
+
+    async_util.async_listdir = _counted(async_util.async_listdir)
+    scan_module._async_list_dir = _counted(scan_module._async_list_dir)
+    return counter
+
+
+async def run(run_dir: Path, counter, indexed: bool, scans: int) -> None:
+    if indexed:
+        pathutil._CYLC_RUN_DIR = run_dir
+    else:
+        # scans of directories other than cylc-run are not indexed
+        pathutil._CYLC_RUN_DIR = run_dir / 'elsewhere'
+    for ind in range(scans):
+        counter[0] = 0
+        start = perf_counter()
+        workflows = [flow async for flow in scan(run_dir)]
+        elapsed = perf_counter() - start
+        print(
+            f'{"indexed" if indexed else "unindexed":>9} scan {ind + 1}:'
+            f' {len(workflows)} workflows,'
+            f' {counter[0]:5d} dirs listed,'
+            f' {elapsed * 1000:7.1f} ms'
+        )
+
+
+def main():
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument('--workflows', type=int, default=1000,
+                        help='Number of installed workflows.')
+    parser.add_argument('--scans', type=int, default=3,
+                        help='Number of scans in each mode.')
+    opts = parser.parse_args()
+    counter = count_listings()
+    with TemporaryDirectory() as tmp_dir:
+        run_dir = Path(tmp_dir, 'cylc-run')
+        make_run_dir(run_dir, opts.workflows)
+        for indexed in (False, True):
+            asyncio.run(run(run_dir, counter, indexed, opts.scans))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+# THIS FILE IS PART OF THE CYLC WORKFLOW ENGINE.
+# Copyright (C) NIWA & British Crown (Met Office) & Contributors.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""Benchmark task lookup by ID (TaskPool._get_task_by_id).
+
+Simulates a task pool spread over many active cycle points and looks up
+tasks by ID as the scheduler does when processing task messages.
+
+The "scan" mode emulates the previous behaviour where each lookup scanned
+the tasks of every active cycle point in turn.
+"""
+
+from argparse import ArgumentParser
+from time import perf_counter
+from types import SimpleNamespace
+from typing import Optional
+
+from cylc.flow.task_pool import TaskPool
+
+
+def make_pool(n_points: int, n_tasks: int) -> TaskPool:
+    """Return a task pool populated with minimal stand-in TaskProxies."""
+    pool = TaskPool.__new__(TaskPool)
+    pool.active_tasks = {}
+    pool._tasks_by_id = {}
+    pool._tasks_by_name = {}
+    for point in range(1, n_points + 1):
+        for ind in range(n_tasks):
+            name = f'task{ind}'
+            itask = SimpleNamespace(
+                identity=f'{point}/{name}',
+                point=point,
+                tdef=SimpleNamespace(name=name),
+            )
+            pool.active_tasks.setdefault(point, {})[itask.identity] = itask
+            pool._tasks_by_id[itask.identity] = itask
+            pool._tasks_by_name.setdefault(name, {})[itask.identity] = itask
+    return pool
+
+
+def scan_task_by_id(pool: TaskPool, id_: str) -> Optional[SimpleNamespace]:
+    """The previous implementation of TaskPool._get_task_by_id."""
+    for itask_ids in pool.active_tasks.values():
+        if id_ in itask_ids:
+            return itask_ids[id_]
+    return None
+
+
+def run(pool: TaskPool, ids, scan: bool) -> None:
+    get_task_by_id = (
+        (lambda id_: scan_task_by_id(pool, id_))
+        if scan else pool._get_task_by_id
+    )
+    start = perf_counter()
+    for id_ in ids:
+        assert get_task_by_id(id_) is not None
+    elapsed = perf_counter() - start
+    print(
+        f'{"scan" if scan else "index":>5}:'
+        f' {elapsed / len(ids) * 1e6:10.2f} us/lookup'
+        f' {elapsed * 1000:10.1f} ms total'
+    )
+
+
+def main():
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument('--points', type=int, default=500,
+                        help='Number of active cycle points.')
+    parser.add_argument('--tasks', type=int, default=20,
+                        help='Number of tasks per cycle point.')
+    parser.add_argument('--lookups', type=int, default=10000,
+                        help='Number of task messages to look up.')
+    opts = parser.parse_args()
+    print(
+        f'{opts.points} cycle points, {opts.tasks} tasks/point,'
+        f' {opts.lookups} lookups'
+    )
+    pool = make_pool(opts.points, opts.tasks)
+    all_ids = list(pool._tasks_by_id)
+    # spread the lookups evenly over the pool
+    ids = [
+        all_ids[ind * len(all_ids) // opts.lookups % len(all_ids)]
+        for ind in range(opts.lookups)
+    ]
+    for scan in (True, False):
+        run(pool, ids, scan)
+
+
+if __name__ == '__main__':
+    main()
@@ -22,6 +22,7 @@ from typing import TYPE_CHECKING
 
 from graphql import parse, MiddlewareManager
 
+from cylc.flow.data_messages_pb2 import AllDeltas
 from cylc.flow.data_store_mgr import create_delta_store
 from cylc.flow.id import TaskTokens, Tokens
 from cylc.flow.network.client import WorkflowRuntimeClient
@@ -472,7 +473,8 @@ async def test_subscription_deltas(one, start):
             == get_workflow_status(one).value
         )
         # Get the all delta, process, then add it to the subscription queue.
-        btopic, delta, _ = one.data_store_mgr.publish_deltas[-1]
+        btopic, buf, _ = one.data_store_mgr.publish_deltas[-1]
+        delta = AllDeltas.FromString(buf)
         _, sub_queue = next(
             iter(one.data_store_mgr.delta_queues[one.id].items())
         )
@@ -25,6 +25,7 @@ from cylc.flow.id import Tokens
 from cylc.flow import CYLC_LOG
 from cylc.flow.network.resolvers import Resolvers
 from cylc.flow.scheduler import Scheduler
+from cylc.flow.task_state import TASK_STATUS_FAILED
 from cylc.flow.workflow_status import StopMode
 
 
@@ -127,6 +128,97 @@ async def test_get_nodes_all(mock_flow, node_args):
     assert len(nodes) == 1
 
 
+async def test_get_nodes_index(
+    flow, scheduler, start, node_args, monkeypatch
+):
+    """It uses the data-store indexes to select nodes to filter.
+
+    The results should be the same (and in the same order) as filtering
+    every node.
+    """
+    id_ = flow({
+        'scheduler': {'allow implicit tasks': True},
+        'scheduling': {
+            'initial cycle point': '1',
+            'cycling mode': 'integer',
+            'runahead limit': 'P2',
+            'graph': {'P1': 'a & b => c'},
+        },
+    })
+    schd = scheduler(id_, paused_start=True)
+    async with start(schd):
+        schd.pool.release_runahead_tasks()
+        for itask in schd.pool.get_tasks():
+            if itask.tdef.name == 'a' and str(itask.point) != '2':
+                itask.state.reset(TASK_STATUS_FAILED)
+                schd.data_store_mgr.delta_task_state(itask)
+        await schd.update_data_structure()
+        resolvers = Resolvers(schd.data_store_mgr, schd=schd)
+        flow_data = schd.data_store_mgr.data[schd.data_store_mgr.workflow_id]
+
+        # it selects nodes using the index
+        failed = [
+            node.id
+            for node in resolvers.get_filter_nodes(
+                flow_data, TASK_PROXIES, {'states': ['failed']}
+            )
+        ]
+        assert failed == [
+            node.id
+            for node in flow_data[TASK_PROXIES].values()
+            if node.state == TASK_STATUS_FAILED
+        ]
+        assert 0 < len(failed) < len(flow_data[TASK_PROXIES])
+
+        for args in (
+            {'states': ['failed']},
+            {'states': ['failed', 'waiting']},
+            {'exstates': ['failed']},
+            {'ids': [Tokens('1/a', relative=True)]},
+            {'ids': [Tokens('1', relative=True)]},
+            {'ids': [Tokens('*/a', relative=True)]},
+            {'ids': [Tokens('1/*:failed', relative=True)]},
+            {'ids': [
+                Tokens('2/a', relative=True),
+                Tokens('*/b', relative=True),
+            ]},
+            {'ids': [Tokens('[12]/a', relative=True)]},
+            {'ids': [Tokens('9/a', relative=True)]},
+            {'ids': [Tokens('*/a', relative=True)], 'states': ['waiting']},
+            {'ids': [Tokens('1/a', relative=True)], 'exstates': ['failed']},
+            {'exids': [Tokens('1/a', relative=True)]},
+        ):
+            args = {**node_args, **args}
+            with monkeypatch.context() as mp:
+                mp.setattr(schd.data_store_mgr, 'indexes', {})
+                expected = [
+                    node.id
+                    for node in await resolvers.get_nodes_all(
+                        TASK_PROXIES, args
+                    )
+                ]
+            assert [
+                node.id
+                for node in await resolvers.get_nodes_all(TASK_PROXIES, args)
+            ] == expected, args
+
+            args['native_ids'] = list(flow_data[TASK_PROXIES])
+            with monkeypatch.context() as mp:
+                mp.setattr(schd.data_store_mgr, 'indexes', {})
+                expected = [
+                    node.id
+                    for node in await resolvers.get_nodes_by_ids(
+                        TASK_PROXIES, args
+                    )
+                ]
+            assert [
+                node.id
+                for node in await resolvers.get_nodes_by_ids(
+                    TASK_PROXIES, args
+                )
+            ] == expected, args
+
+
 async def test_get_nodes_by_ids(mock_flow, node_args):
     """Test method returning workflow(s) node messages
     who's ID is a match to any given."""
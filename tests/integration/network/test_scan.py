@@ -16,15 +16,20 @@
 """Test file-system interaction aspects of scan functionality."""
 
 from contextlib import suppress
+import json
+import os
 from pathlib import Path
 import re
+from time import time
 from shutil import rmtree
 from tempfile import TemporaryDirectory
 from typing import List
 
 import pytest
 
+from cylc.flow.network import scan as scan_module
 from cylc.flow.network.scan import (
+    ScanIndex,
     filter_name,
     graphql_query,
     is_active,
@@ -267,6 +272,74 @@ async def test_scan_non_exist(tmp_path: Path):
     ) == []
 
 
+async def test_scan_index(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """It should only list directories which have changed since last scan."""
+    monkeypatch.setattr('cylc.flow.pathutil._CYLC_RUN_DIR', tmp_path)
+    init_flows(
+        tmp_path,
+        running=('foo', 'bar/pub', 'cheese/run1'),
+        un_registered=('qux',),
+    )
+
+    def age_dirs(*paths, age=3600):
+        # make the directories old enough to be indexed
+        mtime = time() - age
+        for path in paths:
+            os.utime(path, (mtime, mtime))
+
+    listed: List[str] = []
+    _list_dir = scan_module._async_list_dir
+
+    async def _list_dir_counted(path):
+        listed.append(str(path.relative_to(tmp_path)))
+        return await _list_dir(path)
+
+    monkeypatch.setattr(
+        'cylc.flow.network.scan._async_list_dir', _list_dir_counted
+    )
+
+    # (creating the index dir changes the mtime of the cylc-run dir)
+    (tmp_path / ScanIndex.DIRNAME).mkdir()
+    age_dirs(*(
+        path
+        for path in (tmp_path, *tmp_path.rglob('*'))
+        if path.is_dir() and not path.is_symlink()
+    ))
+    expected = ['bar/pub', 'cheese/run1', 'foo']
+    assert await listify(scan()) == expected
+    assert 'bar' in listed
+    index_file = tmp_path / ScanIndex.DIRNAME / ScanIndex.FILENAME
+    assert index_file.exists()
+
+    # nothing has changed, nothing is listed
+    listed.clear()
+    assert await listify(scan()) == expected
+    assert listed == []
+
+    # a new workflow is found by listing only the directory it is in
+    init_flows(tmp_path, registered=('bar/baz',))
+    assert await listify(scan()) == ['bar/baz', *expected]
+    assert sorted(listed) == ['bar', 'bar/baz']
+
+    # removed workflows are dropped from the index
+    rmtree(tmp_path / 'cheese')
+    age_dirs(tmp_path, age=1800)
+    listed.clear()
+    assert await listify(scan()) == ['bar/baz', 'bar/pub', 'foo']
+    assert sorted(listed) == ['.', 'bar', 'bar/baz']
+    entries = json.loads(index_file.read_text())['entries']
+    assert not {'cheese', 'cheese/run1'} & set(entries)
+    assert entries['foo'][1] is True
+
+    # a corrupt index is ignored (and replaced)
+    index_file.write_text('{')
+    assert await listify(scan()) == ['bar/baz', 'bar/pub', 'foo']
+    assert json.loads(index_file.read_text())['entries'] == entries
+
+
 async def test_is_active(sample_run_dir):
     """It should filter flows by presence of a contact file."""
     # running flows
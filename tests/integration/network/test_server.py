@@ -20,9 +20,14 @@ from typing import Callable
 
 import pytest
 
-from cylc.flow import __version__ as CYLC_VERSION
+from cylc.flow import (
+    __version__ as CYLC_VERSION,
+    commands,
+)
+from cylc.flow.network.client import WorkflowRuntimeClient
 from cylc.flow.network.server import PB_METHOD_MAP
 from cylc.flow.scheduler import Scheduler
+from cylc.flow.task_state import TASK_STATUS_FAILED
 
 
 @pytest.fixture(scope='module')
@@ -63,6 +68,97 @@ def test_graphql_error(myflow):
         assert "Cannot query field 'alsonotafield'" in excinfo
 
 
+async def test_graphql_cache(one: Scheduler, start):
+    """Query results should be cached until the data-store changes."""
+    request_string = '''
+        query ($ids: [ID]) {
+            taskProxies(ids: $ids) {
+                id
+                state
+            }
+        }
+    '''
+    async with start(one):
+        await one.update_data_structure()
+        cache = one.server.graphql_cache
+        client = WorkflowRuntimeClient(one.workflow)
+
+        async def query(request_string, ids=None):
+            return await client.async_request(
+                'graphql',
+                {
+                    'request_string': request_string,
+                    'variables': {'ids': ids or ['1/one']},
+                }
+            )
+
+        data = await query(request_string)
+        assert data['taskProxies'][0]['state'] == 'waiting'
+        assert (cache.hits, cache.misses) == (0, 1)
+
+        # repeated queries (regardless of formatting) hit the cache
+        assert await query(request_string) == data
+        assert await query(' '.join(request_string.split())) == data
+        assert (cache.hits, cache.misses) == (2, 1)
+
+        # the variables are part of the key
+        assert await query(request_string, ['1/two']) == {'taskProxies': []}
+        assert (cache.hits, cache.misses) == (2, 2)
+
+        # changes to the data-store invalidate the cache
+        itask = one.pool.get_tasks()[0]
+        itask.state.reset(TASK_STATUS_FAILED)
+        one.data_store_mgr.delta_task_state(itask)
+        await one.update_data_structure()
+        data = await query(request_string)
+        assert data['taskProxies'][0]['state'] == TASK_STATUS_FAILED
+        assert (cache.hits, cache.misses) == (2, 3)
+        assert cache.info()['size'] == 1
+
+        # mutations are never cached
+        request_string = f'''
+            mutation {{
+                hold(workflows: ["{one.id}"], tasks: ["1/one"]) {{
+                    result
+                }}
+            }}
+        '''
+        for _ in range(2):
+            await query(request_string)
+        assert (cache.hits, cache.misses) == (2, 3)
+        client.stop(stop_loop=False)
+
+
+async def test_graphql_cache_reload(one: Scheduler, start):
+    """Query results cached before a reload should not be returned after.
+
+    The data-store is rebuilt on reload, its generation must keep increasing
+    so that it is never mistaken for the one the results were cached for.
+    """
+    request_string = 'query { taskProxies { id state } }'
+    async with start(one):
+        await one.update_data_structure()
+        client = WorkflowRuntimeClient(one.workflow)
+
+        async def query():
+            return await client.async_request(
+                'graphql', {'request_string': request_string}
+            )
+
+        data = await query()
+        assert data['taskProxies'][0]['state'] == 'waiting'
+        generation = one.data_store_mgr.generation
+
+        # change the task state without telling the data-store, then reload
+        one.pool.get_tasks()[0].state.reset(TASK_STATUS_FAILED)
+        await commands.run_cmd(commands.reload_workflow(one))
+        assert one.data_store_mgr.generation > generation
+
+        data = await query()
+        assert data['taskProxies'][0]['state'] == TASK_STATUS_FAILED
+        client.stop(stop_loop=False)
+
+
 def test_pb_data_elements(myflow):
     """Test Protobuf elements endpoint method."""
     element_type = 'workflow'
@@ -82,6 +178,33 @@ def test_pb_entire_workflow(myflow):
     assert data.workflow.id == myflow.id
 
 
+async def test_put_messages(one: Scheduler, start):
+    """It should queue messages for multiple jobs without GraphQL."""
+    async with start(one):
+        res = one.server.receiver({
+            'command': 'put_messages',
+            'args': {
+                'messages': [
+                    ['1/one/01', '2000', [['INFO', 'a'], ['INFO', 'b']]],
+                    ['1/two/01', '2001', [['WARNING', 'c']]],
+                ],
+            },
+            'meta': {},
+        })
+        assert res['data'] == (True, 'Messages queued: 3')
+        queued = []
+        while one.message_queue.qsize():
+            queued.append(one.message_queue.get())
+        assert [
+            (msg.job_id.relative_id, msg.event_time, msg.severity, msg.message)
+            for msg in queued
+        ] == [
+            ('1/one/01', '2000', 'INFO', 'a'),
+            ('1/one/01', '2000', 'INFO', 'b'),
+            ('1/two/01', '2001', 'WARNING', 'c'),
+        ]
+
+
 async def test_stop(one: Scheduler, start):
     """Test stop."""
     async with start(one):
@@ -151,3 +274,21 @@ async def test_publish_before_shutdown(
         one.server.publish_queue.put([(b'fake', b'blah')])
         await one.server.stop('i said stop!')
         assert not one.server.publish_queue.qsize()
+
+
+async def test_operate_wakeup(one: Scheduler, start):
+    """The server should respond / publish without waiting for a timeout."""
+    async with start(one):
+        assert one.server.OPERATE_POLL_TIMEOUT >= 5
+        client = WorkflowRuntimeClient(one.workflow)
+        async with asyncio.timeout(2):
+            # requests wake the server
+            for _ in range(10):
+                await client.async_request('pb_entire_workflow')
+
+            # publishes wake the server
+            for _ in range(10):
+                one.server.publish_queue.put([(b'fake', b'blah')])
+                while one.server.publish_queue.qsize():
+                    await asyncio.sleep(0.01)
+        client.stop(stop_loop=False)
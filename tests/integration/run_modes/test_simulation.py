@@ -16,12 +16,14 @@
 
 """Test the workings of simulation mode"""
 
+from copy import deepcopy
 import logging
 from pathlib import Path
 import pytest
 from pytest import param
 
 from cylc.flow import commands
+from cylc.flow.cycling.integer import IntegerPoint
 from cylc.flow.cycling.iso8601 import ISO8601Point
 from cylc.flow.run_modes import RunMode
 from cylc.flow.run_modes.simulation import sim_time_check
@@ -490,3 +492,95 @@ async def test_db_submit_num(
     assert db_select(schd, False, 'task_states', 'submit_num', 'status') == [
         (1, 'succeeded'),
     ]
+
+
+def plain(config):
+    """Return a copy of a config as plain dicts, for comparison."""
+    if isinstance(config, dict):
+        return {key: plain(value) for key, value in config.items()}
+    return deepcopy(config)
+
+
+@pytest.mark.parametrize('mode', [RunMode.SIMULATION, RunMode.DUMMY])
+async def test_shared_sections(flow, scheduler, start, monkeytime, mode):
+    """Submitting a task should not modify the config of other tasks.
+
+    Runtime sections which aren't overridden are shared between namespaces,
+    e.g. tasks "a" and "b" share the [simulation] section of "FAM".
+    """
+    schd = scheduler(flow({
+        'scheduling': {'graph': {'R1': 'a & b'}},
+        'runtime': {
+            'FAM': {'simulation': {'fail cycle points': '1'}},
+            'a, b': {'inherit': 'FAM'},
+        },
+    }))
+    async with start(schd):
+        rtconfig = schd.config.get_taskdef('b').rtconfig
+        assert rtconfig['simulation'] is (
+            schd.config.get_taskdef('a').rtconfig['simulation']
+        )
+        before = {
+            key: plain(rtconfig[key])
+            for key in ('simulation', 'job', 'remote')
+        }
+
+        itask = schd.pool.get_task(IntegerPoint('1'), 'a')
+        itask.state.is_queued = False
+        monkeytime(0)
+        schd.task_job_mgr.submit_nonlive_task_jobs([itask], mode)
+        assert itask.mode_settings.sim_task_fails
+
+        assert {key: plain(rtconfig[key]) for key in before} == before
+        # (the fail cycle points of "b" have not been parsed)
+        assert rtconfig['simulation']['fail cycle points'] == ['1']
+        assert isinstance(rtconfig['simulation']['fail cycle points'][0], str)
+
+
+@pytest.mark.parametrize('mode', [RunMode.SIMULATION, RunMode.DUMMY])
+async def test_cached_rtconfig(flow, scheduler, start, monkeytime, mode):
+    """Submitting tasks should not modify the cached task config.
+
+    The config of a task with broadcasts applied is cached and shared by
+    each submission of the task (see BroadcastMgr.get_updated_rtconfig).
+    """
+    schd = scheduler(flow({
+        'scheduling': {
+            'cycling mode': 'integer',
+            'runahead limit': 'P1',
+            'graph': {'P1': 'a'},
+        },
+        'runtime': {
+            'a': {
+                'script': 'true',
+                'environment': {'X': '1'},
+            },
+        },
+    }))
+    async with start(schd):
+        schd.broadcast_mgr.put_broadcast(
+            ['*'], ['a'], [{'environment': {'Y': '2'}}]
+        )
+        itasks = [
+            schd.pool.get_task(IntegerPoint(cycle), 'a')
+            for cycle in ('1', '2')
+        ]
+        rtconfig = schd.broadcast_mgr.get_updated_rtconfig(itasks[0])
+        before = plain(rtconfig)
+
+        for itask in itasks:
+            itask.state.is_queued = False
+            monkeytime(0)
+            schd.task_job_mgr.submit_nonlive_task_jobs([itask], mode)
+            assert itask.mode_settings
+            # the cached config is used by both tasks
+            assert schd.broadcast_mgr.get_updated_rtconfig(itask) is rtconfig
+            assert plain(rtconfig) == before
+            assert dict(rtconfig['environment']) == {'X': '1', 'Y': '2'}
+
+        if mode == RunMode.DUMMY:
+            # the job should be configured for dummy mode regardless
+            job_rtconfig = schd.task_job_mgr._get_rtconfig(itasks[0])
+            assert job_rtconfig['script'].startswith('sleep')
+            assert job_rtconfig['environment'] == {}
+            assert job_rtconfig['platform'] == 'localhost'
@@ -282,3 +282,45 @@ async def test_broadcast_old_cycle(flow, scheduler, run, complete):
                 await asyncio.sleep(0.1)
                 if a_1.state(TASK_STATUS_FAILED):
                     break
+
+
+async def test_get_updated_rtconfig(one_conf, flow, scheduler, start):
+    """It should cache broadcast-merged runtime configs.
+
+    The cache should be invalidated when broadcasts change and the merged
+    config should share the sections broadcasts don't touch with the task
+    definition.
+    """
+    schd = scheduler(flow(one_conf))
+    async with start(schd):
+        bc_mgr = schd.broadcast_mgr
+        itask = schd.pool.get_tasks()[0]
+        tdef_rtconfig = itask.tdef.rtconfig
+
+        # no broadcasts
+        assert bc_mgr.get_updated_rtconfig(itask) is tdef_rtconfig
+
+        # all-cycle broadcast
+        bc_mgr.put_broadcast(
+            point_strings=['*'],
+            namespaces=['root'],
+            settings=[{'environment': {'FOO': 'foo'}}],
+        )
+        rtconfig = bc_mgr.get_updated_rtconfig(itask)
+        assert rtconfig['environment']['FOO'] == 'foo'
+        assert 'FOO' not in tdef_rtconfig['environment']
+        assert rtconfig['directives'] is tdef_rtconfig['directives']
+        assert bc_mgr.get_updated_rtconfig(itask) is rtconfig
+
+        # cycle specific broadcast
+        bc_mgr.put_broadcast(
+            point_strings=['1'],
+            namespaces=['one'],
+            settings=[{'environment': {'FOO': 'bar'}}],
+        )
+        rtconfig = bc_mgr.get_updated_rtconfig(itask)
+        assert rtconfig['environment']['FOO'] == 'bar'
+
+        # clear broadcasts
+        bc_mgr.clear_broadcast()
+        assert bc_mgr.get_updated_rtconfig(itask) is tdef_rtconfig
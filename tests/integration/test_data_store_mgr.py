@@ -31,17 +31,24 @@ from cylc.flow.commands import (
     run_cmd,
 )
 from cylc.flow.data_messages_pb2 import (
+    AllDeltas,
     PbJob,
     PbPrerequisite,
     PbTaskProxy,
+    TPDeltas,
 )
 from cylc.flow.data_store_mgr import (
+    ALL_DELTAS,
+    CHECKSUM_ATTRS,
+    DELTAS_MAP,
     EDGES,
     FAMILY_PROXIES,
     JOBS,
     TASK_PROXIES,
     TASKS,
     WORKFLOW,
+    generate_checksum,
+    generate_incremental_checksum,
 )
 from cylc.flow.id import (
     TaskTokens,
@@ -512,6 +519,116 @@ async def test_prune_data_store(flow, scheduler, start):
         }) == 0
 
 
+async def test_incremental_checksums(flow, scheduler, start):
+    """The checksums should be kept in sync with the data-store elements.
+
+    The checksums are maintained incrementally, they should match a checksum
+    generated from scratch (as subscribers do) as elements are added,
+    updated and pruned.
+    """
+    id_ = flow({
+        'scheduling': {
+            'graph': {
+                'R1': 'foo => bar'
+            }
+        },
+        'runtime': {
+            'FOO': {},
+            'foo': {
+                'inherit': 'FOO'
+            },
+        }
+    })
+    schd = scheduler(id_)
+
+    def assert_checksums():
+        data = schd.data_store_mgr.data[schd.data_store_mgr.workflow_id]
+        for key, s_att in CHECKSUM_ATTRS.items():
+            assert schd.data_store_mgr.checksums[key] == (
+                generate_incremental_checksum(
+                    getattr(element, s_att) for element in data[key].values()
+                )
+            ), key
+
+    async with start(schd):
+        await schd.update_data_structure()
+        assert_checksums()
+        assert schd.data_store_mgr.checksums[TASK_PROXIES]
+
+        # update
+        schd.pool.hold_tasks({TaskTokens('*', 'root')})
+        await schd.update_data_structure()
+        assert_checksums()
+        # the published deltas should carry the checksum
+        published = {
+            key.decode(): buf
+            for key, buf, _ in schd.data_store_mgr.publish_deltas
+        }
+        delta = TPDeltas.FromString(published[TASK_PROXIES])
+        assert delta.incremental_checksum == (
+            schd.data_store_mgr.checksums[TASK_PROXIES]
+        )
+        # and the checksum expected by older subscribers
+        data = schd.data_store_mgr.data[schd.data_store_mgr.workflow_id]
+        assert delta.checksum == generate_checksum(
+            itask.stamp for itask in data[TASK_PROXIES].values()
+        )
+
+        # prune
+        schd.data_store_mgr.set_graph_window_extent(0)
+        schd.data_store_mgr.update_data_structure()
+        assert_checksums()
+
+        # add
+        for itask in schd.pool.get_tasks():
+            schd.pool.spawn_on_output(itask, TASK_OUTPUT_SUCCEEDED)
+        schd.data_store_mgr.update_data_structure()
+        assert_checksums()
+
+
+async def test_legacy_checksums(one: Scheduler, start):
+    """It should only publish the older checksums if configured to."""
+    async with start(one):
+        one.data_store_mgr.legacy_checksums = False
+        one.pool.hold_tasks({TaskTokens('*', 'root')})
+        await one.update_data_structure()
+        published = {
+            key.decode(): buf
+            for key, buf, _ in one.data_store_mgr.publish_deltas
+        }
+        delta = TPDeltas.FromString(published[TASK_PROXIES])
+        assert not delta.HasField('checksum')
+        assert delta.incremental_checksum == (
+            one.data_store_mgr.checksums[TASK_PROXIES]
+        )
+
+
+async def test_get_publish_deltas(one: Scheduler, start):
+    """The deltas should be published as serialised messages.
+
+    The AllDeltas message is assembled from the serialised deltas, it
+    should match the message built from the deltas themselves.
+    """
+    async with start(one):
+        one.data_store_mgr.initiate_data_model()
+        one.data_store_mgr.batch_deltas(True)
+        expected = AllDeltas()
+        for key, delta in one.data_store_mgr.deltas.items():
+            if delta.ListFields():
+                getattr(expected, key).CopyFrom(delta)
+        published = {
+            topic.decode(): buf
+            for topic, buf, _ in one.data_store_mgr.get_publish_deltas()
+        }
+        # NOTE: compare messages not bytes, the serialisation order of
+        # protobuf map fields is not deterministic
+        assert AllDeltas.FromString(published.pop(ALL_DELTAS)) == expected
+        assert published
+        for key, buf in published.items():
+            assert isinstance(buf, bytes)
+            assert DELTAS_MAP[key].FromString(buf) == getattr(expected, key)
+
+
 async def test_family_ascent_point_prune(mod_harness):
     """Test _family_ascent_point_prune. This method tries to remove
     non-existent family."""
@@ -34,6 +34,7 @@ from cylc.flow.task_state import (
     TASK_STATUS_RUNNING,
     TASK_STATUS_FAILED
 )
+from cylc.flow.timer import Timer
 
 from cylc.flow.workflow_status import AutoRestartMode, StopMode
 
@@ -454,3 +455,88 @@ async def test_set_stall_interaction(flow, scheduler, start):
             schd.data_store_mgr.data[schd.tokens.id]['workflow'].status_msg
             != 'stalled'
         )
+
+
+async def test_event_driven_main_loop(
+    mock_glbl_cfg, flow, scheduler, start
+):
+    """In event driven mode the main loop should be woken by new messages.
+
+    It should sleep until the next known deadline otherwise.
+    """
+    mock_glbl_cfg(
+        'cylc.flow.scheduler.glbl_cfg',
+        '''
+            [scheduler]
+                [[main loop]]
+                    event driven = True
+                    maximum idle interval = PT1M
+        ''',
+    )
+    id_ = flow('a')
+    schd: 'Scheduler' = scheduler(id_)
+    async with start(schd):
+        assert schd.main_loop_event_driven is True
+        schd.main_loop_wakeup.bind()
+
+        # new tasks are checked straight away
+        assert schd.get_main_loop_timeout() == 0
+        assert schd.pool.get_tasks_to_check() == schd.pool.get_tasks()
+
+        # with nothing to do the main loop should sleep for the idle interval
+        assert schd.get_main_loop_timeout() == pytest.approx(60, abs=1)
+
+        # ... unless there is a deadline before then
+        schd.timers['foo'] = Timer('foo', 5)
+        schd.timers['foo'].reset()
+        assert schd.get_main_loop_timeout() == pytest.approx(5, abs=1)
+        schd.timers.pop('foo')
+
+        # queueing a message from another thread should wake the main loop
+        main_loop = asyncio.create_task(schd._main_loop())
+        await asyncio.sleep(0.5)
+        assert not main_loop.done()
+        await asyncio.to_thread(schd.ext_trigger_queue.put, ('foo', 'bar'))
+        await asyncio.wait_for(main_loop, 5)
+        schd.ext_trigger_queue.get()
+
+
+async def test_main_loop_changed_tasks(
+    mock_glbl_cfg, flow, scheduler, start, mocker
+):
+    """Main loop iterations should only handle tasks which have changed.
+
+    Unchanged tasks should not be rescanned by idle iterations.
+    """
+    mock_glbl_cfg(
+        'cylc.flow.scheduler.glbl_cfg',
+        '''
+            [scheduler]
+                [[main loop]]
+                    event driven = True
+                    maximum idle interval = PT0S
+        ''',
+    )
+    id_ = flow('a')
+    schd: 'Scheduler' = scheduler(id_, paused_start=False, run_mode='live')
+    async with start(schd):
+        itask = schd.pool.get_tasks()[0]
+        itask.state_reset(is_held=True)
+        to_check = mocker.spy(schd.pool, 'get_tasks_to_check')
+        updated = mocker.spy(schd.pool, 'get_updated_tasks')
+
+        await schd._main_loop()
+        assert to_check.spy_return == [itask]
+        assert updated.spy_return == [itask]
+        assert not itask.state.is_updated
+
+        # nothing has changed
+        await schd._main_loop()
+        assert to_check.spy_return == []
+        assert updated.spy_return == []
+
+        # the task has changed
+        schd.pool.unqueue_task(itask)
+        await schd._main_loop()
+        assert to_check.spy_return == [itask]
+        assert updated.spy_return == [itask]
@@ -2688,3 +2688,29 @@ async def test_add_to_pool(
         schd.pool.add_to_pool(a_1)
 
         assert "1/a not added to n=0: already exists" in caplog.text
+
+
+async def test_task_indexes(example_flow: 'Scheduler'):
+    """The ID and name indexes should track tasks added and removed."""
+    pool = example_flow.pool
+    assert set(pool._tasks_by_id) == pool.get_task_ids()
+    assert {itask.identity for itask in pool.get_tasks_by_name('foo')} == {
+        '1/foo', '2/foo', '3/foo', '4/foo', '5/foo'
+    }
+
+    foo_1 = pool._get_task_by_id('1/foo')
+    assert foo_1 is pool.get_task(IntegerPoint('1'), 'foo')
+    pool.remove(foo_1)
+    assert pool._get_task_by_id('1/foo') is None
+    assert foo_1 not in pool.get_tasks_by_name('foo')
+
+    # removing the last task of a name should drop it from the index
+    pub_2 = pool._get_task_by_id('2/pub')
+    pool.remove(pub_2)
+    assert pool.get_tasks_by_name('pub') == []
+    assert 'pub' not in pool._tasks_by_name
+
+    # re-adding the task should re-index it
+    pool.add_to_pool(foo_1)
+    assert pool.get_itasks([Tokens('1/foo', relative=True)]) == [foo_1]
+    assert set(pool._tasks_by_id) == pool.get_task_ids()
@@ -0,0 +1,267 @@
+# THIS FILE IS PART OF THE CYLC WORKFLOW ENGINE.
+# Copyright (C) NIWA & British Crown (Met Office) & Contributors.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Tests for task timers (late, job poll / timeout and clock-expiry).
+
+These timers are kept in deadline queues, only the timers which are due are
+checked by the main loop.
+"""
+
+import logging
+from time import time
+from unittest.mock import Mock
+
+import pytest
+
+from cylc.flow import commands
+from cylc.flow.run_modes import RunMode
+from cylc.flow.scheduler import Scheduler
+from cylc.flow.task_events_mgr import TaskEventsManager
+from cylc.flow.task_state import (
+    TASK_STATUS_EXPIRED,
+    TASK_STATUS_RUNNING,
+    TASK_STATUS_WAITING,
+)
+
+
+@pytest.fixture
+def set_time(monkeypatch):
+    """Set the current time as seen by the task timers."""
+    def _set_time(time_: float) -> None:
+        for module in (
+            'cylc.flow.timer.now',
+            'cylc.flow.task_job_mgr.time',
+            'cylc.flow.task_proxy.time',
+            'cylc.flow.task_action_timer.time',
+            'cylc.flow.task_events_mgr.time',
+        ):
+            monkeypatch.setattr(module, lambda: time_)
+    return _set_time
+
+
+def run_job(schd: Scheduler, task: str):
+    """Fake a live job for a task starting now.
+
+    Returns the task proxy.
+    """
+    itask = schd.pool._get_task_by_id(task)
+    assert itask
+    itask.submit_num += 1
+    itask.run_mode = RunMode.LIVE
+    schd.task_events_mgr.process_message(itask, logging.INFO, 'started')
+    assert itask.state(TASK_STATUS_RUNNING)
+    return itask
+
+
+async def test_late_tasks(flow, scheduler, start, set_time, log_filter):
+    """Tasks should be reported late once their late time has passed."""
+    id_ = flow({
+        'scheduler': {'cycle point format': 'CCYY'},
+        'scheduling': {
+            'initial cycle point': '2000',
+            'graph': {'R1': 'a & b'},
+        },
+        'runtime': {
+            'a': {'events': {'late offset': 'PT1H'}},
+            'b': {'events': {'late offset': 'PT2H'}},
+        },
+    })
+    schd: Scheduler = scheduler(id_)
+    async with start(schd):
+        a, b = (schd.pool._get_task_by_id(f'2000/{name}') for name in 'ab')
+        assert schd.pool.late_timers.get_next_deadline() == a.get_late_time()
+
+        # neither task is late yet
+        set_time(a.get_late_time() - 1)
+        schd.late_tasks_check()
+        assert not a.is_late
+        assert not b.is_late
+
+        # "a" is late
+        set_time(a.get_late_time() + 1)
+        schd.late_tasks_check()
+        assert a.is_late
+        assert not b.is_late
+        assert log_filter(
+            logging.WARNING, contains=f'[{a}] {TaskEventsManager.EVENT_LATE}'
+        )
+
+        # "b" is late, "a" should only be reported once
+        set_time(b.get_late_time() + 1)
+        schd.late_tasks_check()
+        assert b.is_late
+        assert len(log_filter(contains='] late (late-time=')) == 2
+        assert schd.pool.late_timers.get_next_deadline() is None
+
+
+async def test_late_tasks_active(flow, scheduler, start, set_time):
+    """Tasks which are active by their late time should not be late."""
+    id_ = flow({
+        'scheduler': {'cycle point format': 'CCYY'},
+        'scheduling': {
+            'initial cycle point': '2000',
+            'graph': {'R1': 'a'},
+        },
+        'runtime': {
+            'a': {'events': {'late offset': 'PT1H'}},
+        },
+    })
+    schd: Scheduler = scheduler(id_, run_mode='live')
+    async with start(schd):
+        itask = run_job(schd, '2000/a')
+        set_time(itask.get_late_time() + 1)
+        schd.late_tasks_check()
+        assert not itask.is_late
+
+
+JOB_TIMERS_CONF = {
+    'scheduling': {'graph': {'R1': 'a'}},
+    'runtime': {
+        'a': {
+            'execution time limit': 'PT1H',
+            'execution polling intervals': 'PT10M',
+            'events': {'execution timeout': 'PT2H'},
+        },
+    },
+}
+
+
+def check_job_timers(schd: Scheduler, set_time, started_time: float):
+    """Check the task's job is polled, then times out, when due."""
+    itask = schd.pool._get_task_by_id('1/a')
+    assert itask
+    schd.task_job_mgr.poll_task_jobs = Mock()
+    # (the times are restored to the nearest second on restart)
+    poll_time = itask.poll_timer.timeout
+    assert poll_time == pytest.approx(started_time + 600, abs=1)
+    assert itask.timeout == pytest.approx(started_time + 7200, abs=1)
+    assert (
+        schd.task_events_mgr.job_timer_queue.get_next_deadline() == poll_time
+    )
+
+    # nothing is due yet
+    set_time(poll_time - 1)
+    schd.task_job_mgr.check_task_jobs(schd.pool)
+    assert not schd.task_job_mgr.poll_task_jobs.called
+
+    # the poll timer is due
+    set_time(poll_time + 1)
+    schd.task_job_mgr.check_task_jobs(schd.pool)
+    schd.task_job_mgr.poll_task_jobs.assert_called_once_with({itask})
+    assert schd.task_events_mgr.job_timer_queue.get_next_deadline() == (
+        itask.poll_timer.timeout
+    )
+
+    # the execution timeout is due
+    schd.task_job_mgr.poll_task_jobs.reset_mock()
+    set_time(itask.timeout + 1)
+    schd.task_job_mgr.check_task_jobs(schd.pool)
+    schd.task_job_mgr.poll_task_jobs.assert_called_once_with({itask})
+    assert itask.timeout is None
+
+
+async def test_job_timers_restart(flow, scheduler, start, set_time):
+    """Job poll timers and timeouts should be restored on restart."""
+    id_ = flow(JOB_TIMERS_CONF)
+    schd: Scheduler = scheduler(id_, run_mode='live')
+    started_time = time()
+    set_time(started_time)
+    async with start(schd):
+        run_job(schd, '1/a')
+
+    schd = scheduler(id_, run_mode='live')
+    async with start(schd):
+        check_job_timers(schd, set_time, started_time)
+
+
+async def test_job_timers_reload(flow, scheduler, start, set_time):
+    """Job poll timers and timeouts should survive reload."""
+    id_ = flow(JOB_TIMERS_CONF)
+    schd: Scheduler = scheduler(id_, run_mode='live')
+    started_time = time()
+    set_time(started_time)
+    async with start(schd):
+        itask = run_job(schd, '1/a')
+        await commands.run_cmd(commands.reload_workflow(schd))
+        # the task proxy has been replaced
+        assert schd.pool._get_task_by_id('1/a') is not itask
+        check_job_timers(schd, set_time, started_time)
+
+
+async def test_clock_expire(flow, scheduler, start, set_time):
+    """Tasks should clock-expire once their expiry time has passed."""
+    id_ = flow({
+        'scheduler': {'cycle point format': 'CCYY'},
+        'scheduling': {
+            'initial cycle point': '2000',
+            'special tasks': {'clock-expire': 'a(PT1H), b(PT2H)'},
+            'graph': {'R1': 'a & b'},
+        },
+    })
+    schd: Scheduler = scheduler(id_)
+    async with start(schd):
+        a, b = (schd.pool._get_task_by_id(f'2000/{name}') for name in 'ab')
+        assert schd.pool.expiry_timers.get_next_deadline() == a.expire_time
+
+        # nothing has expired yet
+        set_time(a.expire_time - 1)
+        schd.pool.clock_expire_tasks()
+        assert a.state(TASK_STATUS_WAITING)
+        assert b.state(TASK_STATUS_WAITING)
+
+        # "a" has expired
+        set_time(a.expire_time + 1)
+        schd.pool.clock_expire_tasks()
+        assert a.state(TASK_STATUS_EXPIRED)
+        assert b.state(TASK_STATUS_WAITING)
+
+        # "b" has expired
+        set_time(b.expire_time + 1)
+        schd.pool.clock_expire_tasks()
+        assert b.state(TASK_STATUS_EXPIRED)
+        assert schd.pool.expiry_timers.get_next_deadline() is None
+        assert not schd.pool.expiry_pending
+
+
+async def test_clock_expire_pending(flow, scheduler, start, set_time):
+    """Tasks which can't expire at their expiry time should expire later.
+
+    Active tasks can not clock-expire.
+    """
+    id_ = flow({
+        'scheduler': {'cycle point format': 'CCYY'},
+        'scheduling': {
+            'initial cycle point': '2000',
+            'special tasks': {'clock-expire': 'a(PT1H)'},
+            'graph': {'R1': 'a'},
+        },
+        'runtime': {'a': {'execution retry delays': 'PT0S'}},
+    })
+    schd: Scheduler = scheduler(id_, run_mode='live')
+    async with start(schd):
+        itask = run_job(schd, '2000/a')
+        set_time(itask.expire_time + 1)
+        schd.pool.clock_expire_tasks()
+        assert itask.state(TASK_STATUS_RUNNING)
+        assert itask.identity in schd.pool.expiry_pending
+
+        # the job fails, the task will retry, it can expire now
+        schd.task_job_mgr._set_retry_timers(itask, itask.tdef.rtconfig)
+        schd.task_events_mgr.process_message(itask, logging.INFO, 'failed')
+        assert itask.state(TASK_STATUS_WAITING)
+        schd.pool.clock_expire_tasks()
+        assert itask.state(TASK_STATUS_EXPIRED)
+        assert not schd.pool.expiry_pending
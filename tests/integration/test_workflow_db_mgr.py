@@ -20,6 +20,7 @@ import sqlite3
 from typing import TYPE_CHECKING
 
 from cylc.flow import commands
+from cylc.flow.cycling.loader import get_point
 
 if TYPE_CHECKING:
     from cylc.flow.scheduler import Scheduler
@@ -208,3 +209,195 @@ async def test_time_zone_writing(
     assert (
         abs(time_submit - now) < timedelta(seconds=10)
     ), f"{time_submit} ~= {now}"
+
+
+async def test_put_task_pool_incremental(flow, scheduler, start, db_select):
+    """Only changed task pool rows should be written to the DB."""
+    id_ = flow({
+        'scheduling': {
+            'graph': {'R1': 'a & b => c'},
+        },
+    })
+    schd: 'Scheduler' = scheduler(id_)
+    async with start(schd):
+        db_mgr = schd.workflow_db_mgr
+
+        def put_task_pool():
+            """Queue the task pool rows, return the number queued."""
+            db_mgr.put_task_pool(schd.pool)
+            n_rows = sum(
+                len(db_mgr.db_inserts_map[table_name])
+                + len(db_mgr.db_deletes_map[table_name])
+                for table_name in db_mgr.TASK_POOL_TABLES
+            )
+            schd.process_workflow_db_queue()
+            return n_rows
+
+        # the first write replaces the task pool tables
+        assert put_task_pool() == 5  # 3 * delete-all + 2 * task_pool rows
+        # nothing has changed since so nothing needs to be written
+        assert put_task_pool() == 0
+        assert sorted(db_select(schd, False, 'task_pool', 'name')) == [
+            ('a',), ('b',)
+        ]
+
+        # a change to one task should only rewrite that task's row
+        itask = schd.pool.get_task(schd.config.initial_point, 'a')
+        itask.state_reset(is_held=True)
+        assert put_task_pool() == 1
+        assert db_select(
+            schd, False, 'task_pool', 'is_held', name='a'
+        ) == [(1,)]
+
+        # completing 1/a should spawn 1/c (with a satisfied prerequisite)
+        # and remove 1/a
+        schd.pool.task_events_mgr.process_message(itask, 1, 'succeeded')
+        put_task_pool()
+        assert sorted(db_select(schd, False, 'task_pool', 'name')) == [
+            ('b',), ('c',)
+        ]
+        assert sorted(
+            db_select(
+                schd,
+                False,
+                'task_prerequisites',
+                'name',
+                'prereq_name',
+                'satisfied',
+            )
+        ) == [
+            ('c', 'a', 'satisfied naturally'),
+            ('c', 'b', '0'),
+        ]
+        assert put_task_pool() == 0
+
+
+async def test_task_history_cache(flow, scheduler, start, monkeypatch):
+    """Task history should be loaded from the DB by cycle and cached."""
+    id_ = flow({
+        'scheduling': {
+            'cycling mode': 'integer',
+            'graph': {'P1': 'a => b'},
+        },
+    })
+    schd: 'Scheduler' = scheduler(id_)
+    async with start(schd):
+        db_mgr = schd.workflow_db_mgr
+        db_mgr.process_queued_ops()
+
+        # record the DB queries made
+        queries = []
+        for method in (
+            'select_prev_instances',
+            'select_prev_instances_for_cycle',
+            'select_task_outputs',
+            'select_task_outputs_for_cycle',
+        ):
+            def _select(*args, _method=method, _orig=getattr(
+                db_mgr.pri_dao, method
+            )):
+                queries.append(_method)
+                return _orig(*args)
+            monkeypatch.setattr(db_mgr.pri_dao, method, _select)
+
+        # the first lookup in a cycle loads the cycle
+        assert db_mgr.select_prev_instances('a', '10') == []
+        assert queries == [
+            'select_prev_instances_for_cycle',
+            'select_task_outputs_for_cycle',
+        ]
+        # subsequent lookups in the cycle are cached
+        queries.clear()
+        assert db_mgr.select_prev_instances('b', '10') == []
+        assert db_mgr.select_task_outputs('b', '10') == {}
+        assert queries == []
+
+        # tasks written to the DB since are re-loaded (once)
+        for _ in range(2):
+            assert db_mgr.select_prev_instances('a', '1') == [
+                (0, False, {1}, 'waiting')
+            ]
+            assert db_mgr.select_task_outputs('a', '1') == {'{}': {1}}
+        assert queries == ['select_prev_instances', 'select_task_outputs']
+
+        # tasks with pending writes are read through to the DB
+        queries.clear()
+        itask = schd.pool.get_task(schd.config.initial_point, 'a')
+        itask.state_reset('succeeded')
+        db_mgr.put_update_task_state(itask)
+        assert db_mgr.select_prev_instances('a', '1') == [
+            (0, False, {1}, 'waiting')
+        ]
+        assert queries == ['select_prev_instances']
+        queries.clear()
+        db_mgr.process_queued_ops()
+        assert db_mgr.select_prev_instances('a', '1') == [
+            (0, False, {1}, 'succeeded')
+        ]
+        assert queries == ['select_prev_instances', 'select_task_outputs']
+
+        # cycles are evicted once they fall behind the runahead base point
+        assert '1' in db_mgr.task_history.cycles
+        db_mgr.task_history.evict(get_point('10'))
+        assert list(db_mgr.task_history.cycles) == ['10']
+
+
+async def test_persistent_connections(
+    mock_glbl_cfg, one_conf, flow, scheduler, start
+):
+    """The workflow should run with persistent DB connections.
+
+    The public DB should be correctly recovered from the private DB.
+    """
+    mock_glbl_cfg(
+        'cylc.flow.scheduler.glbl_cfg',
+        '''
+            [scheduler]
+                [[database]]
+                    persistent connections = True
+        ''',
+    )
+    id_ = flow(one_conf)
+    schd: 'Scheduler' = scheduler(id_)
+    async with start(schd):
+        db_mgr = schd.workflow_db_mgr
+        assert db_mgr.pri_dao.persistent
+        schd.workflow_db_mgr.put_task_pool(schd.pool)
+        schd.process_workflow_db_queue()
+        assert db_mgr.pri_dao.conn is not None
+
+        # force recovery of the public DB from the private one
+        db_mgr.pub_dao.n_tries = db_mgr.pub_dao.MAX_TRIES
+        db_mgr.recover_pub_from_pri()
+        with sqlite3.connect(db_mgr.pub_path) as conn:
+            assert list(conn.execute('SELECT name FROM task_pool')) == [
+                ('one',)
+            ]
+
+
+async def test_asynchronous_public_database(
+    mock_glbl_cfg, one_conf, flow, scheduler, start
+):
+    """The public DB should be written to in the background."""
+    mock_glbl_cfg(
+        'cylc.flow.scheduler.glbl_cfg',
+        '''
+            [scheduler]
+                [[database]]
+                    asynchronous public database = True
+        ''',
+    )
+    id_ = flow(one_conf)
+    schd: 'Scheduler' = scheduler(id_)
+    async with start(schd):
+        db_mgr = schd.workflow_db_mgr
+        assert db_mgr.pub_writer is not None
+        schd.workflow_db_mgr.put_task_pool(schd.pool)
+        schd.process_workflow_db_queue()
+
+    # the writer should have been flushed on shutdown
+    assert db_mgr.pub_writer is None
+    with sqlite3.connect(db_mgr.pub_path) as conn:
+        assert list(conn.execute('SELECT name FROM task_pool')) == [
+            ('one',)
+        ]
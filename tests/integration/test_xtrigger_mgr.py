@@ -179,15 +179,14 @@ async def test_1_xtrigger_2_tasks_async(
 
         satisfy_xtrigger_functions(schd)  # mock results
         assert "xtrigger succeeded" in caplog.text
+        # the callback satisfies both waiting tasks
+        assert "[1/foo:waiting] satisfying xtrigger" in caplog.text
+        assert "[1/bar:waiting] satisfying xtrigger" in caplog.text
         caplog.clear()
 
-        schd.xtrigger_mgr.call_xtriggers_async(foo)  # process callbacks
-        assert "satisfying xtrigger" in caplog.text
-        caplog.clear()
-
-        schd.xtrigger_mgr.call_xtriggers_async(bar)  # process callbacks
-        assert "satisfying xtrigger" in caplog.text
-        caplog.clear()
+        schd.xtrigger_mgr.call_xtriggers_async(foo)
+        schd.xtrigger_mgr.call_xtriggers_async(bar)
+        assert "xtrigger" not in caplog.text
 
         # It should now be satisfied.
         assert foo.state.xtriggers == {'echo': True}
@@ -235,13 +234,9 @@ async def test_1_xtrigger_2_tasks_later(
         assert "Commencing xtrigger" in caplog.text
         caplog.clear()
 
-        # satisfy it
+        # satisfy it (the callback updates foo)
         satisfy_xtrigger_functions(schd)  # mock results
         assert "xtrigger succeeded" in caplog.text
-        caplog.clear()
-
-        # process callback
-        schd.xtrigger_mgr.call_xtriggers_async(foo)
         assert "satisfying xtrigger" in caplog.text
         caplog.clear()
 
@@ -249,7 +244,7 @@ async def test_1_xtrigger_2_tasks_later(
         assert foo.state.xtriggers == {'echo': True}
 
         # this will delete the xtrigger - nothing else depends on it
-        schd.xtrigger_mgr.housekeep([foo])
+        schd.xtrigger_mgr.housekeep()
 
         # Spawn bar and remove foo
         schd.pool.spawn_on_output(foo, TASK_OUTPUT_SUCCEEDED)
@@ -261,13 +256,9 @@ async def test_1_xtrigger_2_tasks_later(
         assert "Commencing xtrigger" in caplog.text
         caplog.clear()
 
-        # satisfy it
+        # satisfy it (the callback updates bar)
         satisfy_xtrigger_functions(schd)  # mock results
         assert "xtrigger succeeded" in caplog.text
-        caplog.clear()
-
-        # process callback
-        schd.xtrigger_mgr.call_xtriggers_async(bar)
         assert "satisfying xtrigger" in caplog.text
         caplog.clear()
 
@@ -278,6 +269,141 @@ async def test_1_xtrigger_2_tasks_later(
         assert spy.call_count == 2
 
 
+async def test_xtrigger_index(flow, start, scheduler):
+    """It indexes waiting tasks by xtrigger signature.
+
+    Results are forgotten when the last task which uses them is removed.
+    """
+    id_ = flow({
+        'scheduling': {
+            'cycling mode': 'integer',
+            'final cycle point': '2',
+            'runahead limit': 'P0',
+            'xtriggers': {
+                'echo': 'echo("whatever", succeed=False)',
+            },
+            'graph': {
+                'R1': '''
+                    @echo => foo & bar
+                ''',
+                'P1': '''
+                    @echo => baz
+                ''',
+            },
+        },
+    })
+    schd = scheduler(id_)
+    async with start(schd):
+        xtrigger_mgr = schd.xtrigger_mgr
+        sig = 'echo(whatever, succeed=False)'
+        assert set(xtrigger_mgr.xtrig_tasks[sig]) == {
+            '1/foo', '1/bar', '1/baz', '2/baz'
+        }
+
+        # the callback satisfies the waiting tasks, not runahead ones
+        assert schd.pool._get_task_by_id('2/baz').state.is_runahead
+        xtrigger_mgr.call_xtriggers_async(schd.pool._get_task_by_id('1/foo'))
+        satisfy_xtrigger_functions(schd)
+        assert set(xtrigger_mgr.xtrig_tasks[sig]) == {'2/baz'}
+        assert xtrigger_mgr.sat_xtrig == {sig: {}}
+
+        # the result is kept while needed by any task
+        schd.pool.remove(schd.pool._get_task_by_id('1/foo'))
+        assert sig in xtrigger_mgr.sat_xtrig
+
+        # and forgotten when the last task is removed
+        for itask in schd.pool.get_tasks():
+            schd.pool.remove(itask)
+        assert not xtrigger_mgr.xtrig_tasks
+        assert not xtrigger_mgr.sat_xtrig
+        assert not xtrigger_mgr.task_xtrig_ctxs
+
+
+async def test_xtrigger_checks(flow, start, scheduler, monkeypatch):
+    """Tasks should only be checked when changed or their xtriggers are due.
+
+    Unchanged waiting tasks should not be rescanned by each main loop
+    iteration.
+    """
+    id_ = flow({
+        'scheduling': {
+            'xtriggers': {'x': 'xrandom(0):PT1M'},
+            'graph': {'R1': '@x => foo'},
+        },
+    })
+    schd: Scheduler = scheduler(id_)
+    async with start(schd):
+        xtrigger_mgr = schd.xtrigger_mgr
+        foo = schd.pool.get_tasks()[0]
+        (sig,) = xtrigger_mgr.xtrig_tasks
+
+        # new tasks are checked
+        assert schd.pool.get_tasks_to_check() == [foo]
+        xtrigger_mgr.call_xtriggers_async(foo)
+        assert xtrigger_mgr.active == [sig]
+        assert not schd.pool.get_tasks_to_check()
+
+        # the xtrigger is not satisfied, check again when it is next due
+        satisfy_xtrigger_functions(schd, stdout='[false, {}]')
+        next_call = xtrigger_mgr.t_next_call[sig]
+        assert xtrigger_mgr.call_timers.get_next_deadline() == next_call
+        xtrigger_mgr.check_due_xtriggers()
+        assert not schd.pool.get_tasks_to_check()
+        monkeypatch.setattr(
+            'cylc.flow.xtrigger_mgr.time', lambda: next_call + 1
+        )
+        xtrigger_mgr.check_due_xtriggers()
+        assert schd.pool.get_tasks_to_check() == [foo]
+        xtrigger_mgr.call_xtriggers_async(foo)
+        assert xtrigger_mgr.active == [sig]
+
+        # the xtrigger is satisfied, check the task
+        satisfy_xtrigger_functions(schd)
+        assert foo.state.xtriggers == {'x': True}
+        assert schd.pool.get_tasks_to_check() == [foo]
+
+        # state changes are checked too (if the task is waiting)
+        schd.pool.queue_task(foo)
+        assert not schd.pool.get_tasks_to_check()
+        schd.pool.unqueue_task(foo)
+        assert schd.pool.get_tasks_to_check() == [foo]
+
+
+async def test_clock_trigger_checks(flow, start, scheduler, monkeypatch):
+    """Tasks should be checked when their clock triggers are due."""
+    id_ = flow({
+        'scheduler': {'cycle point format': 'CCYY'},
+        'scheduling': {
+            'initial cycle point': '2000',
+            'graph': {'R1': '@wall_clock => foo'},
+        },
+    })
+    schd: Scheduler = scheduler(id_)
+    async with start(schd):
+        xtrigger_mgr = schd.xtrigger_mgr
+        foo = schd.pool.get_tasks()[0]
+        trigger_time = foo.get_clock_trigger_time(foo.point, 'PT0S')
+        monkeypatch.setattr(
+            'cylc.flow.xtriggers.wall_clock.time', lambda: trigger_time - 1
+        )
+        schd.pool.get_tasks_to_check()
+        xtrigger_mgr.call_xtriggers_async(foo)
+        assert foo.state.xtriggers == {'wall_clock': False}
+        assert xtrigger_mgr.call_timers.get_next_deadline() == trigger_time
+
+        # the task is checked when the clock trigger is due
+        monkeypatch.setattr(
+            'cylc.flow.xtrigger_mgr.time', lambda: trigger_time - 1
+        )
+        xtrigger_mgr.check_due_xtriggers()
+        assert not schd.pool.get_tasks_to_check()
+        monkeypatch.setattr(
+            'cylc.flow.xtrigger_mgr.time', lambda: trigger_time + 1
+        )
+        xtrigger_mgr.check_due_xtriggers()
+        assert schd.pool.get_tasks_to_check() == [foo]
+
+
 async def test_xtriggers_restart(flow, start, scheduler, db_select):
     """It should write satisfied xtriggers to the DB and load on restart.
 
@@ -310,13 +436,7 @@ async def test_xtriggers_restart(flow, start, scheduler, db_select):
         # and x100 should succeed
         assert len(schd.proc_pool.queuings) + len(schd.proc_pool.runnings) == 2
         # wait for it to return
-        for _ in range(50):
-            await asyncio.sleep(0.1)
-            schd.proc_pool.process()
-            if len(schd.proc_pool.runnings) == 0:
-                break
-        else:
-            raise Exception('Process pool did not clear')
+        await wait_for_proc_pool(schd)
 
     # the satisfied x100 should be written to the DB
     db_xtriggers = db_select(schd, True, 'xtriggers')
@@ -466,19 +586,52 @@ async def test_error_in_xtrigger(flow, start, scheduler):
     async with start(schd) as log:
         foo = schd.pool.get_tasks()[0]
         schd.xtrigger_mgr.call_xtriggers_async(foo)
-        for _ in range(50):
-            await asyncio.sleep(0.1)
-            schd.proc_pool.process()
-            if len(schd.proc_pool.runnings) == 0:
-                break
-        else:
-            raise Exception('Process pool did not clear')
+        await wait_for_proc_pool(schd)
 
         error = log.messages[-1].split('\n')
         assert error[-2] == 'Exception: This Xtrigger is broken'
         assert error[0] == 'ERROR in xtrigger mytrig()'
 
 
+async def test_xtrigger_pool(flow, start, scheduler, mock_glbl_cfg):
+    """Xtriggers can be run by a pool of worker processes."""
+    mock_glbl_cfg(
+        'cylc.flow.subprocpool.glbl_cfg',
+        '''
+            [scheduler]
+                xtrigger pool size = 1
+        '''
+    )
+    id_ = flow({
+        'scheduling': {
+            'xtriggers': {
+                'mytrig': 'mytrig(%(point)s)'
+            },
+            'graph': {
+                'R1': '@mytrig => foo'
+            },
+        }
+    })
+
+    # add a custom xtrigger to the workflow
+    run_dir = Path(get_workflow_run_dir(id_))
+    xtrig_dir = run_dir / 'lib/python'
+    xtrig_dir.mkdir(parents=True)
+    (xtrig_dir / 'mytrig.py').write_text(dedent('''
+        async def mytrig(point):
+            return True, {'point': point}
+    '''))
+
+    schd = scheduler(id_)
+    async with start(schd):
+        foo = schd.pool.get_tasks()[0]
+        schd.xtrigger_mgr.call_xtriggers_async(foo)
+        await wait_for_proc_pool(schd)
+
+        assert schd.xtrigger_mgr.sat_xtrig == {'mytrig(1)': {'point': '1'}}
+        assert schd.xtrigger_mgr.active == []
+
+
 async def test_1_seq_clock_trigger_2_tasks(flow, start, scheduler):
     """Test that all tasks dependent on a sequential clock trigger continue to
     spawn after the first cycle.
@@ -679,6 +832,18 @@ async def test_data_store(flow, start, scheduler):
         assert xtriggers[clock1].satisfied is True
 
 
+async def wait_for_proc_pool(schd: Scheduler) -> None:
+    """Process the process pool until all commands have completed.
+
+    The time commands take to start up varies with the load on the system,
+    so allow plenty.
+    """
+    async with asyncio.timeout(60):
+        while schd.proc_pool.is_not_done():
+            await asyncio.sleep(0.1)
+            schd.proc_pool.process()
+
+
 def satisfy_xtrigger_functions(schd, stdout='[true, {}]', ret_code=0):
     """Satisfy and dequeue any xtrigger subprocesses."""
     for item in list(schd.proc_pool.queuings):
@@ -25,6 +25,7 @@ from time import time
 import pytest
 
 from cylc.flow.cycling.integer import IntegerPoint
+from cylc.flow.data_store_mgr import TASK_PROXIES
 from cylc.flow.id import Tokens
 from cylc.flow.tui.updater import (
     Updater,
@@ -234,3 +235,91 @@ async def test_filters(one_conf, flow, scheduler, run, updater):
             #     '1/b',
             #     '1/c',
             # }
+
+
+@pytest.mark.parametrize('clock_offset', [0, -3600, 3600])
+async def test_deltas(
+    one_conf, flow, scheduler, start, updater, monkeypatch, clock_offset
+):
+    """It should keep the workflow up to date using published deltas.
+
+    This should work even if the scheduler's clock differs from Tui's.
+    """
+    monkeypatch.setattr(
+        'cylc.flow.data_store_mgr.time', lambda: time() + clock_offset
+    )
+    schd = scheduler(flow(one_conf))
+
+    async with start(schd):
+        await schd.update_data_structure()
+        updater.subscribe(schd.tokens.id)
+
+        async with asyncio.timeout(10):
+            root_node = await updater._update()
+            replica = updater._replicas[schd.tokens.id]
+            assert replica.data is not None
+            cycle_node = root_node['children'][0]['children'][0]
+            assert cycle_node['children'][0]['data']['state'] == 'waiting'
+
+            # the tree should not be recomputed if nothing has changed
+            workflow_node = root_node['children'][0]
+            root_node = await updater._update()
+            assert root_node['children'][0] is workflow_node
+
+            # change the task state, this should arrive as a delta
+            itask = schd.pool.get_tasks()[0]
+            itask.state_reset('succeeded')
+            schd.data_store_mgr.delta_task_state(itask)
+            await schd.update_data_structure()
+            while True:
+                root_node = await updater._update()
+                cycle_node = root_node['children'][0]['children'][0]
+                if cycle_node['children'][0]['data']['state'] == 'succeeded':
+                    break
+                await asyncio.sleep(0.1)
+
+            # it should re-sync the data if it gets out of sync
+            replica.checksums[TASK_PROXIES] += 1
+            itask.state_reset('running')
+            schd.data_store_mgr.delta_task_state(itask)
+            await schd.update_data_structure()
+            while replica.checksums[TASK_PROXIES] != (
+                schd.data_store_mgr.checksums[TASK_PROXIES]
+            ):
+                await updater._update()
+                await asyncio.sleep(0.1)
+            root_node = await updater._update()
+            cycle_node = root_node['children'][0]['children'][0]
+            assert cycle_node['children'][0]['data']['state'] == 'running'
+
+
+async def test_query_compat(one_conf, flow, scheduler, start, updater):
+    """It should poll older schedulers using GraphQL queries.
+
+    The deltas published by older schedulers have no incremental checksums.
+    """
+    schd = scheduler(flow(one_conf))
+
+    async with start(schd):
+        await schd.update_data_structure()
+        updater.subscribe(schd.tokens.id)
+
+        async with asyncio.timeout(10):
+            # connect to the workflow, then pretend it's an older version
+            await updater._update()
+            replica = updater._replicas[schd.tokens.id]
+            replica.client.scheduler_version = '8.6.0'
+            replica.stop()
+            replica.data = None
+
+            itask = schd.pool.get_tasks()[0]
+            itask.state_reset('succeeded')
+            schd.data_store_mgr.delta_task_state(itask)
+            await schd.update_data_structure()
+            root_node = await updater._update()
+            cycle_node = root_node['children'][0]['children'][0]
+            assert cycle_node['children'][0]['data']['state'] == 'succeeded'
+
+            # the data should not be replicated
+            assert replica.data is None
+            assert replica.subscriber is None
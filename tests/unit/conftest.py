@@ -209,6 +209,7 @@ def xtrigger_mgr() -> XtriggerManager:
     user = "john-foo"
     schd = create_autospec(Scheduler, workflow=workflow_name, owner=user)
     schd.proc_pool = Mock(put_command=lambda *a, **k: True)
+    schd.pool = Mock()
     schd.workflow_db_mgr = Mock(housekeep=lambda *a, **k: True)
     schd.broadcast_mgr = Mock(put_broadcast=lambda *a, **k: True)
     schd.data_store_mgr = DataStoreMgr(schd)
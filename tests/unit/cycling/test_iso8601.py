@@ -19,6 +19,7 @@ from datetime import (
     timezone,
 )
 
+from metomi.isodatetime.data import CALENDAR
 import pytest
 from pytest import param
 
@@ -26,6 +27,7 @@ from cylc.flow.cycling.iso8601 import (
     ISO8601Interval,
     ISO8601Point,
     ISO8601Sequence,
+    WorkflowSpecifics,
     ingest_time,
 )
 from cylc.flow.cycling.loader import ISO8601_CYCLING_TYPE
@@ -952,3 +954,77 @@ def test_validate_fails_comma_sep_offset_list(
     set_cycling_type(ISO8601_CYCLING_TYPE, "Z")
     with pytest.raises(Exception, match=errortext):
         ingest_time(_input)
+
+
+@pytest.fixture
+def calendar_mode():
+    """Set the calendar mode, the original mode is restored afterwards."""
+    orig_mode = CALENDAR.mode
+    yield CALENDAR.set_mode
+    CALENDAR.set_mode(orig_mode)
+
+
+@pytest.mark.parametrize(
+    'mode', ['gregorian', '360_day', '365_day', '366_day']
+)
+@pytest.mark.parametrize('time_zone', ['Z', '+13', '-0330'])
+def test_compact_points(mode, time_zone, calendar_mode, set_cycling_type):
+    """Points in compact format match the results of isodatetime."""
+    calendar_mode(mode)
+    set_cycling_type(ISO8601_CYCLING_TYPE, time_zone)
+    points = [
+        ISO8601Point(value).standardise()
+        for value in (
+            '1999-12-30T23:30',
+            '2000-01-01T00:00',
+            '2000-02-28T12:00',
+            '2100-02-28T06:15',
+            '0800-06-30T18:00',
+        )
+    ]
+    intervals = [
+        ISO8601Interval(value)
+        for value in (
+            'P0Y', 'PT1M', 'PT90M', 'PT6H', '-PT6H', 'P1D', 'P2W', 'P31D',
+            '-P400D',
+            # not in whole minutes or not exact (handled by isodatetime)
+            'PT30S', 'P1M', 'P1Y', 'P1YT6H',
+        )
+    ]
+    for point in points:
+        assert point._get_minutes() is not None
+        for interval in intervals:
+            assert str(point + interval) == ISO8601Point._iso_point_add(
+                point.value, interval.value, CALENDAR.mode
+            )
+            assert str(point - interval) == (
+                ISO8601Point._iso_point_sub_interval(
+                    point.value, interval.value, CALENDAR.mode
+                )
+            )
+        for other in points:
+            assert point._cmp(other) == ISO8601Point._iso_point_cmp(
+                point.value, other.value, CALENDAR.mode
+            )
+            assert str(point - other) == ISO8601Point._iso_point_sub_point(
+                point.value, other.value, CALENDAR.mode
+            )
+
+
+def test_compact_points_fallback(set_cycling_type):
+    """Points not in compact format are handled by isodatetime."""
+    set_cycling_type(ISO8601_CYCLING_TYPE, 'Z')
+    compact = ISO8601Point('20000101T0000Z')
+    other = ISO8601Point('20000101T0030+01')
+    assert compact._get_minutes() is not None
+    assert other._get_minutes() is None
+    assert other < compact
+    assert str(compact - other) == 'PT30M'
+    assert str(other + ISO8601Interval('PT1H')) == '20000101T0030Z'
+
+    # custom dump formats are handled by isodatetime
+    set_cycling_type(ISO8601_CYCLING_TYPE, 'Z', 'CCYY-MM-DDThh:mmZ')
+    assert WorkflowSpecifics.compact_format is None
+    point = ISO8601Point('2000-01-01T00:00Z')
+    assert point._get_minutes() is None
+    assert str(point + ISO8601Interval('PT1H')) == '2000-01-01T01:00Z'
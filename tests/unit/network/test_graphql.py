@@ -25,7 +25,8 @@ from graphql import (
 
 from cylc.flow.data_messages_pb2 import PbTaskProxy, PbPrerequisite
 from cylc.flow.network.graphql import (
-    CylcVisitor, null_setter, strip_null, async_next, NULL_VALUE, grow_tree
+    CylcVisitor, null_setter, strip_null, async_next, NULL_VALUE, grow_tree,
+    ResponseCache
 )
 from cylc.flow.network.schema import schema
 
@@ -242,3 +243,39 @@ async def test_strip_null(pre_result, expected_result):
 def test_grow_tree(expect, tree, path, leaves):
     grow_tree(tree, path, leaves)
     assert tree == expect
+
+
+def test_response_cache():
+    """Test the LRU eviction and invalidation of ResponseCache."""
+    cache = ResponseCache(maxsize=2)
+    key_a = cache.get_key('{ workflows { id } }', None)
+    key_b = cache.get_key('{ workflows { id } }', {'a': 1})
+    key_c = cache.get_key('{ workflows { name } }', None)
+    assert len({key_a, key_b, key_c}) == 3
+    assert cache.get_key('mutation { stop { result } }', None) is None
+    assert cache.get_key(None, None) is None
+
+    assert cache.get(key_a, 1) is None
+    cache.put(key_a, 1, 'a')
+    cache.put(key_b, 1, 'b')
+    assert cache.get(key_a, 1) == 'a'
+    # key_b is the least recently used
+    cache.put(key_c, 1, 'c')
+    assert cache.get(key_b, 1) is None
+    assert cache.get(key_c, 1) == 'c'
+    assert cache.info() == {
+        'hits': 2,
+        'misses': 2,
+        'hit_rate': 0.5,
+        'evictions': 1,
+        'size': 2,
+        'maxsize': 2,
+    }
+
+    # results for an old generation are not cached
+    cache.put(key_b, 0, 'b')
+    assert cache.get(key_b, 1) is None
+
+    # a new generation clears the cache
+    assert cache.get(key_a, 2) is None
+    assert cache.info()['size'] == 0
@@ -30,17 +30,21 @@ from pytest import param
 from cylc.flow.scripts.lint import (
     LINT_SECTION,
     MANUAL_DEPRECATIONS,
+    LintCache,
     check_lowercase_family_names,
+    compile_checks,
     get_cylc_files,
     get_pyproject_toml,
     get_reference,
     get_upgrader_info,
     lint,
+    lint_files,
     _merge_cli_with_tomldata,
     parse_checks,
     validate_toml_items
 )
 from cylc.flow.exceptions import CylcError
+from cylc.flow.scripts import lint as lint_module
 
 STYLE_CHECKS = parse_checks(['style'])
 UPG_CHECKS = parse_checks(['728'])
@@ -722,3 +726,73 @@ def test_noqa():
     )
     assert len(output.messages) == 1
     assert 'flow.cylc:3' in output.messages[0]
+
+
+def test_compile_checks():
+    """The combined pattern matches every line an individual check does."""
+    checks = parse_checks(['728', 'style'])
+    compiled, combined = compile_checks(checks)
+    assert combined
+    for line in TEST_FILE.splitlines() + LINT_TEST_FILE.splitlines():
+        if not combined.search(line):
+            for _, _, check_meta, is_regex in compiled:
+                if is_regex:
+                    assert not check_meta[lint_module.FUNCTION](line)
+
+
+@pytest.fixture
+def lint_workflow(tmp_path, monkeypatch):
+    """A workflow with some lint to find, and an empty lint cache."""
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path / 'cache'))
+    workflow = tmp_path / 'workflow'
+    for name in ('flow.cylc', *(f'sub/inc{ind}.cylc' for ind in range(3))):
+        (workflow / name).parent.mkdir(exist_ok=True, parents=True)
+        (workflow / name).write_text(LINT_TEST_FILE)
+    return workflow
+
+
+def _lint_files(workflow, checks, **kwargs):
+    files = sorted(
+        (file, file.relative_to(workflow))
+        for file in get_cylc_files(workflow)
+    )
+    return list(lint_files(files, checks, (['style'],), **kwargs))
+
+
+def test_lint_files_jobs(lint_workflow):
+    """Results are the same, and in the same order, when run in parallel."""
+    checks = parse_checks(['style'])
+    results = _lint_files(lint_workflow, checks, jobs=1)
+    assert len(results) == 4
+    assert all(messages for _, messages in results)
+    assert _lint_files(lint_workflow, checks, jobs=2) == results
+
+
+def test_lint_files_cache(lint_workflow, monkeypatch):
+    """Unchanged files are not re-linted."""
+    checks = parse_checks(['style'])
+    results = _lint_files(
+        lint_workflow, checks, cache=LintCache(lint_workflow, checks)
+    )
+
+    linted = []
+    monkeypatch.setattr(
+        lint_module,
+        'check_cylc_file',
+        lambda file, *args, **kwargs: linted.append(file),
+    )
+    assert _lint_files(
+        lint_workflow, checks, cache=LintCache(lint_workflow, checks)
+    ) == results
+    assert linted == []
+
+    # changed files are re-linted
+    (lint_workflow / 'flow.cylc').write_text('foo = bar\n')
+    _lint_files(lint_workflow, checks, cache=LintCache(lint_workflow, checks))
+    assert linted == [lint_workflow / 'flow.cylc']
+
+    # everything is re-linted if the rules change
+    linted.clear()
+    checks = parse_checks(['style'], ignores=['S002'])
+    _lint_files(lint_workflow, checks, cache=LintCache(lint_workflow, checks))
+    assert len(linted) == 4
@@ -0,0 +1,56 @@
+# THIS FILE IS PART OF THE CYLC WORKFLOW ENGINE.
+# Copyright (C) NIWA & British Crown (Met Office) & Contributors.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+from threading import Thread
+from time import sleep
+
+import pytest
+
+from cylc.flow.exceptions import InputError
+from cylc.flow.scripts.message import (
+    parse_messages,
+    read_stdin_batches,
+)
+
+
+def test_parse_messages():
+    assert parse_messages(['-', 'a', 'WARNING: b'], None) == [
+        ['INFO', 'a'], ['WARNING', 'b']
+    ]
+    assert parse_messages(['a'], 'CUSTOM') == [['CUSTOM', 'a']]
+    with pytest.raises(InputError):
+        parse_messages(['a b:c'], None)
+
+
+def test_read_stdin_batches(monkeypatch: pytest.MonkeyPatch):
+    """Messages written in quick succession should be sent together."""
+    read_fd, write_fd = os.pipe()
+
+    def _write():
+        os.write(write_fd, b'a\n\nb\nc\n\n')
+        sleep(0.5)
+        os.write(write_fd, 'd\n\n\xe9'.encode())
+        os.close(write_fd)
+
+    with open(read_fd) as stdin:
+        monkeypatch.setattr('sys.stdin', stdin)
+        writer = Thread(target=_write)
+        writer.start()
+        batches = list(read_stdin_batches(0.1))
+        writer.join()
+
+    assert batches == [['a\n', 'b\nc\n'], ['d\n', '\xe9']]
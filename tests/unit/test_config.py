@@ -263,6 +263,63 @@ def test_family_inheritance_and_quotes(
             config.runtime['descendants']['SOMEFAM'])
 
 
+def test_inheritance_shares_sections(
+    mock_glbl_cfg: Callable, tmp_flow_config: Callable
+) -> None:
+    """Test namespaces share the inherited sections they don't override."""
+    mock_glbl_cfg(
+        'cylc.flow.platforms.glbl_cfg',
+        '''
+        [platforms]
+            [[localhost]]
+                hosts = localhost
+        '''
+    )
+    id_ = 'test'
+    file_path = tmp_flow_config(id_, '''
+        [task parameters]
+            m = 1..3
+        [scheduling]
+            [[graph]]
+                R1 = foo<m>
+        [runtime]
+            [[root]]
+                [[[environment]]]
+                    ROOT = root
+            [[FAM]]
+                [[[directives]]]
+                    -l = 1
+                [[[meta]]]
+                    URL = https://example.com/%(task)s
+            [[foo<m>]]
+                inherit = FAM
+            [[foo<m=3>]]
+                [[[directives]]]
+                    -q = x
+    ''')
+    config = WorkflowConfig(
+        id_, file_path, template_vars={}, options=Values()
+    )
+    rtcfg1, rtcfg2, rtcfg3 = (
+        config.cfg['runtime'][f'foo_m{m}'] for m in range(1, 4)
+    )
+    assert rtcfg1 is not rtcfg2
+    assert rtcfg1['directives'] is rtcfg2['directives']
+    assert rtcfg1['environment'] is rtcfg3['environment']
+
+    # overridden sections are not shared
+    assert rtcfg3['directives'] is not rtcfg1['directives']
+    assert dict(rtcfg3['directives']) == {'-l': '1', '-q': 'x'}
+    assert dict(rtcfg1['directives']) == {'-l': '1'}
+
+    # the sections of the parents are unchanged
+    assert dict(config.cfg['runtime']['FAM']['directives']) == {'-l': '1'}
+
+    # per-task values are not shared
+    assert rtcfg1['meta']['URL'] == 'https://example.com/foo_m1'
+    assert rtcfg2['meta']['URL'] == 'https://example.com/foo_m2'
+
+
 @pytest.mark.parametrize(
     ('cycling_type', 'scheduling_cfg', 'expected_icp', 'expected_err'),
     [
@@ -20,10 +20,13 @@ from time import time
 from cylc.flow.data_store_mgr import (
     task_mean_elapsed_time,
     apply_delta,
+    create_indexes,
     WORKFLOW,
     DELTAS_MAP,
     ALL_DELTAS,
-    DATA_TEMPLATE
+    DATA_TEMPLATE,
+    JOBS,
+    TASK_PROXIES,
 )
 
 
@@ -67,3 +70,43 @@ def test_apply_delta():
 
     assert data[WORKFLOW].id == w_id
     assert data[WORKFLOW].pruned is True
+
+
+def test_apply_delta_indexes():
+    """Test the secondary indexes are updated as deltas are applied."""
+    data = deepcopy(DATA_TEMPLATE)
+    indexes = create_indexes()
+    index = indexes[TASK_PROXIES]
+
+    delta = DELTAS_MAP[TASK_PROXIES]()
+    for id_, state in (('1/b', 'waiting'), ('1/a', 'waiting')):
+        tproxy = delta.added.add()
+        tproxy.id = id_
+        tproxy.state = state
+        tproxy.cycle_point = '1'
+        tproxy.name = id_[2:]
+    apply_delta(TASK_PROXIES, delta, data, indexes)
+    assert index.select('state', ['waiting']) == {'1/a', '1/b'}
+    assert index.sort({'1/a', '1/b'}) == ['1/b', '1/a']
+    assert index.select('name', ['a']) == {'1/a'}
+
+    # updated fields move elements between index entries
+    delta = DELTAS_MAP[TASK_PROXIES]()
+    tproxy = delta.updated.add()
+    tproxy.id = '1/a'
+    tproxy.state = 'running'
+    apply_delta(TASK_PROXIES, delta, data, indexes)
+    assert index.select('state', ['waiting']) == {'1/b'}
+    assert index.select('state', ['running']) == {'1/a'}
+    assert index.select('cycle_point', ['1']) == {'1/a', '1/b'}
+
+    # pruned elements are removed from the index
+    delta = DELTAS_MAP[TASK_PROXIES]()
+    delta.pruned.append('1/b')
+    apply_delta(TASK_PROXIES, delta, data, indexes)
+    assert index.select('state', ['waiting']) == set()
+    assert index.select('cycle_point', ['1']) == {'1/a'}
+    assert '1/b' not in index.order
+
+    # other types are unaffected
+    assert not indexes[JOBS].order
@@ -0,0 +1,211 @@
+# THIS FILE IS PART OF THE CYLC WORKFLOW ENGINE.
+# Copyright (C) NIWA & British Crown (Met Office) & Contributors.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import json
+import sys
+from time import (
+    sleep,
+    time,
+)
+
+import pytest
+
+from cylc.flow.job_agent import JobAgentPool
+from cylc.flow.job_runner_mgr import JobRunnerManager
+from cylc.flow.subprocctx import SubProcContext
+from cylc.flow.subprocpool import SubProcPool
+
+
+AGENT = 'from cylc.flow.job_agent import run_agent; run_agent()'
+
+
+@pytest.fixture
+def platform(tmp_path):
+    """A platform whose "ssh command" runs the agent locally."""
+    def _platform(script=f'exec {sys.executable} -c "{AGENT}"'):
+        ssh = tmp_path / 'ssh'
+        ssh.write_text(f'#!/bin/sh\n{script}\n')
+        ssh.chmod(0o755)
+        return {
+            'name': 'myplatform',
+            'install target': 'mytarget',
+            'ssh command': str(ssh),
+            'use login shell': False,
+            'cylc path': None,
+            'ssh forward environment variables': [],
+            'use job agent': True,
+        }
+    return _platform
+
+
+@pytest.fixture
+def job_log_root(tmp_path):
+    return tmp_path / 'log' / 'job'
+
+
+@pytest.fixture
+def pool():
+    pool = JobAgentPool(timeout=60)
+    yield pool
+    pool.terminate()
+
+
+def run(pool, agent, *cmds, stdin_files=None):
+    """Send commands to an agent and wait for the results."""
+    ctxs = []
+    for cmd in cmds:
+        pool.put_command(
+            agent,
+            SubProcContext(cmd[0], cmd, stdin_files=stdin_files),
+        )
+    timeout = time() + 30
+    while len(ctxs) < len(cmds):
+        assert time() < timeout
+        ctxs.extend(ctx for ctx, *_ in pool.process())
+        sleep(0.01)
+    return ctxs
+
+
+def summary(ctx):
+    return [
+        line.split('|')
+        for line in ctx.out.splitlines()
+        if line.startswith(JobRunnerManager.OUT_PREFIX_SUMMARY)
+    ]
+
+
+def test_get(pool, platform):
+    """It starts an agent per platform if configured."""
+    assert pool.get({**platform(), 'use job agent': False}, 'host') is None
+    agent = pool.get(platform(), 'host')
+    assert agent.host == 'host'
+    assert agent.cmd[:2] == [platform()['ssh command'], 'host']
+    assert 'jobs-agent' in agent.cmd
+    assert pool.get(platform(), 'other') is agent
+
+    # it replaces agents on bad hosts
+    assert pool.get(platform(), 'other', {'host'}) is not agent
+    assert pool.get(platform(), 'host').host == 'other'
+
+
+def test_poll_and_submit(pool, platform, job_log_root):
+    """It runs job commands and returns their output."""
+    job_log_dir = job_log_root / '1' / 'a' / '01'
+    job_log_dir.mkdir(parents=True)
+    job_file = job_log_dir.parent / 'job'
+    job_file.write_text(
+        '#!/bin/bash\n'
+        '# Job runner: background\n'
+        '# Job log directory: 1/a/01\n'
+        'exit 0\n'
+        '#EOF: 1/a/01\n'
+    )
+    agent = pool.get(platform(), 'host')
+    ctx, = run(
+        pool,
+        agent,
+        ['jobs-submit', '--remote-mode', '--', str(job_log_root), '1/a/01'],
+        stdin_files=[str(job_file)],
+    )
+    assert ctx.ret_code == 0, ctx.err
+    assert ctx.host == 'host'
+    assert ctx.cmd[:2] == [platform()['ssh command'], 'host']
+    (_, _, ret_code, job_id), = summary(ctx)
+    assert ret_code == '0'
+    assert (job_log_dir / 'job').read_text() == job_file.read_text()
+
+    (job_log_dir / 'job.status').write_text(
+        'CYLC_JOB_RUNNER_NAME=background\n'
+        f'CYLC_JOB_ID={job_id}\n'
+        'CYLC_JOB_EXIT=SUCCEEDED\n'
+    )
+    # several requests are queued by the agent
+    ctxs = run(
+        pool,
+        agent,
+        ['jobs-poll', '--', str(job_log_root), '1/a/01'],
+        ['jobs-poll', '--', str(job_log_root), '1/a/01', '1/b/01'],
+        ['jobs-kill', '--', str(job_log_root), '1/a/01'],
+        ['jobs-poll'],
+    )
+    assert [ctx.ret_code for ctx in ctxs] == [0, 0, 0, 2]
+    (_, _, poll), = summary(ctxs[0])
+    assert json.loads(poll) == {
+        'job_runner_name': 'background',
+        'job_id': job_id,
+        'run_status': 0,
+    }
+    assert [line[1] for line in summary(ctxs[1])] == ['1/a/01', '1/b/01']
+    (_, _, ret_code), = summary(ctxs[2])
+    assert ret_code == '1'
+    assert 'Wrong number of arguments' in ctxs[3].err
+    assert pool.get(platform(), 'host') is agent
+    assert not pool.is_not_done()
+
+
+def test_agent_exit(pool, platform):
+    """It fails the pending requests if the agent exits."""
+    agent = pool.get(platform('echo "connection closed" >&2; exit 255'), 'h')
+    ctx, = run(pool, agent, ['jobs-poll', '--', 'x', '1/a/01'])
+    assert ctx.ret_code == 255
+    assert 'connection closed' in ctx.err
+    assert not pool.agents
+
+
+def test_timeout(pool, platform):
+    """It kills agents which don't respond in time."""
+    pool.timeout = 0
+    agent = pool.get(platform('sleep 10'), 'host')
+    ctx, = run(pool, agent, ['jobs-poll', '--', 'x', '1/a/01'])
+    assert ctx.ret_code == 1
+    assert 'killed on timeout' in ctx.err
+    assert not pool.agents
+
+
+def test_subprocpool(platform, job_log_root):
+    """The SubProcPool sends commands to agents and runs the callbacks."""
+    proc_pool = SubProcPool()
+    results = []
+    agent = proc_pool.job_agents.get(platform(), 'host')
+    for _ in range(2):
+        proc_pool.put_command(
+            SubProcContext(
+                'jobs-poll', ['jobs-poll', '--', str(job_log_root), '1/a/01']
+            ),
+            callback=lambda ctx, arg: results.append((ctx.ret_code, arg)),
+            callback_args=['foo'],
+            agent=agent,
+        )
+    assert proc_pool.is_not_done()
+    timeout = time() + 30
+    while proc_pool.is_not_done():
+        assert time() < timeout
+        proc_pool.process()
+        sleep(0.01)
+    assert results == [(0, 'foo'), (0, 'foo')]
+
+    # the host is unreachable
+    proc_pool.put_command(
+        SubProcContext('jobs-poll', ['jobs-poll', '--', 'x', '1/a/01']),
+        callback=lambda ctx, arg: results.append((ctx.ret_code, arg)),
+        callback_args=['bar'],
+        agent=agent,
+    )
+    proc_pool._close_bad_host(SubProcContext('x', [], host='host'), {'host'})
+    assert not proc_pool.job_agents.agents
+    proc_pool.process()
+    assert results[-1] == (255, 'bar')
+    proc_pool.terminate()
@@ -142,6 +142,38 @@ def test_operational_error(tmp_path, caplog):
         assert 'SQLite error name: Not available' in message
 
 
+def test_persistent_connection(tmp_path: Path):
+    """Persistent connections should be reused and use WAL mode."""
+    db_file = tmp_path / 'db'
+    with CylcWorkflowDAO(db_file, create_tables=True, persistent=True) as dao:
+        conn = dao.connect()
+        assert list(conn.execute('PRAGMA journal_mode')) == [('wal',)]
+        for value in ('a', 'b'):
+            dao.add_insert_item(
+                CylcWorkflowDAO.TABLE_WORKFLOW_PARAMS, [value, value]
+            )
+            dao.execute_queued_items()
+            # the connection should not have been closed
+            assert dao.conn is conn
+
+        # the changes should be visible to other connections
+        with CylcWorkflowDAO(db_file) as other_dao:
+            assert sorted(other_dao.select_workflow_params()) == [
+                ('a', 'a'), ('b', 'b')
+            ]
+
+
+def test_persistent_connection_file_removed(tmp_path: Path):
+    """Persistent connections should notice if the DB file is removed."""
+    db_file = tmp_path / 'db'
+    with CylcWorkflowDAO(db_file, create_tables=True, persistent=True) as dao:
+        dao.connect()
+        db_file.unlink()
+        dao.add_insert_item(CylcWorkflowDAO.TABLE_WORKFLOW_PARAMS, ['a'])
+        with pytest.raises(sqlite3.OperationalError):
+            dao.execute_queued_items()
+
+
 def test_table_creation(tmp_path: Path):
     """Test tables are NOT created by default."""
     db_file = tmp_path / 'db'
@@ -0,0 +1,194 @@
+# THIS FILE IS PART OF THE CYLC WORKFLOW ENGINE.
+# Copyright (C) NIWA & British Crown (Met Office) & Contributors.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+from pathlib import Path
+import shlex
+
+import pytest
+
+from cylc.flow.remote import (
+    construct_rsync_over_ssh_cmd,
+    construct_ssh_cmd,
+)
+from cylc.flow.ssh_pool import SSHConnectionPool
+
+
+@pytest.fixture
+def pool():
+    pool = SSHConnectionPool()
+    yield pool
+    pool.close()
+
+
+@pytest.fixture
+def fake_ssh(tmp_path):
+    """Return a platform whose "ssh command" logs its args and exits."""
+    log = tmp_path / 'ssh.log'
+
+    def _fake_ssh(ret_code=0, name='myplatform', sleep=0):
+        script = tmp_path / f'ssh-{ret_code}-{sleep}'
+        script.write_text(
+            '#!/bin/sh\n'
+            f'echo "$@" >> {log}\n'
+            f'sleep {sleep}\n'
+            f'exit {ret_code}\n'
+        )
+        script.chmod(0o755)
+        return {
+            'name': name,
+            'ssh command': f'{script} -oBatchMode=yes',
+            'share ssh connections': True,
+        }, log
+
+    return _fake_ssh
+
+
+def wait(pool):
+    for proc, *_ in pool._procs:
+        proc.wait()
+    pool.check()
+
+
+def test_get_ssh_opts(pool):
+    """It returns the same options for the same platform and host."""
+    platform = {
+        'name': 'a',
+        'ssh command': 'ssh',
+        'share ssh connections': True,
+    }
+    opts = pool.get_ssh_opts(platform, 'host1')
+    path = Path(pool.connections[('a', 'host1')].path)
+    assert opts == [
+        '-oControlMaster=auto',
+        f'-oControlPath={path}',
+        '-oControlPersist=600',
+    ]
+    assert path.parent == Path(pool.socket_dir)
+    assert oct(path.parent.stat().st_mode & 0o777) == oct(0o700)
+    assert pool.get_ssh_opts(platform, 'host1') == opts
+
+    # different hosts and platforms use different connections
+    assert pool.get_ssh_opts(platform, 'host2') != opts
+    assert pool.get_ssh_opts({**platform, 'name': 'b'}, 'host1') != opts
+    assert len(pool.connections) == 3
+
+    # nothing to do for platforms which don't share connections
+    assert pool.get_ssh_opts(
+        {**platform, 'share ssh connections': False}, 'host1'
+    ) == []
+    assert pool.get_ssh_opts({'name': 'd', 'ssh command': 'ssh'}, 'h') == []
+
+
+def test_construct_cmds(pool, monkeypatch):
+    """It adds the options to SSH and rsync commands."""
+    for env_var in os.environ:
+        if env_var.startswith('CYLC'):
+            monkeypatch.delenv(env_var)
+    platform = {
+        'name': 'a',
+        'ssh command': 'ssh -oBatchMode=yes',
+        'rsync command': 'rsync',
+        'share ssh connections': True,
+        'use login shell': False,
+        'cylc path': None,
+        'ssh forward environment variables': [],
+        'hosts': ['host1'],
+        'selection': {'method': 'definition order'},
+    }
+    opts = pool.get_ssh_opts(platform, 'host1')
+
+    cmd = construct_ssh_cmd(
+        ['play'], platform, 'host1', ssh_connections=pool
+    )
+    assert cmd[:5] == ['ssh', '-oBatchMode=yes', *opts]
+    assert cmd[5] == 'host1'
+    assert construct_ssh_cmd(['play'], platform, 'host1')[:3] == [
+        'ssh', '-oBatchMode=yes', 'host1'
+    ]
+
+    cmd, host = construct_rsync_over_ssh_cmd(
+        '/foo', '/bar', platform, ssh_connections=pool
+    )
+    rsh = next(arg for arg in cmd if arg.startswith('--rsh='))
+    assert shlex.split(rsh[len('--rsh='):]) == [
+        'ssh', '-oBatchMode=yes', *opts
+    ]
+
+
+def test_check(pool, fake_ssh):
+    """It forgets connections which are no longer running."""
+    running, log = fake_ssh(0, 'running')
+    exited, _ = fake_ssh(255, 'exited')
+    for platform in (running, exited):
+        pool.get_ssh_opts(platform, 'host')
+        Path(pool.connections[(platform['name'], 'host')].path).touch()
+    # no connection yet
+    pool.get_ssh_opts({**running, 'name': 'unused'}, 'host')
+
+    # not due
+    pool.check()
+    assert not pool._procs
+
+    pool.next_check = 0
+    pool.check()
+    assert len(pool._procs) == 2
+    wait(pool)
+    assert not pool._procs
+    assert set(pool.connections) == {('running', 'host'), ('unused', 'host')}
+    assert all(
+        line.endswith('-O check host')
+        for line in log.read_text().splitlines()
+    )
+
+
+def test_check_timeout(pool, fake_ssh, monkeypatch, caplog):
+    """It abandons connections which don't respond."""
+    platform, _ = fake_ssh(sleep=10)
+    pool.get_ssh_opts(platform, 'host')
+    path = Path(pool.connections[('myplatform', 'host')].path)
+    path.touch()
+    monkeypatch.setattr('cylc.flow.ssh_pool.CONTROL_TIMEOUT', 0)
+    pool.next_check = 0
+    pool.check()
+    pool.check()
+    assert not pool._procs
+    assert not pool.connections
+    assert not path.exists()
+    assert 'not responding' in caplog.text
+
+
+def test_close(pool, fake_ssh):
+    """It closes the connections to a host or all hosts."""
+    platform, log = fake_ssh()
+    for host in ('host1', 'host2', 'host3'):
+        pool.get_ssh_opts(platform, host)
+        Path(pool.connections[('myplatform', host)].path).touch()
+    pool.get_ssh_opts(platform, 'host4')
+
+    pool.close('host1')
+    wait(pool)
+    assert log.read_text().splitlines()[-1].endswith('-O exit host1')
+    assert len(pool.connections) == 3
+
+    socket_dir = pool.socket_dir
+    pool.close()
+    assert not pool._procs
+    assert not pool.connections
+    assert sorted(
+        line.rsplit(' ', 1)[-1] for line in log.read_text().splitlines()
+    ) == ['host1', 'host2', 'host3']
+    assert not Path(socket_dir).exists()
@@ -14,6 +14,8 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+import asyncio
+import os
 from pathlib import Path
 from types import SimpleNamespace
 from tempfile import (
@@ -29,10 +31,15 @@ from cylc.flow import LOG
 from cylc.flow.id import Tokens
 from cylc.flow.cycling.iso8601 import ISO8601Point
 from cylc.flow.task_events_mgr import TaskJobLogsRetrieveContext
-from cylc.flow.subprocctx import SubProcContext
+from cylc.flow.subprocctx import (
+    SubFuncContext,
+    SubProcContext,
+)
 from cylc.flow.subprocpool import (
+    FunctionPool,
     SubProcPool,
     _XTRIG_FUNC_CACHE,
+    call_function,
     get_xtrig_func,
 )
 from cylc.flow.task_outputs import (
@@ -43,6 +50,7 @@ from cylc.flow.task_outputs import (
     TASK_OUTPUT_EXPIRED,
 )
 from cylc.flow.task_proxy import TaskProxy
+from cylc.flow.wakeup import Wakeup
 
 
 def test_get_temporary_file():
@@ -230,6 +238,201 @@ def test_xfunction_attribute_error():
             get_xtrig_func(f_name, f_name, temp_dir)
 
 
+@pytest.fixture(params=['events', 'polled'])
+def proc_pool(request, monkeypatch):
+    """A SubProcPool, with and without pidfd support (event driven)."""
+    if request.param == 'polled':
+        monkeypatch.delattr(os, 'pidfd_open', raising=False)
+    elif not hasattr(os, 'pidfd_open'):
+        pytest.skip('pidfd not supported on this platform')
+    pool = SubProcPool(wakeup=Wakeup())
+    yield pool
+    pool.terminate()
+
+
+async def _wait_for_pool(proc_pool):
+    """Process the pool until all commands have completed."""
+    proc_pool.wakeup.bind()
+    async with asyncio.timeout(5):
+        while True:
+            proc_pool.process()
+            if not proc_pool.is_not_done():
+                break
+            await proc_pool.wakeup.wait(0.1)
+
+
+async def _wait_for_workers(proc_pool):
+    """Process the pool until all function pool workers have started.
+
+    Worker start-up time varies with the load on the system.
+    """
+    proc_pool.wakeup.bind()
+    async with asyncio.timeout(60):
+        while True:
+            proc_pool.process()
+            if not proc_pool.func_pool.starting:
+                break
+            await proc_pool.wakeup.wait(0.1)
+
+
+async def test_process(proc_pool):
+    """It captures command output and calls back on exit."""
+    done = []
+    ctx = SubProcContext(
+        'hello', ['bash', '-c', 'echo hello; echo world >&2; exit 3']
+    )
+    proc_pool.put_command(ctx, callback=done.append)
+    proc_pool.process()
+    assert len(proc_pool.runnings) == 1
+    assert proc_pool.needs_polling() is (not proc_pool.pidfds)
+    await _wait_for_pool(proc_pool)
+    assert done == [ctx]
+    assert (ctx.out, ctx.err, ctx.ret_code) == ('hello\n', 'world\n', 3)
+    assert not proc_pool.pidfds
+    assert not proc_pool.polled
+
+
+async def test_process_timeout(proc_pool):
+    """It kills commands which exceed the process pool timeout."""
+    proc_pool.proc_pool_timeout = 0.2
+    ctx = SubProcContext('sleepy', ['sleep', '10'])
+    proc_pool.put_command(ctx)
+    proc_pool.process()
+    if proc_pool.pidfds:
+        assert proc_pool.get_next_timeout() == ctx.timeout
+    await _wait_for_pool(proc_pool)
+    assert 'killed on timeout (0.2)' in ctx.err
+    assert proc_pool.get_next_timeout() is None
+
+
+async def test_process_wakeup(proc_pool):
+    """It sets the wake-up signal when event driven commands have events."""
+    if not hasattr(os, 'pidfd_open'):
+        pytest.skip('commands are polled')
+    proc_pool.wakeup.bind()
+    proc_pool.put_command(SubProcContext('truth', ['true']))
+    proc_pool.process()
+    # the pool is woken by output/exit rather than waiting for the timeout
+    for _ in range(5):
+        assert await proc_pool.wakeup.wait(5)
+        proc_pool.process()
+        if not proc_pool.is_not_done():
+            break
+    else:
+        raise Exception('Process pool did not clear')
+
+
+@pytest.fixture
+def xtrig_src_dir(tmp_path):
+    """A source dir containing the local xtrigger module "xtrig"."""
+    python_dir = tmp_path / 'lib' / 'python'
+    python_dir.mkdir(parents=True)
+    (python_dir / 'xtrig.py').write_text(
+        'import asyncio\n'
+        'import time\n'
+        'def echo(x):\n'
+        '    print("echoing")\n'
+        '    return True, {"x": x}\n'
+        'async def aecho(x):\n'
+        '    await asyncio.sleep(0)\n'
+        '    return True, {"x": x}\n'
+        'def fail():\n'
+        '    raise ValueError("failure")\n'
+        'def sleep(secs):\n'
+        '    time.sleep(secs)\n'
+        '    return True, {}\n'
+    )
+    return str(tmp_path)
+
+
+def test_call_function(xtrig_src_dir):
+    """It captures results, output and errors of (async) functions."""
+    assert call_function('xtrig', 'echo', [1], {}, xtrig_src_dir) == (
+        0, '[true, {"x": 1}]', 'echoing\n'
+    )
+    assert call_function('xtrig', 'aecho', [], {'x': 2}, xtrig_src_dir) == (
+        0, '[true, {"x": 2}]', ''
+    )
+    ret_code, out, err = call_function('xtrig', 'fail', [], {}, xtrig_src_dir)
+    assert (ret_code, out) == (1, None)
+    assert 'ValueError: failure' in err
+
+
+async def test_function_pool(xtrig_src_dir, proc_pool):
+    """It runs xtrigger functions in long-lived worker processes."""
+    proc_pool.func_pool = FunctionPool(2, 5)
+    done = []
+    ctxs = []
+    for func_name, args in (
+        ('echo', [1]), ('aecho', [2]), ('fail', []), ('echo', [3])
+    ):
+        ctx = SubFuncContext('label', func_name, args, {}, mod_name='xtrig')
+        ctx.update_command(xtrig_src_dir)
+        proc_pool.put_command(ctx, callback=done.append)
+        ctxs.append(ctx)
+    proc_pool.process()
+    # the functions are not run as subprocesses
+    assert not proc_pool.runnings
+    # calls are queued whilst the workers start up
+    assert len(proc_pool.func_pool.starting) == 2
+    assert len(proc_pool.func_pool.queuings) == 4
+    assert proc_pool.needs_polling()
+    # the call timeouts do not start until the calls are sent to the workers
+    assert proc_pool.get_next_timeout() is None
+    await _wait_for_workers(proc_pool)
+    # calls are queued whilst all workers are busy
+    assert len(proc_pool.func_pool.runnings) <= 2
+    await _wait_for_pool(proc_pool)
+    assert sorted(done, key=ctxs.index) == ctxs
+    assert [(ctx.ret_code, ctx.out) for ctx in ctxs] == [
+        (0, '[true, {"x": 1}]'),
+        (0, '[true, {"x": 2}]'),
+        (1, None),
+        (0, '[true, {"x": 3}]'),
+    ]
+    # the workers are re-used
+    assert len(proc_pool.func_pool.idle) == 2
+
+
+async def test_function_pool_timeout(xtrig_src_dir, proc_pool):
+    """It kills and replaces workers which exceed the timeout."""
+    proc_pool.func_pool = FunctionPool(1, 0.5)
+    ctx = SubFuncContext('label', 'sleep', [10], {}, mod_name='xtrig')
+    ctx.update_command(xtrig_src_dir)
+    proc_pool.put_command(ctx)
+    await _wait_for_workers(proc_pool)
+    assert proc_pool.get_next_timeout() == ctx.timeout
+    await _wait_for_pool(proc_pool)
+    assert (ctx.ret_code, ctx.err) == (1, 'killed on timeout (0.5)')
+    assert not proc_pool.func_pool.idle
+    assert proc_pool.get_next_timeout() is None
+
+    # a new worker is started for the next call
+    ctx = SubFuncContext('label', 'echo', [1], {}, mod_name='xtrig')
+    ctx.update_command(xtrig_src_dir)
+    proc_pool.put_command(ctx)
+    await _wait_for_workers(proc_pool)
+    assert len(proc_pool.func_pool.runnings) == 1
+    await _wait_for_pool(proc_pool)
+    assert (ctx.ret_code, ctx.out) == (0, '[true, {"x": 1}]')
+
+
+async def test_function_pool_start_failed(xtrig_src_dir, proc_pool):
+    """It fails queued calls if a worker dies before it is ready."""
+    proc_pool.func_pool = FunctionPool(1, 5)
+    ctx = SubFuncContext('label', 'echo', [1], {}, mod_name='xtrig')
+    ctx.update_command(xtrig_src_dir)
+    proc_pool.put_command(ctx)
+    proc_pool.process()
+    (worker,) = proc_pool.func_pool.starting.values()
+    worker.kill()
+    await _wait_for_pool(proc_pool)
+    assert ctx.ret_code == 1
+    assert ctx.err.startswith('xtrigger worker failed to start')
+    assert not proc_pool.func_pool.starting
+    assert not proc_pool.func_pool.idle
+
+
 @pytest.fixture
 def mock_ctx():
     def inner_(ret_code=None, host=None, cmd_key=None, cmd=None):
@@ -14,11 +14,28 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+import json
 from socket import gaierror
+from subprocess import run
+import sys
+from threading import (
+    Event,
+    Thread,
+)
 
 import pytest
+import zmq
+import zmq.auth
 
-from cylc.flow.task_message import send_messages
+from cylc.flow.exceptions import (
+    ClientTimeout,
+    RequestError,
+)
+from cylc.flow.task_message import (
+    fast_message,
+    put_messages,
+    send_messages,
+)
 
 
 def test_send_messages_err(
@@ -36,3 +53,168 @@ def test_send_messages_err(
         'arasaka', '1/v/01', [['INFO', 'silverhand']], '2077-01-01T00:00:00Z'
     )
     assert f"gaierror: [Errno -2] {exc_msg}" in capsys.readouterr().err
+
+
+def test_send_messages(monkeypatch: pytest.MonkeyPatch):
+    """It should use the put_messages endpoint, falling back to GraphQL."""
+    requests = []
+
+    def mock_client(command, args):
+        requests.append(command)
+        if command == 'put_messages' and old_scheduler:
+            raise RequestError(
+                "No method by the name 'put_messages' at Cylc 8.6.0"
+            )
+
+    monkeypatch.setattr(
+        'cylc.flow.task_message.get_client', lambda *a, **k: mock_client
+    )
+    old_scheduler = False
+    send_messages('w', '1/v/01', [['INFO', 'x']], '2077-01-01T00:00:00Z')
+    assert requests == ['put_messages']
+
+    requests.clear()
+    old_scheduler = True
+    send_messages('w', '1/v/01', [['INFO', 'x']], '2077-01-01T00:00:00Z')
+    assert requests == ['put_messages', 'graphql']
+
+
+@pytest.fixture
+def scheduler(tmp_path, monkeypatch):
+    """A fake scheduler which replies to requests from a job.
+
+    Returns the list of requests received and a list of responses which may
+    be modified to change the reply (None for no reply).
+    """
+    srv_dir = tmp_path / '.service'
+    srv_dir.mkdir()
+    zmq.auth.create_certificates(srv_dir, 'server')
+    zmq.auth.create_certificates(srv_dir, 'client')
+    context = zmq.Context()
+    socket = context.socket(zmq.REP)
+    socket.curve_publickey, socket.curve_secretkey = (
+        zmq.auth.load_certificate(srv_dir / 'server.key_secret')
+    )
+    socket.curve_server = True
+    port = socket.bind_to_random_port('tcp://127.0.0.1')
+    (srv_dir / 'contact').write_text(
+        'CYLC_WORKFLOW_HOST=127.0.0.1\n'
+        f'CYLC_WORKFLOW_PORT={port}\n'
+    )
+    monkeypatch.setenv('CYLC_WORKFLOW_ID', 'w')
+    monkeypatch.setenv('CYLC_WORKFLOW_RUN_DIR', str(tmp_path))
+    monkeypatch.setenv('CYLC_TASK_LOG_ROOT', str(tmp_path / 'job'))
+    monkeypatch.setenv('CYLC_TASK_COMMS_METHOD', 'zmq')
+    requests = []
+    responses = [{'data': [True, '']}]
+    stopping = Event()
+
+    def _serve():
+        while not stopping.is_set():
+            if socket.poll(10):
+                requests.append(json.loads(socket.recv()))
+                if responses[0] is not None:
+                    socket.send_string(json.dumps(responses[0]))
+
+    server = Thread(target=_serve)
+    server.start()
+    yield requests, responses
+    stopping.set()
+    server.join()
+    socket.close(linger=0)
+    context.term()
+
+
+def test_put_messages(scheduler, monkeypatch: pytest.MonkeyPatch):
+    """It sends messages to the scheduler without the full client."""
+    requests, responses = scheduler
+    messages = [['INFO', 'x']]
+    assert put_messages('w', '1/v/01', messages, '2077-01-01T00:00:00Z')
+    (request,) = requests
+    assert request['command'] == 'put_messages'
+    assert request['args'] == {
+        'messages': [['1/v/01', '2077-01-01T00:00:00Z', messages]]
+    }
+    assert request['meta']['prog'] == 'message'
+
+    # errors are raised
+    responses[0] = {'error': {'message': 'Relic malfunction'}}
+    with pytest.raises(RequestError, match='Relic malfunction'):
+        put_messages('w', '1/v/01', messages, '2077-01-01T00:00:00Z')
+
+    # old schedulers use the full client
+    responses[0] = {
+        'error': {
+            'message': "No method by the name 'put_messages' at Cylc 8.6.0"
+        }
+    }
+    assert not put_messages('w', '1/v/01', messages, '2077-01-01T00:00:00Z')
+
+    # no response
+    responses[0] = None
+    monkeypatch.setattr('cylc.flow.task_message.SEND_TIMEOUT', 0.1)
+    with pytest.raises(ClientTimeout):
+        put_messages('w', '1/v/01', messages, '2077-01-01T00:00:00Z')
+
+    # only the workflow of the job can be messaged this way
+    assert len(requests) == 4
+    assert not put_messages('x', '1/v/01', messages, '2077-01-01T00:00:00Z')
+    monkeypatch.delenv('CYLC_WORKFLOW_RUN_DIR')
+    assert not put_messages('w', '1/v/01', messages, '2077-01-01T00:00:00Z')
+    assert len(requests) == 4
+
+
+def test_fast_message(scheduler, tmp_path):
+    """It sends messages from job scripts without importing the CLI."""
+    requests, _ = scheduler
+    proc = run(
+        [
+            sys.executable,
+            '-c',
+            'import atexit, json, sys\n'
+            'atexit.register(lambda: print(json.dumps(list(sys.modules))))\n'
+            'from cylc.flow.scripts.cylc import main\n'
+            'main()\n',
+            'message',
+            '--',
+            'w',
+            '1/v/01',
+            'started',
+            'x',
+        ],
+        capture_output=True,
+        text=True,
+    )
+    assert proc.returncode == 0, proc.stderr
+    modules = json.loads(proc.stdout.splitlines()[-1])
+    assert len(modules) < 200
+    for module in (
+        'cylc.flow.network',
+        'cylc.flow.option_parsers',
+        'cylc.flow.id_cli',
+        'cylc.flow.workflow_files',
+        'cylc.flow.unicode_rules',
+        'asyncio',
+        'graphql',
+    ):
+        assert module not in modules
+    (request,) = requests
+    assert request['args']['messages'][0][2] == [
+        ['INFO', 'started'], ['INFO', 'x']
+    ]
+    assert 'CYLC_JOB_INIT_TIME=' in (tmp_path / 'job.status').read_text()
+
+
+def test_fast_message_args(monkeypatch: pytest.MonkeyPatch):
+    """It only handles messages in the form sent by job scripts."""
+    monkeypatch.setenv('CYLC_WORKFLOW_ID', 'w')
+    for args in (
+        ['--help'],
+        ['hello'],
+        ['-s', 'WARNING', '--', 'w', '1/v/01', 'x'],
+        ['--', 'w', '1/v/01'],
+        ['--', 'x', '1/v/01', 'x'],
+        ['--', 'w', '1/v/01', '-'],
+        ['--', 'w', '1/v/01', 'a b:c'],
+    ):
+        assert fast_message(args) is None
@@ -75,7 +75,7 @@ def test_check_output(
     expected: SatisfiedState,
 ):
     mock_task_pool = Mock()
-    mock_task_pool.workflow_db_mgr.pri_dao.select_task_outputs.return_value = {
+    mock_task_pool.workflow_db_mgr.select_task_outputs.return_value = {
         '{"f": "foo", "g": "goo"}': db_flow_nums,
     }
 
@@ -19,7 +19,7 @@ from time import sleep
 
 import pytest
 
-from cylc.flow.timer import Timer
+from cylc.flow.timer import DeadlineQueue, Timer
 
 
 def test_Timer(caplog: pytest.LogCaptureFixture):
@@ -55,3 +55,42 @@ def test_Timer(caplog: pytest.LogCaptureFixture):
     caplog.clear()
     timer.stop()
     assert not caplog.records
+
+
+def test_DeadlineQueue():
+    """Test the DeadlineQueue class."""
+    queue = DeadlineQueue()
+    assert queue.get_next_deadline() is None
+    assert queue.pop_due(100) == []
+
+    for key, deadline in (('a', 5), ('b', 1), ('c', 3), ('d', 3)):
+        queue.schedule(key, deadline)
+    assert len(queue) == 4
+    assert queue.get_next_deadline() == 1
+
+    # reschedule and cancel
+    queue.schedule('b', 4)
+    queue.cancel('c')
+    queue.cancel('x')
+    assert len(queue) == 3
+    assert queue.get_next_deadline() == 3
+
+    # cancel then re-schedule for the same deadline
+    queue.cancel('d')
+    queue.schedule('d', 3)
+    assert queue.pop_due(2) == []
+    assert queue.pop_due(4) == ['d', 'b']
+    assert 'd' not in queue
+    assert queue.pop_due(4) == []
+    assert queue.pop_due(5) == ['a']
+    assert len(queue) == 0
+
+
+def test_DeadlineQueue_compaction():
+    """It should not accumulate stale entries when rescheduling."""
+    queue = DeadlineQueue()
+    for deadline in range(1000):
+        queue.schedule('a', deadline)
+        queue.schedule('b', deadline)
+    assert len(queue._heap) < 100
+    assert queue.pop_due(999) == ['a', 'b']
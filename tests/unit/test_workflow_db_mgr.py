@@ -15,6 +15,8 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 from pathlib import Path
+import sqlite3
+from time import sleep
 from typing import (
     List,
     Set,
@@ -27,10 +29,14 @@ from pytest import param
 from cylc.flow.cycling.integer import IntegerPoint
 from cylc.flow.flow_mgr import FlowNums
 from cylc.flow.id import Tokens
+from cylc.flow.rundb import CylcWorkflowDAO
 from cylc.flow.task_proxy import TaskProxy
 from cylc.flow.taskdef import TaskDef
 from cylc.flow.util import serialise_set
-from cylc.flow.workflow_db_mgr import WorkflowDatabaseManager
+from cylc.flow.workflow_db_mgr import (
+    PublicDatabaseWriter,
+    WorkflowDatabaseManager,
+)
 
 
 @pytest.mark.parametrize('flow_nums, expected_removed', [
@@ -77,3 +83,70 @@ def test_remove_task_from_flows(
                 )
             }
             assert remaining_fnums == expected_remaining
+
+
+def _select_workflow_params(db_path: Path) -> List[tuple]:
+    with CylcWorkflowDAO(db_path) as dao:
+        return sorted(dao.select_workflow_params())
+
+
+def test_async_pub(tmp_path: Path):
+    """The public DB should be written to in the background."""
+    (tmp_path / 'pri').mkdir()
+    (tmp_path / 'pub').mkdir()
+    db_mgr = WorkflowDatabaseManager(
+        tmp_path / 'pri', tmp_path / 'pub', async_pub=True
+    )
+    db_mgr.on_workflow_start(is_restart=False)
+    assert db_mgr.pub_writer is not None
+    for key in ('a', 'b', 'c'):
+        db_mgr.put_workflow_params_1(key, key)
+        db_mgr.process_queued_ops()
+    db_mgr.db_deletes_map[db_mgr.TABLE_WORKFLOW_PARAMS].append({'key': 'b'})
+    db_mgr.process_queued_ops()
+    db_mgr.on_workflow_shutdown()
+
+    # batches should have been applied to the public DB in order
+    expected = [('a', 'a'), ('c', 'c')]
+    assert _select_workflow_params(db_mgr.pri_path) == expected
+    assert _select_workflow_params(db_mgr.pub_path) == expected
+
+
+def test_async_pub_recovery(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    """The public DB should be recovered from a snapshot if writes fail."""
+    (tmp_path / 'pri').mkdir()
+    (tmp_path / 'pub').mkdir()
+    db_mgr = WorkflowDatabaseManager(
+        tmp_path / 'pri', tmp_path / 'pub', async_pub=True
+    )
+    db_mgr.on_workflow_start(is_restart=False)
+    writer = db_mgr.pub_writer
+
+    # make writes to the public DB fail
+    execute_stmt = CylcWorkflowDAO._execute_stmt
+
+    def _execute_stmt(self, *args):
+        if self.is_public:
+            raise sqlite3.OperationalError('database is locked')
+        return execute_stmt(self, *args)
+
+    monkeypatch.setattr(CylcWorkflowDAO, 'MAX_TRIES', 2)
+    monkeypatch.setattr(CylcWorkflowDAO, '_execute_stmt', _execute_stmt)
+    monkeypatch.setattr(PublicDatabaseWriter, 'RETRY_DELAY', 0.01)
+    db_mgr.put_workflow_params_1('a', 'a')
+    db_mgr.process_queued_ops()
+    # wait for the writer to give up and take a snapshot
+    for _ in range(100):
+        if writer.n_snapshots:
+            break
+        sleep(0.05)
+    monkeypatch.undo()
+
+    db_mgr.put_workflow_params_1('b', 'b')
+    db_mgr.process_queued_ops()
+    db_mgr.on_workflow_shutdown()
+
+    assert writer.n_snapshots == 1
+    assert _select_workflow_params(db_mgr.pub_path) == [
+        ('a', 'a'), ('b', 'b')
+    ]
@@ -159,7 +159,7 @@ def test_housekeeping_nothing_satisfied(xtrigger_mgr):
     xtrigger_mgr.add_xtriggers(XtriggerCollator())
     xtrigger_mgr.load_xtrigger_for_restart(row_idx=0, row=row)
     assert xtrigger_mgr.sat_xtrig
-    xtrigger_mgr.housekeep([])
+    xtrigger_mgr.housekeep()
     assert not xtrigger_mgr.sat_xtrig
 
 
@@ -195,10 +195,11 @@ def test_housekeeping_with_xtrigger_satisfied(xtrigger_mgr):
 
     xtrigger_mgr.active.append(xtrig.get_signature())
 
+    xtrigger_mgr.add_task(itask)
     xtrigger_mgr.callback(xtrig)
     assert xtrigger_mgr.sat_xtrig
 
-    xtrigger_mgr.housekeep([itask])
+    xtrigger_mgr.housekeep()
     # here we still have the same number as before
     assert xtrigger_mgr.sat_xtrig
 
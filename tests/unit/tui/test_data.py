@@ -21,6 +21,7 @@ from cylc.flow import __version__
 import cylc.flow.tui.data
 from cylc.flow.tui.data import (
     _QUERY,
+    DELTA_VERSIONS,
     VersionIncompat,
     generate_mutation,
     get_query,
@@ -57,3 +58,11 @@ def test_query_compat():
 
     # future version - supported
     assert get_query('9.0.0') == _QUERY
+
+
+def test_delta_versions():
+    """Only schedulers which publish compatible deltas should be replicated.
+    """
+    assert __version__ in DELTA_VERSIONS
+    assert '9.0.0' in DELTA_VERSIONS
+    assert '8.6.0' not in DELTA_VERSIONS